@@ -180,6 +180,15 @@ class DelegatingConstantProvider(ConstantProvider, ABC):
         self._delegate = delegate
         self._probability = probability
 
+    @property
+    def pool(self) -> ConstantPool:
+        """Provides the pool of constants of this provider.
+
+        Returns:
+            The pool of constants
+        """
+        return self._pool
+
     def get_constant_for(self, tp_: type[T]) -> T | None:  # noqa: D102
         if self._pool.has_constant_for(tp_) and randomness.next_float() < self._probability:
             return self._pool.get_constant_for(tp_)
@@ -0,0 +1,200 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a corpus of covering tests that is kept across runs on the same module.
+
+Every code object of the module under test is identified by a hash of its qualified
+name and its source code, which stays stable as long as the code object does not
+change.  The corpus maps these hashes to the tests of a previous run that executed
+the code object.  A later run replays the tests of all code objects that still
+exist unchanged; goals in those code objects that the replayed tests do not cover
+were not covered by the previous run either and are not targeted again.  Only the
+goals of new and changed code objects are left for the search.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import hashlib
+import inspect
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pynguin.analyses.seeding import parse_seed_module, render_seed_module
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import CodeType
+
+    import pynguin.testcase.testcase as tc
+    from pynguin.analyses.module import ModuleTestCluster
+    from pynguin.instrumentation.tracer import SubjectProperties
+    from pynguin.testcase.execution import AbstractTestCaseExecutor
+
+_LOGGER = logging.getLogger(__name__)
+
+CORPUS_VERSION = 1
+
+
+def get_code_object_hash(code_object: CodeType) -> str | None:
+    """Computes a hash of the qualified name and the source code of a code object.
+
+    Args:
+        code_object: The code object
+
+    Returns:
+        The hash, or None if the source of the code object is not available.
+    """
+    try:
+        if code_object.co_name == "<module>":
+            source = Path(code_object.co_filename).read_text(encoding="utf-8")
+        else:
+            source = inspect.getsource(code_object)
+    except (OSError, TypeError):
+        return None
+    name = getattr(code_object, "co_qualname", code_object.co_name)
+    return hashlib.sha256(f"{name}\0{source}".encode()).hexdigest()
+
+
+def get_code_object_hashes(subject_properties: SubjectProperties) -> dict[int, str]:
+    """Computes the hashes of all code objects of the subject under test.
+
+    Args:
+        subject_properties: The properties of the subject under test
+
+    Returns:
+        The hash of every code object whose source is available, by code object id.
+    """
+    hashes: dict[int, str] = {}
+    for code_object_id, meta in subject_properties.existing_code_objects.items():
+        code_object_hash = get_code_object_hash(meta.code_object)
+        if code_object_hash is not None:
+            hashes[code_object_id] = code_object_hash
+    return hashes
+
+
+@dataclasses.dataclass
+class TestCorpus:
+    """The covering tests of a module, keyed by the hashes of its code objects."""
+
+    # Source code of the tests, one module per test.
+    tests: list[str] = dataclasses.field(default_factory=list)
+
+    # The indices of the tests executing a code object, by the hash of the code object.
+    # Contains every code object of the run that created the corpus.
+    code_objects: dict[str, list[int]] = dataclasses.field(default_factory=dict)
+
+    version: int = CORPUS_VERSION
+
+    @staticmethod
+    def get_path(directory: str | Path, module_name: str) -> Path:
+        """Provides the path of the corpus file of a module.
+
+        Args:
+            directory: The directory of the corpus
+            module_name: The name of the module
+
+        Returns:
+            The path of the corpus file
+        """
+        return Path(directory) / f"{module_name}.json.gz"
+
+    @classmethod
+    def load(cls, path: Path) -> TestCorpus | None:
+        """Loads a corpus.
+
+        Args:
+            path: The path of the corpus file
+
+        Returns:
+            The corpus, or None if there is no usable corpus.
+        """
+        if not path.is_file():
+            return None
+        try:
+            with gzip.open(path, mode="rt", encoding="utf-8") as file:
+                corpus = cls(**json.load(file))
+        except (OSError, ValueError, TypeError) as error:
+            _LOGGER.warning("Ignoring unreadable test corpus %s: %s", path, error)
+            return None
+        if corpus.version != CORPUS_VERSION:
+            _LOGGER.info("Ignoring test corpus %s of version %d", path, corpus.version)
+            return None
+        return corpus
+
+    def save(self, path: Path) -> None:
+        """Saves the corpus, replacing the previous one atomically.
+
+        Args:
+            path: The path of the corpus file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f"{path.name}.tmp")
+        with gzip.open(temporary, mode="wt", encoding="utf-8") as file:
+            json.dump(dataclasses.asdict(self), file)
+        temporary.replace(path)
+
+    def knows(self, code_object_hash: str) -> bool:
+        """Whether the run that created the corpus had the given code object.
+
+        Args:
+            code_object_hash: The hash of the code object
+
+        Returns:
+            True, if the code object is unchanged since the corpus was created
+        """
+        return code_object_hash in self.code_objects
+
+    def get_test_cases(
+        self, code_object_hashes: Iterable[str], test_cluster: ModuleTestCluster
+    ) -> list[tc.TestCase]:
+        """Parses the tests that execute any of the given code objects.
+
+        Args:
+            code_object_hashes: The hashes of the code objects
+            test_cluster: The test cluster used to parse the tests
+
+        Returns:
+            The parsable tests, in the order they were stored
+        """
+        indices = sorted({
+            index
+            for code_object_hash in code_object_hashes
+            for index in self.code_objects.get(code_object_hash, ())
+        })
+        test_cases: list[tc.TestCase] = []
+        for index in indices:
+            test_cases.extend(
+                parse_seed_module(self.tests[index], test_cluster, create_assertions=False)
+            )
+        return test_cases
+
+    @classmethod
+    def create(
+        cls, test_cases: Iterable[tc.TestCase], executor: AbstractTestCaseExecutor
+    ) -> TestCorpus:
+        """Creates the corpus of the given tests by executing them.
+
+        Args:
+            test_cases: The tests to store
+            executor: The executor of the subject under test
+
+        Returns:
+            The corpus
+        """
+        hashes = get_code_object_hashes(executor.subject_properties)
+        corpus = cls(code_objects={code_object_hash: [] for code_object_hash in hashes.values()})
+        for test_case in test_cases:
+            result = executor.execute(test_case)
+            index = len(corpus.tests)
+            corpus.tests.append(render_seed_module([test_case]))
+            for code_object_id in result.execution_trace.executed_code_objects:
+                if (code_object_hash := hashes.get(code_object_id)) is not None:
+                    corpus.code_objects[code_object_hash].append(index)
+        return corpus
@@ -43,6 +43,8 @@ from pynguin.utils.naming import get_module_alias
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     import pynguin.testcase.testfactory as tf
     from pynguin.analyses.module import ModuleTestCluster
 
@@ -122,6 +124,14 @@ class InitialPopulationProvider:
         stat.track_output_variable(RuntimeVariable.CollectedTestCases, len(self._testcases))
         self._mutate_testcases_initially()
 
+    def add_testcases(self, test_cases: Iterable[tc.TestCase]) -> None:
+        """Add already parsed test cases to the seeded test cases.
+
+        Args:
+            test_cases: The test cases, which are copied
+        """
+        self._testcases.extend(test_case.clone() for test_case in test_cases)
+
     def _mutate_testcases_initially(self) -> None:
         """Mutates the initial population."""
         for _ in range(config.configuration.seeding.initial_population_mutations):
@@ -196,3 +206,21 @@ def parse_seed_module(
         else:
             logger.debug("Failed to parse %s.", node.name.value)
     return testcases
+
+
+def render_seed_module(test_cases: Iterable[tc.TestCase]) -> str:
+    """Render test cases into a module that :func:`parse_seed_module` can read.
+
+    Only the statements are rendered, assertions are dropped.
+
+    Args:
+        test_cases: The test cases to render.
+
+    Returns:
+        The source code of the module.
+    """
+    module_name = config.configuration.module_name
+    functions = "\n\n".join(
+        test_case.to_test_function(index).code for index, test_case in enumerate(test_cases)
+    )
+    return f"import {module_name} as {get_module_alias(module_name)}\n\n\n{functions}"
@@ -8,7 +8,9 @@
 
 from __future__ import annotations
 
+import collections
 import dataclasses
+import functools
 import logging
 import time
 from typing import TYPE_CHECKING
@@ -21,21 +23,30 @@ import pynguin.configuration as config
 import pynguin.ga.chromosomevisitor as cv
 import pynguin.testcase.execution as ex
 import pynguin.utils.statistics.stats as stat
+from pynguin.assertion.mutation_analysis.pool import MutantExecutionPool
 from pynguin.utils import randomness
 from pynguin.utils.orderedset import OrderedSet
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 if TYPE_CHECKING:
+    import ast
     import types
-    from collections.abc import Generator, Iterable
+    from collections.abc import Callable, Generator, Iterable
 
     import pynguin.ga.testcasechromosome as tcc
     import pynguin.ga.testsuitechromosome as tsc
     import pynguin.testcase.testcase as tc
+    from pynguin.assertion.mutation_analysis.cache import KillMatrix
+    from pynguin.assertion.mutation_analysis.operators.base import Mutation
+    from pynguin.instrumentation.tracer import ExecutionTrace, SubjectProperties
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# The seconds a mutation analysis worker may take on a mutant beyond the timeouts of
+# the tests, e.g., to create the mutated module.
+_MUTANT_TIMEOUT_SLACK = 10.0
+
 
 def create_filtering_executor(
     plain_executor: ex.TestCaseExecutor,
@@ -190,6 +201,9 @@ class _MutantInfo:
     # Was the mutant killed by any test?
     killed_by: list[int] = dataclasses.field(default_factory=list)
 
+    # Which tests did not reach the mutated lines and were not executed?
+    not_reached_by: list[int] = dataclasses.field(default_factory=list)
+
 
 @dataclasses.dataclass
 class _MutationSummary:
@@ -258,6 +272,36 @@ class _MutationMetrics:
         return self.num_killed_mutants / divisor
 
 
+def _reached_lines(
+    trace: ExecutionTrace,
+    subject_properties: SubjectProperties,
+    file_name: str | None,
+) -> frozenset[int]:
+    """Collect the lines of a module that an execution reached.
+
+    If the lines are instrumented, these are the covered lines.  Otherwise, these
+    are all lines of the executed code objects, which over-approximates the lines
+    that were actually executed.
+
+    Args:
+        trace: The execution trace.
+        subject_properties: The properties of the subject the trace refers to.
+        file_name: The file of the module.
+
+    Returns:
+        The numbers of the reached lines of the module.
+    """
+    if subject_properties.existing_lines:
+        lines = (subject_properties.existing_lines[line_id] for line_id in trace.covered_line_ids)
+        return frozenset(line.line_number for line in lines if line.file_name == file_name)
+    reached: set[int] = set()
+    for code_object_id in trace.executed_code_objects:
+        code_object = subject_properties.existing_code_objects[code_object_id].code_object
+        if code_object.co_filename == file_name:
+            reached.update(line for _, _, line in code_object.co_lines() if line is not None)
+    return frozenset(reached)
+
+
 def _select_minimal_assertions(
     kill_map: dict[tuple[int, int], set[int]],
 ) -> set[tuple[int, int]]:
@@ -311,6 +355,35 @@ def _select_minimal_assertions(
     return keep
 
 
+@dataclasses.dataclass
+class _PlannedMutant:
+    """A mutant together with the cached results of the tests on it."""
+
+    idx: int
+    source: ast.Module | int
+    mutations: list[Mutation]
+    # The cached result of each test, or None if it is not cached.
+    cached: list[ex.ExecutionResult | None]
+    # Whether to execute each test, or None if all tests have to be executed.
+    to_execute: list[bool] | None
+
+    @property
+    def is_cached(self) -> bool:
+        """Whether no test has to be executed on the mutant.
+
+        A mutant without any cached result is still created, because it is only
+        checked if it creates a valid module.
+
+        Returns:
+            Whether the results of the mutant are all cached.
+        """
+        return (
+            self.to_execute is not None
+            and not any(self.to_execute)
+            and any(result is not None for result in self.cached)
+        )
+
+
 class MutationAnalysisAssertionGenerator(AssertionGenerator):
     """Uses mutation analysis to filter out less relevant assertions."""
 
@@ -347,8 +420,18 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
 
         self._mutation_executor.add_remote_observer(ato.RemoteAssertionVerificationObserver())
 
+        # The processes forked per mutant are isolated already, so they execute the
+        # tests in-process.
+        self._forked_mutation_executor = ex.TestCaseExecutor(subject_properties)
+        self._forked_mutation_executor.add_remote_observer(
+            ato.RemoteAssertionVerificationObserver()
+        )
+
         self._mutation_controller = mutation_controller
 
+        # The lines each test reached on the original module, by the id of the test.
+        self._reached_lines: dict[int, frozenset[int]] = {}
+
         # Some debug information
         self._testing = testing
         self._testing_mutation_summary: _MutationSummary = _MutationSummary()
@@ -359,7 +442,12 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
         mutated_module: types.ModuleType | None,
         idx: int,
         mutant_count: int,
+        reached: list[bool] | None = None,
+        *,
+        executor: ex.TestCaseExecutor | None = None,
     ) -> Iterable[ex.ExecutionResult | None] | None:
+        if executor is None:
+            executor = self._mutation_executor
         if mutated_module is None:
             self._logger.info(
                 "Skipping mutant %3i/%i because it created an invalid module",
@@ -368,24 +456,73 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
             )
             return None
 
+        selected = self._select_tests(test_cases, reached)
+        if not selected:
+            self._logger.info(
+                "Skipping mutant %3i/%i because no test reaches it",
+                idx,
+                mutant_count,
+            )
+            return [None] * len(test_cases)
+
         self._logger.info(
-            "Running tests on mutant %3i/%i",
+            "Running %i test(s) on mutant %3i/%i",
+            len(selected),
             idx,
             mutant_count,
         )
-        self._mutation_executor.module_provider.add_mutated_version(
+        executor.module_provider.add_mutated_version(
             module_name=config.configuration.module_name,
             mutated_module=mutated_module,
         )
 
-        results = self._mutation_executor.execute_multiple(test_cases)
+        results = executor.execute_multiple(selected)
 
         # The subprocess executor materializes and runs all tests before returning,
         # so aborting early there saves nothing; only the in-process executor is a
         # lazy generator we can stop consuming.
-        if isinstance(self._mutation_executor, ex.SubprocessTestCaseExecutor):
+        if not isinstance(executor, ex.SubprocessTestCaseExecutor):
+            results = self._abort_after_first_timeout(results, len(selected))
+        if reached is None:
             return results
-        return self._abort_after_first_timeout(results, len(test_cases))
+        return self._spread_over_reaching_tests(results, reached)
+
+    @staticmethod
+    def _select_tests(
+        test_cases: list[tc.TestCase],
+        reached: list[bool] | None,
+    ) -> list[tc.TestCase]:
+        """Select the tests to execute on a mutant.
+
+        Args:
+            test_cases: The tests
+            reached: Whether each test reaches the mutant, or ``None`` if all tests
+                have to be executed on it.
+
+        Returns:
+            The tests to execute on the mutant.
+        """
+        if reached is None:
+            return test_cases
+        return [test for test, is_reached in zip(test_cases, reached, strict=True) if is_reached]
+
+    @staticmethod
+    def _spread_over_reaching_tests(
+        results: Iterable[ex.ExecutionResult | None],
+        reached: list[bool],
+    ) -> Generator[ex.ExecutionResult | None, None, None]:
+        """Place the results of the tests reaching a mutant among all tests.
+
+        Args:
+            results: The lazily produced results of the tests reaching the mutant.
+            reached: Whether each test reaches the mutant.
+
+        Yields:
+            The result of each reaching test, and ``None`` for the other tests.
+        """
+        iterator = iter(results)
+        for is_reached in reached:
+            yield next(iterator) if is_reached else None
 
     @staticmethod
     def _abort_after_first_timeout(
@@ -423,28 +560,299 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
         self,
         test_cases: list[tc.TestCase],
         mutant_count: int,
+        reached_lines: list[frozenset[int] | None],
+        kill_matrix: KillMatrix | None = None,
     ) -> Generator[Iterable[ex.ExecutionResult | None] | None, None, None]:
         maximum_time = config.configuration.test_case_output.maximum_mutation_time
         start_time = time.monotonic()
-
-        for idx, (mutated_module, _) in enumerate(
-            self._mutation_controller.create_mutants(), start=1
-        ):
-            if maximum_time >= 0 and time.monotonic() - start_time >= maximum_time:
-                self._logger.info(
-                    "Mutation time budget of %ss exceeded; checked %i of %i mutant(s).",
-                    maximum_time,
-                    idx - 1,
+        checked = 0
+        exceeded = False
+
+        def budget_exceeded() -> bool:
+            nonlocal exceeded
+            exceeded = maximum_time >= 0 and time.monotonic() - start_time >= maximum_time
+            return exceeded
+
+        # The sources of the mutants, which may require creating the mutant schemata,
+        # are created before the workers are forked.
+        mutants = self._plan_mutants(
+            self._mutation_controller.create_mutant_sources(),
+            len(test_cases),
+            reached_lines,
+            kill_matrix,
+        )
+        number_of_workers = config.configuration.test_case_output.mutation_workers
+        # Instead of a subprocess per execution, a process is forked per mutant.
+        fork_server = (
+            isinstance(self._mutation_executor, ex.SubprocessTestCaseExecutor)
+            and config.configuration.test_case_output.mutation_fork_server
+        )
+        executor = self._forked_mutation_executor if fork_server else self._mutation_executor
+        pool = MutantExecutionPool(
+            self._mutation_executor.subject_properties,
+            functools.partial(
+                self._execute_test_case_on_mutant_source, test_cases, mutant_count, executor
+            ),
+            len(test_cases),
+            number_of_workers,
+            fork_per_mutant=fork_server,
+            mutant_timeout=functools.partial(self._mutant_timeout, test_cases, executor),
+        )
+        if (number_of_workers > 1 or fork_server) and pool.start():
+            try:
+                for results in self._execute_in_pool(pool, mutants, kill_matrix, budget_exceeded):
+                    checked += 1
+                    yield results
+            finally:
+                pool.close()
+        else:
+            for mutant in mutants:
+                if budget_exceeded():
+                    break
+                checked += 1
+                if mutant.is_cached:
+                    self._logger.info(
+                        "Using the cached results on mutant %3i/%i", mutant.idx, mutant_count
+                    )
+                    yield mutant.cached
+                    continue
+                results = self._execute_test_case_on_mutant(
+                    test_cases,
+                    self._mutation_controller.try_create_mutant(mutant.source),
+                    mutant.idx,
                     mutant_count,
+                    mutant.to_execute,
                 )
-                break
-            yield self._execute_test_case_on_mutant(
-                test_cases,
-                mutated_module,
-                idx,
+                yield self._merge_cached_results(kill_matrix, mutant, results)
+
+        if exceeded:
+            self._logger.info(
+                "Mutation time budget of %ss exceeded; checked %i of %i mutant(s).",
+                maximum_time,
+                checked,
                 mutant_count,
             )
 
+    def _execute_test_case_on_mutant_source(
+        self,
+        test_cases: list[tc.TestCase],
+        mutant_count: int,
+        executor: ex.TestCaseExecutor,
+        idx: int,
+        mutant: tuple[ast.Module | int, list[bool] | None],
+    ) -> list[ex.ExecutionResult | None] | None:
+        """Execute the tests on a mutant in a worker of the mutant execution pool.
+
+        Args:
+            test_cases: The tests to execute
+            mutant_count: The number of mutants
+            executor: The executor of the tests
+            idx: The number of the mutant
+            mutant: The source of the mutant and whether each test reaches it
+
+        Returns:
+            The result per test, or None if the mutant is invalid
+        """
+        source, reached = mutant
+        results = self._execute_test_case_on_mutant(
+            test_cases,
+            self._mutation_controller.try_create_mutant(source),
+            idx,
+            mutant_count,
+            reached,
+            executor=executor,
+        )
+        return None if results is None else list(results)
+
+    @classmethod
+    def _mutant_timeout(
+        cls,
+        test_cases: list[tc.TestCase],
+        executor: ex.TestCaseExecutor,
+        mutant: tuple[ast.Module | int, list[bool] | None],
+    ) -> float:
+        """Provide the seconds a worker may take to execute the tests on a mutant.
+
+        Each selected test may take its timeout.  The slack covers creating the
+        mutated module and waiting for a test that does not stop at its timeout.
+
+        Args:
+            test_cases: The tests
+            executor: The executor of the tests
+            mutant: The source of the mutant and whether each test reaches it
+
+        Returns:
+            The time limit of the worker in seconds
+        """
+        _, reached = mutant
+        return (
+            sum(
+                executor._calculate_timeout(test_case)  # noqa: SLF001
+                for test_case in cls._select_tests(test_cases, reached)
+            )
+            + executor._maximum_test_execution_timeout  # noqa: SLF001
+            + _MUTANT_TIMEOUT_SLACK
+        )
+
+    @staticmethod
+    def _tests_to_execute(
+        reached: list[bool] | None,
+        cached: list[ex.ExecutionResult | None],
+    ) -> list[bool] | None:
+        """Determine which tests to execute on a mutant given the cached results.
+
+        Args:
+            reached: Whether each test reaches the mutant, or ``None`` if all tests
+                have to be executed on it.
+            cached: The cached result of each test on the mutant, or ``None`` if the
+                result is not cached.
+
+        Returns:
+            Whether to execute each test on the mutant, or ``None`` if all tests
+            have to be executed on it.
+        """
+        if all(result is None for result in cached):
+            return reached
+        if any(result is not None and result.timeout for result in cached):
+            # The mutant is discarded anyway, like after the first timeout.
+            return [False] * len(cached)
+        if reached is None:
+            return [result is None for result in cached]
+        return [
+            result is None and is_reached
+            for result, is_reached in zip(cached, reached, strict=True)
+        ]
+
+    def _plan_mutants(
+        self,
+        sources: Iterable[tuple[ast.Module | int, list[Mutation]]],
+        number_of_tests: int,
+        reached_lines: list[frozenset[int] | None],
+        kill_matrix: KillMatrix | None,
+    ) -> Generator[_PlannedMutant, None, None]:
+        """Determine the cached results and the tests to execute for each mutant.
+
+        Args:
+            sources: The sources of the mutants together with their mutations.
+            number_of_tests: The number of tests.
+            reached_lines: The lines each test reached on the original module.
+            kill_matrix: The cached results, or ``None`` if no results are cached.
+
+        Yields:
+            The mutants in the order of their sources.
+        """
+        for idx, (source, mutations) in enumerate(sources, start=1):
+            cached: list[ex.ExecutionResult | None] = (
+                [None] * number_of_tests
+                if kill_matrix is None
+                else kill_matrix.cached_results(idx, mutations)
+            )
+            reached = self._tests_reaching(mutations, reached_lines)
+            yield _PlannedMutant(
+                idx, source, mutations, cached, self._tests_to_execute(reached, cached)
+            )
+
+    def _execute_in_pool(
+        self,
+        pool: MutantExecutionPool[tuple[ast.Module | int, list[bool] | None]],
+        mutants: Iterable[_PlannedMutant],
+        kill_matrix: KillMatrix | None,
+        stop: Callable[[], bool],
+    ) -> Generator[Iterable[ex.ExecutionResult | None] | None, None, None]:
+        """Execute the tests on the mutants in the workers of the pool.
+
+        The workers create the mutated modules from the sources themselves.  The
+        mutants whose results are all cached are not handed to the pool, but kept in
+        order among the pending mutants.
+
+        Args:
+            pool: The started pool.
+            mutants: The mutants.
+            kill_matrix: The cached results, or ``None`` if no results are cached.
+            stop: The condition to stop handing out mutants.
+
+        Yields:
+            The result per test of each mutant, or ``None`` if it is invalid.
+        """
+        pending: collections.deque[_PlannedMutant] = collections.deque()
+
+        def executed_mutants() -> Generator[tuple[ast.Module | int, list[bool] | None]]:
+            for mutant in mutants:
+                pending.append(mutant)
+                if not mutant.is_cached:
+                    yield mutant.source, mutant.to_execute
+
+        for results in pool.execute(executed_mutants(), stop):
+            while pending[0].is_cached:
+                yield pending.popleft().cached
+            yield self._merge_cached_results(kill_matrix, pending.popleft(), results)
+        while pending and pending[0].is_cached:
+            yield pending.popleft().cached
+
+    @staticmethod
+    def _merge_cached_results(
+        kill_matrix: KillMatrix | None,
+        mutant: _PlannedMutant,
+        results: Iterable[ex.ExecutionResult | None] | None,
+    ) -> Iterable[ex.ExecutionResult | None] | None:
+        """Record the results of the executed tests and add the cached results.
+
+        Args:
+            kill_matrix: The cached results, or ``None`` if no results are cached.
+            mutant: The mutant.
+            results: The result of each executed test, or ``None`` if the mutant is
+                invalid.
+
+        Returns:
+            The result of each test, or ``None`` if the mutant is invalid.
+        """
+        if kill_matrix is None or results is None:
+            return results
+        executed = list(results)
+        kill_matrix.record(mutant.idx, mutant.mutations, executed)
+        return [
+            result if cached is None else cached
+            for result, cached in zip(executed, mutant.cached, strict=True)
+        ]
+
+    @staticmethod
+    def _tests_reaching(
+        mutations: list[Mutation],
+        reached_lines: list[frozenset[int] | None],
+    ) -> list[bool] | None:
+        """Determine which tests reach the lines a mutant changes.
+
+        Args:
+            mutations: The mutations applied to create the mutant.
+            reached_lines: The lines each test reached on the original module, or
+                ``None`` for a test whose lines are unknown.
+
+        Returns:
+            Whether each test reaches the mutant, or ``None`` if all tests have to
+            be executed on it.
+        """
+        if not config.configuration.test_case_output.mutation_test_selection or all(
+            lines is None for lines in reached_lines
+        ):
+            return None
+        locations = [mutation.location for mutation in mutations]
+        if not locations or any(location is None for location in locations):
+            return None
+        return [
+            lines is None
+            or any(location.is_reached(lines) for location in locations if location is not None)
+            for lines in reached_lines
+        ]
+
+    def _add_assertions_for(self, test_case: tc.TestCase, result: ex.ExecutionResult):
+        super()._add_assertions_for(test_case, result)
+        if config.configuration.test_case_output.mutation_test_selection:
+            self._reached_lines[id(test_case)] = _reached_lines(
+                result.execution_trace,
+                self._plain_executor.subject_properties,
+                self._mutation_controller.module.__file__,
+            )
+
     def _add_assertions(self, test_cases: list[tc.TestCase]):
         super()._add_assertions(test_cases)
         self._handle_add_assertions(test_cases)
@@ -452,18 +860,32 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
     def _handle_add_assertions(self, test_cases: list[tc.TestCase]):
         tests_mutants_results: list[list[ex.ExecutionResult | None]] = [[] for _ in test_cases]
 
-        # Pre-truncation total number of mutants the module yields.
+        # Pre-truncation total number of mutants the module yields, without the
+        # equivalent and duplicate mutants the controller drops.
         num_created = self._mutation_controller.mutant_count()
 
+        # The lines each test reached when adding its assertions on the original
+        # module; unknown if the assertions were added otherwise.
+        reached_lines = [self._reached_lines.pop(id(test), None) for test in test_cases]
+        self._reached_lines.clear()
+
         # Only fully-checked mutants (valid module, executed within the budget)
         # get a column; unchecked mutants must not enter the score as survivors.
+        # The results of the tests that were executed on the mutants in earlier runs.
+        cache = self._mutation_controller.cache
+        kill_matrix = None if cache is None else cache.load_kill_matrix(test_cases)
+
         num_checked = 0
-        for tests_mutant_results in self._execute_test_case_on_mutants(test_cases, num_created):
+        for tests_mutant_results in self._execute_test_case_on_mutants(
+            test_cases, num_created, reached_lines, kill_matrix
+        ):
             if tests_mutant_results is None:
                 continue
             num_checked += 1
             for i, test_mutant_results in enumerate(tests_mutant_results):
                 tests_mutants_results[i].append(test_mutant_results)
+        if kill_matrix is not None:
+            kill_matrix.save()
 
         summary = self.__compute_mutation_summary(num_checked, tests_mutants_results)
         self.__report_mutation_summary(summary, num_created)
@@ -571,7 +993,11 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
         for test_num, test_mutants_results in enumerate(tests_mutants_results):
             # For each mutation, check if we had a violated assertion
             for info, result in zip(mutation_info, test_mutants_results, strict=True):
-                if result is None or info.timed_out_by:
+                if info.timed_out_by:
+                    continue
+                if result is None:
+                    # The test does not reach the mutant and was not executed.
+                    info.not_reached_by.append(test_num)
                     continue
                 if result.timeout:
                     # Mutant caused timeout
@@ -596,8 +1022,9 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
         stat.track_output_variable(
             RuntimeVariable.NumberOfTimedOutMutants, metrics.num_timeout_mutants
         )
-        # NumberOfCreatedMutants stays the pre-truncation total; NumberOfCheckedMutants
-        # is how many were actually executed. The score is computed over the latter.
+        # NumberOfCreatedMutants stays the pre-truncation total, without the dropped
+        # equivalent and duplicate mutants; NumberOfCheckedMutants is how many were
+        # actually executed. The score is computed over the latter.
         stat.track_output_variable(RuntimeVariable.NumberOfCreatedMutants, num_created)
         stat.track_output_variable(
             RuntimeVariable.NumberOfCheckedMutants, metrics.num_created_mutants
@@ -623,6 +1050,12 @@ class MutationAnalysisAssertionGenerator(AssertionGenerator):
                     info.mut_num,
                     info.timed_out_by[0],
                 )
+            elif info.not_reached_by:
+                _LOGGER.info(
+                    "Mutant %i survived, not reached by Test(s): %s",
+                    info.mut_num,
+                    ", ".join(map(str, info.not_reached_by)),
+                )
         survived = mutation_summary.get_survived()
         _LOGGER.info(
             "Number of Surviving Mutant(s): %i (Mutants: %s)",
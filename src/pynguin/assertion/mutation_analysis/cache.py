@@ -0,0 +1,337 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a cache of mutation analysis results kept across runs.
+
+For an unchanged module and unchanged settings of the mutant generation, every run
+creates the same mutants, and an unchanged test has the same outcome on each of them.
+The cache keeps a directory per module version, identified by a hash of the source
+code of the module, the mutation operators and the mutation strategy.
+
+``mutants.json`` lists the created mutants, described by their number and the
+operator, visitor and line of their mutations, together with the positions of the
+mutants the equivalence filter dropped.  Later runs regenerate the mutants, which is
+deterministic, but take the dropped mutants from the cache instead of compiling every
+mutant again.  A mutant is identified by a hash of its description.
+
+The kill matrix, i.e., the outcome of each test on each mutant, is stored in one file
+per test in ``kills/``, named after a hash of the code of the test including its
+assertions.  Only the pairs of tests and mutants that are not in the cache are
+executed; the outcomes of the others are read from the cache.  Timeouts are not
+stored, because they depend on the load of the machine; a test that timed out on a
+mutant is executed on it again in the next run.
+
+A file is written to a temporary file first, which then atomically replaces the
+previous file, so a run never reads a partially written file.  Updating a file reads,
+merges and writes it without any lock, though; if concurrent runs update the same
+file, the outcomes recorded by one of them may be lost and are executed again later.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import tempfile
+from itertools import starmap
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pynguin.testcase.execution_result import ExecutionResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import pynguin.testcase.testcase as tc
+    from pynguin.assertion.mutation_analysis.operators.base import Mutation, MutationOperator
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 2
+
+_MUTANTS_FILE_NAME = "mutants.json"
+
+_KILLS_DIRECTORY_NAME = "kills"
+
+
+def get_mutants_key(
+    source_code: str,
+    operators: Iterable[type[MutationOperator]],
+    *settings: object,
+) -> str:
+    """Provides the key of the mutants of a module.
+
+    Args:
+        source_code: The source code of the module
+        operators: The mutation operators
+        *settings: The further settings the mutants depend on, e.g., the mutation
+            strategy
+
+    Returns:
+        The key
+    """
+    key = "\0".join((
+        str(CACHE_VERSION),
+        source_code,
+        *sorted(f"{operator.__module__}.{operator.__qualname__}" for operator in operators),
+        *map(str, settings),
+    ))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def get_test_key(test_case: tc.TestCase) -> str:
+    """Provides the key of a test, which depends on its statements and assertions.
+
+    Args:
+        test_case: The test
+
+    Returns:
+        The key
+    """
+    parts: list[str] = []
+    for statement in test_case.statements():
+        parts.append(statement.to_code())
+        parts.extend(repr(assertion) for assertion in statement.assertions)
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class CachedTestException(Exception):  # noqa: N818
+    """Stands in for an exception that a test raised on a mutant in an earlier run."""
+
+
+class MutationAnalysisCache:
+    """A directory that keeps the mutants of a module and their kill matrix."""
+
+    def __init__(self, directory: Path, mutants_key: str) -> None:
+        """Initializes the cache.
+
+        Args:
+            directory: The directory of the cache, which is shared by all modules
+            mutants_key: The key of the mutants, see :func:`get_mutants_key`
+        """
+        self._directory = directory / mutants_key
+
+    def load_kill_matrix(self, test_cases: Sequence[tc.TestCase]) -> KillMatrix:
+        """Loads the outcomes of the tests on the mutants.
+
+        Args:
+            test_cases: The tests
+
+        Returns:
+            The kill matrix of the tests
+        """
+        test_keys = [get_test_key(test_case) for test_case in test_cases]
+        kills = [_read(self._kills_file(test_key)) for test_key in test_keys]
+        _LOGGER.info(
+            "Loaded %d cached mutation analysis result(s)",
+            sum(len(test_kills) for test_kills in kills),
+        )
+        return KillMatrix(self, test_keys, kills)
+
+    def load_dropped_mutants(self) -> set[int] | None:
+        """Loads the positions of the mutants the equivalence filter dropped.
+
+        Returns:
+            The positions among the mutants of the mutant generator, or None if the
+            mutants are not stored yet
+        """
+        dropped = _read(self._directory / _MUTANTS_FILE_NAME).get("dropped")
+        if not isinstance(dropped, list):
+            return None
+        return set(dropped)
+
+    def store_mutants(self, mutants: Sequence[list[Mutation]], dropped: Iterable[int]) -> None:
+        """Stores the created mutants and the mutants the equivalence filter dropped.
+
+        Args:
+            mutants: The mutations of each created mutant, in the order of their
+                numbers
+            dropped: The positions of the dropped mutants among the mutants of the
+                mutant generator
+        """
+        try:
+            _write(
+                self._directory / _MUTANTS_FILE_NAME,
+                {
+                    "mutants": list(starmap(_describe, enumerate(mutants, start=1))),
+                    "dropped": sorted(dropped),
+                },
+            )
+        except OSError as error:
+            _LOGGER.warning("Failed to write the mutation analysis cache: %s", error)
+
+    def store(self, kills: dict[str, dict[str, Any]]) -> None:
+        """Adds outcomes of tests to the cache.
+
+        Args:
+            kills: The outcomes of each test, by the key of the test and the id of
+                the mutant
+        """
+        try:
+            for test_key, test_kills in kills.items():
+                kills_file = self._kills_file(test_key)
+                _write(kills_file, _read(kills_file) | test_kills)
+        except OSError as error:
+            _LOGGER.warning("Failed to write the mutation analysis cache: %s", error)
+
+    def _kills_file(self, test_key: str) -> Path:
+        return self._directory / _KILLS_DIRECTORY_NAME / f"{test_key}.json"
+
+
+class KillMatrix:
+    """The outcomes of a list of tests on the mutants, as far as they are cached.
+
+    New outcomes are recorded in memory and written to the cache by :meth:`save`.
+    """
+
+    def __init__(
+        self,
+        cache: MutationAnalysisCache,
+        test_keys: list[str],
+        kills: list[dict[str, Any]],
+    ) -> None:
+        """Initializes the kill matrix.
+
+        Args:
+            cache: The cache the matrix is loaded from
+            test_keys: The key of each test
+            kills: The cached outcomes of each test, by the id of the mutant
+        """
+        self._cache = cache
+        self._test_keys = test_keys
+        self._kills = kills
+        self._new_kills: dict[str, dict[str, Any]] = {}
+
+    def cached_results(
+        self, number: int, mutations: list[Mutation]
+    ) -> list[ExecutionResult | None]:
+        """Provides the cached outcomes of the tests on a mutant.
+
+        Args:
+            number: The number of the mutant, starting from 1
+            mutations: The mutations applied to create the mutant
+
+        Returns:
+            The result of each test, or None if it is not cached
+        """
+        mutant_id = _mutant_id(number, mutations)
+        return [
+            None if (entry := test_kills.get(mutant_id)) is None else _decode(entry)
+            for test_kills in self._kills
+        ]
+
+    def record(
+        self,
+        number: int,
+        mutations: list[Mutation],
+        results: Sequence[ExecutionResult | None],
+    ) -> None:
+        """Records the outcomes of the tests that were executed on a mutant.
+
+        Timeouts are not recorded, such that the tests are executed again.
+
+        Args:
+            number: The number of the mutant, starting from 1
+            mutations: The mutations applied to create the mutant
+            results: The result of each test, or None if it was not executed
+        """
+        mutant_id = _mutant_id(number, mutations)
+        for test_key, test_kills, result in zip(self._test_keys, self._kills, results, strict=True):
+            if result is None or result.timeout or mutant_id in test_kills:
+                continue
+            entry = _encode(result)
+            test_kills[mutant_id] = entry
+            self._new_kills.setdefault(test_key, {})[mutant_id] = entry
+
+    def save(self) -> None:
+        """Writes the recorded outcomes to the cache."""
+        if not self._new_kills:
+            return
+        self._cache.store(self._new_kills)
+        _LOGGER.info(
+            "Cached %d new mutation analysis result(s)",
+            sum(len(test_kills) for test_kills in self._new_kills.values()),
+        )
+        self._new_kills = {}
+
+
+def _describe(number: int, mutations: list[Mutation]) -> dict[str, Any]:
+    return {
+        "number": number,
+        "mutations": [
+            {
+                "operator": mutation.operator.__name__,
+                "visitor": mutation.visitor_name,
+                "line": _line_of(mutation),
+            }
+            for mutation in mutations
+        ],
+    }
+
+
+def _mutant_id(number: int, mutations: list[Mutation]) -> str:
+    description = json.dumps(_describe(number, mutations), sort_keys=True)
+    return hashlib.sha256(description.encode()).hexdigest()[:16]
+
+
+def _line_of(mutation: Mutation) -> int | None:
+    node: Any = mutation.node
+    while node is not None and not hasattr(node, "lineno"):
+        node = getattr(node, "parent", None)
+    return None if node is None else node.lineno
+
+
+def _encode(result: ExecutionResult) -> dict[str, Any]:
+    trace = result.assertion_verification_trace
+    return {
+        "timeout": result.timeout,
+        "exceptions": {
+            str(position): type(exception).__name__
+            for position, exception in result.exceptions.items()
+        },
+        "failed": {str(position): list(indices) for position, indices in trace.failed.items()},
+        "error": {str(position): list(indices) for position, indices in trace.error.items()},
+    }
+
+
+def _decode(entry: dict[str, Any]) -> ExecutionResult:
+    result = ExecutionResult(timeout=entry["timeout"])
+    for position, name in entry["exceptions"].items():
+        result.report_new_thrown_exception(int(position), CachedTestException(name))
+    trace = result.assertion_verification_trace
+    for position, indices in entry["failed"].items():
+        trace.failed[int(position)].update(indices)
+    for position, indices in entry["error"].items():
+        trace.error[int(position)].update(indices)
+    return result
+
+
+def _read(path: Path) -> dict[str, Any]:
+    try:
+        with path.open(encoding="utf-8") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as error:
+        _LOGGER.warning("Ignoring the unreadable cache file %s: %s", path, error)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique temporary file, such that concurrent runs do not write to the same one.
+    with tempfile.NamedTemporaryFile(
+        mode="w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+    ) as file:
+        temporary = Path(file.name)
+        try:
+            json.dump(data, file, sort_keys=True)
+            file.close()
+            temporary.replace(path)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
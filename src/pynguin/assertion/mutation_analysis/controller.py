@@ -12,14 +12,17 @@ import ast
 import logging
 from typing import TYPE_CHECKING
 
+from pynguin.assertion.mutation_analysis.equivalence import EquivalentMutantFilter
+from pynguin.assertion.mutation_analysis.schemata import MutantSchemata
 from pynguin.assertion.mutation_analysis.transformer import create_module
 
 if TYPE_CHECKING:
     import types
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterator
     from types import ModuleType
 
     import pynguin.assertion.mutation_analysis.mutators as mu
+    from pynguin.assertion.mutation_analysis.cache import MutationAnalysisCache
     from pynguin.assertion.mutation_analysis.operators.base import Mutation
 
 
@@ -34,6 +37,10 @@ class MutationController:
         mutant_generator: mu.Mutator,
         module_ast: ast.Module,
         module: types.ModuleType,
+        *,
+        schemata: bool = False,
+        filter_equivalent: bool = False,
+        cache: MutationAnalysisCache | None = None,
     ) -> None:
         """Initialize the controller.
 
@@ -41,10 +48,40 @@ class MutationController:
             mutant_generator: The mutant generator to use.
             module_ast: The AST of the module to mutate.
             module: The module to mutate.
+            schemata: Whether to create the mutants in a mutant schemata, i.e., a
+                single module in which a switch activates the mutants.
+            filter_equivalent: Whether to drop the mutants that compile to the same
+                code as the module or as an earlier mutant.
+            cache: The cache of the mutants and the outcomes of the tests on them,
+                if the outcomes are kept across runs.
         """
         self._mutant_generator = mutant_generator
         self._module_ast = module_ast
         self._module = module
+        self._schemata = schemata
+        self._filter_equivalent = filter_equivalent
+        self._cache = cache
+        self._mutant_schemata: MutantSchemata | None = None
+        # The positions of the mutants the equivalence filter drops, once known.
+        self._redundant_mutants: set[int] | None = None
+
+    @property
+    def module(self) -> types.ModuleType:
+        """Provides the module to mutate.
+
+        Returns:
+            The module to mutate.
+        """
+        return self._module
+
+    @property
+    def cache(self) -> MutationAnalysisCache | None:
+        """Provides the cache of the mutants and the outcomes of the tests on them.
+
+        Returns:
+            The cache, or None if the outcomes are not kept across runs.
+        """
+        return self._cache
 
     def create_mutant(self, mutant_ast: ast.Module) -> ModuleType:
         """Creates a mutant of the module.
@@ -57,38 +94,146 @@ class MutationController:
         """
         return create_module(mutant_ast, self._module.__name__)
 
+    def create_mutant_sources(self) -> Iterator[tuple[ast.Module | int, list[Mutation]]]:
+        """Creates the sources from which the mutants of the module are created.
+
+        The source of a mutant is its AST or, if the controller uses a mutant
+        schemata, its number in the schemata.  The mutant schemata is created by
+        this method, such that processes forked afterwards can activate its mutants.
+
+        The mutant generator mutates the AST of the module in place and restores it
+        when the next mutant is requested, so a mutant AST must be used, or copied,
+        before the next source is requested.
+
+        Returns:
+            An iterator of tuples where the first entry is the source of the mutant
+            and the second part is a list of all the mutations operators applied.
+        """
+        if not self._schemata:
+            return self._create_mutant_asts()
+
+        schemata = MutantSchemata(self._module_ast, self._module.__name__)
+        mutants = [(schemata.add(mutations), mutations) for mutations, _ in self._mutate()]
+        if schemata.create_module() is None:
+            _LOGGER.info("Cannot create the mutant schemata, creating every mutant on its own")
+        else:
+            _LOGGER.info(
+                "Created a mutant schemata that activates %d of %d mutant(s)",
+                schemata.switched_count(),
+                len(mutants),
+            )
+        self._mutant_schemata = schemata
+        return (
+            (
+                number if schemata.is_switched(number) else schemata.create_mutant_ast(number),
+                mutations,
+            )
+            for number, mutations in mutants
+        )
+
+    def _create_mutant_asts(self) -> Generator[tuple[ast.Module | int, list[Mutation]]]:
+        for mutations, mutant_ast in self._mutate():
+            yield mutant_ast, mutations
+
+    def _mutate(self) -> Generator[tuple[list[Mutation], ast.Module]]:
+        redundant = self._find_redundant_mutants()
+        mutants = self._mutant_generator.mutate(self._module_ast, self._module)
+        for position, (mutations, mutant_ast) in enumerate(mutants):
+            assert isinstance(mutant_ast, ast.Module)
+            if position not in redundant:
+                yield mutations, mutant_ast
+
+    def _find_redundant_mutants(self) -> set[int]:
+        """Determines the mutants that the equivalence filter drops.
+
+        The mutants are compiled for the filter only once, when the mutants or their
+        number are requested first.  If the controller has a cache, the created
+        mutants and the dropped ones are stored in it, and later runs take the
+        dropped mutants from the cache.
+
+        Returns:
+            The positions of the dropped mutants among the mutants of the generator.
+        """
+        if self._redundant_mutants is not None:
+            return self._redundant_mutants
+        if self._cache is not None:
+            self._redundant_mutants = self._cache.load_dropped_mutants()
+            if self._redundant_mutants is not None:
+                _LOGGER.info(
+                    "Dropping the %d mutant(s) stored in the mutation analysis cache",
+                    len(self._redundant_mutants),
+                )
+                return self._redundant_mutants
+        self._redundant_mutants = set()
+        if not self._filter_equivalent and self._cache is None:
+            return self._redundant_mutants
+        equivalence_filter = (
+            EquivalentMutantFilter(self._module_ast, self._module.__name__)
+            if self._filter_equivalent
+            else None
+        )
+        created: list[list[Mutation]] = []
+        mutants = self._mutant_generator.mutate(self._module_ast, self._module)
+        for position, (mutations, mutant_ast) in enumerate(mutants):
+            assert isinstance(mutant_ast, ast.Module)
+            if equivalence_filter is not None and equivalence_filter.is_redundant(mutant_ast):
+                self._redundant_mutants.add(position)
+            else:
+                created.append(mutations)
+        if equivalence_filter is not None:
+            equivalence_filter.log_dropped()
+        if self._cache is not None:
+            self._cache.store_mutants(created, self._redundant_mutants)
+        return self._redundant_mutants
+
+    def try_create_mutant(self, source: ast.Module | int) -> ModuleType | None:
+        """Creates a mutant of the module, unless the mutated module is invalid.
+
+        Args:
+            source: The source of the mutant, see :meth:`create_mutant_sources`.
+
+        Returns:
+            The created mutant module, or None if it cannot be created.
+        """
+        if isinstance(source, int):
+            assert self._mutant_schemata is not None
+            return self._mutant_schemata.activate(source)
+        try:
+            return self.create_mutant(source)
+        except Exception as exception:  # noqa: BLE001
+            _LOGGER.debug("Error creating mutant: %s", exception)
+        except SystemExit as exception:
+            _LOGGER.debug("Caught SystemExit during mutant creation/execution: %s", exception)
+        return None
+
     def create_mutants(
         self,
     ) -> Generator[tuple[ModuleType | None, list[Mutation]]]:
         """Creates mutants for the module.
 
+        If the controller uses a mutant schemata, all mutants in the schemata are
+        the same module, in which the mutant is activated until the next mutant is
+        requested.
+
         Returns:
             A generator of tuples where the first entry is the mutated module or None
             if the mutated module cannot be created and the second part is a list of
             all the mutations operators applied.
         """
-        for mutations, mutant_ast in self._mutant_generator.mutate(self._module_ast, self._module):
-            assert isinstance(mutant_ast, ast.Module)
-
-            try:
-                mutant_module = self.create_mutant(mutant_ast)
-            except Exception as exception:  # noqa: BLE001
-                _LOGGER.debug("Error creating mutant: %s", exception)
-                mutant_module = None
-            except SystemExit as exception:
-                _LOGGER.debug("Caught SystemExit during mutant creation/execution: %s", exception)
-                mutant_module = None
-
-            yield mutant_module, mutations
+        for source, mutations in self.create_mutant_sources():
+            yield self.try_create_mutant(source), mutations
 
     def mutant_count(self) -> int:
         """Calculates the number of mutants that can be created.
 
         This is the pre-truncation total: if the mutant generator is configured
         to sample a subset (e.g. via a mutant-count cap), this still reports the
-        full number of mutations the module yields.
+        full number of mutations the module yields.  The mutants that the
+        equivalence filter drops among the created ones are not counted.
 
         Returns:
             The number of mutants that can be created.
         """
-        return self._mutant_generator.mutation_count(self._module_ast, self._module)
+        return self._mutant_generator.mutation_count(self._module_ast, self._module) - len(
+            self._find_redundant_mutants()
+        )
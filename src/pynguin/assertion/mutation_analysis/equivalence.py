@@ -0,0 +1,122 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a filter for mutants that the compiler proves trivially equivalent.
+
+Many mutants compile to the same code objects as the original module or as another
+mutant, e.g., mutants of dead code that the compiler removes or of constant
+expressions that it folds.  Executing the tests on such a mutant cannot kill it, or
+only repeats what another mutant showed.  The filter compares the compiled code
+objects of the mutants, ignoring their positions in the source, and drops the
+mutants whose code was seen before.
+"""
+
+from __future__ import annotations
+
+import logging
+from types import CodeType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import ast
+    from collections.abc import Hashable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def code_fingerprint(code: CodeType) -> Hashable:
+    """Computes a fingerprint of a code object that ignores source positions.
+
+    Two code objects with the same fingerprint behave the same: they have the same
+    bytecode, names and constants, recursively for nested code objects.
+
+    Args:
+        code: The code object
+
+    Returns:
+        The fingerprint, which can be hashed and compared
+    """
+    return (
+        code.co_code,
+        code.co_name,
+        getattr(code, "co_qualname", None),
+        code.co_flags,
+        code.co_argcount,
+        code.co_posonlyargcount,
+        code.co_kwonlyargcount,
+        code.co_nlocals,
+        code.co_names,
+        code.co_varnames,
+        code.co_freevars,
+        code.co_cellvars,
+        getattr(code, "co_exceptiontable", None),
+        tuple(_constant_fingerprint(constant) for constant in code.co_consts),
+    )
+
+
+def _constant_fingerprint(constant: object) -> Hashable:
+    # Equal constants of different types, e.g., 1 and True, or floats with equal
+    # values, e.g., 0.0 and -0.0, must not share a fingerprint.
+    if isinstance(constant, CodeType):
+        return code_fingerprint(constant)
+    if isinstance(constant, tuple):
+        return tuple, tuple(_constant_fingerprint(element) for element in constant)
+    if isinstance(constant, frozenset):
+        return frozenset, frozenset(_constant_fingerprint(element) for element in constant)
+    if isinstance(constant, float | complex):
+        return type(constant), repr(constant)
+    return type(constant), constant
+
+
+class EquivalentMutantFilter:
+    """Drops mutants whose compiled code equals the original or an earlier mutant."""
+
+    def __init__(self, module_ast: ast.Module, module_name: str) -> None:
+        """Initializes the filter.
+
+        Args:
+            module_ast: The AST of the original module
+            module_name: The name of the original module
+        """
+        self._module_name = module_name
+        self._original = code_fingerprint(compile(module_ast, module_name, "exec"))
+        self._seen = {self._original}
+        self._equivalent = 0
+        self._duplicate = 0
+
+    def is_redundant(self, mutant_ast: ast.Module) -> bool:
+        """Checks whether a mutant compiles to code that was seen before.
+
+        A mutant that cannot be compiled is never redundant, such that it is
+        reported as invalid.
+
+        Args:
+            mutant_ast: The AST of the mutant
+
+        Returns:
+            Whether the mutant is equivalent to the original module or a duplicate
+            of an earlier mutant
+        """
+        try:
+            fingerprint = code_fingerprint(compile(mutant_ast, self._module_name, "exec"))
+        except (SyntaxError, ValueError, TypeError):
+            return False
+        if fingerprint not in self._seen:
+            self._seen.add(fingerprint)
+            return False
+        if fingerprint == self._original:
+            self._equivalent += 1
+        else:
+            self._duplicate += 1
+        return True
+
+    def log_dropped(self) -> None:
+        """Logs how many mutants were dropped."""
+        _LOGGER.info(
+            "Dropped %d mutant(s) equivalent to the original module and %d duplicate mutant(s)",
+            self._equivalent,
+            self._duplicate,
+        )
@@ -22,6 +22,7 @@ from typing import TYPE_CHECKING, TypeVar
 if TYPE_CHECKING:
     import types
     from collections.abc import Callable, Generator, Iterable
+    from collections.abc import Set as AbstractSet
 
 
 def fix_lineno(node: ast.AST, fixing_node: ast.AST | None) -> None:
@@ -103,6 +104,25 @@ def shift_lines(nodes: list[T], shift_by: int = 1) -> None:
         ast.increment_lineno(node, shift_by)
 
 
+@dataclass(frozen=True)
+class MutationLocation:
+    """The lines of the module source that a mutation changes."""
+
+    first_line: int
+    last_line: int
+
+    def is_reached(self, lines: AbstractSet[int]) -> bool:
+        """Checks whether any of the lines of the mutation is in the given lines.
+
+        Args:
+            lines: The line numbers, e.g., the lines a test covered
+
+        Returns:
+            Whether the mutation is located in one of the lines
+        """
+        return any(line in lines for line in range(self.first_line, self.last_line + 1))
+
+
 @dataclass(frozen=True)
 class Mutation:
     """Represents a mutation."""
@@ -121,6 +141,39 @@ class Mutation:
         if self.visitor_name not in dir(self.operator):
             raise ValueError(f"Visitor {self.visitor_name} not found in operator {self.operator}")
 
+    @property
+    def location(self) -> MutationLocation | None:
+        """Provides the lines that the mutation changes.
+
+        The location is only provided for mutations in the body of a function,
+        which only take effect if the mutated lines are executed.  Other mutations,
+        e.g., of a decorator or of a statement of the module, take effect when the
+        mutated module is created.
+
+        Returns:
+            The location of the mutation, or None if it takes effect when the module
+            is created
+        """
+        located: ast.AST | None = None
+        child = self.node
+        parent = getattr(child, "parent", None)
+        while parent is not None:
+            if located is None and hasattr(child, "lineno"):
+                located = child
+            if (
+                isinstance(parent, ast.FunctionDef | ast.AsyncFunctionDef)
+                and any(statement is child for statement in parent.body)
+            ) or (isinstance(parent, ast.Lambda) and parent.body is child):
+                break
+            child, parent = parent, getattr(parent, "parent", None)
+        else:
+            return None
+        if located is None:
+            return None
+        first_line: int = located.lineno  # type: ignore[attr-defined]
+        last_line: int | None = getattr(located, "end_lineno", None)
+        return MutationLocation(first_line, max(first_line, last_line or first_line))
+
 
 def copy_node(node: T) -> T:
     """Copy a node.
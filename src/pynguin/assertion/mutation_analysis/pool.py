@@ -0,0 +1,327 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a pool of processes that execute the tests on mutants in parallel.
+
+The workers are forked once the tests are known, so they share the subject, the
+executor and the tests with the main process without pickling them.  For every
+mutant, the main process sends the mutated AST, or the number of the mutant in the
+mutant schemata, to an idle worker, which creates or activates the mutated module
+and executes the tests on it.  The worker reports back only
+what decides whether a test kills the mutant, i.e., whether the execution timed
+out, which exceptions it raised and which assertions it violated, but neither the
+mutated module nor the traces of the executions.  A worker that exceeds the time
+limit of its mutant is killed and replaced, and the mutant is treated as timed out.
+
+The pool can also act as a fork server, which forks a fresh worker for every
+mutant.  The worker inherits the modules the main process imported, i.e., the
+module under test and its dependencies, so it only creates the mutated module, and
+it exits after executing the tests on it, such that no state of the module under
+test carries over to the next mutant.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import multiprocess as mp
+import multiprocess.connection as mp_conn
+
+from pynguin.testcase.execution_result import ExecutionResult
+from pynguin.testcase.subprocess_executor import (
+    SubprocessTestCaseExecutor,
+    disable_tracing_while_unpickling,
+)
+from pynguin.utils.statistics.profiler import profiled_subprocess
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable
+
+    from pynguin.instrumentation.tracer import SubjectProperties
+
+    MutantResults = list[ExecutionResult | None] | None
+
+M = TypeVar("M")
+
+_LOGGER = logging.getLogger(__name__)
+
+# The seconds to wait for a worker to exit after it was asked to.
+_JOIN_TIMEOUT = 1.0
+
+
+class MutantExecutionPool(Generic[M]):
+    """A pool of forked workers that execute the tests on one mutant at a time.
+
+    A mutant is handed to a worker as its AST or its number in the mutant schemata,
+    possibly together with further data about the mutant.  The pool must be started
+    before and closed after executing mutants.
+    """
+
+    def __init__(
+        self,
+        subject_properties: SubjectProperties,
+        execute_mutant: Callable[[int, M], MutantResults],
+        number_of_tests: int,
+        number_of_workers: int,
+        *,
+        fork_per_mutant: bool = False,
+        mutant_timeout: Callable[[M], float] | None = None,
+    ) -> None:
+        """Initializes the pool.
+
+        Args:
+            subject_properties: The properties of the subject the tests execute
+            execute_mutant: The function that executes the tests on a mutant in a
+                worker, given the number of the mutant and the mutant, and provides
+                the result per test, or None if the mutant is invalid
+            number_of_tests: The number of tests executed on each mutant
+            number_of_workers: The number of workers
+            fork_per_mutant: Whether to fork a fresh worker for every mutant, which
+                exits after executing the tests on it, instead of starting the
+                workers once
+            mutant_timeout: Provides the seconds a worker may take to execute the
+                tests on a mutant before it is killed, or None to wait without limit
+        """
+        self._subject_properties = subject_properties
+        self._execute_mutant = execute_mutant
+        self._number_of_tests = number_of_tests
+        self._number_of_workers = number_of_workers
+        self._fork_per_mutant = fork_per_mutant
+        self._mutant_timeout = mutant_timeout
+        self._context: Any = None
+        self._workers: dict[mp_conn.Connection, mp.Process] = {}
+
+    def start(self) -> bool:
+        """Starts the workers.
+
+        Returns:
+            Whether the workers were started
+        """
+        try:
+            self._context = mp.get_context("fork")
+        except ValueError:
+            _LOGGER.warning(
+                "Parallel mutation analysis requires the fork start method, "
+                "executing the mutants sequentially"
+            )
+            return False
+        if self._fork_per_mutant:
+            _LOGGER.info(
+                "Forking a mutation analysis worker per mutant, at most %d at a time",
+                self._number_of_workers,
+            )
+            return True
+        for _ in range(self._number_of_workers):
+            self._start_worker()
+        _LOGGER.info("Started %d mutation analysis workers", self._number_of_workers)
+        return True
+
+    def execute(
+        self,
+        mutants: Iterable[M],
+        stop: Callable[[], bool],
+    ) -> Generator[MutantResults, None, None]:
+        """Executes the tests on the mutants.
+
+        A mutant is handed to a worker as soon as a worker is idle, unless the stop
+        condition holds; the mutants handed out before still finish.  A mutant is
+        sent before the next one is requested, so the mutants may share their AST.
+        A worker that exceeds the time limit of its mutant is killed, and the mutant
+        is reported as timed out.
+
+        Args:
+            mutants: The mutants
+            stop: The condition to stop handing out mutants
+
+        Yields:
+            The results of the mutants that were handed out, in the order of the
+            mutants
+        """
+        numbered = iter(enumerate(mutants, start=1))
+        # The idle workers; None stands for a worker yet to be forked for a mutant.
+        idle: list[mp_conn.Connection | None] = (
+            [None] * self._number_of_workers if self._fork_per_mutant else list(self._workers)
+        )
+        # The number of the mutant and the deadline of each busy worker.
+        busy: dict[mp_conn.Connection, tuple[int, float]] = {}
+        finished: dict[int, MutantResults] = {}
+        next_to_yield = 1
+        exhausted = False
+        while True:
+            while idle and not exhausted:
+                if stop() or (mutant := next(numbered, None)) is None:
+                    exhausted = True
+                    break
+                connection = idle.pop()
+                if connection is None:
+                    connection = self._fork_worker(mutant)
+                else:
+                    connection = self._send(connection, mutant)
+                busy[connection] = mutant[0], self._deadline(mutant[1])
+            if not busy:
+                return
+            for connection in self._wait(busy):
+                index, _ = busy.pop(connection)
+                finished[index] = self._receive(connection, index)
+                if self._fork_per_mutant:
+                    self._stop_worker(connection)
+                    idle.append(None)
+                elif connection in self._workers:
+                    idle.append(connection)
+                else:
+                    idle.append(self._start_worker())
+            while next_to_yield in finished:
+                yield finished.pop(next_to_yield)
+                next_to_yield += 1
+
+    def _send(self, connection: mp_conn.Connection, mutant: tuple[int, M]) -> mp_conn.Connection:
+        """Sends a mutant to an idle worker, which is replaced if it died meanwhile.
+
+        Args:
+            connection: The connection to the idle worker
+            mutant: The number of the mutant and the mutant
+
+        Returns:
+            The connection to the worker the mutant was sent to
+        """
+        try:
+            connection.send(mutant)
+        except OSError:
+            _LOGGER.warning(
+                "Idle mutation analysis worker died, restarting it for mutant %i", mutant[0]
+            )
+            self._stop_worker(connection)
+            connection = self._start_worker()
+            connection.send(mutant)
+        return connection
+
+    def _deadline(self, mutant: M) -> float:
+        if self._mutant_timeout is None:
+            return math.inf
+        return time.monotonic() + self._mutant_timeout(mutant)
+
+    def _wait(self, busy: dict[mp_conn.Connection, tuple[int, float]]) -> list[mp_conn.Connection]:
+        """Waits until a busy worker reported back or exceeded its deadline.
+
+        The workers that exceeded their deadline are killed, such that receiving from
+        them fails like receiving from a crashed worker.
+
+        Args:
+            busy: The number of the mutant and the deadline of each busy worker
+
+        Returns:
+            The connections of the workers that reported back or were killed
+        """
+        deadline = min(worker_deadline for _, worker_deadline in busy.values())
+        ready: list[mp_conn.Connection] = mp_conn.wait(
+            list(busy),
+            timeout=None if math.isinf(deadline) else max(0.0, deadline - time.monotonic()),
+        )
+        now = time.monotonic()
+        for connection, (index, worker_deadline) in busy.items():
+            if worker_deadline <= now and connection not in ready:
+                _LOGGER.warning(
+                    "Mutation analysis worker exceeded its time limit on mutant %i, killing it",
+                    index,
+                )
+                worker = self._workers[connection]
+                worker.kill()
+                worker.join(timeout=_JOIN_TIMEOUT)
+                ready.append(connection)
+        return ready
+
+    def close(self) -> None:
+        """Stops the workers."""
+        for connection in list(self._workers):
+            self._stop_worker(connection)
+
+    def _stop_worker(self, connection: mp_conn.Connection) -> None:
+        worker = self._workers.pop(connection)
+        with contextlib.suppress(OSError):
+            connection.send(None)
+        worker.join(timeout=_JOIN_TIMEOUT)
+        if worker.exitcode is None:
+            worker.kill()
+            worker.join(timeout=_JOIN_TIMEOUT)
+        connection.close()
+
+    def _start_worker(self) -> mp_conn.Connection:
+        connection, worker_connection = self._context.Pipe()
+        # Not a daemon, such that the subprocess executor can start subprocesses.
+        worker = self._context.Process(target=self._run_worker, args=(worker_connection,))
+        worker.start()
+        worker_connection.close()
+        self._workers[connection] = worker
+        return connection
+
+    def _fork_worker(self, mutant: tuple[int, M]) -> mp_conn.Connection:
+        connection, worker_connection = self._context.Pipe()
+        # The worker inherits the mutant, which is thus not pickled.
+        worker = self._context.Process(
+            target=self._run_forked_worker, args=(worker_connection, mutant)
+        )
+        worker.start()
+        worker_connection.close()
+        self._workers[connection] = worker
+        return connection
+
+    def _receive(self, connection: mp_conn.Connection, index: int) -> MutantResults:
+        try:
+            with disable_tracing_while_unpickling(self._subject_properties):
+                return connection.recv()
+        except (EOFError, OSError):
+            _LOGGER.warning(
+                "Mutation analysis worker crashed or was killed on mutant %i, continuing "
+                "as if a timeout occurred",
+                index,
+            )
+        if not self._fork_per_mutant:
+            worker = self._workers.pop(connection)
+            worker.join(timeout=_JOIN_TIMEOUT)
+            connection.close()
+        return [ExecutionResult(timeout=True)] + [None] * (self._number_of_tests - 1)
+
+    @profiled_subprocess("mutation analysis worker")
+    def _run_worker(self, connection: mp_conn.Connection) -> None:
+        while (mutant := connection.recv()) is not None:
+            self._execute_and_send(connection, mutant)
+
+    @profiled_subprocess("mutation analysis worker")
+    def _run_forked_worker(self, connection: mp_conn.Connection, mutant: tuple[int, M]) -> None:
+        self._execute_and_send(connection, mutant)
+
+    def _execute_and_send(self, connection: mp_conn.Connection, mutant: tuple[int, M]) -> None:
+        index, payload = mutant
+        results = self._execute_mutant(index, payload)
+        if results is not None:
+            results = [None if result is None else _kill_vector(result) for result in results]
+        # Pickling can execute code of the instrumented module, see the subprocess
+        # executor.
+        with self._subject_properties.instrumentation_tracer:
+            for result in results or ():
+                if result is not None:
+                    SubprocessTestCaseExecutor._fix_result_for_pickle(result)  # noqa: SLF001
+            connection.send(results)
+
+
+def _kill_vector(result: ExecutionResult) -> ExecutionResult:
+    """Reduces a result to the parts that decide whether a test kills a mutant.
+
+    Args:
+        result: The result of executing a test on a mutant
+
+    Returns:
+        A result with the timeout, exceptions and assertion verification of the
+        given result, and empty traces otherwise
+    """
+    reduced = ExecutionResult(timeout=result.timeout)
+    reduced.exceptions = result.exceptions
+    reduced.assertion_verification_trace = result.assertion_verification_trace
+    return reduced
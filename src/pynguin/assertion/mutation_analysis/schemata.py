@@ -0,0 +1,346 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides mutant schemata, i.e., a single module that contains many mutants.
+
+Creating a mutant compiles its AST and executes the resulting module, including all
+imports and statements of the module.  A mutant schemata instead is a single
+meta-module, in which the code at every mutation point is guarded by a switch on the
+number of the active mutant, e.g., ``a + b`` becomes
+``(a - b) if _pynguin_active_mutant == 3 else (a + b)``.  The meta-module is created
+only once, and activating a mutant just sets the switch.
+
+Only mutations in the body of a function, see :attr:`Mutation.location`, can be
+switched, because the body is executed after the switch is set.  A mutant that
+mutates other code, or whose switch is already evaluated while the meta-module is
+created, e.g., because a function is called by a statement of the module, is
+created from its own AST instead.
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+from typing import TYPE_CHECKING, Any
+
+from pynguin.assertion.mutation_analysis.transformer import create_module
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import ModuleType
+
+    from pynguin.assertion.mutation_analysis.operators.base import Mutation
+
+_LOGGER = logging.getLogger(__name__)
+
+SWITCH_NAME = "_pynguin_active_mutant"
+"""The name of the global variable of the meta-module holding the active mutant."""
+
+
+class MutantSchemata:
+    """Collects mutants and creates a meta-module that contains the switchable ones.
+
+    The mutants are added while the mutator yields them, because a mutant is only
+    available while the AST of the module is mutated.
+    """
+
+    def __init__(self, module_ast: ast.Module, module_name: str) -> None:
+        """Initializes the schemata.
+
+        Args:
+            module_ast: The AST of the module to mutate
+            module_name: The name of the module to mutate
+        """
+        self._module_ast = module_ast
+        self._module_name = module_name
+        # The mutation points of each mutant together with a copy of their mutated
+        # code.
+        self._mutants: list[list[tuple[ast.AST, ast.AST]]] = []
+        self._switched: list[bool] = []
+        self._module: ModuleType | None = None
+
+    def add(self, mutations: list[Mutation]) -> int:
+        """Adds the mutant the AST of the module is currently mutated to.
+
+        Args:
+            mutations: The mutations applied to create the mutant
+
+        Returns:
+            The number of the mutant, starting from 1
+        """
+        points: list[tuple[ast.AST, ast.AST]] = []
+        for mutation in mutations:
+            point = _mutation_point(mutation.node)
+            mutated = mutation.replacement_node if point is mutation.node else point
+            points.append((point, _copy_tree(mutated)))
+        self._mutants.append(points)
+        self._switched.append(
+            bool(mutations) and all(mutation.location is not None for mutation in mutations)
+        )
+        return len(self._mutants)
+
+    def is_switched(self, number: int) -> bool:
+        """Checks whether a mutant is activated by the switch of the meta-module.
+
+        Args:
+            number: The number of the mutant
+
+        Returns:
+            Whether the mutant is part of the meta-module
+        """
+        return self._module is not None and self._switched[number - 1]
+
+    def create_module(self) -> ModuleType | None:
+        """Creates the meta-module from the mutants added so far.
+
+        Returns:
+            The meta-module, or None if it cannot be created
+        """
+        numbers = self._compilable([
+            number for number, switched in enumerate(self._switched, start=1) if switched
+        ])
+        self._switched = [number in numbers for number in range(1, len(self._mutants) + 1)]
+        probe = _SwitchProbe()
+        try:
+            module = create_module(
+                self._create_meta_ast(numbers), self._module_name, {SWITCH_NAME: probe}
+            )
+        except Exception as exception:  # noqa: BLE001
+            _LOGGER.debug("Error creating mutant schemata: %s", exception)
+            return None
+        except SystemExit as exception:
+            _LOGGER.debug("Caught SystemExit during mutant schemata creation: %s", exception)
+            return None
+        setattr(module, SWITCH_NAME, 0)
+        for number in probe.evaluated:
+            self._switched[number - 1] = False
+        self._module = module
+        return module
+
+    def activate(self, number: int) -> ModuleType:
+        """Activates a mutant of the meta-module.
+
+        Args:
+            number: The number of the mutant, which must be switched
+
+        Returns:
+            The meta-module
+        """
+        assert self._module is not None
+        assert self._switched[number - 1]
+        setattr(self._module, SWITCH_NAME, number)
+        return self._module
+
+    def create_mutant_ast(self, number: int) -> ast.Module:
+        """Creates the AST of a single mutant.
+
+        Args:
+            number: The number of the mutant
+
+        Returns:
+            The AST of the module mutated by the mutations of the mutant
+        """
+        tree = _TreeCopy(self._module_ast)
+        for point, mutated in self._mutants[number - 1]:
+            tree.replace(point, _copy_tree(mutated))
+        return ast.fix_missing_locations(tree.root)
+
+    def switched_count(self) -> int:
+        """Counts the mutants that are activated by the switch of the meta-module.
+
+        Returns:
+            The number of switched mutants
+        """
+        return sum(self._switched) if self._module is not None else 0
+
+    def _compilable(self, numbers: list[int]) -> set[int]:
+        """Selects the mutants whose code can be compiled.
+
+        The code of a mutant may not compile, e.g., because a mutation operator
+        created nodes with invalid positions.  Such a mutant is also invalid when it
+        is created on its own.  It is found by bisecting the mutants, such that the
+        other mutants stay in the meta-module.
+
+        Args:
+            numbers: The numbers of the mutants to check
+
+        Returns:
+            The numbers of the mutants whose code compiles
+        """
+        try:
+            compile(self._create_meta_ast(numbers), self._module_name, "exec")
+        except (SyntaxError, ValueError, TypeError):
+            if len(numbers) <= 1:
+                return set()
+            middle = len(numbers) // 2
+            return self._compilable(numbers[:middle]) | self._compilable(numbers[middle:])
+        return set(numbers)
+
+    def _create_meta_ast(self, numbers: Iterable[int]) -> ast.Module:
+        variants: dict[int, tuple[ast.AST, list[tuple[int, ast.AST]]]] = {}
+        for number in sorted(numbers):
+            for point, mutated in self._mutants[number - 1]:
+                variants.setdefault(id(point), (point, []))[1].append((
+                    number,
+                    _copy_tree(mutated),
+                ))
+        tree = _TreeCopy(self._module_ast)
+        for point, mutants in variants.values():
+            tree.replace(point, _guard(tree.copy_of(point), mutants))
+        return ast.fix_missing_locations(tree.root)
+
+
+class _SwitchProbe:
+    """Stands in for the active mutant while the meta-module is created.
+
+    It records the mutants whose switch is evaluated, which the meta-module cannot
+    activate later on.
+    """
+
+    def __init__(self) -> None:
+        self.evaluated: set[int] = set()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, int):
+            self.evaluated.add(other)
+        return False
+
+    __hash__ = object.__hash__
+
+
+class _TreeCopy:
+    """A copy of an AST that can replace the copies of nodes of the original AST."""
+
+    def __init__(self, original: ast.Module) -> None:
+        self._copies: dict[int, ast.AST] = {}
+        # The parent, field and index in a list field of each copied node.
+        self._positions: dict[int, tuple[ast.AST, str, int | None]] = {}
+        root = self._copy(original)
+        assert isinstance(root, ast.Module)
+        self.root = root
+
+    def copy_of(self, node: ast.AST) -> ast.AST:
+        return self._copies[id(node)]
+
+    def replace(self, node: ast.AST, replacement: ast.AST) -> None:
+        parent, field, index = self._positions[id(self.copy_of(node))]
+        if index is None:
+            setattr(parent, field, replacement)
+        else:
+            getattr(parent, field)[index] = replacement
+
+    def _copy(self, node: ast.AST) -> ast.AST:
+        fields: dict[str, Any] = {}
+        children: list[tuple[ast.AST, str, int | None]] = []
+        for field, value in ast.iter_fields(node):
+            if isinstance(value, ast.AST):
+                fields[field] = self._copy(value)
+                children.append((fields[field], field, None))
+            elif isinstance(value, list):
+                fields[field] = [
+                    self._copy(element) if isinstance(element, ast.AST) else element
+                    for element in value
+                ]
+                children.extend(
+                    (element, field, index)
+                    for index, element in enumerate(fields[field])
+                    if isinstance(element, ast.AST)
+                )
+            else:
+                fields[field] = value
+        copied = type(node)(**fields)
+        _copy_attributes(node, copied)
+        for child, field, index in children:
+            self._positions[id(child)] = (copied, field, index)
+        self._copies[id(node)] = copied
+        return copied
+
+
+def _copy_tree(node: ast.AST) -> ast.AST:
+    """Copies the fields of an AST, but not the parent links of its nodes.
+
+    Args:
+        node: The root of the AST
+
+    Returns:
+        The copy
+    """
+    fields: dict[str, Any] = {}
+    for field, value in ast.iter_fields(node):
+        if isinstance(value, ast.AST):
+            fields[field] = _copy_tree(value)
+        elif isinstance(value, list):
+            fields[field] = [
+                _copy_tree(element) if isinstance(element, ast.AST) else element
+                for element in value
+            ]
+        else:
+            fields[field] = value
+    copied = type(node)(**fields)
+    _copy_attributes(node, copied)
+    return copied
+
+
+def _copy_attributes(node: ast.AST, copied: ast.AST) -> None:
+    for attribute in node._attributes:  # noqa: SLF001
+        if hasattr(node, attribute):
+            setattr(copied, attribute, getattr(node, attribute))
+
+
+def _mutation_point(node: ast.AST) -> ast.AST:
+    """Determines the node whose code a switch can choose.
+
+    This is the innermost expression or statement containing the mutated node, but
+    not an expression that can only occur in its place, e.g., an assignment target,
+    a slice or a pattern of a match statement.
+
+    Args:
+        node: The mutated node
+
+    Returns:
+        The mutation point
+    """
+    point = node
+    while not isinstance(point, ast.stmt) and not (
+        isinstance(point, ast.expr) and _can_switch(point, point.parent)  # type: ignore[attr-defined]
+    ):
+        point = point.parent  # type: ignore[attr-defined]
+    return point
+
+
+def _can_switch(expression: ast.expr, parent: ast.AST) -> bool:
+    return not (
+        not isinstance(getattr(expression, "ctx", ast.Load()), ast.Load)
+        or isinstance(expression, ast.Slice | ast.Starred)
+        or isinstance(parent, ast.JoinedStr | ast.pattern)
+        or (isinstance(expression, ast.JoinedStr) and isinstance(parent, ast.FormattedValue))
+    )
+
+
+def _guard(original: ast.AST, mutants: list[tuple[int, ast.AST]]) -> ast.AST:
+    """Guards the original code and its mutated versions by the switch.
+
+    Args:
+        original: The original code at a mutation point
+        mutants: The numbers of the mutants together with their code at the point
+
+    Returns:
+        The guarded code
+    """
+    guarded: Any = original
+    for number, mutated in reversed(mutants):
+        test = ast.Compare(
+            left=ast.Name(id=SWITCH_NAME, ctx=ast.Load()),
+            ops=[ast.Eq()],
+            comparators=[ast.Constant(value=number)],
+        )
+        if isinstance(original, ast.expr):
+            guarded = ast.IfExp(test=test, body=mutated, orelse=guarded)
+        else:
+            guarded = ast.If(test=test, body=[mutated], orelse=[guarded])
+        for node in (guarded, *ast.walk(test)):
+            ast.copy_location(node, original)
+    return guarded
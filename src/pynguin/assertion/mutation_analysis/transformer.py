@@ -13,21 +13,28 @@ and integrated in Pynguin.
 import ast
 import copy
 import types
-from typing import TypeVar
+from typing import Any, TypeVar
 
 
-def create_module(ast_node: ast.Module, module_name: str) -> types.ModuleType:
+def create_module(
+    ast_node: ast.Module,
+    module_name: str,
+    variables: dict[str, Any] | None = None,
+) -> types.ModuleType:
     """Creates a module from an AST node.
 
     Args:
         ast_node: The AST node.
         module_name: The name of the module.
+        variables: The global variables to define before the module is executed.
 
     Returns:
         The created module.
     """
     code = compile(ast_node, module_name, "exec")
     module = types.ModuleType(module_name)
+    if variables is not None:
+        module.__dict__.update(variables)
     exec(code, module.__dict__)  # noqa: S102
     return module
 
@@ -26,6 +26,7 @@ from rich.traceback import install
 import pynguin.configuration as config
 from pynguin.__version__ import __version__
 from pynguin.generator import run_pynguin, set_configuration
+from pynguin.master_worker.batch import run_batch
 from pynguin.master_worker.client import run_pynguin_with_master_worker
 from pynguin.utils.configuration_writer import write_configuration
 from pynguin.utils.logging_utils import (
@@ -42,7 +43,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-def _create_argument_parser() -> argparse.ArgumentParser:
+def _create_argument_parser(*, batch: bool = False) -> argparse.ArgumentParser:
     parser = simple_parsing.ArgumentParser(
         add_option_string_dash_variants=simple_parsing.DashVariant.UNDERSCORE_AND_DASH,
         argument_generation_mode=simple_parsing.ArgumentGenerationMode.BOTH,
@@ -75,6 +76,8 @@ def _create_argument_parser() -> argparse.ArgumentParser:
         type=Path,
     )
     parser.add_arguments(config.Configuration, dest="config")
+    if batch:
+        parser.add_arguments(config.BatchConfiguration, dest="batch")
 
     return parser
 
@@ -180,21 +183,9 @@ def _setup_logging(
 _DANGER_ENV = "PYNGUIN_DANGER_AWARE"
 
 
-def main(argv: list[str] | None = None) -> int:
-    """Entry point for the CLI of the Pynguin automatic unit test generation framework.
-
-    This method behaves like a standard UNIX command-line application, i.e.,
-    the return value `0` signals a successful execution.  Any other return value
-    signals some errors.  This is, e.g., the case if the framework was not able
-    to generate one successfully running test case for the class under test.
-
-    Args:
-        argv: List of command-line arguments
-
-    Returns:
-        An integer representing the success of the program run.  0 means
-        success, all non-zero exit codes indicate errors.
-    """
+def _parse_and_set_up(
+    argv: list[str] | None, *, batch: bool
+) -> tuple[argparse.Namespace, Console | None] | None:
     if _DANGER_ENV not in os.environ:
         print(  # noqa: T201
             f"""Environment variable '{_DANGER_ENV}' not set.
@@ -203,7 +194,7 @@ Please refer to the documentation
 (https://pynguin.readthedocs.io/en/latest/user/quickstart.html)
 to see why this happens and what you must do to prevent it."""
         )
-        return -1
+        return None
 
     if argv is None:
         argv = sys.argv
@@ -211,7 +202,7 @@ to see why this happens and what you must do to prevent it."""
         argv.append("--help")
     argv = _expand_arguments_if_necessary(argv[1:])
 
-    argument_parser = _create_argument_parser()
+    argument_parser = _create_argument_parser(batch=batch)
     parsed = argument_parser.parse_args(argv)
 
     _setup_output_path(parsed.config.test_case_output.output_path)
@@ -224,6 +215,27 @@ to see why this happens and what you must do to prevent it."""
 
     set_configuration(parsed.config)
     write_configuration()
+    return parsed, console
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the CLI of the Pynguin automatic unit test generation framework.
+
+    This method behaves like a standard UNIX command-line application, i.e.,
+    the return value `0` signals a successful execution.  Any other return value
+    signals some errors.  This is, e.g., the case if the framework was not able
+    to generate one successfully running test case for the class under test.
+
+    Args:
+        argv: List of command-line arguments
+
+    Returns:
+        An integer representing the success of the program run.  0 means
+        success, all non-zero exit codes indicate errors.
+    """
+    if (setup := _parse_and_set_up(argv, batch=False)) is None:
+        return -1
+    parsed, console = setup
 
     use_master_worker = parsed.config.use_master_worker
     message = (
@@ -245,6 +257,29 @@ to see why this happens and what you must do to prevent it."""
         return run_pynguin().value
 
 
+def batch_main(argv: list[str] | None = None) -> int:
+    """Entry point for the batch mode, which generates tests for a whole package.
+
+    The module name denotes the package, and the maximum search time is the time
+    budget of the whole package, which is split among its modules.
+
+    Args:
+        argv: List of command-line arguments
+
+    Returns:
+        An integer representing the success of the program run.  0 means
+        success, all non-zero exit codes indicate errors.
+    """
+    if (setup := _parse_and_set_up(argv, batch=True)) is None:
+        return -1
+    parsed, console = setup
+
+    if console is not None:
+        with console.status("Running Pynguin in batch mode..."):
+            return run_batch(parsed.config, parsed.batch).value
+    return run_batch(parsed.config, parsed.batch).value
+
+
 if __name__ == "__main__":
     import multiprocess as mp
 
@@ -315,6 +315,17 @@ class StatisticsOutputConfiguration:
     Use with caution: Converting pynguin internal representation to a pytest test case
     and writing it to a file is expensive and leads to lower iterations/coverage."""
 
+    profile: bool = False
+    """Run a sampling profiler in the main process and in the subprocesses that
+    execute test cases.  The sampled stacks are written to the report directory in
+    the collapsed-stack format, both for the whole run and per phase (generation,
+    execution, assertion generation, minimization, export), such that they can be
+    rendered as flame graphs to tell apart the time spent in Pynguin and in the SUT."""
+
+    profile_sampling_interval: int = 5_000_000
+    """Interval in nano-seconds of CPU time between two samples of the profiler.
+    The default value is every 5ms."""
+
 
 @dataclasses.dataclass
 class Minimization:
@@ -379,6 +390,52 @@ class TestCaseOutputConfiguration:
     module yields more mutants, a seeded random sample of this size is used
     (-1 = unlimited)."""
 
+    mutation_workers: int = 1
+    """The number of processes that execute the tests on the mutants in parallel.
+    Every worker receives the AST of a mutant, creates the mutated module from it
+    and reports back only the outcome of the tests.  Requires the fork start
+    method."""
+
+    mutation_fork_server: bool = False
+    """If the tests are executed in subprocesses, fork a fresh process for every
+    mutant instead of starting a subprocess per execution of the tests on it.  The
+    process inherits the module under test and its dependencies from Pynguin, so it
+    only creates the mutated module, executes all tests on it and reports back only
+    their outcome.  No state of the module under test carries over between mutants.
+    At most ``mutation_workers`` processes run at a time.  A process that exceeds the
+    summed timeouts of its tests is killed and the mutant counts as timed out.
+    Requires the fork start method."""
+
+    mutation_test_selection: bool = True
+    """Execute on a mutant only the tests that reached the mutated lines when they
+    were executed on the original module, i.e., that covered these lines, or, if the
+    lines are not instrumented, that executed the function containing them.  The
+    other tests cannot kill the mutant; it survives them without executing them."""
+
+    mutant_schemata: bool = False
+    """Create the mutants in a mutant schemata, i.e., a single module in which the
+    code at every mutation point is guarded by a switch on the active mutant.  The
+    module is created once, and activating a mutant only sets the switch, instead
+    of compiling and executing a module per mutant.  Mutants of code that is not
+    part of a function body are still created on their own.  The mutants share the
+    global state of the module."""
+
+    filter_equivalent_mutants: bool = True
+    """Drop the mutants whose compiled code equals the code of the original module,
+    e.g., mutants of dead code, or of an earlier mutant before executing the tests
+    on them.  Source positions are ignored when comparing the code.  The dropped
+    mutants are not part of the mutation score."""
+
+    mutation_cache_directory: str = ""
+    """Directory of the mutation analysis cache kept across runs.  If set, Pynguin
+    stores the mutants of the module, including those the equivalence filter drops,
+    and the outcome of every test on every mutant.  On later runs, it takes the
+    dropped mutants from the cache and only executes the tests on the mutants whose
+    outcome is not stored yet, i.e., for new or changed tests.  Timeouts are not
+    stored, so tests that timed out on a mutant are executed on it again.  The cache
+    is keyed by the source code of the module and the settings of the mutant
+    generation."""
+
     post_process: bool = True
     """Should the results be post processed? For example, truncate test cases after
     statements that raise an exception."""
@@ -434,6 +491,11 @@ class SeedingConfiguration:
     """Number of how often the testcases collected by initial population seeding should
     be mutated to promote diversity"""
 
+    corpus_directory: str = ""
+    """Directory of the test corpus kept across runs.  If set, Pynguin replays the
+    stored tests of the module under test, only targets the goals of new or changed
+    functions and stores the generated tests for the next run."""
+
     dynamic_constant_seeding: bool = True
     """Enables seeding of constants at runtime."""
 
@@ -506,6 +568,15 @@ class MIOConfiguration:
     """Percentage ]0,1] of search budget after which exploitation is activated, i.e.,
     switching to focused phase."""
 
+    number_of_workers: int = 1
+    """The number of processes that sample, mutate and execute test cases in parallel.
+    Every worker keeps a replica of the archive; the replicas are synchronised
+    periodically.  Requires the fork start method."""
+
+    synchronization_interval: int = 20
+    """The number of test cases each worker evaluates between two synchronisations
+    of the archive replicas."""
+
 
 @dataclasses.dataclass
 class RandomConfiguration:
@@ -817,6 +888,25 @@ class SearchAlgorithmConfiguration:
     number_of_mutations: int = 3
     """Number of mutations that should be applied in one breeding step."""
 
+    number_of_islands: int = 1
+    """Number of populations DynaMOSA evolves in parallel, each in its own process.
+    Values larger than one enable the island model, which requires the fork start
+    method of multiprocessing."""
+
+    island_migration_interval: int = 10
+    """Number of generations after which an island shares its newly covering tests
+    with the other islands and sends its elite individuals to the next island."""
+
+    island_migration_size: int = 2
+    """Number of elite individuals an island sends to the next island when
+    migrating."""
+
+    checkpoint_interval: int = 0
+    """Number of seconds between two checkpoints of the search state, 0 disables
+    checkpointing.  The checkpoint is stored in the report directory; a search for
+    the same module with the same algorithm and seed resumes from it.  Only
+    supported by the MOSA-based algorithms and MIO."""
+
 
 @dataclasses.dataclass
 class StringStatementConfiguration:
@@ -1024,6 +1114,18 @@ class LocalSearchConfiguration:
     """The factor which defines how much the delta should increase for each iteration for integer
     local search."""
 
+    ls_batch_size: int = 1
+    """The number of candidate values of a primitive statement that are executed together
+    in one batch, e.g., the next steps of an increasing delta.  Batches save round-trips
+    to the subprocess executor at the cost of executing candidates that are never
+    evaluated, because the search stopped before them.  A value of 1 disables batching."""
+
+    ls_reuse_prefix: bool = False
+    """Whether the candidate values of a primitive statement are executed on top of a
+    single execution of the statements before it.  A forked worker keeps the state after
+    these statements, and each candidate is executed in a fork of it, which executes
+    only the statement and the statements after it.  Requires the fork start method."""
+
     ls_string_random_mutation_count: int = 10
     """The number of mutations made to the string to determine if it's worth to completely mutate
     the string."""
@@ -1133,6 +1235,27 @@ class LLMRefinementConfiguration:
     or unparseable module-level response falls back automatically to the per-test path."""
 
 
+@dataclasses.dataclass
+class BatchConfiguration:
+    """Configuration of the batch mode, which generates tests for all modules of a package.
+
+    In batch mode, the module name denotes the package and the maximum search time is
+    the time budget of the whole package.
+    """
+
+    batch_workers: int = 1
+    """Number of modules for which tests are generated in parallel."""
+
+    batch_plateau_iterations: int = 100
+    """Stop the search on a module once its coverage did not change for this many
+    iterations, and reassign the remaining search time of the module to the modules
+    that did not start yet.  Only applies if no maximum coverage plateau is
+    configured; -1 disables it."""
+
+    batch_minimum_search_time: int = 10
+    """Minimum search time in seconds of every module."""
+
+
 @dataclasses.dataclass
 class Configuration:
     """General configuration for the test generator."""
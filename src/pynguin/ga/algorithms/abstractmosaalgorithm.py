@@ -15,12 +15,15 @@ from typing import TYPE_CHECKING, cast
 import pynguin.configuration as config
 import pynguin.ga.computations as ff
 import pynguin.ga.testcasechromosome as tcc
+import pynguin.utils.statistics.stats as stat
 from pynguin.ga.algorithms.archive import CoverageArchive
 from pynguin.ga.algorithms.generationalgorithm import GenerationAlgorithm
 from pynguin.ga.operators.comparator import DominanceComparator
 from pynguin.ga.operators.ranking import fast_epsilon_dominance_assignment
 from pynguin.utils import randomness
 from pynguin.utils.exceptions import ConstructionFailedException
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+from pynguin.utils.statistics.searchphases import SearchPhase, measured
 
 if TYPE_CHECKING:
     import pynguin.ga.chromosomefactory as cf
@@ -36,7 +39,10 @@ class AbstractMOSAAlgorithm(GenerationAlgorithm[CoverageArchive], ABC):
         super().__init__()
         self._population: list[tcc.TestCaseChromosome] = []
         self._number_of_goals = -1
+        self._bred_offspring = 0
+        self._avoided_executions = 0
 
+    @measured(SearchPhase.BREEDING)
     def _breed_next_generation(  # noqa: C901
         self,
         factory: cf.ChromosomeFactory | None = None,
@@ -86,9 +92,52 @@ class AbstractMOSAAlgorithm(GenerationAlgorithm[CoverageArchive], ABC):
             if tch.changed and tch.size() > 0:
                 offspring_population.append(tch)
 
+        offspring_population = self._deduplicate_offspring(offspring_population)
         self._logger.debug("Number of offsprings = %d", len(offspring_population))
         return offspring_population
 
+    def _deduplicate_offspring(
+        self, offspring_population: list[tcc.TestCaseChromosome]
+    ) -> list[tcc.TestCaseChromosome]:
+        """Avoids executing offspring whose test case was already evaluated or bred.
+
+        Offspring equal to an evaluated member of the population or the archive take
+        over its execution result and fitness values.  Offspring equal to an earlier
+        offspring of the same generation are dropped, as the earlier one is executed
+        anyway.  Test cases are compared by their per-statement code, which is cached
+        across clones.
+
+        Args:
+            offspring_population: The bred offspring
+
+        Returns:
+            The offspring without duplicates
+        """
+        evaluated: dict[tuple[str, ...], tcc.TestCaseChromosome] = {}
+        for chromosome in (*self._population, *self._archive.solutions):
+            if not chromosome.changed and chromosome.get_last_execution_result() is not None:
+                evaluated.setdefault(chromosome.test_case.statement_codes(), chromosome)
+        bred: set[tuple[str, ...]] = set()
+        unique: list[tcc.TestCaseChromosome] = []
+        for offspring in offspring_population:
+            key = offspring.test_case.statement_codes()
+            if key in bred:
+                continue
+            bred.add(key)
+            if (twin := evaluated.get(key)) is not None:
+                offspring.reuse_evaluation_of(twin)
+            unique.append(offspring)
+        avoided = len(offspring_population) - sum(offspring.changed for offspring in unique)
+        self._bred_offspring += len(offspring_population)
+        self._avoided_executions += avoided
+        stat.add_to_runtime_variable(RuntimeVariable.AvoidedExecutions, avoided)
+        if self._bred_offspring > 0:
+            stat.set_output_variable_for_runtime_variable(
+                RuntimeVariable.AvoidedExecutionRate,
+                self._avoided_executions / self._bred_offspring,
+            )
+        return unique
+
     @staticmethod
     def _mutate(offspring: tcc.TestCaseChromosome) -> None:
         offspring.mutate()
@@ -120,9 +169,15 @@ class AbstractMOSAAlgorithm(GenerationAlgorithm[CoverageArchive], ABC):
                     next_front.remove(dominated_solution)
         return next_front
 
+    @property
+    def population(self) -> list[tcc.TestCaseChromosome]:  # noqa: D102
+        return list(self._population)
+
     def _get_random_population(self) -> list[tcc.TestCaseChromosome]:
-        population: list[tcc.TestCaseChromosome] = []
-        for _ in range(config.configuration.search_algorithm.population):
+        # The test cases of a resumed search are all part of the first population,
+        # even if there are more of them than the configured population size.
+        population: list[tcc.TestCaseChromosome] = self._take_resumed_chromosomes()
+        for _ in range(config.configuration.search_algorithm.population - len(population)):
             chromosome = self._chromosome_factory.get_chromosome()
             population.append(chromosome)
         return population
@@ -10,18 +10,22 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import pynguin.ga.coveragegoals as bg
 from pynguin.ga.fitness_metrics import normalise
 from pynguin.utils import randomness
 from pynguin.utils.orderedset import OrderedSet
+from pynguin.utils.statistics.searchphases import SearchPhase, measured
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
 
     import pynguin.ga.computations as ff
     import pynguin.ga.testcasechromosome as tcc
+    from pynguin.testcase.execution import ExecutionResult
 
 
 class Archive(ABC):
@@ -75,6 +79,78 @@ class Archive(ABC):
             callback(target)
 
 
+class GoalIndex:
+    """Indexes coverage goals by the parts of an execution trace that can cover them.
+
+    A branch or branch-less code-object goal can only be covered by an execution that
+    entered the goal's code object, and a line or checked-line goal only by an
+    execution that covered, respectively checked, the goal's line.  Looking up the
+    goals of an execution result thus only visits what its trace touched.  Goals of
+    other fitness functions are not indexed and are always considered.
+    """
+
+    def __init__(self, goals: Iterable[ff.TestCaseFitnessFunction] = ()) -> None:
+        """Initializes the index.
+
+        Args:
+            goals: The goals to index initially
+        """
+        self._by_code_object: defaultdict[int, list[ff.TestCaseFitnessFunction]] = defaultdict(list)
+        self._by_line: defaultdict[int, list[ff.TestCaseFitnessFunction]] = defaultdict(list)
+        self._by_checked_line: defaultdict[int, list[ff.TestCaseFitnessFunction]] = defaultdict(
+            list
+        )
+        self._unindexed: list[ff.TestCaseFitnessFunction] = []
+        for goal in goals:
+            self.add(goal)
+
+    def add(self, goal: ff.TestCaseFitnessFunction) -> None:
+        """Adds a goal to the index.
+
+        Args:
+            goal: The goal to add
+        """
+        if isinstance(goal, bg.BranchCoverageTestFitness):
+            self._by_code_object[goal.goal.code_object_id].append(goal)
+        elif isinstance(goal, bg.LineCoverageTestFitness):
+            self._by_line[goal.goal.line_id].append(goal)
+        elif isinstance(goal, bg.StatementCheckedCoverageTestFitness):
+            self._by_checked_line[goal.goal.line_id].append(goal)
+        else:
+            self._unindexed.append(goal)
+
+    @property
+    def has_indexed_goals(self) -> bool:
+        """Whether any goal could be indexed.
+
+        Returns:
+            True, iff the index contains goals that are not always considered
+        """
+        return bool(self._by_code_object or self._by_line or self._by_checked_line)
+
+    def get_candidates(self, result: ExecutionResult) -> list[ff.TestCaseFitnessFunction]:
+        """Provides the goals that may be covered by an execution result.
+
+        Args:
+            result: The execution result
+
+        Returns:
+            The goals that may be covered by the result
+        """
+        trace = result.execution_trace
+        candidates = list(self._unindexed)
+        for keys, index in (
+            (trace.executed_code_objects, self._by_code_object),
+            (trace.covered_line_ids, self._by_line),
+            (trace.checked_lines, self._by_checked_line),
+        ):
+            if index:
+                for key in keys:
+                    if (goals := index.get(key)) is not None:
+                        candidates.extend(goals)
+        return candidates
+
+
 class CoverageArchive(Archive):
     """Implements the archive used by MOSA.
 
@@ -102,7 +178,13 @@ class CoverageArchive(Archive):
         self._covered: dict[ff.TestCaseFitnessFunction, tcc.TestCaseChromosome] = {}
         self._uncovered = OrderedSet(objectives)
         self._objectives = OrderedSet(objectives)
+        self._goal_index = GoalIndex(self._objectives)
+        # The position of every objective, to visit the candidates in a stable order.
+        self._positions: dict[ff.TestCaseFitnessFunction, int] = {
+            objective: position for position, objective in enumerate(self._objectives)
+        }
 
+    @measured(SearchPhase.ARCHIVE_UPDATE)
     def update(self, solutions: Iterable[tcc.TestCaseChromosome]) -> bool:
         """Updates this archive with the given set of solutions.
 
@@ -113,14 +195,22 @@ class CoverageArchive(Archive):
         error-free test cases over shorter ones with errors.  Otherwise,
         the solution is discarded.
 
+        Only the objectives a solution's last execution can have covered are checked
+        against the solution, see :class:`GoalIndex`.
+
         Args:
             solutions: The solutions to update the archive with
         """
+        candidates: dict[ff.TestCaseFitnessFunction, list[tcc.TestCaseChromosome]] = {}
+        for solution in solutions:
+            for objective in self._get_candidate_objectives(solution):
+                candidates.setdefault(objective, []).append(solution)
+
         updated = False
-        for objective in self._objectives:
+        for objective in sorted(candidates, key=self._positions.__getitem__):
             best_solution = self._covered.get(objective, None)
 
-            for solution in solutions:
+            for solution in candidates[objective]:
                 covers = solution.get_is_covered(objective)
 
                 if covers and (
@@ -135,6 +225,28 @@ class CoverageArchive(Archive):
         self._logger.debug("ArchiveCoverageGoals: %d", len(self._covered))
         return updated
 
+    def _get_candidate_objectives(
+        self, solution: tcc.TestCaseChromosome
+    ) -> Iterable[ff.TestCaseFitnessFunction]:
+        if not self._goal_index.has_indexed_goals:
+            return self._objectives
+        result = None if solution.changed else solution.get_last_execution_result()
+        if result is None:
+            # The solution has to be executed anyway, so we cannot restrict the goals.
+            return self._objectives
+        return self._goal_index.get_candidates(result)
+
+    def is_covered(self, goal: ff.TestCaseFitnessFunction) -> bool:
+        """Whether the archive holds a solution that covers the goal.
+
+        Args:
+            goal: The goal to check
+
+        Returns:
+            True, iff the goal is covered
+        """
+        return goal in self._covered
+
     @property
     def uncovered_goals(self) -> OrderedSet[ff.TestCaseFitnessFunction]:
         """Provides the set of goals that are yet to cover.
@@ -167,8 +279,10 @@ class CoverageArchive(Archive):
         for goal in new_goals:
             if goal not in self._objectives:
                 self._logger.debug("Adding goal: %s", goal)
+                self._positions[goal] = len(self._objectives)
                 self._objectives.add(goal)
                 self._uncovered.add(goal)
+                self._goal_index.add(goal)
 
     @property
     def solutions(self) -> OrderedSet[tcc.TestCaseChromosome]:  # noqa: D102
@@ -382,7 +496,11 @@ class MIOArchive(Archive):
         self._archive: dict[ff.TestCaseFitnessFunction, MIOPopulation] = {
             target: MIOPopulation(initial_size) for target in targets
         }
+        self._on_solution_added: list[
+            Callable[[ff.TestCaseFitnessFunction, float, tcc.TestCaseChromosome], None]
+        ] = []
 
+    @measured(SearchPhase.ARCHIVE_UPDATE)
     def update(self, solutions: Iterable[tcc.TestCaseChromosome]) -> bool:
         """Update the archive with the given solutions."""
         updated = False
@@ -396,16 +514,49 @@ class MIOArchive(Archive):
                     chop_position = solution_clone.get_last_mutatable_statement()
                     assert chop_position is not None
                     solution_clone.test_case.chop(chop_position)
-                covered_before = self._archive[target].is_covered
-                updated |= self._archive[target].add_solution(
-                    1.0 - normalise(fitness_value), solution_clone
-                )
-                # The goal was covered with this solution
-                # TODO(fk) replace with goal.is_covered?
-                if not covered_before and self._archive[target].is_covered:
-                    self._on_target_covered(target)
+                h = 1.0 - normalise(fitness_value)
+                if self.add_solution(target, h, solution_clone):
+                    updated = True
+                    for callback in self._on_solution_added:
+                        callback(target, h, solution_clone)
         return updated
 
+    def add_solution(
+        self, target: ff.TestCaseFitnessFunction, h: float, solution: tcc.TestCaseChromosome
+    ) -> bool:
+        """Add a solution whose h-value for the given target is already known.
+
+        Unlike :meth:`update`, this neither executes the solution nor notifies the
+        callbacks registered via :meth:`add_on_solution_added`.
+
+        Args:
+            target: The target the solution was evaluated for
+            h: The h-value of the solution for the target
+            solution: The solution
+
+        Returns:
+            True, iff the solution was stored.
+        """
+        population = self._archive[target]
+        covered_before = population.is_covered
+        added = population.add_solution(h, solution)
+        # The goal was covered with this solution
+        # TODO(fk) replace with goal.is_covered?
+        if not covered_before and population.is_covered:
+            self._on_target_covered(target)
+        return added
+
+    def add_on_solution_added(
+        self, callback: Callable[[ff.TestCaseFitnessFunction, float, tcc.TestCaseChromosome], None]
+    ) -> None:
+        """Register a callback for whenever :meth:`update` stores a solution for a target.
+
+        Args:
+            callback: The callback, called with the target, the h-value and the stored
+                solution.
+        """
+        self._on_solution_added.append(callback)
+
     def get_solution(self) -> tcc.TestCaseChromosome | None:
         """Get a random solution."""
         # Choose one target at random that has not been covered but contains some
@@ -441,6 +592,17 @@ class MIOArchive(Archive):
             sampled = sampled.clone()
         return sampled
 
+    def is_covered(self, target: ff.TestCaseFitnessFunction) -> bool:
+        """Whether the given target is covered by a solution in the archive.
+
+        Args:
+            target: The target to check
+
+        Returns:
+            True, if the target is covered
+        """
+        return self._archive[target].is_covered
+
     def shrink_solutions(self, new_population_size):
         """Shrink all populations to the new given size."""
         assert new_population_size > 0
@@ -172,6 +172,9 @@ class _GoalsManager:
             branch_fitness_functions.add(fit)
         self._graph = _BranchFitnessGraph(branch_fitness_functions, subject_properties)
         self._current_goals: OrderedSet[bg.BranchCoverageTestFitness] = self._graph.root_branches
+        # The goals the archive covered since the last update of the current goals.
+        self._newly_covered: OrderedSet[ff.TestCaseFitnessFunction] = OrderedSet()
+        self._archive.add_on_target_covered(self._newly_covered.add)
         self._archive.add_goals(self._current_goals)  # type: ignore[arg-type]
 
     @property
@@ -186,6 +189,9 @@ class _GoalsManager:
     def update(self, solutions: list[tcc.TestCaseChromosome]) -> None:
         """Updates the information on the current goals from the found solutions.
 
+        Only goals that were covered since the last update are replaced by their
+        structural children; the other current goals remain untouched.
+
         Args:
             solutions: The previously found solutions
         """
@@ -193,14 +199,17 @@ class _GoalsManager:
         new_goals_added = True
         while new_goals_added:
             self._archive.update(solutions)
-            covered = self._archive.covered_goals
-            new_goals: OrderedSet[bg.BranchCoverageTestFitness] = OrderedSet()
             new_goals_added = False
+            if not self._newly_covered:
+                break
+            newly_covered = OrderedSet(self._newly_covered)
+            self._newly_covered.clear()
+            new_goals: OrderedSet[bg.BranchCoverageTestFitness] = OrderedSet()
             for old_goal in self._current_goals:
-                if old_goal in covered:
+                if old_goal in newly_covered:
                     children = self._graph.get_structural_children(old_goal)
                     for child in children:
-                        if child not in self._current_goals and child not in covered:
+                        if child not in self._current_goals and not self._archive.is_covered(child):
                             new_goals.add(child)
                             new_goals_added = True
                 else:
@@ -26,6 +26,7 @@ if TYPE_CHECKING:
     import pynguin.ga.computations as ff
     import pynguin.ga.coveragegoals as bg
     import pynguin.ga.searchobserver as so
+    import pynguin.testcase.testcase as tc
     import pynguin.testcase.testfactory as tf
     from pynguin.analyses.module import ModuleTestCluster
     from pynguin.ga.operators.crossover import CrossOverFunction
@@ -33,6 +34,7 @@ if TYPE_CHECKING:
     from pynguin.ga.operators.selection import SelectionFunction
     from pynguin.ga.stoppingcondition import StoppingCondition
     from pynguin.testcase.execution import AbstractTestCaseExecutor
+    from pynguin.testcase.execution_result import ExecutionResult
 
 A = TypeVar("A", bound=arch.Archive)
 
@@ -57,6 +59,7 @@ class GenerationAlgorithm(Generic[A]):  # noqa: PLR0904
         self._test_suite_coverage_functions: OrderedSet[ff.TestSuiteCoverageFunction] = OrderedSet()
         self._branch_goal_pool: bg.BranchGoalPool
         self._search_observers: list[so.SearchObserver] = []
+        self._resumed_test_cases: list[tuple[tc.TestCase, ExecutionResult | None]] = []
 
     @property
     def chromosome_factory(self) -> cf.ChromosomeFactory:
@@ -258,6 +261,60 @@ class GenerationAlgorithm(Generic[A]):  # noqa: PLR0904
             suite.add_coverage_function(suite_coverage)
         return suite
 
+    @property
+    def population(self) -> list[tcc.TestCaseChromosome]:
+        """Provides the test-case chromosomes the algorithm currently evolves.
+
+        Algorithms that do not evolve a population of test-case chromosomes
+        provide an empty list.
+
+        Returns:
+            The current population
+        """
+        return []
+
+    def resume(self, test_cases: Iterable[tc.TestCase]) -> None:
+        """Resume the search from the test cases of a previous search.
+
+        The algorithm evaluates the test cases before it evolves new ones.  Test cases
+        of several calls are evaluated in the order they were given.
+
+        Args:
+            test_cases: The archived and population test cases of the previous search
+        """
+        self._resumed_test_cases.extend((test_case, None) for test_case in test_cases)
+
+    def resume_evaluated(self, chromosomes: Iterable[tcc.TestCaseChromosome]) -> None:
+        """Resume the search from test cases that were already executed.
+
+        Like :meth:`resume`, but the last execution result of each chromosome is
+        reused, so the test cases are not executed again.
+
+        Args:
+            chromosomes: The executed chromosomes of the test cases
+        """
+        self._resumed_test_cases.extend(
+            (chromosome.test_case, chromosome.get_last_execution_result())
+            for chromosome in chromosomes
+        )
+
+    def _take_resumed_chromosomes(self) -> list[tcc.TestCaseChromosome]:
+        chromosomes = []
+        for test_case, result in self._resumed_test_cases:
+            chromosome = self._create_chromosome(test_case)
+            if result is not None:
+                chromosome.set_last_execution_result(result)
+                chromosome.changed = False
+            chromosomes.append(chromosome)
+        self._resumed_test_cases = []
+        return chromosomes
+
+    def _create_chromosome(self, test_case: tc.TestCase) -> tcc.TestCaseChromosome:
+        chromosome = tcc.TestCaseChromosome(test_case, self._test_factory)
+        for fitness_function in self._test_case_fitness_functions:
+            chromosome.add_fitness_function(fitness_function)
+        return chromosome
+
     @abstractmethod
     def generate_tests(self) -> tsc.TestSuiteChromosome:
         """Generates tests for a given module until the time limit is reached.
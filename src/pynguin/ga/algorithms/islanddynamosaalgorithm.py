@@ -0,0 +1,229 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides an island-model variant of the DynaMOSA test-generation strategy.
+
+Every island evolves its own population with DynaMOSA in a separate process.  The
+islands are forked after the subject under test has been instrumented, so each
+island inherits its own executor and test cluster.  Periodically, every island
+sends the tests that newly covered goals in its archive to all other islands and its
+elite individuals to the next island in a ring.  Test cases travel between the
+processes as source code, which the receiving island parses with its own test
+cluster.  When the search ends, the first island merges the archives of all other
+islands into its own, so that minimisation and export run once on the merged
+archive.  The first island also tells the other islands to stop once its own search
+has ended.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import queue
+import time
+from typing import TYPE_CHECKING
+
+import multiprocess as mp
+
+import pynguin.configuration as config
+import pynguin.ga.testcasechromosome as tcc
+from pynguin.analyses.seeding import parse_seed_module, render_seed_module
+from pynguin.ga.algorithms.dynamosaalgorithm import DynaMOSAAlgorithm
+from pynguin.utils import randomness
+from pynguin.utils.orderedset import OrderedSet
+from pynguin.utils.statistics.profiler import profiled_subprocess
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import pynguin.ga.testsuitechromosome as tsc
+
+
+@dataclasses.dataclass(frozen=True)
+class Migration:
+    """The test cases an island sends to another island."""
+
+    # The index of the sending island.
+    island: int
+
+    # Source code of the tests that newly covered goals in the sender's archive.
+    archive: str
+
+    # Source code of the sender's elite individuals, empty if none are sent.
+    elites: str
+
+    # Whether this is the last migration of the sending island.
+    final: bool = False
+
+
+class IslandDynaMOSAAlgorithm(DynaMOSAAlgorithm):
+    """Implements an island model of DynaMOSA with one process per island."""
+
+    _logger = logging.getLogger(__name__)
+
+    # Seconds to wait for the final migrations of the other islands.
+    _FINAL_MIGRATION_TIMEOUT = 60.0
+
+    def __init__(self) -> None:  # noqa: D107
+        super().__init__()
+        self._island = 0
+        self._inboxes: list[mp.Queue] = []
+        self._islands: list[mp.Process] = []
+        self._generation = 0
+        self._stop: mp.synchronize.Event | None = None
+        # The archive solutions that were already sent to the other islands.
+        self._emigrated: OrderedSet[tcc.TestCaseChromosome] = OrderedSet()
+
+    @property
+    def island(self) -> int:
+        """Provides the index of the island evolved by this process.
+
+        Returns:
+            The index of the island
+        """
+        return self._island
+
+    def generate_tests(self) -> tsc.TestSuiteChromosome:  # noqa: D102
+        number_of_islands = config.configuration.search_algorithm.number_of_islands
+        if number_of_islands > 1:
+            self._start_islands(number_of_islands)
+        return super().generate_tests()
+
+    def _start_islands(self, number_of_islands: int) -> None:
+        try:
+            context = mp.get_context("fork")
+        except ValueError:
+            self._logger.warning(
+                "The island model requires the fork start method, using a single island"
+            )
+            return
+        self._inboxes = [context.Queue() for _ in range(number_of_islands)]
+        self._stop = context.Event()
+        for island in range(1, number_of_islands):
+            process = context.Process(
+                target=self._run_island, args=(island,), name=f"PynguinIsland-{island}"
+            )
+            process.start()
+            self._islands.append(process)
+        # Unread migrations to islands that already finished must not block our exit.
+        for inbox in self._inboxes[1:]:
+            inbox.cancel_join_thread()
+        self._logger.info("Started %d islands", number_of_islands)
+
+    @profiled_subprocess("island")
+    def _run_island(self, island: int) -> None:
+        self._island = island
+        self._islands = []
+        for index, inbox in enumerate(self._inboxes):
+            if index != 0:
+                inbox.cancel_join_thread()
+        randomness.RNG.seed(randomness.RNG.get_seed() + island)
+        try:
+            DynaMOSAAlgorithm.generate_tests(self)
+        except Exception:
+            self._logger.exception("Island %d failed", island)
+            self._inboxes[0].put(Migration(island, "", "", final=True))
+
+    def resources_left(self) -> bool:  # noqa: D102
+        return (self._stop is None or not self._stop.is_set()) and super().resources_left()
+
+    def evolve(self) -> None:  # noqa: D102
+        super().evolve()
+        self._generation += 1
+        interval = config.configuration.search_algorithm.island_migration_interval
+        if self._inboxes and self._generation % max(1, interval) == 0:
+            self._emigrate()
+            self._immigrate()
+
+    def after_search_finish(self) -> None:  # noqa: D102
+        if self._inboxes:
+            if self._island == 0:
+                assert self._stop is not None
+                self._stop.set()
+                self._collect_final_migrations()
+            else:
+                self._inboxes[0].put(
+                    Migration(self._island, self._encode(self._archive.solutions), "", final=True)
+                )
+        super().after_search_finish()
+
+    def _emigrate(self) -> None:
+        new_solutions = [
+            solution for solution in self._archive.solutions if solution not in self._emigrated
+        ]
+        self._emigrated.update(new_solutions)
+        archive = self._encode(new_solutions)
+        successor = (self._island + 1) % len(self._inboxes)
+        elites = self._encode(
+            self._population[: config.configuration.search_algorithm.island_migration_size]
+        )
+        for island, inbox in enumerate(self._inboxes):
+            if island == self._island or (not archive and island != successor):
+                continue
+            inbox.put(Migration(self._island, archive, elites if island == successor else ""))
+
+    def _immigrate(self) -> None:
+        while True:
+            try:
+                migration = self._inboxes[self._island].get_nowait()
+            except queue.Empty:
+                return
+            self._receive(migration)
+
+    def _collect_final_migrations(self) -> None:
+        pending = {process.name for process in self._islands}
+        deadline = time.monotonic() + self._FINAL_MIGRATION_TIMEOUT
+        while pending and time.monotonic() < deadline:
+            try:
+                migration = self._inboxes[0].get(timeout=1.0)
+            except queue.Empty:
+                # Do not wait for islands that died without a final migration.
+                pending &= {process.name for process in self._islands if process.is_alive()}
+                continue
+            self._receive(migration)
+            if migration.final:
+                pending.discard(f"PynguinIsland-{migration.island}")
+        for process in self._islands:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.kill()
+        if pending:
+            self._logger.warning("Did not receive the final archive of %s", sorted(pending))
+
+    def _receive(self, migration: Migration) -> None:
+        archive = self._decode(migration.archive)
+        if archive:
+            self._goals_manager.update(archive)
+        elites = self._decode(migration.elites)
+        if elites and self._population:
+            # Immigrants replace the worst individuals of the population.
+            replaced = self._population[-len(elites) :]
+            for elite, individual in zip(elites, replaced, strict=False):
+                elite.rank = individual.rank
+                elite.distance = individual.distance
+            self._population[-len(replaced) :] = elites[: len(replaced)]
+        self._logger.debug(
+            "Island %d received %d archive tests and %d elites from island %d",
+            self._island,
+            len(archive),
+            len(elites),
+            migration.island,
+        )
+
+    @staticmethod
+    def _encode(solutions: Iterable[tcc.TestCaseChromosome]) -> str:
+        test_cases = [solution.test_case for solution in solutions]
+        if not test_cases:
+            return ""
+        return render_seed_module(test_cases)
+
+    def _decode(self, source: str) -> list[tcc.TestCaseChromosome]:
+        if not source:
+            return []
+        return [
+            self._create_chromosome(test_case)
+            for test_case in parse_seed_module(source, self.test_cluster, create_assertions=False)
+        ]
@@ -17,6 +17,7 @@ import pynguin.ga.testcasechromosome as tcc
 import pynguin.utils.statistics.stats as stat
 from pynguin.ga.algorithms.mosaalgorithm import MOSAAlgorithm
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+from pynguin.utils.statistics.searchphases import SearchPhase, measured
 
 if TYPE_CHECKING:
     import pynguin.ga.chromosomefactory as cf
@@ -316,6 +317,7 @@ class LLMOSAAlgorithm(MOSAAlgorithm):
             population.append(chromosome)
         return population
 
+    @measured(SearchPhase.BREEDING)
     def _breed_next_generation(
         self,
         factory: cf.ChromosomeFactory | None = None,
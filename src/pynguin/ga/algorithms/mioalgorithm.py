@@ -17,6 +17,7 @@ import pynguin.configuration as config
 import pynguin.ga.algorithms.archive as arch
 from pynguin.ga.algorithms.generationalgorithm import GenerationAlgorithm
 from pynguin.utils import randomness
+from pynguin.utils.statistics.searchphases import SearchPhase, phase_timer
 
 if TYPE_CHECKING:
     import pynguin.ga.testcasechromosome as tcc
@@ -57,6 +58,8 @@ class MIOAlgorithm(GenerationAlgorithm[arch.MIOArchive]):
 
     def generate_tests(self) -> tsc.TestSuiteChromosome:  # noqa: D102
         self.before_search_start()
+        if resumed := self._take_resumed_chromosomes():
+            self._archive.update(resumed)
         while (
             self.resources_left()
             and len(self._test_case_fitness_functions) - self._archive.num_covered_targets != 0
@@ -67,6 +70,10 @@ class MIOAlgorithm(GenerationAlgorithm[arch.MIOArchive]):
         self.after_search_finish()
         return self.create_test_suite(self._archive.solutions)
 
+    @property
+    def population(self) -> list[tcc.TestCaseChromosome]:  # noqa: D102
+        return [] if self._solution is None else [self._solution]
+
     def _update_parameters(self):
         progress = self.progress()
         progress_until_focused = progress / config.configuration.mio.exploitation_starts_at_percent
@@ -122,21 +129,22 @@ class MIOAlgorithm(GenerationAlgorithm[arch.MIOArchive]):
         # Note: in MIO there is an extra parameter m which controls how many mutations
         # and fitness evaluations should be done on the same individual before sampling
         # a new one.
-        if self._solution is not None and self._current_mutations < self._parameters.m:
-            offspring = self._solution.clone()
-            offspring.mutate()
-            self._current_mutations += 1
-        elif randomness.next_float() < self._parameters.Pr:
-            offspring = self.chromosome_factory.get_chromosome()
-            self._current_mutations = 1
-        else:
-            maybe_offspring = self._archive.get_solution()
-            if maybe_offspring is None:
-                # Nothing in archive, so sample new one.
+        with phase_timer.measure(SearchPhase.BREEDING):
+            if self._solution is not None and self._current_mutations < self._parameters.m:
+                offspring = self._solution.clone()
+                offspring.mutate()
+                self._current_mutations += 1
+            elif randomness.next_float() < self._parameters.Pr:
                 offspring = self.chromosome_factory.get_chromosome()
+                self._current_mutations = 1
             else:
-                offspring = maybe_offspring
-            offspring.mutate()
-            self._current_mutations = 1
+                maybe_offspring = self._archive.get_solution()
+                if maybe_offspring is None:
+                    # Nothing in archive, so sample new one.
+                    offspring = self.chromosome_factory.get_chromosome()
+                else:
+                    offspring = maybe_offspring
+                offspring.mutate()
+                self._current_mutations = 1
         if self._archive.update([offspring]):
             self._solution = offspring
@@ -0,0 +1,249 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a variant of MIO that samples, mutates and executes in parallel.
+
+MIO evaluates one test case at a time, so its throughput is bound by the execution
+latency of the subject under test.  This variant forks several workers after the
+subject has been instrumented; each worker runs the MIO loop on its own replica of
+the :class:`~pynguin.ga.algorithms.archive.MIOArchive`.
+
+Keeping a single archive in shared memory would require synchronising every
+per-target population update across processes.  Instead, every worker records the
+solutions its archive stored, together with their h-values, and periodically
+broadcasts them to the other workers.  The receivers insert the solutions into the
+respective per-target populations using the h-values computed by the sender, so
+synchronising does not execute any test case again.  The workers also share their
+search progress, such that the focused phase starts based on the progress of all
+workers.  When the search ends, the first worker merges the final updates of all
+other workers into its archive.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import queue
+import time
+from typing import TYPE_CHECKING
+
+import multiprocess as mp
+
+import pynguin.configuration as config
+import pynguin.ga.testcasechromosome as tcc
+from pynguin.analyses.seeding import parse_seed_module, render_seed_module
+from pynguin.ga.algorithms.mioalgorithm import MIOAlgorithm
+from pynguin.utils import randomness
+from pynguin.utils.statistics.profiler import profiled_subprocess
+
+if TYPE_CHECKING:
+    import pynguin.ga.computations as ff
+    import pynguin.ga.testsuitechromosome as tsc
+
+
+@dataclasses.dataclass(frozen=True)
+class ArchiveUpdate:
+    """The solutions a worker stored in its archive since its last update."""
+
+    # The index of the sending worker.
+    worker: int
+
+    # Source code of the stored solutions, one module per solution.
+    solutions: tuple[str, ...]
+
+    # Target index, h-value and solution index of every stored solution.
+    additions: tuple[tuple[int, float, int], ...]
+
+    # Whether this is the last update of the sending worker.
+    final: bool = False
+
+
+class ParallelMIOAlgorithm(MIOAlgorithm):
+    """Implements MIO with several workers that synchronise their archives."""
+
+    _logger = logging.getLogger(__name__)
+
+    # Seconds to wait for the final updates of the other workers.
+    _FINAL_UPDATE_TIMEOUT = 60.0
+
+    def __init__(self) -> None:  # noqa: D107
+        super().__init__()
+        self._worker = 0
+        self._inboxes: list[mp.Queue] = []
+        self._workers: list[mp.Process] = []
+        self._stop: mp.synchronize.Event | None = None
+        self._progress: mp.sharedctypes.SynchronizedArray | None = None
+        self._evaluations = 0
+        self._targets: list[ff.TestCaseFitnessFunction] = []
+        self._target_indices: dict[ff.TestCaseFitnessFunction, int] = {}
+        self._pending: list[tuple[ff.TestCaseFitnessFunction, float, tcc.TestCaseChromosome]] = []
+
+    @property
+    def worker(self) -> int:
+        """Provides the index of the worker running in this process.
+
+        Returns:
+            The index of the worker
+        """
+        return self._worker
+
+    def generate_tests(self) -> tsc.TestSuiteChromosome:  # noqa: D102
+        number_of_workers = config.configuration.mio.number_of_workers
+        if number_of_workers > 1:
+            self._targets = list(self._test_case_fitness_functions)
+            self._target_indices = {target: index for index, target in enumerate(self._targets)}
+            if self._start_workers(number_of_workers):
+                self._record_stored_solutions()
+        return super().generate_tests()
+
+    def _record_stored_solutions(self) -> None:
+        # Only recorded while there are workers to send the solutions to, because the
+        # recorded solutions are only released by synchronising.
+        self._archive.add_on_solution_added(
+            lambda target, h, solution: self._pending.append((target, h, solution))
+        )
+
+    def _start_workers(self, number_of_workers: int) -> bool:
+        try:
+            context = mp.get_context("fork")
+        except ValueError:
+            self._logger.warning(
+                "Parallel MIO requires the fork start method, using a single worker"
+            )
+            return False
+        self._inboxes = [context.Queue() for _ in range(number_of_workers)]
+        self._stop = context.Event()
+        self._progress = context.Array("d", number_of_workers)
+        for worker in range(1, number_of_workers):
+            process = context.Process(
+                target=self._run_worker, args=(worker,), name=f"PynguinMIOWorker-{worker}"
+            )
+            process.start()
+            self._workers.append(process)
+        # Unread updates to workers that already finished must not block our exit.
+        for inbox in self._inboxes[1:]:
+            inbox.cancel_join_thread()
+        self._logger.info("Started %d MIO workers", number_of_workers)
+        return True
+
+    @profiled_subprocess("MIO worker")
+    def _run_worker(self, worker: int) -> None:
+        self._worker = worker
+        self._workers = []
+        for index, inbox in enumerate(self._inboxes):
+            if index != 0:
+                inbox.cancel_join_thread()
+        randomness.RNG.seed(randomness.RNG.get_seed() + worker)
+        self._record_stored_solutions()
+        try:
+            MIOAlgorithm.generate_tests(self)
+        except Exception:
+            self._logger.exception("MIO worker %d failed", worker)
+            self._inboxes[0].put(ArchiveUpdate(worker, (), (), final=True))
+
+    def resources_left(self) -> bool:  # noqa: D102
+        return (self._stop is None or not self._stop.is_set()) and super().resources_left()
+
+    def progress(self) -> float:
+        """Provides the progress of the search, averaged over all workers.
+
+        Returns:
+            The progress of the search
+        """
+        if self._progress is None:
+            return super().progress()
+        with self._progress.get_lock():
+            return sum(self._progress) / len(self._progress)
+
+    def evolve(self) -> None:  # noqa: D102
+        super().evolve()
+        if not self._inboxes:
+            return
+        self._evaluations += 1
+        if self._evaluations % max(1, config.configuration.mio.synchronization_interval) == 0:
+            self._synchronize()
+
+    def _update_parameters(self) -> None:
+        if self._progress is not None:
+            self._progress[self._worker] = super().progress()
+        super()._update_parameters()
+
+    def after_search_finish(self) -> None:  # noqa: D102
+        if self._inboxes:
+            if self._worker == 0:
+                assert self._stop is not None
+                self._stop.set()
+                self._collect_final_updates()
+            else:
+                self._inboxes[0].put(self._create_update(final=True))
+        super().after_search_finish()
+
+    def _synchronize(self) -> None:
+        if self._pending:
+            update = self._create_update(final=False)
+            for worker, inbox in enumerate(self._inboxes):
+                if worker != self._worker:
+                    inbox.put(update)
+        while True:
+            try:
+                update = self._inboxes[self._worker].get_nowait()
+            except queue.Empty:
+                return
+            self._receive(update)
+
+    def _collect_final_updates(self) -> None:
+        pending = {process.name for process in self._workers}
+        deadline = time.monotonic() + self._FINAL_UPDATE_TIMEOUT
+        while pending and time.monotonic() < deadline:
+            try:
+                update = self._inboxes[0].get(timeout=1.0)
+            except queue.Empty:
+                # Do not wait for workers that died without a final update.
+                pending &= {process.name for process in self._workers if process.is_alive()}
+                continue
+            self._receive(update)
+            if update.final:
+                pending.discard(f"PynguinMIOWorker-{update.worker}")
+        for process in self._workers:
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.kill()
+        if pending:
+            self._logger.warning("Did not receive the final archive of %s", sorted(pending))
+
+    def _create_update(self, *, final: bool) -> ArchiveUpdate:
+        solutions: dict[int, int] = {}
+        sources: list[str] = []
+        additions: list[tuple[int, float, int]] = []
+        for target, h, solution in self._pending:
+            index = solutions.get(id(solution))
+            if index is None:
+                index = solutions[id(solution)] = len(sources)
+                sources.append(render_seed_module([solution.test_case]))
+            additions.append((self._target_indices[target], h, index))
+        self._pending.clear()
+        return ArchiveUpdate(self._worker, tuple(sources), tuple(additions), final=final)
+
+    def _receive(self, update: ArchiveUpdate) -> None:
+        solutions = [self._decode(source) for source in update.solutions]
+        added = 0
+        for target_index, h, solution_index in update.additions:
+            solution = solutions[solution_index]
+            if solution is not None:
+                added += self._archive.add_solution(self._targets[target_index], h, solution)
+        self._logger.debug(
+            "Worker %d stored %d of %d solutions from worker %d",
+            self._worker,
+            added,
+            len(update.additions),
+            update.worker,
+        )
+
+    def _decode(self, source: str) -> tcc.TestCaseChromosome | None:
+        test_cases = parse_seed_module(source, self.test_cluster, create_assertions=False)
+        if len(test_cases) != 1:
+            return None
+        return self._create_chromosome(test_cases[0])
@@ -18,6 +18,7 @@ import pynguin.ga.coveragegoals as bg
 from pynguin.ga.algorithms.generationalgorithm import GenerationAlgorithm
 from pynguin.utils import randomness
 from pynguin.utils.exceptions import ConstructionFailedException
+from pynguin.utils.statistics.searchphases import SearchPhase, measured
 
 if TYPE_CHECKING:
     import pynguin.ga.testsuitechromosome as tsc
@@ -53,6 +54,12 @@ class WholeSuiteAlgorithm(GenerationAlgorithm[arch.CoverageArchive]):
 
     def evolve(self) -> None:
         """Evolve the current population and replace it with a new one."""
+        self._population = self._breed_next_generation()
+        self._update_archive()
+        self._sort_population()
+
+    @measured(SearchPhase.BREEDING)
+    def _breed_next_generation(self) -> list[tsc.TestSuiteChromosome]:
         new_generation = []
         new_generation.extend(self.elitism())
         while not self.is_next_population_full(new_generation):
@@ -88,10 +95,7 @@ class WholeSuiteAlgorithm(GenerationAlgorithm[arch.CoverageArchive]):
                         new_generation.append(randomness.choice((parent1, parent2)))
             else:
                 new_generation.extend((parent1, parent2))
-
-        self._population = new_generation
-        self._update_archive()
-        self._sort_population()
+        return new_generation
 
     def _get_random_population(self) -> list[tsc.TestSuiteChromosome]:
         population = []
@@ -100,6 +104,7 @@ class WholeSuiteAlgorithm(GenerationAlgorithm[arch.CoverageArchive]):
             population.append(chromosome)
         return population
 
+    @measured(SearchPhase.ARCHIVE_UPDATE)
     def _update_archive(self) -> None:
         """Store covering test cases in archive."""
         if not config.configuration.search_algorithm.use_archive:
@@ -137,6 +142,7 @@ class WholeSuiteAlgorithm(GenerationAlgorithm[arch.CoverageArchive]):
             for chromosome in self._population:
                 chromosome.invalidate_cache()
 
+    @measured(SearchPhase.RANKING)
     def _sort_population(self) -> None:
         """Sort the population by fitness."""
         self._population.sort(key=lambda x: x.get_fitness())
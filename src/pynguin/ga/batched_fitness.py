@@ -0,0 +1,319 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Batched computation of test-case fitness values for many goals at once.
+
+Computing the fitness of a test case goal by goal costs a Python call per goal, and
+every :class:`~pynguin.ga.coveragegoals.BranchCoverageTestFitness` walks the execution
+trace on its own.  The evaluator in this module instead groups the goals by their code
+object once and then computes the whole fitness vector of an execution result in a
+single pass over the trace.  Goals whose code object was not executed keep a
+precomputed default value, so the cost of an evaluation scales with what the trace
+actually touched rather than with the total number of goals.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING
+
+import networkx as nx
+
+import pynguin.ga.coveragegoals as bg
+from pynguin.ga.fitness_metrics import normalise
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import pynguin.ga.computations as ff
+    import pynguin.ga.testcasechromosome as tcc
+    from pynguin.instrumentation.controlflow import ControlDependenceGraph, ProgramNode
+    from pynguin.instrumentation.tracer import ExecutionTrace, SubjectProperties
+    from pynguin.testcase.execution import ExecutionResult
+
+# The number of plans an evaluator keeps.  A search evaluates only a few distinct
+# sequences of goals at a time, e.g., the current goals of DynaMOSA, so the plans of
+# goal sequences that are no longer evaluated are dropped first.
+MAX_PLANS = 64
+
+
+@dataclasses.dataclass
+class _CodeObjectPlan:
+    """The goals of a single code object, prepared for batched evaluation."""
+
+    # Vector indices of the branch-less code object goals.
+    branchless: list[int] = dataclasses.field(default_factory=list)
+
+    # Vector index, predicate id, branch value and CDG node of the branch goals.
+    branches: list[tuple[int, int, bool, ProgramNode]] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class _GoalPlan:
+    """The evaluation plan for a fixed sequence of goals."""
+
+    # The goals this plan was created for.
+    goals: tuple[bg.AbstractCoverageGoal, ...]
+
+    # The fitness values of the goals if nothing at all was executed.
+    default_values: list[float]
+
+    # The branch-coverage goals grouped by their code object id.
+    code_objects: dict[int, _CodeObjectPlan]
+
+    # Vector index of the line-coverage goals, keyed by line id.
+    lines: dict[int, list[int]]
+
+    # Vector index of the checked-coverage goals, keyed by line id.
+    checked_lines: dict[int, list[int]]
+
+
+class BatchedFitnessEvaluator:
+    """Computes the fitness values of many coverage goals in one pass over a trace.
+
+    Supported are branch-coverage, line-coverage and checked-coverage goals.  The
+    values computed by the evaluator are identical to those computed by the
+    respective fitness functions one at a time.
+    """
+
+    def __init__(self, subject_properties: SubjectProperties) -> None:
+        """Initializes the evaluator.
+
+        Args:
+            subject_properties: The properties of the subject under test
+        """
+        self._subject_properties = subject_properties
+        # The plans in least-recently used order.
+        self._plans: OrderedDict[tuple[int, ...], _GoalPlan] = OrderedDict()
+        # Shortest path lengths in the CDGs, computed lazily per source node.
+        self._path_lengths: dict[
+            int, tuple[ControlDependenceGraph, dict[ProgramNode, dict[ProgramNode, int]]]
+        ] = {}
+
+    @property
+    def subject_properties(self) -> SubjectProperties:
+        """Provides the subject properties the evaluator works on.
+
+        Returns:
+            The subject properties
+        """
+        return self._subject_properties
+
+    def compute(
+        self, result: ExecutionResult, goals: Sequence[bg.AbstractCoverageGoal]
+    ) -> list[float]:
+        """Computes the fitness vector of an execution result.
+
+        The goals may stem from a single code object or from the whole module.
+
+        Args:
+            result: The execution result
+            goals: The goals to compute the fitness values for
+
+        Returns:
+            The fitness values, in the same order as the given goals.
+        """
+        # Goals implement a custom hash, which is too expensive to compute for every
+        # evaluation; the plan keeps the goals alive, so their ids stay unique.
+        key = tuple(map(id, goals))
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._create_plan(tuple(goals))
+            self._plans[key] = plan
+            if len(self._plans) > MAX_PLANS:
+                self._plans.popitem(last=False)
+        else:
+            self._plans.move_to_end(key)
+        trace = result.execution_trace
+        values = list(plan.default_values)
+
+        if plan.code_objects:
+            self._compute_branch_values(trace, plan, values)
+        if plan.lines:
+            self._clear_covered(trace.covered_line_ids, plan.lines, values)
+        if plan.checked_lines:
+            self._clear_covered(trace.checked_lines, plan.checked_lines, values)
+        return values
+
+    @staticmethod
+    def _clear_covered(covered, index: dict[int, list[int]], values: list[float]) -> None:
+        for line_id in covered:
+            for position in index.get(line_id, ()):
+                values[position] = 0.0
+
+    def _compute_branch_values(
+        self, trace: ExecutionTrace, plan: _GoalPlan, values: list[float]
+    ) -> None:
+        existing_predicates = self._subject_properties.existing_predicates
+        executed_predicates = trace.executed_predicates
+        true_distances = trace.true_distances
+        false_distances = trace.false_distances
+        # The executed predicates per code object, together with the sum of their
+        # branch distances.  Only required for predicates that were not executed.
+        executed_per_code_object: dict[int, list[tuple[ProgramNode, float]]] | None = None
+
+        for code_object_id in trace.executed_code_objects:
+            code_object_plan = plan.code_objects.get(code_object_id)
+            if code_object_plan is None:
+                continue
+            for position in code_object_plan.branchless:
+                values[position] = 0.0
+            for position, predicate_id, value, node in code_object_plan.branches:
+                if predicate_id in executed_predicates:
+                    distances = true_distances if value else false_distances
+                    values[position] = normalise(distances.get(predicate_id, math.inf))
+                    continue
+
+                if executed_per_code_object is None:
+                    executed_per_code_object = defaultdict(list)
+                    for executed_id in executed_predicates:
+                        meta = existing_predicates[executed_id]
+                        executed_per_code_object[meta.code_object_id].append((
+                            meta.node,
+                            true_distances.get(executed_id, math.inf)
+                            + false_distances.get(executed_id, math.inf),
+                        ))
+
+                approach_level = values[position]
+                branch_distance = 0.0
+                for executed_node, distance in executed_per_code_object.get(code_object_id, ()):
+                    length = self._path_length(code_object_id, executed_node, node)
+                    if length is not None and (length, distance) < (
+                        approach_level,
+                        branch_distance,
+                    ):
+                        approach_level = length
+                        branch_distance = distance
+                values[position] = approach_level + normalise(branch_distance)
+
+    def _path_length(
+        self, code_object_id: int, source: ProgramNode, target: ProgramNode
+    ) -> int | None:
+        cdg = self._subject_properties.existing_code_objects[code_object_id].cdg
+        entry = self._path_lengths.get(code_object_id)
+        if entry is None or entry[0] is not cdg:
+            entry = (cdg, {})
+            self._path_lengths[code_object_id] = entry
+        lengths = entry[1].get(source)
+        if lengths is None:
+            try:
+                lengths = dict(nx.single_source_shortest_path_length(cdg.graph, source))
+            except nx.NodeNotFound:
+                lengths = {}
+            entry[1][source] = lengths
+        return lengths.get(target)
+
+    def _create_plan(self, goals: tuple[bg.AbstractCoverageGoal, ...]) -> _GoalPlan:
+        existing_code_objects = self._subject_properties.existing_code_objects
+        existing_predicates = self._subject_properties.existing_predicates
+        plan = _GoalPlan(
+            goals=goals,
+            default_values=[1.0] * len(goals),
+            code_objects={},
+            lines=defaultdict(list),
+            checked_lines=defaultdict(list),
+        )
+        for position, goal in enumerate(goals):
+            if isinstance(goal, bg.BranchlessCodeObjectGoal):
+                plan.code_objects.setdefault(
+                    goal.code_object_id, _CodeObjectPlan()
+                ).branchless.append(position)
+            elif isinstance(goal, bg.BranchGoal):
+                meta = existing_predicates[goal.predicate_id]
+                # A predicate in a code object that was not executed has the
+                # diameter of the code object's CFG as its approach level.
+                plan.default_values[position] = float(
+                    existing_code_objects[meta.code_object_id].cfg.diameter
+                )
+                plan.code_objects.setdefault(
+                    meta.code_object_id, _CodeObjectPlan()
+                ).branches.append((position, goal.predicate_id, goal.value, meta.node))
+            elif isinstance(goal, bg.LineCoverageGoal):
+                plan.lines[goal.line_id].append(position)
+            elif isinstance(goal, bg.CheckedCoverageGoal):
+                plan.checked_lines[goal.line_id].append(position)
+            else:
+                raise ValueError(f"Cannot evaluate goal {goal} in a batch")
+        return plan
+
+
+_BATCHED_FITNESS_FUNCTIONS = (
+    bg.BranchCoverageTestFitness,
+    bg.LineCoverageTestFitness,
+    bg.StatementCheckedCoverageTestFitness,
+)
+
+_EVALUATOR: BatchedFitnessEvaluator | None = None
+
+
+def get_evaluator(subject_properties: SubjectProperties) -> BatchedFitnessEvaluator:
+    """Provides the batched evaluator for the given subject properties.
+
+    The evaluator caches evaluation plans and CDG distances, so it is shared between
+    all chromosomes of a search.
+
+    Args:
+        subject_properties: The properties of the subject under test
+
+    Returns:
+        The evaluator for the subject properties
+    """
+    global _EVALUATOR  # noqa: PLW0603
+    if _EVALUATOR is None or _EVALUATOR.subject_properties is not subject_properties:
+        _EVALUATOR = BatchedFitnessEvaluator(subject_properties)
+    return _EVALUATOR
+
+
+def supports_batching(fitness_function: ff.FitnessFunction) -> bool:
+    """Whether the value of the fitness function can be computed in a batch.
+
+    Args:
+        fitness_function: The fitness function to check
+
+    Returns:
+        True, if the fitness function targets a goal the batched evaluator supports.
+    """
+    return isinstance(fitness_function, _BATCHED_FITNESS_FUNCTIONS)
+
+
+def compute_fitness_vector(
+    individual: tcc.TestCaseChromosome, fitness_functions: Sequence[ff.FitnessFunction]
+) -> list[float]:
+    """Computes the fitness values of the given functions for a test-case chromosome.
+
+    All coverage-goal fitness functions that share an executor are evaluated in one
+    batch; the remaining fitness functions are computed one by one.
+
+    Args:
+        individual: The test-case chromosome
+        fitness_functions: The fitness functions to compute the values for
+
+    Returns:
+        The fitness values, in the same order as the given fitness functions.
+    """
+    values: list[float] = [0.0] * len(fitness_functions)
+    batches: dict[int, tuple[ff.TestCaseFitnessFunction, list[int]]] = {}
+    for position, fitness_function in enumerate(fitness_functions):
+        if supports_batching(fitness_function):
+            batches.setdefault(
+                id(fitness_function._executor),  # noqa: SLF001
+                (fitness_function, []),
+            )[1].append(position)
+        else:
+            values[position] = fitness_function.compute_fitness(individual)
+
+    for representative, positions in batches.values():
+        result = representative._run_test_case_chromosome(individual)  # noqa: SLF001
+        evaluator = get_evaluator(representative._executor.subject_properties)  # noqa: SLF001
+        batch_values = evaluator.compute(
+            result,
+            [fitness_functions[position].goal for position in positions],  # type: ignore[attr-defined]
+        )
+        for position, value in zip(positions, batch_values, strict=True):
+            values[position] = value
+    return values
@@ -0,0 +1,301 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides checkpoints of the search state, from which a search can be resumed.
+
+A checkpoint holds the test cases of the archive and of the population as source
+code, the goals the archive covers, the state of the random number generator, the
+values of the dynamic constant pool and the numeric statistics tracked so far.  It is
+written as gzip-compressed JSON to a temporary file, which then atomically replaces
+the previous checkpoint, so a crash while writing never leaves a corrupt checkpoint.
+
+A checkpoint does not keep track of the consumed search time; the master process
+already reduces the search budget of a restarted worker accordingly.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from itertools import starmap
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pynguin.configuration as config
+import pynguin.ga.searchobserver as so
+import pynguin.utils.statistics.stats as stat
+from pynguin.analyses.seeding import parse_seed_module, render_seed_module
+from pynguin.utils import randomness
+from pynguin.utils.statistics.statisticsbackend import OutputVariable
+
+if TYPE_CHECKING:
+    import pynguin.ga.testsuitechromosome as tsc
+    from pynguin.analyses.constants import ConstantPool
+    from pynguin.ga.algorithms.generationalgorithm import GenerationAlgorithm
+
+_LOGGER = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+CHECKPOINT_FILE_NAME = "checkpoint.json.gz"
+
+
+@dataclasses.dataclass
+class SearchCheckpoint:
+    """The state of a search at a point in time."""
+
+    # Identifies the module, algorithm and seed the search was started with.
+    fingerprint: str
+
+    # The string representation of the goals covered by the archive.
+    covered_goals: list[str]
+
+    # Source code of the test cases in the archive.
+    archive: str
+
+    # Source code of the test cases in the population that are not in the archive.
+    population: str
+
+    # The state of the random number generator, as returned by getstate().
+    rng_state: list[Any]
+
+    # The values of the dynamic constant pool, keyed by the name of their type.
+    constants: dict[str, list[Any]]
+
+    # The numeric output variables of the statistics, keyed by their name.
+    statistics: dict[str, int | float]
+
+    version: int = CHECKPOINT_VERSION
+
+
+def get_checkpoint_path() -> Path:
+    """Provides the path of the checkpoint file of the configured search.
+
+    Returns:
+        The path of the checkpoint file
+    """
+    return Path(config.configuration.statistics_output.report_dir) / CHECKPOINT_FILE_NAME
+
+
+def get_fingerprint() -> str:
+    """Provides a fingerprint of the configured search.
+
+    Only a search with the same fingerprint may resume from a checkpoint.  The
+    fingerprint does not include the search budget or the execution mode, as the
+    master process changes both when it restarts a crashed worker.
+
+    Returns:
+        The fingerprint of the configured search
+    """
+    key = "\0".join((
+        config.configuration.project_path,
+        config.configuration.module_name,
+        config.configuration.algorithm.name,
+        str(config.configuration.seeding.seed),
+    ))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def write_checkpoint(checkpoint: SearchCheckpoint, path: Path) -> None:
+    """Write a checkpoint, replacing the previous one atomically.
+
+    Args:
+        checkpoint: The checkpoint to write
+        path: The path of the checkpoint file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.tmp")
+    with gzip.open(temporary, mode="wt", encoding="utf-8") as file:
+        json.dump(dataclasses.asdict(checkpoint), file)
+    temporary.replace(path)
+
+
+def read_checkpoint(path: Path) -> SearchCheckpoint | None:
+    """Read the checkpoint of the configured search.
+
+    Args:
+        path: The path of the checkpoint file
+
+    Returns:
+        The checkpoint, or None if there is no usable checkpoint for the configured
+        search.
+    """
+    if not path.is_file():
+        return None
+    try:
+        with gzip.open(path, mode="rt", encoding="utf-8") as file:
+            checkpoint = SearchCheckpoint(**json.load(file))
+    except (OSError, ValueError, TypeError) as error:
+        _LOGGER.warning("Ignoring unreadable checkpoint %s: %s", path, error)
+        return None
+    if checkpoint.version != CHECKPOINT_VERSION or checkpoint.fingerprint != get_fingerprint():
+        _LOGGER.info("Ignoring checkpoint %s of a different search", path)
+        return None
+    return checkpoint
+
+
+def create_checkpoint(
+    algorithm: GenerationAlgorithm, constant_pool: ConstantPool | None
+) -> SearchCheckpoint:
+    """Create a checkpoint of the current state of a search.
+
+    Args:
+        algorithm: The search algorithm
+        constant_pool: The dynamic constant pool, if dynamic constant seeding is used
+
+    Returns:
+        The checkpoint
+    """
+    archive = algorithm.archive
+    solutions = archive.solutions
+    population = [
+        chromosome.test_case for chromosome in algorithm.population if chromosome not in solutions
+    ]
+    return SearchCheckpoint(
+        fingerprint=get_fingerprint(),
+        covered_goals=[
+            str(goal)
+            for goal in algorithm.test_case_fitness_functions
+            if archive.is_covered(goal)  # type: ignore[attr-defined]
+        ],
+        archive=render_seed_module(solution.test_case for solution in solutions),
+        population=render_seed_module(population),
+        rng_state=_encode_rng_state(randomness.RNG.getstate()),
+        constants={} if constant_pool is None else _encode_constants(constant_pool),
+        statistics={
+            name: variable.value
+            for name, variable in stat.statistics_tracker.output_variables.items()
+            if isinstance(variable.value, int | float) and not isinstance(variable.value, bool)
+        },
+    )
+
+
+def restore_checkpoint(
+    checkpoint: SearchCheckpoint,
+    algorithm: GenerationAlgorithm,
+    constant_pool: ConstantPool | None,
+) -> None:
+    """Restore the state of a search from a checkpoint.
+
+    The algorithm re-executes the test cases of the archive and the population when
+    the search starts, which restores the covered goals.  Statistics that were
+    already tracked before the search started are not overwritten.
+
+    Args:
+        checkpoint: The checkpoint
+        algorithm: The search algorithm
+        constant_pool: The dynamic constant pool, if dynamic constant seeding is used
+    """
+    test_cases = parse_seed_module(
+        checkpoint.archive, algorithm.test_cluster, create_assertions=False
+    )
+    test_cases.extend(
+        parse_seed_module(checkpoint.population, algorithm.test_cluster, create_assertions=False)
+    )
+    algorithm.resume(test_cases)
+    if constant_pool is not None:
+        for value in _decode_constants(checkpoint.constants):
+            constant_pool.add_constant(value)
+    output_variables = stat.statistics_tracker.output_variables
+    for name, value in checkpoint.statistics.items():
+        if name not in output_variables:
+            stat.set_output_variable(OutputVariable(name=name, value=value))
+    randomness.RNG.setstate(_decode_rng_state(checkpoint.rng_state))
+    _LOGGER.info(
+        "Resuming from checkpoint with %d test cases and %d covered goals",
+        len(test_cases),
+        len(checkpoint.covered_goals),
+    )
+
+
+def _encode_rng_state(state: tuple[Any, ...]) -> list[Any]:
+    version, internal_state, gauss_next = state
+    return [version, list(internal_state), gauss_next]
+
+
+def _decode_rng_state(state: list[Any]) -> tuple[Any, ...]:
+    version, internal_state, gauss_next = state
+    return version, tuple(internal_state), gauss_next
+
+
+def _encode_constants(constant_pool: ConstantPool) -> dict[str, list[Any]]:
+    return {
+        "int": list(constant_pool.get_all_constants_for(int)),
+        "float": list(constant_pool.get_all_constants_for(float)),
+        "str": list(constant_pool.get_all_constants_for(str)),
+        "bytes": [value.hex() for value in constant_pool.get_all_constants_for(bytes)],
+        "complex": [
+            [value.real, value.imag] for value in constant_pool.get_all_constants_for(complex)
+        ],
+    }
+
+
+def _decode_constants(constants: dict[str, list[Any]]) -> list[Any]:
+    return [
+        *(int(value) for value in constants.get("int", ())),
+        *(float(value) for value in constants.get("float", ())),
+        *(str(value) for value in constants.get("str", ())),
+        *(bytes.fromhex(value) for value in constants.get("bytes", ())),
+        *starmap(complex, constants.get("complex", ())),
+    ]
+
+
+class CheckpointObserver(so.SearchObserver):
+    """Periodically writes a checkpoint of the search state."""
+
+    def __init__(
+        self,
+        algorithm: GenerationAlgorithm,
+        constant_pool: ConstantPool | None,
+        path: Path,
+        interval: int,
+    ) -> None:
+        """Initializes the observer.
+
+        Args:
+            algorithm: The search algorithm whose state is checkpointed
+            constant_pool: The dynamic constant pool, if dynamic constant seeding is used
+            path: The path of the checkpoint file
+            interval: The number of seconds between two checkpoints
+        """
+        self._algorithm = algorithm
+        self._constant_pool = constant_pool
+        self._path = path
+        self._interval_ns = interval * 1_000_000_000
+        self._last_checkpoint_ns = time.time_ns()
+        # Islands and workers forked by the search must not overwrite the checkpoint.
+        self._pid = os.getpid()
+
+    def before_search_start(self, start_time_ns: int) -> None:  # noqa: D102
+        self._last_checkpoint_ns = start_time_ns
+
+    def before_first_search_iteration(  # noqa: D102
+        self, initial: tsc.TestSuiteChromosome
+    ) -> None:
+        pass
+
+    def after_search_iteration(self, best: tsc.TestSuiteChromosome) -> None:  # noqa: D102
+        if time.time_ns() - self._last_checkpoint_ns >= self._interval_ns:
+            self._write()
+
+    def after_search_finish(self) -> None:  # noqa: D102
+        self._write()
+
+    def _write(self) -> None:
+        if os.getpid() != self._pid:
+            return
+        self._last_checkpoint_ns = time.time_ns()
+        try:
+            write_checkpoint(create_checkpoint(self._algorithm, self._constant_pool), self._path)
+        except OSError as error:
+            _LOGGER.warning("Failed to write checkpoint %s: %s", self._path, error)
+            return
+        _LOGGER.debug("Wrote checkpoint %s", self._path)
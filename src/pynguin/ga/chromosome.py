@@ -15,6 +15,9 @@ from pynguin.analyses.generator import Selectable
 from pynguin.ga.computation_cache import ComputationCache
 
 if TYPE_CHECKING:
+    from array import array
+    from collections.abc import Sequence
+
     import pynguin.ga.chromosomevisitor as cv
     import pynguin.ga.computations as ff
 
@@ -119,6 +122,41 @@ class Chromosome(Selectable):  # noqa: PLR0904
         """
         return self.computation_cache.get_fitness()
 
+    def get_fitness_vector(self) -> list[float]:
+        """Provide the fitness values of all configured fitness functions.
+
+        Returns:
+            The fitness values, in the order of the configured fitness functions.
+        """
+        return self.computation_cache.get_fitness_vector()
+
+    def get_fitness_array(self) -> array[float]:
+        """Provide a copy of the fitness values of all configured fitness functions.
+
+        Returns:
+            The fitness values, indexed by the dense indices of the fitness functions
+        """
+        return self.computation_cache.get_fitness_array()
+
+    def set_fitness_array(self, fitness_values: array[float]) -> None:
+        """Replaces the fitness values of all configured fitness functions.
+
+        Args:
+            fitness_values: The fitness values, as provided by :meth:`get_fitness_array`
+        """
+        self.computation_cache.set_fitness_array(fitness_values)
+
+    def get_fitness_values(self, fitness_functions: Sequence[ff.FitnessFunction]) -> list[float]:
+        """Provide the fitness values of several fitness functions at once.
+
+        Args:
+            fitness_functions: The fitness functions
+
+        Returns:
+            Their fitness values, in the order of the given fitness functions
+        """
+        return self.computation_cache.get_fitness_values(fitness_functions)
+
     def get_fitness_for(self, fitness_function: ff.FitnessFunction) -> float:
         """Returns the fitness values of a specific fitness function.
 
@@ -157,6 +195,23 @@ class Chromosome(Selectable):  # noqa: PLR0904
         """
         return self.computation_cache.get_coverage()
 
+    def get_coverage_array(self) -> array[float]:
+        """Provide a copy of the coverage values of all configured coverage functions.
+
+        Returns:
+            The coverage values, indexed by the dense indices of the coverage functions
+        """
+        return self.computation_cache.get_coverage_array()
+
+    def set_coverage_array(self, coverage_values: array[float]) -> None:
+        """Replaces the coverage values of all configured coverage functions.
+
+        Args:
+            coverage_values: The coverage values, as provided by
+                :meth:`get_coverage_array`
+        """
+        self.computation_cache.set_coverage_array(coverage_values)
+
     def get_coverage_for(self, coverage_function: ff.CoverageFunction) -> float:
         """Provides the coverage value for a certain coverage function.
 
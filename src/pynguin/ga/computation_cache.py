@@ -10,10 +10,14 @@ from __future__ import annotations
 
 import math
 import statistics
-from typing import TYPE_CHECKING, Any, TypeVar
+from array import array
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+import pynguin.ga.batched_fitness as bf
+from pynguin.utils.statistics.searchphases import SearchPhase, phase_timer
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Sequence
 
     from pynguin.ga.computations import CoverageFunction, FitnessFunction
 
@@ -22,8 +26,66 @@ else:
     T = TypeVar("T")
 
 
-class ComputationCache:
-    """Caches computation results and computes values on demand."""
+class _FunctionIndex(Generic[T]):
+    """Assigns dense integer indices to the functions configured for a chromosome.
+
+    The index is shared by all caches cloned from each other and is only modified by
+    the cache that owns it; every other cache copies it before adding a function.
+    """
+
+    __slots__ = ("functions", "owner", "positions")
+
+    def __init__(self, functions: Iterable[T], owner: ComputationCache | None) -> None:
+        self.functions: list[T] = list(functions)
+        self.positions: dict[T, int] = {func: i for i, func in enumerate(self.functions)}
+        self.owner = owner
+
+    def add(self, function: T) -> int:
+        self.positions[function] = len(self.functions)
+        self.functions.append(function)
+        return len(self.functions) - 1
+
+
+class _DenseValues:
+    """Stores one value per function densely, indexed by the function's index.
+
+    Values that are not yet computed are stored as NaN.  Like the function index,
+    the values are shared copy-on-write between clones.
+    """
+
+    __slots__ = ("known", "owner", "values")
+
+    def __init__(self, values: array[float], known: int, owner: ComputationCache | None) -> None:
+        self.values = values
+        self.known = known
+        self.owner = owner
+
+    @classmethod
+    def empty(cls, size: int, owner: ComputationCache) -> _DenseValues:
+        return cls(array("d", [math.nan]) * size, 0, owner)
+
+    def copy(self, owner: ComputationCache) -> _DenseValues:
+        return _DenseValues(array("d", self.values), self.known, owner)
+
+    def get(self, position: int) -> float | None:
+        value = self.values[position]
+        return None if math.isnan(value) else value
+
+    def set(self, position: int, value: float) -> None:
+        if math.isnan(self.values[position]):
+            self.known += 1
+        self.values[position] = value
+
+
+class ComputationCache:  # noqa: PLR0904
+    """Caches computation results and computes values on demand.
+
+    Every configured function has a dense integer index, under which its fitness,
+    is-covered and coverage values are stored in compact arrays.  Cloning a cache
+    shares both the index and the arrays; they are copied only when one of the
+    clones modifies them, which makes cloning a chromosome O(1).  Invalidating the
+    cache simply drops the arrays.
+    """
 
     def __init__(  # noqa: D107
         self,
@@ -31,34 +93,62 @@ class ComputationCache:
         *,
         fitness_functions: list[FitnessFunction] | None = None,
         coverage_functions: list[CoverageFunction] | None = None,
-        fitness_cache: dict[FitnessFunction, float] | None = None,
-        is_covered_cache: dict[FitnessFunction, bool] | None = None,
-        coverage_cache: dict[CoverageFunction, float] | None = None,
     ):
         self._chromosome = chromosome
-        self._fitness_functions = fitness_functions or []
-        self._coverage_functions = coverage_functions or []
-        self._fitness_cache: dict[FitnessFunction, float] = fitness_cache or {}
-        self._is_covered_cache: dict[FitnessFunction, bool] = is_covered_cache or {}
-        self._coverage_cache: dict[CoverageFunction, float] = coverage_cache or {}
+        self._fitness_index: _FunctionIndex[FitnessFunction] = _FunctionIndex(
+            fitness_functions or (), self
+        )
+        self._coverage_index: _FunctionIndex[CoverageFunction] = _FunctionIndex(
+            coverage_functions or (), self
+        )
+        self._fitness_values: _DenseValues | None = None
+        self._is_covered_values: _DenseValues | None = None
+        self._coverage_values: _DenseValues | None = None
 
     def clone(self, new_chromosome) -> ComputationCache:
-        """Create a deep copy of this cache.
+        """Create a copy of this cache.
+
+        The copy shares all data with this cache until either of them is modified.
 
         Args:
             new_chromosome: The chromosome with which this cache is associated.
 
         Returns:
-            A deep copy.
+            A copy of this cache.
         """
-        return ComputationCache(
-            new_chromosome,
-            fitness_functions=list(self._fitness_functions),
-            coverage_functions=list(self._coverage_functions),
-            fitness_cache=dict(self._fitness_cache),
-            is_covered_cache=dict(self._is_covered_cache),
-            coverage_cache=dict(self._coverage_cache),
-        )
+        clone = ComputationCache.__new__(ComputationCache)
+        clone._chromosome = new_chromosome  # noqa: SLF001
+        for name in (
+            "_fitness_index",
+            "_coverage_index",
+            "_fitness_values",
+            "_is_covered_values",
+            "_coverage_values",
+        ):
+            shared = getattr(self, name)
+            if shared is not None:
+                # Nobody owns shared data, so every cache copies it before writing.
+                shared.owner = None
+            setattr(clone, name, shared)
+        return clone
+
+    def share_functions(self, other: ComputationCache) -> None:
+        """Configure the same functions as the other cache.
+
+        The function indices are shared with the other cache, so that all chromosomes
+        created from the same set of functions use the same dense indices.  This
+        cache must not have any functions configured yet.
+
+        Args:
+            other: The cache whose functions shall be used.
+        """
+        assert not self._fitness_index.functions, "Fitness functions already configured"
+        assert not self._coverage_index.functions, "Coverage functions already configured"
+        for index in (other._fitness_index, other._coverage_index):
+            index.owner = None
+        self._fitness_index = other._fitness_index
+        self._coverage_index = other._coverage_index
+        self.invalidate_cache()
 
     def get_fitness_functions(self) -> list[FitnessFunction]:
         """Provide the currently configured fitness functions of this chromosome.
@@ -66,7 +156,18 @@ class ComputationCache:
         Returns:
             The list of currently configured fitness functions
         """
-        return self._fitness_functions
+        return self._fitness_index.functions
+
+    def get_fitness_function_index(self, fitness_function: FitnessFunction) -> int | None:
+        """Provide the dense index of a configured fitness function.
+
+        Args:
+            fitness_function: The fitness function
+
+        Returns:
+            The index of the fitness function, None if it is not configured.
+        """
+        return self._fitness_index.positions.get(fitness_function)
 
     def add_fitness_function(
         self,
@@ -80,7 +181,11 @@ class ComputationCache:
         assert not fitness_function.is_maximisation_function(), (
             "Currently only minimization is supported"
         )
-        self._fitness_functions.append(fitness_function)
+        if self._fitness_index.owner is not self:
+            self._fitness_index = _FunctionIndex(self._fitness_index.functions, self)
+        self._fitness_index.add(fitness_function)
+        self._fitness_values = self._grown(self._fitness_values)
+        self._is_covered_values = self._grown(self._is_covered_values)
 
     def get_coverage_functions(self) -> list[CoverageFunction]:
         """Provide the currently configured coverage functions of this chromosome.
@@ -88,7 +193,7 @@ class ComputationCache:
         Returns:
             The list of currently configured coverage functions.
         """
-        return self._coverage_functions
+        return self._coverage_index.functions
 
     def add_coverage_function(
         self,
@@ -99,70 +204,155 @@ class ComputationCache:
         Args:
             coverage_function: A fitness function
         """
-        self._coverage_functions.append(coverage_function)
+        if self._coverage_index.owner is not self:
+            self._coverage_index = _FunctionIndex(self._coverage_index.functions, self)
+        self._coverage_index.add(coverage_function)
+        self._coverage_values = self._grown(self._coverage_values)
+
+    def _grown(self, values: _DenseValues | None) -> _DenseValues | None:
+        if values is None:
+            return None
+        values = self._writable(values)
+        values.values.append(math.nan)
+        return values
+
+    def _writable(self, values: _DenseValues) -> _DenseValues:
+        return values if values.owner is self else values.copy(self)
 
     def _check_cache(
         self,
         comp: Callable[[T | None], None],
-        cache: dict[T, Any],
-        funcs: list[T],
+        values: _DenseValues | None,
+        index: _FunctionIndex[T],
         only: T | None = None,
     ) -> None:
         """Check if values need to be computed.
 
         Args:
             comp: The function to execute, if values need to be computed.
-            cache: The cache that should be checked.
-            funcs: The functions that are used to fill the respective cache.
+            values: The values that should be checked.
+            index: The index of the functions that are used to fill the values.
             only: Only compute the values for this function, optional.
         """
         if self._chromosome.changed:
             # If the chromosome has changed, we invalidate all values computed so far
             self.invalidate_cache()
             # Compute those values in which we are interested.
-            comp(only)
+            with phase_timer.measure(SearchPhase.FITNESS_COMPUTATION):
+                comp(only)
             # Mark individual as no longer changed.
             self._chromosome.changed = False
-        elif len(cache) != len(funcs):
+        elif values is None or values.known != len(index.functions):
             # The individual has not changed, but not all values are cached.
             # So we might have to compute the missing ones.
-            comp(only)
+            with phase_timer.measure(SearchPhase.FITNESS_COMPUTATION):
+                comp(only)
 
     def _compute_fitness(self, only: FitnessFunction | None = None):
-        for fitness_func in self._fitness_functions if only is None else (only,):
-            if fitness_func not in self._fitness_cache:
-                new_value = fitness_func.compute_fitness(self._chromosome)
-                assert (  # noqa: PT018
-                    not math.isnan(new_value) and not math.isinf(new_value) and new_value >= 0
-                ), f"Invalid fitness value {new_value}"
-                self._fitness_cache[fitness_func] = new_value
-                # When computing a minimising fitness value, we can also determine
-                # whether the goal is covered without calling compute_is_covered,
-                # simply by checking if the fitness value is close enough to zero.
-                self._is_covered_cache[fitness_func] = math.isclose(new_value, 0.0)
+        fitness_values = self._fitness_values
+        if fitness_values is None:
+            fitness_values = _DenseValues.empty(len(self._fitness_index.functions), self)
+        if only is not None and (
+            (position := self._fitness_index.positions.get(only)) is None
+            or fitness_values.get(position) is not None
+        ):
+            return
+
+        if only is None:
+            positions = [
+                position
+                for position in range(len(self._fitness_index.functions))
+                if fitness_values.get(position) is None
+            ]
+        elif not bf.supports_batching(only):
+            positions = [position]
+        else:
+            # Computing the values of all goals in one pass over the trace is hardly
+            # more expensive than computing a single one, and the remaining values are
+            # usually requested right afterwards, e.g., during ranking.
+            positions = [
+                position
+                for position, func in enumerate(self._fitness_index.functions)
+                if fitness_values.get(position) is None and bf.supports_batching(func)
+            ]
+        if not positions:
+            return
+
+        functions = self._fitness_index.functions
+        new_values = bf.compute_fitness_vector(
+            self._chromosome, [functions[position] for position in positions]
+        )
+        fitness_values = self._writable(fitness_values)
+        is_covered_values = self._is_covered_values
+        is_covered_values = (
+            _DenseValues.empty(len(functions), self)
+            if is_covered_values is None
+            else self._writable(is_covered_values)
+        )
+        for position, new_value in zip(positions, new_values, strict=True):
+            assert (  # noqa: PT018
+                not math.isnan(new_value) and not math.isinf(new_value) and new_value >= 0
+            ), f"Invalid fitness value {new_value}"
+            fitness_values.set(position, new_value)
+            # When computing a minimising fitness value, we can also determine
+            # whether the goal is covered without calling compute_is_covered,
+            # simply by checking if the fitness value is close enough to zero.
+            is_covered_values.set(position, float(math.isclose(new_value, 0.0)))
+        self._fitness_values = fitness_values
+        self._is_covered_values = is_covered_values
 
     def _compute_is_covered(self, only: FitnessFunction | None = None):
-        for fitness_func in self._fitness_functions if only is None else (only,):
-            if fitness_func not in self._is_covered_cache:
-                new_value = fitness_func.compute_is_covered(self._chromosome)
-                self._is_covered_cache[fitness_func] = new_value
+        functions = self._fitness_index.functions
+        is_covered_values = self._is_covered_values
+        is_covered_values = (
+            _DenseValues.empty(len(functions), self)
+            if is_covered_values is None
+            else self._writable(is_covered_values)
+        )
+        positions = (
+            range(len(functions))
+            if only is None
+            else (self._fitness_index.positions[only],)
+            if only in self._fitness_index.positions
+            else ()
+        )
+        for position in positions:
+            if is_covered_values.get(position) is None:
+                new_value = functions[position].compute_is_covered(self._chromosome)
+                is_covered_values.set(position, float(new_value))
+        self._is_covered_values = is_covered_values
 
     def _compute_coverage(self, only: CoverageFunction | None = None):
-        for coverage_func in self._coverage_functions if only is None else (only,):
-            if coverage_func not in self._coverage_cache:
-                new_value = coverage_func.compute_coverage(self._chromosome)
+        functions = self._coverage_index.functions
+        coverage_values = self._coverage_values
+        coverage_values = (
+            _DenseValues.empty(len(functions), self)
+            if coverage_values is None
+            else self._writable(coverage_values)
+        )
+        positions = (
+            range(len(functions))
+            if only is None
+            else (self._coverage_index.positions[only],)
+            if only in self._coverage_index.positions
+            else ()
+        )
+        for position in positions:
+            if coverage_values.get(position) is None:
+                new_value = functions[position].compute_coverage(self._chromosome)
                 assert (  # noqa: PT018
                     not math.isnan(new_value)
                     and not math.isinf(new_value)
                     and (0 <= new_value <= 1)
                 ), f"Invalid coverage value {new_value}"
-                self._coverage_cache[coverage_func] = new_value
+                coverage_values.set(position, new_value)
+        self._coverage_values = coverage_values
 
     def invalidate_cache(self) -> None:
         """Invalidate all cached computation values."""
-        self._fitness_cache.clear()
-        self._is_covered_cache.clear()
-        self._coverage_cache.clear()
+        self._fitness_values = None
+        self._is_covered_values = None
+        self._coverage_values = None
 
     def set_fitness_values(self, fitness_values: dict[FitnessFunction, float]) -> None:
         """Sets the fitness values for the specific functions.
@@ -170,8 +360,15 @@ class ComputationCache:
         Args:
             fitness_values: A dictionary of fitness values, keyed by fitness function.
         """
+        values = self._fitness_values
+        values = (
+            _DenseValues.empty(len(self._fitness_index.functions), self)
+            if values is None
+            else self._writable(values)
+        )
         for fitness_key, value in fitness_values.items():
-            self._fitness_cache[fitness_key] = value
+            values.set(self._fitness_index.positions[fitness_key], value)
+        self._fitness_values = values
 
     def get_fitness(self) -> float:
         """Provide a sum of the current fitness values.
@@ -181,10 +378,58 @@ class ComputationCache:
         """
         self._check_cache(
             self._compute_fitness,
-            self._fitness_cache,
-            self._fitness_functions,
+            self._fitness_values,
+            self._fitness_index,
+        )
+        if self._fitness_values is None:
+            return 0
+        return sum(self._fitness_values.values)
+
+    def get_fitness_vector(self) -> list[float]:
+        """Provide the fitness values of all configured fitness functions.
+
+        Returns:
+            The fitness values, in the order of the configured fitness functions.
+        """
+        self._check_cache(
+            self._compute_fitness,
+            self._fitness_values,
+            self._fitness_index,
+        )
+        if self._fitness_values is None:
+            return []
+        return self._fitness_values.values.tolist()
+
+    def get_fitness_array(self) -> array[float]:
+        """Provide a copy of the fitness values of all configured fitness functions.
+
+        Returns:
+            The fitness values, indexed by the dense indices of the fitness functions.
+        """
+        self._check_cache(
+            self._compute_fitness,
+            self._fitness_values,
+            self._fitness_index,
+        )
+        if self._fitness_values is None:
+            return array("d")
+        return array("d", self._fitness_values.values)
+
+    def set_fitness_array(self, fitness_values: array[float]) -> None:
+        """Replaces the fitness values of all configured fitness functions.
+
+        Whether a goal is covered is derived from its fitness value.
+
+        Args:
+            fitness_values: The fitness values of all configured fitness functions,
+                e.g., as provided by :meth:`get_fitness_array`.
+        """
+        size = len(self._fitness_index.functions)
+        assert len(fitness_values) == size, "Fitness values do not match the functions"
+        self._fitness_values = _DenseValues(array("d", fitness_values), size, self)
+        self._is_covered_values = _DenseValues(
+            array("d", (float(value == 0.0) for value in fitness_values)), size, self
         )
-        return sum(self._fitness_cache.values())
 
     def get_fitness_for(self, fitness_function: FitnessFunction) -> float:
         """Returns the fitness values of a specific fitness function.
@@ -195,13 +440,44 @@ class ComputationCache:
         Returns:
             Its fitness value
         """
+        position = self._fitness_index.positions.get(fitness_function)
+        if position is None:
+            # Values of functions that are not configured are not cached.
+            if self._chromosome.changed:
+                self.invalidate_cache()
+            return fitness_function.compute_fitness(self._chromosome)
         self._check_cache(
             self._compute_fitness,
-            self._fitness_cache,
-            self._fitness_functions,
+            self._fitness_values,
+            self._fitness_index,
             fitness_function,
         )
-        return self._fitness_cache[fitness_function]
+        assert self._fitness_values is not None
+        return self._fitness_values.values[position]
+
+    def get_fitness_values(self, fitness_functions: Sequence[FitnessFunction]) -> list[float]:
+        """Returns the fitness values of several fitness functions at once.
+
+        Args:
+            fitness_functions: The fitness functions
+
+        Returns:
+            Their fitness values, in the order of the given fitness functions.
+        """
+        positions = self._fitness_index.positions
+        values: list[float] = []
+        for fitness_function in fitness_functions:
+            position = positions.get(fitness_function)
+            fitness_values = self._fitness_values
+            if (
+                position is None
+                or fitness_values is None
+                or self._chromosome.changed
+                or (value := fitness_values.get(position)) is None
+            ):
+                value = self.get_fitness_for(fitness_function)
+            values.append(value)
+        return values
 
     def get_is_covered(self, fitness_function: FitnessFunction) -> bool:
         """Check if the individual covers this fitness function.
@@ -212,13 +488,20 @@ class ComputationCache:
         Returns:
             True, iff the individual covers the fitness function.
         """
+        position = self._fitness_index.positions.get(fitness_function)
+        if position is None:
+            # Values of functions that are not configured are not cached.
+            if self._chromosome.changed:
+                self.invalidate_cache()
+            return fitness_function.compute_is_covered(self._chromosome)
         self._check_cache(
             self._compute_is_covered,
-            self._is_covered_cache,
-            self._fitness_functions,
+            self._is_covered_values,
+            self._fitness_index,
             fitness_function,
         )
-        return self._is_covered_cache[fitness_function]
+        assert self._is_covered_values is not None
+        return self._is_covered_values.values[position] == 1.0
 
     def set_coverage_values(self, coverage_values: dict[CoverageFunction, float]) -> None:
         """Sets the coverage values for the specific functions.
@@ -226,8 +509,15 @@ class ComputationCache:
         Args:
             coverage_values: A dictionary of coverage values, keyed by coverage function.
         """
+        values = self._coverage_values
+        values = (
+            _DenseValues.empty(len(self._coverage_index.functions), self)
+            if values is None
+            else self._writable(values)
+        )
         for coverage_key, value in coverage_values.items():
-            self._coverage_cache[coverage_key] = value
+            values.set(self._coverage_index.positions[coverage_key], value)
+        self._coverage_values = values
 
     def get_coverage(self) -> float:
         """Provides the mean coverage value.
@@ -237,10 +527,38 @@ class ComputationCache:
         """
         self._check_cache(
             self._compute_coverage,
-            self._coverage_cache,
-            self._coverage_functions,
+            self._coverage_values,
+            self._coverage_index,
         )
-        return statistics.mean(self._coverage_cache.values())
+        if self._coverage_values is None:
+            return statistics.mean(())
+        return statistics.mean(self._coverage_values.values)
+
+    def get_coverage_array(self) -> array[float]:
+        """Provide a copy of the coverage values of all configured coverage functions.
+
+        Returns:
+            The coverage values, indexed by the dense indices of the coverage functions.
+        """
+        self._check_cache(
+            self._compute_coverage,
+            self._coverage_values,
+            self._coverage_index,
+        )
+        if self._coverage_values is None:
+            return array("d")
+        return array("d", self._coverage_values.values)
+
+    def set_coverage_array(self, coverage_values: array[float]) -> None:
+        """Replaces the coverage values of all configured coverage functions.
+
+        Args:
+            coverage_values: The coverage values of all configured coverage functions,
+                e.g., as provided by :meth:`get_coverage_array`.
+        """
+        size = len(self._coverage_index.functions)
+        assert len(coverage_values) == size, "Coverage values do not match the functions"
+        self._coverage_values = _DenseValues(array("d", coverage_values), size, self)
 
     def get_coverage_for(self, coverage_function: CoverageFunction) -> float:
         """Provides the coverage value for a certain coverage function.
@@ -252,10 +570,17 @@ class ComputationCache:
         Returns:
             The coverage value for the fitness function
         """
+        position = self._coverage_index.positions.get(coverage_function)
+        if position is None:
+            # Values of functions that are not configured are not cached.
+            if self._chromosome.changed:
+                self.invalidate_cache()
+            return coverage_function.compute_coverage(self._chromosome)
         self._check_cache(
             self._compute_coverage,
-            self._coverage_cache,
-            self._coverage_functions,
+            self._coverage_values,
+            self._coverage_index,
             coverage_function,
         )
-        return self._coverage_cache[coverage_function]
+        assert self._coverage_values is not None
+        return self._coverage_values.values[position]
@@ -419,6 +419,15 @@ class LineCoverageTestFitness(ff.TestCaseFitnessFunction):
     def __repr__(self) -> str:
         return f"LineCoverageTestFitness(executor={self._executor}, goal={self._goal})"
 
+    @property
+    def goal(self) -> LineCoverageGoal:
+        """Provides the line-coverage goal of this fitness function.
+
+        Returns:
+            The attached line-coverage goal
+        """
+        return self._goal
+
 
 class StatementCheckedCoverageTestFitness(ff.TestCaseFitnessFunction):
     """A statement checked coverage fitness implementation for test cases."""
@@ -447,6 +456,15 @@ class StatementCheckedCoverageTestFitness(ff.TestCaseFitnessFunction):
     def __repr__(self) -> str:
         return f"CheckedCoverageTestFitness(executor={self._executor}, goal={self._goal})"
 
+    @property
+    def goal(self) -> CheckedCoverageGoal:
+        """Provides the checked-coverage goal of this fitness function.
+
+        Returns:
+            The attached checked-coverage goal
+        """
+        return self._goal
+
 
 def create_branch_coverage_fitness_functions(
     executor: AbstractTestCaseExecutor, branch_goal_pool: BranchGoalPool
@@ -19,24 +19,34 @@ from typing import TYPE_CHECKING, Generic, TypeVar
 
 import pynguin.configuration as config
 import pynguin.ga.algorithms.archive as arch
+import pynguin.ga.checkpoint as ckpt
 import pynguin.ga.chromosome as chrom
 import pynguin.ga.computations as ff
 import pynguin.ga.coveragegoals as bg
 import pynguin.ga.llmtestsuitechromosomefactory as ltscf
 import pynguin.ga.searchobserver as so
+import pynguin.ga.testcasechromosome as tcc
 import pynguin.ga.testcasechromosomefactory as tccf
 import pynguin.ga.testcasefactory as tcf
 import pynguin.ga.testsuitechromosome as tsc
 import pynguin.ga.testsuitechromosomefactory as tscf
 import pynguin.testcase.testfactory as tf
 import pynguin.utils.statistics.statisticsobserver as sso
-from pynguin.analyses.constants import ConstantProvider, EmptyConstantProvider
+from pynguin.analyses.constants import (
+    ConstantProvider,
+    DynamicConstantProvider,
+    EmptyConstantProvider,
+)
+from pynguin.analyses.corpus import TestCorpus, get_code_object_hashes
 from pynguin.analyses.module import FilteredModuleTestCluster, ModuleTestCluster
 from pynguin.analyses.seeding import InitialPopulationProvider
+from pynguin.ga.algorithms.abstractmosaalgorithm import AbstractMOSAAlgorithm
 from pynguin.ga.algorithms.dynamosaalgorithm import DynaMOSAAlgorithm
+from pynguin.ga.algorithms.islanddynamosaalgorithm import IslandDynaMOSAAlgorithm
 from pynguin.ga.algorithms.llmosalgorithm import LLMOSAAlgorithm
 from pynguin.ga.algorithms.mioalgorithm import MIOAlgorithm
 from pynguin.ga.algorithms.mosaalgorithm import MOSAAlgorithm
+from pynguin.ga.algorithms.parallelmioalgorithm import ParallelMIOAlgorithm
 from pynguin.ga.algorithms.randomalgorithm import RandomAlgorithm
 from pynguin.ga.algorithms.randomsearchalgorithm import (
     RandomTestCaseSearchAlgorithm,
@@ -44,7 +54,11 @@ from pynguin.ga.algorithms.randomsearchalgorithm import (
 )
 from pynguin.ga.algorithms.wholesuitealgorithm import WholeSuiteAlgorithm
 from pynguin.ga.operators.crossover import SinglePointRelativeCrossOver
-from pynguin.ga.operators.ranking import RankBasedPreferenceSorting
+from pynguin.ga.operators.ranking import (
+    NUMPY_AVAILABLE,
+    RankBasedPreferenceSorting,
+    VectorizedRankBasedPreferenceSorting,
+)
 from pynguin.ga.operators.selection import (
     RandomSelection,
     RankSelection,
@@ -71,6 +85,7 @@ if TYPE_CHECKING:
     from typing import ClassVar
 
     import pynguin.ga.chromosomefactory as cf
+    import pynguin.testcase.testcase as tc
     from pynguin.ga.algorithms.generationalgorithm import GenerationAlgorithm
     from pynguin.ga.operators.crossover import CrossOverFunction
     from pynguin.ga.operators.ranking import RankingFunction
@@ -182,6 +197,8 @@ class TestSuiteGenerationAlgorithmFactory(GenerationAlgorithmFactory[tsc.TestSui
         if constant_provider is None:
             constant_provider = EmptyConstantProvider()
         self._constant_provider: ConstantProvider = constant_provider
+        self._corpus_test_cases: list[tc.TestCase] = []
+        self._corpus_chromosomes: list[tcc.TestCaseChromosome] = []
 
     def _get_chromosome_factory(self, strategy: GenerationAlgorithm) -> cf.ChromosomeFactory:
         """Provides a chromosome factory.
@@ -196,16 +213,18 @@ class TestSuiteGenerationAlgorithmFactory(GenerationAlgorithmFactory[tsc.TestSui
         test_case_factory: tcf.TestCaseFactory = tcf.RandomLengthTestCaseFactory(
             strategy.test_factory, strategy.test_cluster
         )
-        if config.configuration.seeding.initial_population_seeding:
+        if config.configuration.seeding.initial_population_seeding or self._corpus_test_cases:
             self._logger.info("Using population seeding")
             population_provider = InitialPopulationProvider(
                 test_cluster=self._test_cluster,
                 test_factory=strategy.test_factory,
             )
-            self._logger.info("Collecting and parsing provided testcases.")
-            population_provider.collect_testcases(
-                config.configuration.seeding.initial_population_data
-            )
+            if config.configuration.seeding.initial_population_seeding:
+                self._logger.info("Collecting and parsing provided testcases.")
+                population_provider.collect_testcases(
+                    config.configuration.seeding.initial_population_data
+                )
+            population_provider.add_testcases(self._corpus_test_cases)
             if len(population_provider) == 0:
                 self._logger.info("Could not parse any test case")
             else:
@@ -253,6 +272,8 @@ class TestSuiteGenerationAlgorithmFactory(GenerationAlgorithmFactory[tsc.TestSui
         strategy = self._get_generation_strategy()
         strategy.branch_goal_pool = bg.BranchGoalPool(self._executor.subject_properties)
         strategy.test_case_fitness_functions = self._get_test_case_fitness_functions(strategy)
+        if config.configuration.seeding.corpus_directory:
+            self._replay_corpus(strategy)
         strategy.test_suite_fitness_functions = self._get_test_suite_fitness_functions()
         strategy.test_suite_coverage_functions = self._get_test_suite_coverage_functions()
         strategy.archive = self._get_archive(strategy)
@@ -276,6 +297,7 @@ class TestSuiteGenerationAlgorithmFactory(GenerationAlgorithmFactory[tsc.TestSui
         strategy.add_search_observer(so.LogSearchObserver())
         strategy.add_search_observer(sso.SequenceStartTimeObserver())
         strategy.add_search_observer(sso.IterationObserver())
+        strategy.add_search_observer(sso.PhaseTimingObserver())
         strategy.add_search_observer(sso.BestIndividualObserver())
 
         crossover_function = self._get_crossover_function()
@@ -284,8 +306,100 @@ class TestSuiteGenerationAlgorithmFactory(GenerationAlgorithmFactory[tsc.TestSui
         ranking_function = self._get_ranking_function()
         strategy.ranking_function = ranking_function
 
+        if self._corpus_chromosomes:
+            # The replayed chromosomes were already executed, so resuming from them
+            # does not execute the corpus again.
+            strategy.resume_evaluated(self._corpus_chromosomes)
+        if config.configuration.search_algorithm.checkpoint_interval > 0:
+            self._setup_checkpointing(strategy)
+
         return strategy
 
+    def _replay_corpus(self, strategy: GenerationAlgorithm) -> None:
+        """Replays the test corpus and removes the goals it makes obsolete.
+
+        Goals of code objects that did not change since the corpus was stored are
+        only kept if the replayed tests cover them; the previous run did not reach
+        the others either, so the search budget is left to new and changed code.
+
+        Args:
+            strategy: The strategy whose test-case fitness functions are filtered
+        """
+        path = TestCorpus.get_path(
+            config.configuration.seeding.corpus_directory, config.configuration.module_name
+        )
+        corpus = TestCorpus.load(path)
+        if corpus is None:
+            self._logger.info("No test corpus found at %s", path)
+            return
+        hashes = get_code_object_hashes(self._executor.subject_properties)
+        unchanged = {
+            code_object_id
+            for code_object_id, code_object_hash in hashes.items()
+            if corpus.knows(code_object_hash)
+        }
+        self._corpus_test_cases = corpus.get_test_cases(
+            (hashes[code_object_id] for code_object_id in unchanged), self._test_cluster
+        )
+        fitness_functions = strategy.test_case_fitness_functions
+        unchanged_goals = [
+            fitness_function
+            for fitness_function in fitness_functions
+            if fitness_function.code_object_id in unchanged
+        ]
+        covered: set[ff.TestCaseFitnessFunction] = set()
+        self._corpus_chromosomes = []
+        for test_case in self._corpus_test_cases:
+            chromosome = tcc.TestCaseChromosome(test_case)
+            for goal in unchanged_goals:
+                chromosome.add_fitness_function(goal)
+            # Executes the test once and computes all its goals in one pass.
+            chromosome.get_fitness()
+            covered.update(goal for goal in unchanged_goals if chromosome.get_is_covered(goal))
+            self._corpus_chromosomes.append(chromosome)
+        strategy.test_case_fitness_functions = OrderedSet(
+            fitness_function
+            for fitness_function in fitness_functions
+            if fitness_function.code_object_id not in unchanged or fitness_function in covered
+        )
+        self._logger.info(
+            "Replayed %d corpus tests, %d of %d code objects are unchanged, %d of %d goals remain",
+            len(self._corpus_test_cases),
+            len(unchanged),
+            len(self._executor.subject_properties.existing_code_objects),
+            len(strategy.test_case_fitness_functions),
+            len(fitness_functions),
+        )
+
+    def _setup_checkpointing(self, strategy: GenerationAlgorithm) -> None:
+        """Resumes the strategy from the latest checkpoint and checkpoints its search.
+
+        Args:
+            strategy: The fully configured strategy
+        """
+        if not isinstance(strategy, AbstractMOSAAlgorithm | MIOAlgorithm):
+            self._logger.warning(
+                "Checkpointing is not supported by %s", config.configuration.algorithm
+            )
+            return
+        constant_pool = (
+            self._constant_provider.pool
+            if isinstance(self._constant_provider, DynamicConstantProvider)
+            else None
+        )
+        path = ckpt.get_checkpoint_path()
+        if (checkpoint := ckpt.read_checkpoint(path)) is not None:
+            self._logger.info("Resuming search from checkpoint %s", path)
+            ckpt.restore_checkpoint(checkpoint, strategy, constant_pool)
+        strategy.add_search_observer(
+            ckpt.CheckpointObserver(
+                strategy,
+                constant_pool,
+                path,
+                config.configuration.search_algorithm.checkpoint_interval,
+            )
+        )
+
     @classmethod
     def _get_generation_strategy(cls) -> GenerationAlgorithm:
         """Provides a generation strategy.
@@ -296,6 +410,26 @@ class TestSuiteGenerationAlgorithmFactory(GenerationAlgorithmFactory[tsc.TestSui
         Raises:
             ConfigurationException: if an unknown algorithm was requested
         """
+        if (
+            config.configuration.algorithm == config.Algorithm.DYNAMOSA
+            and config.configuration.search_algorithm.number_of_islands > 1
+        ):
+            cls._logger.info(
+                "Using strategy: %s with %d islands",
+                config.configuration.algorithm,
+                config.configuration.search_algorithm.number_of_islands,
+            )
+            return IslandDynaMOSAAlgorithm()
+        if (
+            config.configuration.algorithm == config.Algorithm.MIO
+            and config.configuration.mio.number_of_workers > 1
+        ):
+            cls._logger.info(
+                "Using strategy: %s with %d workers",
+                config.configuration.algorithm,
+                config.configuration.mio.number_of_workers,
+            )
+            return ParallelMIOAlgorithm()
         if config.configuration.algorithm in cls._strategies:
             strategy = cls._strategies.get(config.configuration.algorithm)
             assert strategy, "Strategy cannot be defined as None"
@@ -349,6 +483,9 @@ class TestSuiteGenerationAlgorithmFactory(GenerationAlgorithmFactory[tsc.TestSui
         return arch.CoverageArchive(OrderedSet(strategy.test_case_fitness_functions))
 
     def _get_ranking_function(self) -> RankingFunction:
+        if NUMPY_AVAILABLE:
+            self._logger.info("Using ranking function: VectorizedRankBasedPreferenceSorting")
+            return VectorizedRankBasedPreferenceSorting()
         self._logger.info("Using ranking function: RankBasedPreferenceSorting")
         return RankBasedPreferenceSorting()
 
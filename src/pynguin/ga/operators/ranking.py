@@ -19,8 +19,18 @@ import pynguin.ga.chromosome as chrom
 from pynguin.ga.operators.comparator import DominanceComparator, PreferenceSortingComparator
 from pynguin.utils import randomness
 from pynguin.utils.orderedset import OrderedSet
+from pynguin.utils.statistics.searchphases import SearchPhase, measured
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import pynguin.ga.computations as ff
 
 C = TypeVar("C", bound=chrom.Chromosome)
@@ -88,6 +98,7 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
 
     _logger = logging.getLogger(__name__)
 
+    @measured(SearchPhase.RANKING)
     def compute_ranking_assignment(  # noqa: C901,D102
         self, solutions: list[C], uncovered_goals: OrderedSet[ff.FitnessFunction]
     ) -> RankedFronts:
@@ -183,6 +194,126 @@ class RankBasedPreferenceSorting(RankingFunction, Generic[C]):
         return front
 
 
+class VectorizedRankBasedPreferenceSorting(RankBasedPreferenceSorting, Generic[C]):
+    """Computes the MOSA preference sorting on the fitness matrix using NumPy.
+
+    The population's fitness values for all uncovered goals are collected into one
+    matrix, from which the preferred solutions and the dominance relation of all pairs
+    of solutions are computed with array operations.  The resulting fronts are the same
+    as those of :class:`RankBasedPreferenceSorting`, except for the random choice
+    among equally good solutions for a goal.
+    """
+
+    # Upper bound on the number of elements of the temporary arrays created while
+    # computing the dominance relation.
+    _BLOCK_ELEMENTS = 1 << 22
+
+    @measured(SearchPhase.RANKING)
+    def compute_ranking_assignment(  # noqa: D102
+        self, solutions: list[C], uncovered_goals: OrderedSet[ff.FitnessFunction]
+    ) -> RankedFronts:
+        if not solutions:
+            self._logger.debug("Solution is empty")
+            return RankedFronts()
+
+        fitness = fitness_matrix(solutions, list(uncovered_goals))
+        zero_front_indices = self._get_zero_front_indices(solutions, fitness)
+        zero_front = [solutions[index] for index in zero_front_indices]
+        for solution in zero_front:
+            solution.rank = 0
+        fronts = [zero_front]
+        front_index = 1
+
+        in_zero_front = set(zero_front_indices)
+        remaining = np.array(
+            [index for index in range(len(solutions)) if index not in in_zero_front],
+            dtype=np.intp,
+        )
+        population = config.configuration.search_algorithm.population
+        if len(zero_front) >= population:
+            rest = [solutions[index] for index in remaining]
+            for solution in rest:
+                solution.rank = front_index
+            fronts.append(rest)
+            return RankedFronts(fronts)
+
+        dominates = self._dominance_matrix(fitness)
+        ranked_solutions = len(zero_front)
+        while ranked_solutions < population and len(remaining) > 0:
+            dominated = dominates[np.ix_(remaining, remaining)].any(axis=0)
+            new_front = [solutions[index] for index in remaining[~dominated]]
+            for solution in new_front:
+                solution.rank = front_index
+            fronts.append(new_front)
+            remaining = remaining[dominated]
+            ranked_solutions += len(new_front)
+            front_index += 1
+        return RankedFronts(fronts)
+
+    @staticmethod
+    def _get_zero_front_indices(solutions: list[C], fitness: np.ndarray) -> list[int]:
+        if fitness.shape[1] == 0:
+            return []
+        lengths = np.fromiter(
+            (solution.length() for solution in solutions), dtype=float, count=len(solutions)
+        )[:, np.newaxis]
+        # The best solutions for a goal have the minimal fitness value, and among
+        # those, the minimal length.
+        best_fitness = fitness == fitness.min(axis=0)
+        best_lengths = np.where(best_fitness, lengths, np.inf)
+        best = best_fitness & (best_lengths == best_lengths.min(axis=0))
+        zero_front: OrderedSet[int] = OrderedSet()
+        for candidates in best.T:
+            indices = np.flatnonzero(candidates)
+            if len(indices) == 1:
+                zero_front.add(int(indices[0]))
+            else:
+                zero_front.add(int(randomness.choice(indices)))
+        return list(zero_front)
+
+    @classmethod
+    def _dominance_matrix(cls, fitness: np.ndarray) -> np.ndarray:
+        """Computes which solution dominates which other solution.
+
+        Args:
+            fitness: The population-by-goals fitness matrix
+
+        Returns:
+            A boolean matrix whose entry (i, j) is true iff solution i dominates j.
+        """
+        size, goals = fitness.shape
+        dominates = np.zeros((size, size), dtype=bool)
+        if goals == 0:
+            return dominates
+        block = max(1, cls._BLOCK_ELEMENTS // max(1, size * goals))
+        for start in range(0, size, block):
+            rows = fitness[start : start + block, np.newaxis, :]
+            dominates[start : start + block] = (rows <= fitness).all(axis=2) & (rows < fitness).any(
+                axis=2
+            )
+        return dominates
+
+
+def fitness_matrix(
+    solutions: Sequence[chrom.Chromosome], goals: Sequence[ff.FitnessFunction]
+) -> np.ndarray:
+    """Collects the fitness values of the solutions for the goals into a matrix.
+
+    Args:
+        solutions: The solutions
+        goals: The goals
+
+    Returns:
+        The population-by-goals matrix of fitness values
+    """
+    matrix = np.empty((len(solutions), len(goals)), dtype=float)
+    if goals:
+        for row, solution in enumerate(solutions):
+            matrix[row] = solution.get_fitness_values(goals)
+    return matrix
+
+
+@measured(SearchPhase.RANKING)
 def fast_epsilon_dominance_assignment(
     front: list[C], goals: OrderedSet[ff.FitnessFunction]
 ) -> None:
@@ -197,6 +328,10 @@ def fast_epsilon_dominance_assignment(
         front: Front of non-dominated solutions/tests
         goals: Set of goals/targets (e.g., branches) to consider
     """
+    if NUMPY_AVAILABLE:
+        _vectorized_epsilon_dominance_assignment(front, goals)
+        return
+
     for test in front:
         test.distance = 0
 
@@ -222,3 +357,25 @@ def fast_epsilon_dominance_assignment(
             numerator = len(front) - len(min_set)
             denominator = len(front)
             test.distance = max(test.distance, numerator / denominator)
+
+
+def _vectorized_epsilon_dominance_assignment(
+    front: list[C], goals: OrderedSet[ff.FitnessFunction]
+) -> None:
+    if not front:
+        return
+    if not goals:
+        for test in front:
+            test.distance = 0
+        return
+    fitness = fitness_matrix(front, list(goals))
+    minimum = fitness.min(axis=0)
+    maximum = np.maximum(fitness.max(axis=0), 0.0)
+    is_minimal = fitness == minimum
+    min_set_sizes = is_minimal.sum(axis=0)
+    # Goals on which all tests are equally good do not contribute to the distance.
+    relevant = (maximum != minimum) & (minimum <= sys.float_info.max)
+    scores = np.where(relevant, (len(front) - min_set_sizes) / len(front), 0.0)
+    distances = np.where(is_minimal, scores, 0.0).max(axis=1)
+    for test, distance in zip(front, distances.tolist(), strict=True):
+        test.distance = distance
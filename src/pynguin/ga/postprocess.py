@@ -54,8 +54,7 @@ def get_assertion_protected_variables(test_case: tc.TestCase) -> set[str]:
     protected = _directly_asserted_variables(test_case)
     if not protected:
         return protected
-    _add_backward_dependencies(test_case, protected)
-    return protected
+    return test_case.backward_dependencies(protected)
 
 
 def _directly_asserted_variables(test_case: tc.TestCase) -> set[str]:
@@ -68,7 +67,7 @@ def _directly_asserted_variables(test_case: tc.TestCase) -> set[str]:
         The set of directly asserted variable names.
     """
     protected: set[str] = set()
-    for statement in test_case.statements():
+    for statement in test_case.iter_statements():
         for assertion in statement.assertions:
             if isinstance(assertion, ExceptionAssertion):
                 continue
@@ -80,26 +79,6 @@ def _directly_asserted_variables(test_case: tc.TestCase) -> set[str]:
     return protected
 
 
-def _add_backward_dependencies(test_case: tc.TestCase, protected: set[str]) -> None:
-    """Extend *protected* with any variable used to compute a protected variable.
-
-    Args:
-        test_case: Test case to analyze.
-        protected: The set of protected variable names, mutated in place.
-    """
-    statements = test_case.statements()
-    changed = True
-    while changed:
-        changed = False
-        for statement in statements:
-            bv = statement.bound_variable
-            if bv is not None and bv in protected:
-                for used in statement.used_variables():
-                    if used not in protected:
-                        protected.add(used)
-                        changed = True
-
-
 class ExceptionTruncation(cv.ChromosomeVisitor):
     """Truncates test cases after an exception-raising statement."""
 
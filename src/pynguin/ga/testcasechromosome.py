@@ -172,6 +172,16 @@ class TestCaseChromosome(chrom.Chromosome):
         """
         self._last_execution_result = result
 
+    def reuse_evaluation_of(self, other: TestCaseChromosome) -> None:
+        """Take over the execution result and the computed values of another chromosome.
+
+        Args:
+            other: An evaluated chromosome whose test case has the same code
+        """
+        self._last_execution_result = other._last_execution_result
+        self.computation_cache = other.computation_cache.clone(self)
+        self.changed = other.changed
+
     def remove_last_execution_result(self) -> None:
         """Removes the last execution result."""
         self._last_execution_result = None
@@ -47,12 +47,20 @@ class TestCaseChromosomeFactory(cf.ChromosomeFactory[tcc.TestCaseChromosome]):
         self._test_factory = test_factory
         self._test_case_factory = test_case_factory
         self._fitness_functions = fitness_functions
+        # The first chromosome created, whose goal indices all later ones share.
+        self._prototype: tcc.TestCaseChromosome | None = None
 
     def get_chromosome(self) -> tcc.TestCaseChromosome:  # noqa: D102
         test_case = self._test_case_factory.get_test_case()
         chrom = tcc.TestCaseChromosome(test_case=test_case, test_factory=self._test_factory)
+        if self._prototype is not None and len(self._prototype.get_fitness_functions()) == len(
+            self._fitness_functions
+        ):
+            chrom.computation_cache.share_functions(self._prototype.computation_cache)
+            return chrom
         for func in self._fitness_functions:
             chrom.add_fitness_function(func)
+        self._prototype = chrom
         return chrom
 
 
@@ -68,7 +68,9 @@ from pynguin.analyses.constants import (
     RestrictedConstantPool,
     collect_static_constants,
 )
+from pynguin.analyses.corpus import TestCorpus
 from pynguin.analyses.module import generate_test_cluster
+from pynguin.assertion.mutation_analysis.cache import MutationAnalysisCache, get_mutants_key
 from pynguin.assertion.mutation_analysis.controller import MutationController
 from pynguin.assertion.mutation_analysis.transformer import ParentNodeTransformer
 from pynguin.instrumentation.machinery import InstrumentationFinder, install_import_hook
@@ -87,6 +89,12 @@ from pynguin.utils.report import (
     render_coverage_report,
     render_xml_coverage_report,
 )
+from pynguin.utils.statistics.profiler import (
+    ProfilePhase,
+    profile_phase,
+    profiled,
+    profiling,
+)
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 if TYPE_CHECKING:
@@ -142,9 +150,10 @@ def run_pynguin() -> ReturnCode:
     """
     try:
         _LOGGER.info("Start Pynguin Test Generation…")
-        if config.configuration.algorithm == config.Algorithm.LLM:
-            return _run_llm()
-        return _run()
+        with profiling():
+            if config.configuration.algorithm == config.Algorithm.LLM:
+                return _run_llm()
+            return _run()
     finally:
         _LOGGER.info("Stop Pynguin Test Generation…")
 
@@ -678,7 +687,8 @@ def _run() -> ReturnCode:  # noqa: C901, PLR0915
         executor, test_cluster, constant_provider
     )
     _LOGGER.info("Start generating test cases")
-    generation_result = algorithm.generate_tests()
+    with profile_phase(ProfilePhase.GENERATION):
+        generation_result = algorithm.generate_tests()
     if algorithm.resources_left():
         _LOGGER.info("Algorithm stopped before using all resources.")
     else:
@@ -715,6 +725,9 @@ def _run() -> ReturnCode:  # noqa: C901, PLR0915
     except Exception as ex:
         _LOGGER.exception("Minimization failed: %s", ex)
 
+    if config.configuration.seeding.corpus_directory:
+        _update_corpus(executor, generation_result)
+
     if (
         tracked_metrics := _track_final_metrics(
             algorithm,
@@ -852,6 +865,7 @@ def _check_coverage(original_coverages: list[float], minimized_coverages: list[f
     return is_same
 
 
+@profiled(ProfilePhase.MINIMIZATION)
 def _minimize(generation_result, algorithm=None):
     truncation = pp.ExceptionTruncation()
     generation_result.accept(truncation)
@@ -950,6 +964,29 @@ def _minimize(generation_result, algorithm=None):
     generation_result.accept(empty_test_case_remover)
 
 
+def _update_corpus(executor: TestCaseExecutor, generation_result: tsc.TestSuiteChromosome) -> None:
+    """Replaces the test corpus of the module under test with the generated tests.
+
+    Args:
+        executor: The executor of the subject under test
+        generation_result: The generated test suite
+    """
+    path = TestCorpus.get_path(
+        config.configuration.seeding.corpus_directory, config.configuration.module_name
+    )
+    corpus = TestCorpus.create(
+        (chromosome.test_case for chromosome in generation_result.test_case_chromosomes),
+        executor,
+    )
+    try:
+        corpus.save(path)
+    except OSError as error:
+        _LOGGER.warning("Failed to store the test corpus %s: %s", path, error)
+        return
+    _LOGGER.info("Stored %d tests in the test corpus %s", len(corpus.tests), path)
+
+
+@profiled(ProfilePhase.MINIMIZATION)
 def _minimize_assertions(generation_result: tsc.TestSuiteChromosome):
     _LOGGER.info("Minimizing assertions based on checked coverage")
     assertion_minimizer = pp.AssertionMinimization()
@@ -1020,12 +1057,16 @@ _strategies: dict[config.MutationStrategy, Callable[[int], ms.HOMStrategy]] = {
 }
 
 
-def _setup_mutant_generator() -> mu.Mutator:
-    operators: list[type[MutationOperator]] = [
+def _mutation_operators() -> list[type[MutationOperator]]:
+    return [
         *mo.standard_operators,
         *mo.experimental_operators,
     ]
 
+
+def _setup_mutant_generator() -> mu.Mutator:
+    operators = _mutation_operators()
+
     output = config.configuration.test_case_output
     mutation_strategy = output.mutation_strategy
 
@@ -1052,6 +1093,26 @@ def _setup_mutant_generator() -> mu.Mutator:
     raise ConfigurationException("No suitable mutation strategy found.")
 
 
+def _setup_mutation_analysis_cache(module_source_code: str) -> MutationAnalysisCache | None:
+    output = config.configuration.test_case_output
+    if not output.mutation_cache_directory:
+        return None
+    # The mutants, and thereby their numbers, depend on the source code of the module
+    # and the settings of the mutant generation; the seed only matters for sampling.
+    mutants_key = get_mutants_key(
+        module_source_code,
+        _mutation_operators(),
+        config.configuration.module_name,
+        output.mutation_strategy.name,
+        output.mutation_order,
+        output.maximum_mutants,
+        output.maximum_mutation_time >= 0,
+        config.configuration.seeding.seed if output.maximum_mutants >= 0 else None,
+        output.filter_equivalent_mutants,
+    )
+    return MutationAnalysisCache(Path(output.mutation_cache_directory), mutants_key)
+
+
 def _setup_mutation_analysis_assertion_generator(
     executor: TestCaseExecutor,
 ) -> ag.MutationAnalysisAssertionGenerator:
@@ -1066,7 +1127,14 @@ def _setup_mutation_analysis_assertion_generator(
     module_ast = ParentNodeTransformer.create_ast(module_source_code)
 
     _LOGGER.info("Mutate module %s", module.__name__)
-    mutation_controller = MutationController(mutant_generator, module_ast, module)
+    mutation_controller = MutationController(
+        mutant_generator,
+        module_ast,
+        module,
+        schemata=config.configuration.test_case_output.mutant_schemata,
+        filter_equivalent=config.configuration.test_case_output.filter_equivalent_mutants,
+        cache=_setup_mutation_analysis_cache(module_source_code),
+    )
     assertion_generator: ag.MutationAnalysisAssertionGenerator
     if config.configuration.test_case_output.assertion_generation is config.AssertionGenerator.LLM:
         assertion_generator = lag.MutationAnalysisLLMAssertionGenerator(
@@ -1083,6 +1151,7 @@ def _setup_mutation_analysis_assertion_generator(
     return assertion_generator
 
 
+@profiled(ProfilePhase.ASSERTION_GENERATION)
 def _generate_assertions(executor, generation_result, test_cluster):
     ass_gen = config.configuration.test_case_output.assertion_generation
     if ass_gen != config.AssertionGenerator.NONE:
@@ -1174,6 +1243,7 @@ def _collect_miscellaneous_statistics(test_cluster: ModuleTestCluster) -> None:
         stat.set_output_variable_for_runtime_variable(runtime_variable, value)
 
 
+@profiled(ProfilePhase.EXPORT)
 def _export_chromosome(
     chromosome: chrom.Chromosome,
     *,
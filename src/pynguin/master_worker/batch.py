@@ -0,0 +1,315 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides the batch mode, which generates tests for all modules of a package.
+
+Every module is run by its own worker of the master process, so a crashing module is
+restarted like a single run, and up to ``batch_workers`` modules run in parallel.  The
+maximum search time is the wall-clock budget of the whole package; the scheduler
+splits the resulting worker time among the modules in proportion to their weight,
+which is the McCabe complexity plus the estimated number of coverage goals of a
+module.  The search on a module stops once its coverage plateaus, and the time the
+module did not use is reassigned to the modules that did not start yet.  When all
+modules are done, their statistics are merged into a single statistics file.
+"""
+
+from __future__ import annotations
+
+import ast
+import copy
+import csv
+import dataclasses
+import logging
+import math
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pynguin.configuration as config
+from pynguin.analyses.modulecomplexity import mccabe_complexity
+from pynguin.generator import ReturnCode
+from pynguin.master_worker.master import MasterProcess
+from pynguin.master_worker.worker import WorkerReturnCode
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_LOGGER = logging.getLogger(__name__)
+
+_STATISTICS_FILE_NAME = "statistics.csv"
+
+
+def discover_modules(
+    project_path: str | Path, package: str, ignore_modules: Iterable[str] = ()
+) -> list[str]:
+    """Collects the names of all modules of a package.
+
+    Args:
+        project_path: The path of the project containing the package
+        package: The name of the package, or of a single module
+        ignore_modules: Names of modules to leave out
+
+    Returns:
+        The sorted names of the modules
+    """
+    path = Path(project_path).joinpath(*package.split("."))
+    if path.with_suffix(".py").is_file():
+        return [package] if package not in ignore_modules else []
+    modules: list[str] = []
+    for file in path.rglob("*.py"):
+        parts = list(file.relative_to(path).with_suffix("").parts)
+        if parts[-1] == "__main__":
+            continue
+        if parts[-1] == "__init__":
+            parts.pop()
+        module_name = ".".join([package, *parts])
+        if module_name not in ignore_modules:
+            modules.append(module_name)
+    return sorted(modules)
+
+
+def estimate_goals(tree: ast.AST) -> int:
+    """Estimates the number of branch-coverage goals of a module.
+
+    Every branching statement and conditional expression yields two goals, and
+    every function yields one goal for entering it.
+
+    Args:
+        tree: The AST of the module
+
+    Returns:
+        The estimated number of goals
+    """
+    goals = 1
+    for node in ast.walk(tree):
+        if isinstance(node, ast.If | ast.While | ast.For | ast.AsyncFor | ast.IfExp):
+            goals += 2
+        elif isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.Lambda):
+            goals += 1
+    return goals
+
+
+def get_module_weight(project_path: str | Path, module_name: str) -> float:
+    """Computes the share of the budget a module deserves relative to other modules.
+
+    Args:
+        project_path: The path of the project containing the module
+        module_name: The name of the module
+
+    Returns:
+        The weight of the module, which is 0 if the module does not define any
+        function or class, otherwise at least 1
+    """
+    path = Path(project_path).joinpath(*module_name.split("."))
+    path = path / "__init__.py" if path.is_dir() else path.with_suffix(".py")
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError) as error:
+        _LOGGER.warning("Cannot analyse module %s: %s", module_name, error)
+        return 1.0
+    if not any(
+        isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef)
+        for node in ast.walk(tree)
+    ):
+        return 0.0
+    return float(max(1, mccabe_complexity(tree) + estimate_goals(tree)))
+
+
+@dataclasses.dataclass
+class ModuleRun:
+    """The test generation for a single module of a batch."""
+
+    module_name: str
+
+    weight: float
+
+    # Seconds of worker time assigned to the module when it starts.
+    budget: float = 0.0
+
+    # Seconds of wall-clock time the module used.
+    elapsed: float = 0.0
+
+    # The return code of the run, None if the worker failed.
+    return_code: ReturnCode | None = None
+
+
+class BudgetScheduler:
+    """Splits a time budget among modules in proportion to their weights.
+
+    The modules with the highest weights start first.  A module receives its share
+    of the budget that is neither assigned to a running module nor used by a
+    finished one; time a finished module did not use is therefore shared among the
+    modules that did not start yet.
+    """
+
+    def __init__(self, runs: Iterable[ModuleRun], budget: float, minimum_budget: float) -> None:
+        """Initializes the scheduler.
+
+        Args:
+            runs: The modules to schedule
+            budget: The total worker time in seconds, may be infinite
+            minimum_budget: The minimum worker time of a module in seconds
+        """
+        self._pending = sorted(runs, key=lambda run: run.weight, reverse=True)
+        self._available = budget
+        self._minimum_budget = minimum_budget
+
+    def has_pending(self) -> bool:
+        """Whether there are modules that did not start yet.
+
+        Returns:
+            True, if a module is waiting to start
+        """
+        return bool(self._pending)
+
+    def start_next(self) -> ModuleRun:
+        """Starts the next module and assigns its budget.
+
+        Returns:
+            The started module
+        """
+        pending_weight = sum(run.weight for run in self._pending)
+        run = self._pending.pop(0)
+        run.budget = max(self._minimum_budget, self._available * run.weight / pending_weight)
+        self._available -= run.budget
+        return run
+
+    def finish(self, run: ModuleRun, elapsed: float) -> None:
+        """Records that a module finished and reclaims its unused budget.
+
+        Args:
+            run: The finished module
+            elapsed: The seconds of worker time the module used
+        """
+        run.elapsed = elapsed
+        self._available += max(run.budget - elapsed, 0.0)
+
+
+def merge_statistics(report_dirs: Iterable[Path], output_file: Path) -> int:
+    """Merges the statistics files of several runs into one.
+
+    Args:
+        report_dirs: The report directories of the runs
+        output_file: The merged statistics file
+
+    Returns:
+        The number of merged rows
+    """
+    field_names: dict[str, None] = {}
+    rows: list[dict[str, str]] = []
+    for report_dir in report_dirs:
+        statistics_file = report_dir / _STATISTICS_FILE_NAME
+        if not statistics_file.is_file():
+            continue
+        with statistics_file.open(newline="") as file:
+            reader = csv.DictReader(file)
+            field_names.update(dict.fromkeys(reader.fieldnames or ()))
+            rows.extend(reader)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with output_file.open(mode="w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=list(field_names), quoting=csv.QUOTE_NONNUMERIC)
+        writer.writeheader()
+        writer.writerows(rows)
+    return len(rows)
+
+
+def _configure_module(
+    configuration: config.Configuration,
+    batch_configuration: config.BatchConfiguration,
+    run: ModuleRun,
+) -> config.Configuration:
+    module_configuration = copy.deepcopy(configuration)
+    module_configuration.module_name = run.module_name
+    module_configuration.statistics_output.report_dir = str(
+        Path(configuration.statistics_output.report_dir) / run.module_name
+    )
+    stopping = module_configuration.stopping
+    if math.isfinite(run.budget):
+        stopping.maximum_search_time = max(1, round(run.budget))
+    if stopping.maximum_coverage_plateau < 0 < batch_configuration.batch_plateau_iterations:
+        stopping.maximum_coverage_plateau = batch_configuration.batch_plateau_iterations
+    return module_configuration
+
+
+def _run_modules(
+    configuration: config.Configuration,
+    batch_configuration: config.BatchConfiguration,
+    scheduler: BudgetScheduler,
+    workers: int,
+) -> None:
+    master = MasterProcess()
+    running: dict[str, tuple[ModuleRun, float]] = {}
+    try:
+        while scheduler.has_pending() or running:
+            while scheduler.has_pending() and len(running) < workers:
+                run = scheduler.start_next()
+                task_id = master.start_pynguin(
+                    _configure_module(configuration, batch_configuration, run)
+                )
+                running[task_id] = (run, time.monotonic())
+                _LOGGER.info("Started %s with a budget of %.0fs", run.module_name, run.budget)
+            for task_id in master.wait(list(running)):
+                run, start = running.pop(task_id)
+                result = master.get_result(task_id)
+                if result.worker_return_code == WorkerReturnCode.OK:
+                    run.return_code = result.return_code
+                scheduler.finish(run, time.monotonic() - start)
+                _LOGGER.info(
+                    "Finished %s after %.0fs: %s",
+                    run.module_name,
+                    run.elapsed,
+                    "FAILED" if run.return_code is None else run.return_code.name,
+                )
+    finally:
+        master.stop()
+
+
+def run_batch(
+    configuration: config.Configuration, batch_configuration: config.BatchConfiguration
+) -> ReturnCode:
+    """Generates tests for all modules of the package given as the module name.
+
+    Modules that do not define any function or class are skipped.
+
+    Args:
+        configuration: The configuration shared by all modules
+        batch_configuration: The configuration of the batch mode
+
+    Returns:
+        OK if tests were generated for every module, otherwise the first failing
+        return code
+    """
+    runs: list[ModuleRun] = []
+    for module_name in discover_modules(
+        configuration.project_path, configuration.module_name, configuration.ignore_modules
+    ):
+        if (weight := get_module_weight(configuration.project_path, module_name)) > 0:
+            runs.append(ModuleRun(module_name, weight))
+        else:
+            _LOGGER.info("Skipping %s, which defines no function or class", module_name)
+    if not runs:
+        _LOGGER.error("Found no modules to test in %s", configuration.module_name)
+        return ReturnCode.SETUP_FAILED
+    workers = max(1, min(batch_configuration.batch_workers, len(runs)))
+    search_time = configuration.stopping.maximum_search_time
+    scheduler = BudgetScheduler(
+        runs,
+        search_time * workers if search_time > 0 else math.inf,
+        batch_configuration.batch_minimum_search_time,
+    )
+    _LOGGER.info("Generating tests for %d modules with %d workers", len(runs), workers)
+    _run_modules(configuration, batch_configuration, scheduler, workers)
+
+    report_dir = Path(configuration.statistics_output.report_dir)
+    if configuration.statistics_output.statistics_backend == config.StatisticsBackend.CSV:
+        rows = merge_statistics(
+            (report_dir / run.module_name for run in runs), report_dir / _STATISTICS_FILE_NAME
+        )
+        _LOGGER.info("Merged the statistics of %d modules", rows)
+    for run in runs:
+        if run.return_code != ReturnCode.OK:
+            return ReturnCode.NO_TESTS_GENERATED if run.return_code is None else run.return_code
+    return ReturnCode.OK
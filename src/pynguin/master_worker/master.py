@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
 import time
 
@@ -118,9 +119,22 @@ class RunningTask:
             self._task.configuration.subprocess = True
             self._task.configuration.subprocess_if_recommended = False
 
+        if self._task.configuration.search_algorithm.checkpoint_interval:
+            _LOGGER.info("Restarted worker resumes from the latest checkpoint of the search")
         self._start_worker(self._task)
         return True
 
+    @property
+    def connection(self) -> mp_conn.Connection:
+        """Provides the connection on which the worker sends its result.
+
+        The connection also becomes readable when the worker dies.
+
+        Returns:
+            The receiving connection of the current worker
+        """
+        return self._receiving_connection
+
     def get_result(self) -> WorkerResult:
         """Get the result of the running task and restart the worker if necessary.
 
@@ -166,6 +180,7 @@ class MasterProcess:
     def __init__(self):
         """Initialize the master process."""
         self._running_tasks: dict[str, RunningTask] = {}
+        self._task_counter = itertools.count()
 
     def start_pynguin(self, configuration: config.Configuration) -> str:
         """Start a new task with the given configuration and returns its ID.
@@ -176,12 +191,31 @@ class MasterProcess:
         Returns:
             Task ID of the started task
         """
-        task_id = f"test_gen_{time.time()}"
+        task_id = f"test_gen_{time.time()}_{next(self._task_counter)}"
         task = WorkerTask(task_id=task_id, configuration=configuration)
         running_task = RunningTask(task=task)
         self._running_tasks[task_id] = running_task
         return task_id
 
+    def wait(self, task_ids: list[str], timeout: float | None = None) -> list[str]:
+        """Wait until the result of at least one of the given tasks is available.
+
+        Args:
+            task_ids: IDs of running tasks
+            timeout: Maximum number of seconds to wait, None waits without limit
+
+        Returns:
+            IDs of the tasks whose worker sent its result or died; retrieving the
+            result of a task whose worker died restarts the worker and waits for it
+        """
+        tasks = {
+            self._running_tasks[task_id].connection: task_id
+            for task_id in task_ids
+            if task_id in self._running_tasks
+        }
+        ready = mp_conn.wait(list(tasks), timeout=timeout)
+        return [tasks[connection] for connection in ready]
+
     def get_result(self, task_id: str) -> WorkerResult:
         """Get the result of a running task and remove it from the running tasks.
 
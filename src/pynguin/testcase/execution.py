@@ -59,6 +59,7 @@ from pynguin.utils.exceptions import (
 from pynguin.utils.fs_isolation import FilesystemIsolation
 from pynguin.utils.naming import get_module_alias
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+from pynguin.utils.statistics.searchphases import SearchPhase, measured, phase_timer
 
 # Public API of this facade module: the executor classes defined here plus the
 # symbols re-exported from the focused ``pynguin.testcase`` execution modules.
@@ -366,12 +367,12 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
         """
         self._instrument = instrument
 
+    @measured(SearchPhase.EXECUTION)
     def execute(  # noqa: D102
         self,
         test_case: tc.TestCase,
     ) -> ExecutionResult:
-        self._executed_test_cases += 1
-        stat.track_output_variable(RuntimeVariable.Executed, self._executed_test_cases)
+        self._count_executions(1)
         self._before_remote_test_case_execution(test_case)
 
         with ter.ExecutionRecorder(test_case):
@@ -383,12 +384,7 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
                 daemon=True,
             )
             thread.start()
-            thread.join(
-                timeout=min(
-                    self._maximum_test_execution_timeout,
-                    self._test_execution_time_per_statement * test_case.size(),
-                )
-            )
+            thread.join(timeout=self._calculate_timeout(test_case))
             if thread.is_alive():
                 # Kills the thread
                 self._subject_properties.instrumentation_tracer.stop()
@@ -416,6 +412,25 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
             self._subject_properties.validate_execution_trace(result.execution_trace)
             return result
 
+    def _count_executions(self, executions: int) -> None:
+        self._executed_test_cases += executions
+        stat.track_output_variable(RuntimeVariable.Executed, self._executed_test_cases)
+        phase_timer.count_execution(executions)
+
+    def _calculate_timeout(self, test_case: tc.TestCase) -> float:
+        """Calculate timeout for a test case based on its size.
+
+        Args:
+            test_case: The test case
+
+        Returns:
+            The calculated timeout in seconds
+        """
+        return min(
+            self._maximum_test_execution_timeout,
+            self._test_execution_time_per_statement * test_case.size(),
+        )
+
     def _before_test_case_execution(self, test_case: tc.TestCase) -> None:
         _make_deterministic()
         self._subject_properties.instrumentation_tracer.init_trace()
@@ -437,10 +452,8 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
                 self._subject_properties.instrumentation_tracer,
             ):
                 namespace = self._build_namespace()
-                for idx, statement in enumerate(test_case.statements()):
-                    node = self._before_statement_execution(statement, namespace)
-                    exception = self._exec_statement(node, namespace)
-                    self._after_statement_execution(statement, namespace, exception)
+                for idx, statement in enumerate(test_case.iter_statements()):
+                    exception = self._execute_statement(statement, namespace)
                     if exception is not None:
                         result.report_new_thrown_exception(idx, exception)
                         break
@@ -511,6 +524,23 @@ class TestCaseExecutor(AbstractTestCaseExecutor):
             return exc
         return None
 
+    def _execute_statement(
+        self, statement: tc.Statement, namespace: dict[str, Any]
+    ) -> BaseException | None:
+        """Execute a single statement, notifying the remote observers around it.
+
+        Args:
+            statement: The statement to execute.
+            namespace: The shared namespace (used as both globals and locals).
+
+        Returns:
+            The raised exception, if any, otherwise ``None``.
+        """
+        node = self._before_statement_execution(statement, namespace)
+        exception = self._exec_statement(node, namespace)
+        self._after_statement_execution(statement, namespace, exception)
+        return exception
+
     def _exec_statement(
         self,
         node: cst.SimpleStatementLine | cst.BaseCompoundStatement,
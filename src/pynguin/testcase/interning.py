@@ -0,0 +1,99 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides interned libcst fragments for the nodes test generation builds most.
+
+The literal generator and the test factory create the same small nodes over and
+over: variable and attribute names, the module alias chains of the subject under
+test, and common literals.  libcst nodes are immutable, so a single instance of
+each fragment can be shared by all statements of all test cases of the
+population.  Besides saving memory, sharing makes the per-statement caches that
+are keyed on node identity hit more often.
+
+A fragment must not be interned if a transformation locates it by identity within
+a larger tree, e.g. via :meth:`libcst.CSTNode.deep_replace`, because all
+occurrences would be replaced.  Fragments are therefore limited to leaves and
+attribute chains, which are only ever replaced as a whole.
+"""
+
+from __future__ import annotations
+
+import functools
+
+import libcst as cst
+
+# The caches are bounded, because random string literals are rarely reused.
+_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def name(value: str) -> cst.Name:
+    """Provides the interned name node for an identifier.
+
+    Args:
+        value: The identifier
+
+    Returns:
+        The name node
+    """
+    return cst.Name(value)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def attribute_chain(dotted_path: str) -> cst.Name | cst.Attribute:
+    """Provides the interned node for a dotted path.
+
+    E.g. ``"torch.tensor"`` becomes ``Attribute(Name("torch"), Name("tensor"))``.
+
+    Args:
+        dotted_path: The dotted path, e.g. ``"torch.tensor"``
+
+    Returns:
+        A name node for a bare identifier, else a nested attribute node
+    """
+    head, _, tail = dotted_path.rpartition(".")
+    if not head:
+        return name(tail)
+    return cst.Attribute(value=attribute_chain(head), attr=name(tail))
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def integer(value: str) -> cst.Integer:
+    """Provides the interned node for a non-negative integer literal.
+
+    Args:
+        value: The source of the literal
+
+    Returns:
+        The integer node
+    """
+    return cst.Integer(value)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def floating(value: str) -> cst.Float:
+    """Provides the interned node for a non-negative float literal.
+
+    Args:
+        value: The source of the literal
+
+    Returns:
+        The float node
+    """
+    return cst.Float(value)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def simple_string(value: str) -> cst.SimpleString:
+    """Provides the interned node for a string or bytes literal.
+
+    Args:
+        value: The source of the literal, including quotes and prefix
+
+    Returns:
+        The string node
+    """
+    return cst.SimpleString(value)
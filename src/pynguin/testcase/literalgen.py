@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING
 import libcst as cst
 
 import pynguin.configuration as config
+from pynguin.testcase import interning
 from pynguin.utils import randomness
 
 if TYPE_CHECKING:
@@ -139,9 +140,9 @@ def _int_to_cst(value: int) -> cst.BaseExpression:
     if value < 0:
         return cst.UnaryOperation(
             operator=cst.Minus(),
-            expression=cst.Integer(str(abs(value))),
+            expression=interning.integer(str(abs(value))),
         )
-    return cst.Integer(str(value))
+    return interning.integer(str(value))
 
 
 def _float_to_cst(value: float) -> cst.BaseExpression:
@@ -160,8 +161,8 @@ def _float_to_cst(value: float) -> cst.BaseExpression:
     if not math.isfinite(abs_val):
         # inf/nan are not valid float literal tokens; render as float("inf")/float("nan").
         inner: cst.BaseExpression = cst.Call(
-            func=cst.Name("float"),
-            args=[cst.Arg(value=cst.SimpleString(repr(repr(abs_val))))],
+            func=interning.name("float"),
+            args=[cst.Arg(value=interning.simple_string(repr(repr(abs_val))))],
         )
     else:
         float_str = repr(abs_val)
@@ -194,7 +195,7 @@ def _random_primitive_element(constant_provider: ConstantProvider) -> cst.BaseEx
     """
     tp = randomness.choice(_PRIMITIVE_ELEMENT_TYPES)
     if tp is bool:
-        return cst.Name("True" if randomness.next_bool() else "False")
+        return interning.name("True" if randomness.next_bool() else "False")
     if tp is int:
         return _gen_int(constant_provider)
     if tp is float:
@@ -395,7 +396,7 @@ def _complex_to_cst(value: complex) -> cst.BaseExpression:
         A ``cst.Call`` node of shape ``complex(<real>, <imag>)``.
     """
     return cst.Call(
-        func=cst.Name("complex"),
+        func=interning.name("complex"),
         args=[
             cst.Arg(value=_float_to_cst(value.real)),
             cst.Arg(value=_float_to_cst(value.imag)),
@@ -490,7 +491,7 @@ def _gen_str(constant_provider: ConstantProvider) -> cst.BaseExpression:
     if randomness.next_float() < seed_prob:
         seeded = constant_provider.get_constant_for(str)
         if seeded is not None:
-            return cst.SimpleString(repr(seeded))
+            return interning.simple_string(repr(seeded))
     length = randomness.next_int(0, tc.string_length)
     return cst.SimpleString(repr(randomness.next_string(length)))
 
@@ -509,7 +510,7 @@ def _gen_bytes(constant_provider: ConstantProvider) -> cst.BaseExpression:
     if randomness.next_float() < seed_prob:
         seeded = constant_provider.get_constant_for(bytes)
         if seeded is not None:
-            return cst.SimpleString(repr(seeded))
+            return interning.simple_string(repr(seeded))
     length = randomness.next_int(1, max(2, tc.bytes_length))
     return cst.SimpleString(repr(randomness.next_bytes(length)))
 
@@ -553,7 +554,7 @@ def _gen_set(
         A ``cst.Call`` (empty) or ``cst.Set`` (non-empty) node.
     """
     if randomness.next_bool():
-        return cst.Call(func=cst.Name("set"))
+        return cst.Call(func=interning.name("set"))
     count = randomness.next_int(1, min(3, config.configuration.test_creation.collection_size) + 1)
     elems = [
         cst.Element(value=_element_value(constant_provider, element_pool)) for _ in range(count)
@@ -869,7 +870,7 @@ def _mutate_set(
         idx = randomness.next_int(0, len(selems))
         selems = selems[:idx] + selems[idx + 1 :]
         if not selems:
-            return cst.Call(func=cst.Name("set"))
+            return cst.Call(func=interning.name("set"))
     else:
         selems += [cst.Element(value=_element_value(constant_provider, element_pool))]
     return expr.with_changes(elements=selems)
@@ -905,7 +906,7 @@ def generate_literal(  # noqa: C901
         Returns ``cst.Name("None")`` when ``raw`` is ``None`` or unrecognised.
     """
     if raw is bool:
-        return cst.Name("True" if randomness.next_bool() else "False")
+        return interning.name("True" if randomness.next_bool() else "False")
     if raw is int:
         return _gen_int(constant_provider)
     if raw is float:
@@ -924,7 +925,7 @@ def generate_literal(  # noqa: C901
         return _gen_tuple(constant_provider, element_pool)
     if raw is dict:
         return _gen_dict(constant_provider, element_pool)
-    return cst.Name("None")
+    return interning.name("None")
 
 
 def _mutate_bool(expr: cst.BaseExpression) -> cst.BaseExpression:
@@ -937,8 +938,8 @@ def _mutate_bool(expr: cst.BaseExpression) -> cst.BaseExpression:
         The negated boolean as a ``cst.Name`` node.
     """
     if isinstance(expr, cst.Name):
-        return cst.Name("False" if expr.value == "True" else "True")
-    return cst.Name("True" if randomness.next_bool() else "False")
+        return interning.name("False" if expr.value == "True" else "True")
+    return interning.name("True" if randomness.next_bool() else "False")
 
 
 def _dispatch_mutate(  # noqa: C901
@@ -1084,7 +1085,7 @@ def _collection_to_cst(value: list | tuple | set | dict) -> cst.BaseExpression:
         return cst.Tuple(elements=_tuple_elements(elems))
     if isinstance(value, set):
         if not value:
-            return cst.Call(func=cst.Name("set"))
+            return cst.Call(func=interning.name("set"))
         return cst.Set(elements=[cst.Element(value=literal_to_cst(v)) for v in value])
     return cst.Dict(
         elements=[
@@ -1105,7 +1106,7 @@ def literal_to_cst(value: object) -> cst.BaseExpression:
         for values that have no literal representation.
     """
     if isinstance(value, bool):
-        return cst.Name("True" if value else "False")
+        return interning.name("True" if value else "False")
     if isinstance(value, int):
         return _int_to_cst(value)
     if isinstance(value, float):
@@ -1113,7 +1114,7 @@ def literal_to_cst(value: object) -> cst.BaseExpression:
     if isinstance(value, complex):
         return _complex_to_cst(value)
     if isinstance(value, str | bytes):
-        return cst.SimpleString(repr(value))
+        return interning.simple_string(repr(value))
     if isinstance(value, list | tuple | set | dict):
         return _collection_to_cst(value)
-    return cst.Name("None")
+    return interning.name("None")
@@ -23,6 +23,7 @@ from pynguin.testcase.localsearchstatement import (
 )
 from pynguin.utils import randomness
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+from pynguin.utils.statistics.searchphases import SearchPhase, measured
 
 if TYPE_CHECKING:
     from pynguin.ga.testsuitechromosome import TestSuiteChromosome
@@ -153,11 +154,14 @@ class TestCaseLocalSearch:
             randomize_literal_value(chromosome.test_case, position)
 
         local_search_statement = choose_local_search_statement(
-            chromosome, position, objective, factory, self._timer
+            chromosome, position, objective, factory, self._timer, executor=self._executor
         )
         if local_search_statement is not None:
             self._logger.debug("Local search statement found for position %d", position)
-            improved = local_search_statement.search()
+            try:
+                improved = local_search_statement.search()
+            finally:
+                local_search_statement.close()
             statement = chromosome.test_case.get_statement(position)
             if _is_primitive_statement(statement):
                 statement.local_search_applied = True
@@ -230,6 +234,7 @@ class TestSuiteLocalSearch:
 
     _logger = logging.getLogger(__name__)
 
+    @measured(SearchPhase.LOCAL_SEARCH)
     def local_search(
         self,
         chromosome: TestSuiteChromosome,
@@ -15,14 +15,29 @@ from typing import TYPE_CHECKING
 import pynguin.utils.statistics.stats as stat
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 if TYPE_CHECKING:
-    from pynguin.ga.computations import CoverageFunction, FitnessFunction
+    from array import array
+
     from pynguin.ga.testcasechromosome import TestCaseChromosome
     from pynguin.ga.testsuitechromosome import TestSuiteChromosome
+    from pynguin.testcase.execution_result import ExecutionResult
 
 
 class LocalSearchObjective:
-    """Monitors the success of the current local search on a chromosome."""
+    """Monitors the success of the current local search on a chromosome.
+
+    The objective keeps the fitness and coverage values of the suite before the
+    current change as dense arrays, indexed like the functions of the suite, and the
+    covered goals as a bitset, such that comparing and restoring them does not look
+    up every function of the suite.
+    """
 
     _logger = logging.getLogger(__name__)
 
@@ -33,14 +48,12 @@ class LocalSearchObjective:
             position: The position of the specific test case which will be modified.
             test_suite: The whole testsuite.
         """
-        self._old_fitness: float = 0.0
         self._test_suite = test_suite
         self._position = position
         self._fitness_functions = test_suite.get_fitness_functions()
-        self._latest_coverage_map: dict[CoverageFunction, float] = {}
-        self._latest_fitness_map: dict[FitnessFunction, float] = {}
-        self._update_latest_fitness_map()
-        self._update_latest_coverage_map()
+        self._latest_fitness = test_suite.get_fitness_array()
+        self._latest_covered = covered_goals(self._latest_fitness)
+        self._latest_coverage = test_suite.get_coverage_array()
 
         self._is_maximization = (
             self._fitness_functions[0].is_maximisation_function()
@@ -48,71 +61,54 @@ class LocalSearchObjective:
             else False
         )
 
-    def _update_latest_coverage_map(self) -> None:
-        self._oldFitness = 0.0
-        for fitness_function in self._test_suite.get_fitness_functions():
-            fitness = self._test_suite.get_fitness_for(fitness_function)
-            self._oldFitness += fitness
-            self._latest_fitness_map[fitness_function] = fitness
-
-    def _update_latest_fitness_map(self) -> None:
-        for coverage_function in self._test_suite.get_coverage_functions():
-            self._latest_coverage_map[coverage_function] = self._test_suite.get_coverage_for(
-                coverage_function
-            )
-
-    def has_changed(self, test_case_chromosome: TestCaseChromosome) -> LocalSearchImprovement:
+    def has_changed(
+        self,
+        test_case_chromosome: TestCaseChromosome,
+        result: ExecutionResult | None = None,
+    ) -> LocalSearchImprovement:
         """Gives back, if the fitness of the testsuite has changed.
 
-        It overrides the specific testcase with the provided chromosome.
+        It overrides the specific testcase with the provided chromosome.  A change
+        that covers additional goals without losing any is an improvement, and vice
+        versa; otherwise, the sum of the fitness values decides.
 
         Args:
             test_case_chromosome: The chromosome which will override the original chromosome.
+            result: The result of executing the chromosome, if it was already executed,
+                e.g., in a batch of candidates; otherwise, the chromosome is executed.
 
         Returns:
             Gives back 1 if the fitness has increased, -1 if the fitness has decreased and 0 if the
             fitness has not changed at all.
         """
         start_time = int(time.perf_counter()) * 1000
-        test_case_chromosome.changed = True
-        self._old_fitness = self._test_suite.get_fitness()
+        if result is None:
+            test_case_chromosome.changed = True
+        else:
+            test_case_chromosome.set_last_execution_result(result)
+            test_case_chromosome.changed = False
         self._test_suite.set_test_case_chromosome(self._position, test_case_chromosome)
-        for fitness_function in self._fitness_functions:
-            fitness_function.compute_fitness(self._test_suite)
-        new_fitness = self._test_suite.get_fitness()
+        fitness = self._test_suite.get_fitness_array()
+        covered = covered_goals(fitness)
         old_mut = stat.output_variables.get(RuntimeVariable.LocalSearchTotalMutations.name)
         stat.set_output_variable_for_runtime_variable(
             RuntimeVariable.LocalSearchTotalMutations,
             old_mut.value + 1 if old_mut is not None else 0,
         )
 
-        if (
-            new_fitness > self._old_fitness
-            if self._is_maximization
-            else new_fitness < self._old_fitness
-        ):
-            self._logger.debug(
-                "Local search has improved the fitness of %f to %f",
-                self._old_fitness,
-                new_fitness,
-            )
-            self._update_latest_coverage_map()
-            self._update_latest_fitness_map()
+        comparison = self._compare(fitness, covered)
+        if comparison > 0:
+            self._logger.debug("Local search has improved the fitness")
+            self._latest_fitness = fitness
+            self._latest_covered = covered
+            self._latest_coverage = self._test_suite.get_coverage_array()
             return LocalSearchImprovement.IMPROVEMENT
-        if (
-            new_fitness < self._old_fitness
-            if self._is_maximization
-            else new_fitness > self._old_fitness
-        ):
-            self._logger.debug(
-                "Local search has worsen the fitness of %f to %f",
-                self._old_fitness,
-                new_fitness,
-            )
-            self._test_suite.set_coverage_values(self._latest_coverage_map)
-            self._test_suite.set_fitness_values(self._latest_fitness_map)
+        if comparison < 0:
+            self._logger.debug("Local search has worsened the fitness")
+            self._test_suite.set_coverage_array(self._latest_coverage)
+            self._test_suite.set_fitness_array(self._latest_fitness)
             return LocalSearchImprovement.DETERIORATION
-        self._logger.debug("Local search hasn't changed the fitness of %f", self._old_fitness)
+        self._logger.debug("Local search hasn't changed the fitness")
         time_dif = int(time.perf_counter()) * 1000 - start_time
         old_time = stat.output_variables.get(
             RuntimeVariable.TotalLocalSearchFitnessEvaluationTime.name
@@ -123,16 +119,72 @@ class LocalSearchObjective:
         )
         return LocalSearchImprovement.NONE
 
-    def has_improved(self, test_case_chromosome: TestCaseChromosome) -> bool:
+    def _compare(self, fitness: array[float], covered: int) -> int:
+        """Compares fitness values with the latest ones.
+
+        Args:
+            fitness: The fitness values of the suite after the change
+            covered: The bitset of the goals covered after the change
+
+        Returns:
+            A positive number if the values are better than the latest ones, a
+            negative one if they are worse, and zero otherwise
+        """
+        gained = covered & ~self._latest_covered
+        lost = self._latest_covered & ~covered
+        if gained and not lost:
+            return 1
+        if lost and not gained:
+            return -1
+        difference = fitness_sum(self._latest_fitness) - fitness_sum(fitness)
+        if self._is_maximization:
+            difference = -difference
+        return (difference > 0) - (difference < 0)
+
+    def has_improved(
+        self,
+        test_case_chromosome: TestCaseChromosome,
+        result: ExecutionResult | None = None,
+    ) -> bool:
         """Gives back if changing the old test case chromosome improves the fitness of the suite.
 
         Args:
             test_case_chromosome: The chromosome which will override the original chromosome.
+            result: The result of executing the chromosome, if it was already executed.
 
         Returns:
             Gives back true, if the test suite has improved.
         """
-        return self.has_changed(test_case_chromosome) == LocalSearchImprovement.IMPROVEMENT
+        return self.has_changed(test_case_chromosome, result) == LocalSearchImprovement.IMPROVEMENT
+
+
+def covered_goals(fitness: array[float]) -> int:
+    """Encodes the goals with a fitness of zero, i.e., the covered ones, as a bitset.
+
+    Args:
+        fitness: The fitness values of the goals, indexed like the fitness functions
+
+    Returns:
+        The bitset, in which bit i is set iff the i-th goal is covered
+    """
+    if NUMPY_AVAILABLE:
+        bits = np.packbits(np.frombuffer(fitness, dtype=np.float64) == 0.0, bitorder="little")
+        return int.from_bytes(bits.tobytes(), "little")
+    return sum(1 << index for index, value in enumerate(fitness) if value == 0.0)
+
+
+def fitness_sum(fitness: array[float]) -> float:
+    """Sums fitness values.
+
+    Args:
+        fitness: The fitness values
+
+    Returns:
+        Their sum
+    """
+    if NUMPY_AVAILABLE:
+        return float(np.frombuffer(fitness, dtype=np.float64).sum())
+    return sum(fitness)
 
 
 class LocalSearchImprovement(enum.Enum):
@@ -32,6 +32,7 @@ from __future__ import annotations
 
 import abc
 import enum
+import itertools
 import logging
 import sys
 from abc import ABC, abstractmethod
@@ -44,15 +45,19 @@ import pynguin.utils.generic.genericaccessibleobject as gao
 import pynguin.utils.statistics.stats as stat
 from pynguin.analyses.constants import EmptyConstantProvider
 from pynguin.testcase import literalgen
+from pynguin.testcase.execution import TestCaseExecutor
 from pynguin.testcase.localsearchobjective import LocalSearchImprovement as LS_Imp
+from pynguin.testcase.prefix_executor import PrefixReusingTestCaseExecutor
 from pynguin.testcase.testcase import Statement
 from pynguin.utils import randomness
 from pynguin.utils.naming import get_module_alias
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from pynguin.ga.testcasechromosome import TestCaseChromosome
-    from pynguin.testcase.execution import ExecutionResult
+    from pynguin.testcase.execution import AbstractTestCaseExecutor, ExecutionResult
     from pynguin.testcase.localsearchobjective import LocalSearchObjective
     from pynguin.testcase.localsearchtimer import LocalSearchTimer
     from pynguin.testcase.testcase import TestCase
@@ -188,13 +193,14 @@ class StatementLocalSearch(abc.ABC):
 
     _logger = logging.getLogger(__name__)
 
-    def __init__(
+    def __init__(  # noqa: PLR0917
         self,
         chromosome: TestCaseChromosome,
         position: int,
         objective: LocalSearchObjective,
         factory: TestFactory,
         timer: LocalSearchTimer,
+        executor: AbstractTestCaseExecutor | None = None,
     ):
         """Initializes the local search strategy for a specific statement.
 
@@ -204,12 +210,16 @@ class StatementLocalSearch(abc.ABC):
             objective: The objective to check for improvements.
             factory: The factory to create new statements.
             timer: The timer which limits the local search.
+            executor: The executor to execute candidate values with, if
+                ``ls_batch_size`` is larger than one or ``ls_reuse_prefix`` is set.
         """
         self._chromosome = chromosome
         self._objective = objective
         self._position = position
         self._factory = factory
         self._timer = timer
+        self._executor = executor
+        self._prefix_executor: PrefixReusingTestCaseExecutor | None = None
         self._old_statement: Statement | None = None
         self._last_execution_result: ExecutionResult | None = None
         self._old_changed: bool = False
@@ -222,6 +232,12 @@ class StatementLocalSearch(abc.ABC):
             True, if the local search was successful and improved the fitness.
         """
 
+    def close(self) -> None:
+        """Stops the worker that executed the statements before the position, if any."""
+        if self._prefix_executor is not None:
+            self._prefix_executor.close()
+            self._prefix_executor = None
+
     def _statement(self) -> Statement:
         return self._chromosome.test_case.get_statement(self._position)
 
@@ -239,6 +255,59 @@ class StatementLocalSearch(abc.ABC):
             self._chromosome.set_last_execution_result(self._last_execution_result)
         self._chromosome.changed = self._old_changed
 
+    def _execute_candidates(
+        self, candidates: Iterable[object]
+    ) -> Iterator[tuple[object, ExecutionResult | None]]:
+        """Executes candidate values of the statement ahead of their evaluation.
+
+        Without an executor, or with a batch size of one and without
+        ``ls_reuse_prefix``, the candidates are not executed here but by the
+        objective, one at a time.  Otherwise, the next ``ls_batch_size`` candidates
+        are executed together, such that a subprocess executor pays a single
+        round-trip for all of them.  With ``ls_reuse_prefix``, the statements before
+        the position are executed only once for all candidates.  The consumer may
+        stop early, in which case the remaining candidates of the batch were
+        executed in vain.
+
+        Args:
+            candidates: The candidate values, in the order they are evaluated.
+
+        Yields:
+            The candidate values with their execution results, if executed here.
+        """
+        batch_size = max(config.configuration.local_search.ls_batch_size, 1)
+        executor = self._candidate_executor(batch_size)
+        if executor is None:
+            for candidate in candidates:
+                yield candidate, None
+            return
+        iterator = iter(candidates)
+        while batch := list(itertools.islice(iterator, batch_size)):
+            test_cases = []
+            for candidate in batch:
+                test_case = self._chromosome.test_case.clone()
+                set_literal_value(test_case, self._position, candidate)
+                test_cases.append(test_case)
+            yield from zip(batch, executor.execute_multiple(test_cases), strict=True)
+
+    def _candidate_executor(self, batch_size: int) -> AbstractTestCaseExecutor | None:
+        if self._executor is None:
+            return None
+        if config.configuration.local_search.ls_reuse_prefix and isinstance(
+            self._executor, TestCaseExecutor
+        ):
+            if self._prefix_executor is None:
+                self._prefix_executor = PrefixReusingTestCaseExecutor(
+                    self._executor, self._chromosome.test_case, self._position
+                )
+            return self._prefix_executor
+        return self._executor if batch_size > 1 else None
+
+    def _has_improved(self, result: ExecutionResult | None) -> bool:
+        if result is None:
+            return self._objective.has_improved(self._chromosome)
+        return self._objective.has_improved(self._chromosome, result=result)
+
 
 class PrimitiveLocalSearch(StatementLocalSearch, ABC):
     """Abstract local search strategy for primitive-valued statements."""
@@ -279,17 +348,24 @@ class NumericalLocalSearch(PrimitiveLocalSearch, ABC):
             return False
         improved = False
         self._snapshot()
-        current += delta
-        set_literal_value(self._chromosome.test_case, self._position, current)
-        while self._objective.has_improved(self._chromosome) and not self._timer.limit_reached():
+        for candidate, result in self._execute_candidates(
+            self._steps(current, delta, increasing_factor)
+        ):
+            set_literal_value(self._chromosome.test_case, self._position, candidate)
+            if not self._has_improved(result) or self._timer.limit_reached():
+                break
             self._snapshot()
             improved = True
-            delta *= increasing_factor
-            current += delta
-            set_literal_value(self._chromosome.test_case, self._position, current)
         self._restore()
         return improved
 
+    @staticmethod
+    def _steps(current: float, delta: float, increasing_factor: float) -> Iterator[float]:
+        while True:
+            current += delta
+            yield current
+            delta *= increasing_factor
+
     def iterate_directions(self, delta: float, factor: float) -> bool:
         """Iterates positive and negative deltas until neither improves anymore.
 
@@ -576,22 +652,31 @@ class StringLocalSearch(PrimitiveLocalSearch):
             return False
         self._snapshot()
         improved = False
-        candidate = self._replace_single_char(value, char_position, delta)
-        set_literal_value(self._chromosome.test_case, self._position, candidate)
-        while self._objective.has_improved(self._chromosome):
+        for candidate, result in self._execute_candidates(
+            self._char_steps(value, char_position, delta)
+        ):
+            set_literal_value(self._chromosome.test_case, self._position, candidate)
+            if not self._has_improved(result):
+                break
             improved = True
             self._chromosome.changed = True
             self._snapshot()
             if self._timer.limit_reached():
                 break
-            delta *= config.configuration.local_search.ls_int_delta_increasing_factor
-            if not (0 <= ord(candidate[char_position]) + delta <= sys.maxunicode):
-                return improved
-            candidate = self._replace_single_char(candidate, char_position, delta)
-            set_literal_value(self._chromosome.test_case, self._position, candidate)
+        else:
+            # The next step would leave the range of code points.
+            return improved
         self._restore()
         return improved
 
+    @staticmethod
+    def _char_steps(value: str, char_position: int, delta: int) -> Iterator[str]:
+        factor = config.configuration.local_search.ls_int_delta_increasing_factor
+        while 0 <= ord(value[char_position]) + delta <= sys.maxunicode:
+            value = StringLocalSearch._replace_single_char(value, char_position, delta)
+            yield value
+            delta *= factor
+
     @staticmethod
     def _replace_single_char(value: str, char_position: int, delta: float) -> str:
         new_char = chr(int(ord(value[char_position]) + delta))
@@ -716,21 +801,28 @@ class BytesLocalSearch(PrimitiveLocalSearch):
         if value is None or value[pos] + delta not in range(256):
             return False
         self._snapshot()
-        candidate = value[:pos] + bytes([value[pos] + delta]) + value[pos + 1 :]
-        set_literal_value(self._chromosome.test_case, self._position, candidate)
         improved = False
-        while self._objective.has_improved(self._chromosome) and not self._timer.limit_reached():
+        for candidate, result in self._execute_candidates(self._byte_steps(value, pos, delta)):
+            set_literal_value(self._chromosome.test_case, self._position, candidate)
+            if not self._has_improved(result) or self._timer.limit_reached():
+                break
             improved = True
             self._chromosome.changed = True
             self._snapshot()
-            delta *= config.configuration.local_search.ls_int_delta_increasing_factor
-            if candidate[pos] + delta not in range(256):
-                return improved
-            candidate = candidate[:pos] + bytes([candidate[pos] + delta]) + candidate[pos + 1 :]
-            set_literal_value(self._chromosome.test_case, self._position, candidate)
+        else:
+            # The next step would leave the range of byte values.
+            return improved
         self._restore()
         return improved
 
+    @staticmethod
+    def _byte_steps(value: bytes, pos: int, delta: int) -> Iterator[bytes]:
+        factor = config.configuration.local_search.ls_int_delta_increasing_factor
+        while value[pos] + delta in range(256):
+            value = value[:pos] + bytes([value[pos] + delta]) + value[pos + 1 :]
+            yield value
+            delta *= factor
+
 
 class CollectionLocalSearch(StatementLocalSearch):
     """A local search strategy for literal-only list/set/tuple/dict statements.
@@ -877,6 +969,8 @@ def choose_local_search_statement(  # noqa: C901
     objective: LocalSearchObjective,
     factory: TestFactory,
     timer: LocalSearchTimer,
+    *,
+    executor: AbstractTestCaseExecutor | None = None,
 ) -> StatementLocalSearch | None:
     """Chooses the local search strategy for the statement at the position.
 
@@ -891,12 +985,13 @@ def choose_local_search_statement(  # noqa: C901
         objective: The objective which checks if improvements are made.
         factory: The test factory which modifies the test case.
         timer: The timer which limits the local search.
+        executor: The executor to execute batches of candidate values with.
 
     Returns:
         A strategy instance, or ``None`` if no strategy applies to this statement.
     """
     stmt = chromosome.test_case.get_statement(position)
-    args = (chromosome, position, objective, factory, timer)
+    args = (chromosome, position, objective, factory, timer, executor)
 
     if stmt.bound_type is bool:
         return BooleanLocalSearch(*args) if get_literal_value(stmt, bool) is not None else None
@@ -0,0 +1,330 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides an executor that executes the common prefix of similar test cases once.
+
+Local search probes a single statement of a test case with many values, so all
+probes share the statements before that position.  The executor executes these
+statements once in a forked worker process, which keeps the namespace and the
+trace they produced.  For each probe, the worker forks again and the fork executes
+only the statement at the position and the statements after it.  Every probe thus
+starts from the same state, which is never altered by another probe.
+
+A probe whose statements before the position differ from the prefix, and every
+probe if the prefix cannot be executed in a worker, e.g., because the platform does
+not support forking or because the prefix raises an exception, is executed in full
+by the delegate executor.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import logging
+import os
+import signal
+from typing import TYPE_CHECKING, NoReturn
+
+import multiprocess as mp
+
+import pynguin.utils.execution_recorder as ter
+from pynguin.testcase.execution import AbstractTestCaseExecutor
+from pynguin.testcase.execution_isolation import OutputSuppressionContext
+from pynguin.testcase.execution_result import ExecutionResult
+from pynguin.testcase.subprocess_executor import (
+    SubprocessTestCaseExecutor,
+    disable_tracing_while_unpickling,
+)
+from pynguin.utils.fs_isolation import FilesystemIsolation
+from pynguin.utils.statistics.profiler import profiled_subprocess
+from pynguin.utils.statistics.searchphases import SearchPhase, measured
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+    from typing import Any
+
+    import multiprocess.connection as mp_conn
+
+    import pynguin.testcase.testcase as tc
+    from pynguin.instrumentation.tracer import SubjectProperties
+    from pynguin.testcase.execution import ModuleProvider, TestCaseExecutor
+    from pynguin.testcase.execution_observers import (
+        ExecutionObserver,
+        RemoteExecutionObserver,
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+# The seconds to wait for a worker to exit after it was asked to.
+_JOIN_TIMEOUT = 1.0
+
+
+class PrefixReusingTestCaseExecutor(AbstractTestCaseExecutor):
+    """An executor that executes the prefix of a test case only once.
+
+    The executor is bound to a test case and a position.  Executing a test case that
+    has the same statements before the position executes only its statements from
+    the position on, in a fork of a worker that executed the prefix.  The executor
+    must be closed to stop the worker.
+    """
+
+    def __init__(
+        self,
+        delegate: TestCaseExecutor,
+        test_case: tc.TestCase,
+        position: int,
+    ) -> None:
+        """Initializes the executor.
+
+        Args:
+            delegate: The executor whose observers and settings are used, and which
+                executes the test cases that cannot reuse the prefix
+            test_case: The test case providing the prefix
+            position: The position of the first statement that is not part of the
+                prefix
+        """
+        self._delegate = delegate
+        self._prefix = test_case.clone()
+        self._position = position
+        self._worker: mp.Process | None = None
+        self._connection: mp_conn.Connection | None = None
+        # Whether the prefix cannot be executed in a worker, e.g., because it raises.
+        self._unusable = position == 0
+
+    @property
+    def module_provider(self) -> ModuleProvider:  # noqa: D102
+        return self._delegate.module_provider
+
+    def add_observer(self, observer: ExecutionObserver) -> None:  # noqa: D102
+        self._delegate.add_observer(observer)
+
+    def clear_observers(self) -> None:  # noqa: D102
+        self._delegate.clear_observers()
+
+    def temporarily_add_observer(  # noqa: D102
+        self, observer: ExecutionObserver
+    ) -> AbstractContextManager[None]:
+        return self._delegate.temporarily_add_observer(observer)
+
+    def add_remote_observer(  # noqa: D102
+        self, remote_observer: RemoteExecutionObserver
+    ) -> None:
+        self._delegate.add_remote_observer(remote_observer)
+
+    def clear_remote_observers(self) -> None:  # noqa: D102
+        self._delegate.clear_remote_observers()
+
+    def temporarily_add_remote_observer(  # noqa: D102
+        self, remote_observer: RemoteExecutionObserver
+    ) -> AbstractContextManager[None]:
+        return self._delegate.temporarily_add_remote_observer(remote_observer)
+
+    @property
+    def subject_properties(self) -> SubjectProperties:  # noqa: D102
+        return self._delegate.subject_properties
+
+    @measured(SearchPhase.EXECUTION)
+    def execute(self, test_case: tc.TestCase) -> ExecutionResult:  # noqa: D102
+        changes = self._changes(test_case)
+        if changes is None or not self._start_worker():
+            return self._delegate.execute(test_case)
+
+        self._delegate._count_executions(1)  # noqa: SLF001
+        self._delegate._before_remote_test_case_execution(test_case)  # noqa: SLF001
+        with ter.ExecutionRecorder(test_case):
+            result = self._execute_suffix(test_case, changes)
+            self._delegate._after_remote_test_case_execution(test_case, result)  # noqa: SLF001
+            self.subject_properties.validate_execution_trace(result.execution_trace)
+            return result
+
+    def close(self) -> None:
+        """Stops the worker, if it was started."""
+        if self._worker is None:
+            return
+        assert self._connection is not None
+        with contextlib.suppress(OSError):
+            self._connection.send(None)
+        self._worker.join(timeout=_JOIN_TIMEOUT)
+        self._stop_worker()
+
+    def _changes(self, test_case: tc.TestCase) -> dict[int, tc.Statement] | None:
+        """Computes the statements in which the test case differs from the prefix.
+
+        Statements are compared by their immutable nodes, which clones share.
+
+        Args:
+            test_case: The test case to execute
+
+        Returns:
+            The statements at and after the position that differ from the test case
+            the executor is bound to, or None if the test case does not share the
+            prefix or its size differs
+        """
+        if self._unusable or test_case.size() != self._prefix.size():
+            return None
+        changes: dict[int, tc.Statement] = {}
+        for index, (statement, original) in enumerate(
+            zip(test_case.iter_statements(), self._prefix.iter_statements(), strict=True)
+        ):
+            if statement is original or statement.node is original.node:
+                continue
+            if index < self._position:
+                return None
+            changes[index] = statement
+        return changes
+
+    def _start_worker(self) -> bool:
+        """Starts the worker executing the prefix, unless it is running already.
+
+        Returns:
+            Whether the worker runs and executed the prefix without an exception
+        """
+        if self._worker is not None:
+            return True
+        if self._unusable:
+            return False
+        try:
+            context = mp.get_context("fork")
+        except ValueError:
+            _LOGGER.warning("Reusing the prefix requires the fork start method, not reusing it")
+            self._unusable = True
+            return False
+        self._connection, worker_connection = context.Pipe()
+        self._worker = context.Process(
+            target=_run_worker,
+            args=(self._delegate, self._prefix, self._position, worker_connection),
+            daemon=True,
+        )
+        self._worker.start()
+        worker_connection.close()
+        try:
+            if self._connection.poll(self._delegate._calculate_timeout(self._prefix)):  # noqa: SLF001
+                if self._connection.recv():
+                    return True
+            else:
+                _LOGGER.warning("Experienced timeout from executing the prefix")
+        except (EOFError, OSError):
+            _LOGGER.error("Error during receiving the prefix state from the worker")
+        # Executing the prefix once more for every probe would not help.
+        self._unusable = True
+        self._stop_worker()
+        return False
+
+    def _execute_suffix(
+        self, test_case: tc.TestCase, changes: dict[int, tc.Statement]
+    ) -> ExecutionResult:
+        assert self._connection is not None
+        try:
+            self._connection.send(changes)
+            if self._connection.poll(self._delegate._calculate_timeout(test_case)):  # noqa: SLF001
+                with disable_tracing_while_unpickling(self.subject_properties):
+                    result: ExecutionResult | None = self._connection.recv()
+                if result is not None:
+                    return result
+                _LOGGER.warning(
+                    "Execution of the suffix crashed, continuing as if a timeout occurred"
+                )
+                return ExecutionResult(timeout=True)
+            _LOGGER.warning("Experienced timeout from test-case execution")
+        except (EOFError, OSError):
+            _LOGGER.error("Error during receiving results from the worker")
+        # The worker is unusable now, the next test case starts a new one.
+        self._stop_worker()
+        return ExecutionResult(timeout=True)
+
+    def _stop_worker(self) -> None:
+        assert self._worker is not None
+        assert self._connection is not None
+        if self._worker.exitcode is None:
+            # The worker leads a process group, which contains its forks.
+            with contextlib.suppress(OSError):
+                os.killpg(self._worker.pid, signal.SIGKILL)
+            self._worker.kill()
+            self._worker.join(timeout=_JOIN_TIMEOUT)
+        self._connection.close()
+        self._worker = None
+        self._connection = None
+
+
+@profiled_subprocess("prefix worker")
+def _run_worker(
+    executor: TestCaseExecutor,
+    prefix: tc.TestCase,
+    position: int,
+    connection: mp_conn.Connection,
+) -> None:
+    """Executes the prefix and then forks a process executing the suffix per request.
+
+    Args:
+        executor: The executor whose hooks execute the statements
+        prefix: The test case providing the prefix
+        position: The position of the first statement that is not part of the prefix
+        connection: The connection to the executor in the main process
+    """
+    os.setpgid(0, 0)
+    tracer = executor.subject_properties.instrumentation_tracer
+    SubprocessTestCaseExecutor._replace_tracer(tracer.tracer)  # noqa: SLF001
+    executor._before_test_case_execution(prefix)  # noqa: SLF001
+    with FilesystemIsolation(), OutputSuppressionContext(), tracer:
+        namespace = executor._build_namespace()  # noqa: SLF001
+        for statement in itertools.islice(prefix.iter_statements(), position):
+            if executor._execute_statement(statement, namespace) is not None:  # noqa: SLF001
+                connection.send(False)  # noqa: FBT003
+                return
+        connection.send(True)  # noqa: FBT003
+        while (changes := connection.recv()) is not None:
+            pid = os.fork()
+            if pid == 0:
+                _execute_suffix(executor, prefix, position, changes, namespace, connection)
+            _, status = os.waitpid(pid, 0)
+            if status != 0:
+                connection.send(None)
+
+
+def _execute_suffix(  # noqa: PLR0917
+    executor: TestCaseExecutor,
+    prefix: tc.TestCase,
+    position: int,
+    changes: dict[int, tc.Statement],
+    namespace: dict[str, Any],
+    connection: mp_conn.Connection,
+) -> NoReturn:
+    """Executes the statements from the position on in a fork of the worker.
+
+    Args:
+        executor: The executor whose hooks execute the statements
+        prefix: The test case providing the prefix
+        position: The position of the first statement that is not part of the prefix
+        changes: The statements in which the test case differs from the prefix
+        namespace: The namespace after executing the prefix
+        connection: The connection to the executor in the main process
+    """
+    exit_code = 1
+    try:
+        test_case = prefix.clone()
+        for index, statement in changes.items():
+            test_case.replace_statement(index, statement)
+        result = ExecutionResult()
+        for index, statement in enumerate(
+            itertools.islice(test_case.iter_statements(), position, None), start=position
+        ):
+            exception = executor._execute_statement(statement, namespace)  # noqa: SLF001
+            if exception is not None:
+                result.report_new_thrown_exception(index, exception)
+                break
+        tracer = executor.subject_properties.instrumentation_tracer
+        tracer.stop()
+        executor._after_test_case_execution(test_case, result)  # noqa: SLF001
+        # Pickling can execute code of the instrumented module, see the subprocess
+        # executor.
+        with tracer:
+            SubprocessTestCaseExecutor._fix_result_for_pickle(result)  # noqa: SLF001
+            connection.send(result)
+        exit_code = 0
+    except Exception as e:  # noqa: BLE001
+        _LOGGER.warning("Suppressed exception in the fork executing the suffix: %s", e)
+    finally:
+        os._exit(exit_code)
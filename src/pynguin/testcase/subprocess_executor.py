@@ -29,11 +29,12 @@ from pynguin.testcase.execution import TestCaseExecutor
 from pynguin.testcase.execution_isolation import PatchRandomOnUnpickle
 from pynguin.testcase.execution_result import ExecutionResult
 from pynguin.utils import randomness
-from pynguin.utils.statistics import stats as stat
-from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+from pynguin.utils.statistics.profiler import profiled_subprocess
+from pynguin.utils.statistics.searchphases import SearchPhase, measured
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Collection, Generator, Iterable
+    from contextlib import AbstractContextManager
 
     import pynguin.assertion.assertion_trace as at
     import pynguin.testcase.testcase as tc
@@ -175,20 +176,6 @@ class SubprocessTestCaseExecutor(TestCaseExecutor):
 
             return process.exitcode or 0
 
-    def _calculate_timeout(self, test_case: tc.TestCase) -> float:
-        """Calculate timeout for a test case based on its size.
-
-        Args:
-            test_case: The test case
-
-        Returns:
-            The calculated timeout in seconds
-        """
-        return min(
-            self._maximum_test_execution_timeout,
-            self._test_execution_time_per_statement * test_case.size(),
-        )
-
     def _calculate_timeout_for_multiple(self, test_cases: tuple[tc.TestCase, ...]) -> float:
         """Calculate timeout for multiple test cases based on their sizes.
 
@@ -206,6 +193,7 @@ class SubprocessTestCaseExecutor(TestCaseExecutor):
             ),
         )
 
+    @measured(SearchPhase.EXECUTION)
     def execute_multiple(  # noqa: D102
         self, test_cases: Iterable[tc.TestCase]
     ) -> Iterable[ExecutionResult]:
@@ -214,8 +202,7 @@ class SubprocessTestCaseExecutor(TestCaseExecutor):
         if not test_cases_tuple:
             return ()
 
-        self._executed_test_cases += len(test_cases_tuple)
-        stat.track_output_variable(RuntimeVariable.Executed, self._executed_test_cases)
+        self._count_executions(len(test_cases_tuple))
 
         for test_case in test_cases_tuple:
             self._before_remote_test_case_execution(test_case)
@@ -444,7 +431,7 @@ class SubprocessTestCaseExecutor(TestCaseExecutor):
         # statement position to the name of the variable it binds (if any).
         return {
             position: statement.bound_variable
-            for position, statement in enumerate(test_case.statements())
+            for position, statement in enumerate(test_case.iter_statements())
             if statement.bound_variable is not None
         }
 
@@ -475,6 +462,7 @@ class SubprocessTestCaseExecutor(TestCaseExecutor):
                 assertion_trace.add_entry(position, assertion.clone(memo))
 
     @staticmethod
+    @profiled_subprocess("test execution")
     def _execute_test_cases_in_subprocess(  # noqa: PLR0917
         _patch_random_hook: object,
         subject_properties: SubjectProperties,
@@ -562,31 +550,8 @@ class SubprocessTestCaseExecutor(TestCaseExecutor):
             )
             return None
 
-    @contextlib.contextmanager
-    def _disable_tracing_while_unpickling(self) -> Generator[None, None, None]:
-        """Disable every tracer that unpickling the subprocess results can trigger.
-
-        Unpickling runs code of the instrumented module (``__init__``, ``__setstate__``,
-        …) in *this* process.  That code refers directly to the tracer installed by the
-        import hook, which is not this executor's tracer whenever the executor was built
-        from :meth:`SubjectProperties.sharing_registries` — as the assertion generator
-        does for filtering and mutation analysis.  Since the import-hook tracer is
-        stopped outside test-case execution, leaving it enabled makes it abort the whole
-        run instead of the runaway thread it is meant to kill.
-
-        Yields:
-            Once, with tracing disabled.
-        """
-        with contextlib.ExitStack() as stack:
-            stack.enter_context(
-                self._subject_properties.instrumentation_tracer.temporarily_disable()
-            )
-            for finder in sys.meta_path:
-                if isinstance(finder, InstrumentationFinder):
-                    stack.enter_context(
-                        finder.subject_properties.instrumentation_tracer.temporarily_disable()
-                    )
-            yield
+    def _disable_tracing_while_unpickling(self) -> AbstractContextManager[None]:
+        return disable_tracing_while_unpickling(self._subject_properties)
 
     @staticmethod
     def _replace_tracer(tracer: ExecutionTracer) -> None:
@@ -790,3 +755,33 @@ def _filter_bad_raw_return_types(
 
 def _clear_bad_raw_return_types(result: ExecutionResult) -> None:
     result.raw_return_types.clear()
+
+
+@contextlib.contextmanager
+def disable_tracing_while_unpickling(
+    subject_properties: SubjectProperties,
+) -> Generator[None, None, None]:
+    """Disable every tracer that unpickling the subprocess results can trigger.
+
+    Unpickling runs code of the instrumented module (``__init__``, ``__setstate__``,
+    …) in *this* process.  That code refers directly to the tracer installed by the
+    import hook, which is not the executor's tracer whenever the executor was built
+    from :meth:`SubjectProperties.sharing_registries` — as the assertion generator
+    does for filtering and mutation analysis.  Since the import-hook tracer is
+    stopped outside test-case execution, leaving it enabled makes it abort the whole
+    run instead of the runaway thread it is meant to kill.
+
+    Args:
+        subject_properties: The subject properties of the executor that unpickles
+
+    Yields:
+        Once, with tracing disabled.
+    """
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(subject_properties.instrumentation_tracer.temporarily_disable())
+        for finder in sys.meta_path:
+            if isinstance(finder, InstrumentationFinder):
+                stack.enter_context(
+                    finder.subject_properties.instrumentation_tracer.temporarily_disable()
+                )
+        yield
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import bisect
 import dataclasses
 from typing import TYPE_CHECKING, Literal
 
@@ -17,6 +18,8 @@ from pynguin.assertion.assertion import ExceptionAssertion
 from pynguin.utils import randomness
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import pynguin.assertion.assertion as ass
     from pynguin.utils.generic.genericaccessibleobject import GenericAccessibleObject
 
@@ -126,13 +129,17 @@ class Statement:
     local_search_applied: bool = dataclasses.field(default=False, compare=False, repr=False)
     """Whether local search already tried the same-datatype strategy on this exact
     value once, used to decide when to escape a local optimum by randomizing the
-    value first. Not carried over by :meth:`TestCase.clone` or
-    :meth:`TestCase.append_test_case_from` (both rebuild ``Statement`` instances
-    without passing it), so it resets to ``False`` on clone -- a deliberate,
-    slightly more exploratory choice."""
+    value first. Not carried over to a clone by :meth:`TestCase.clone` or
+    :meth:`TestCase.append_test_case_from`, so it resets to ``False`` on clone -- a
+    deliberate, slightly more exploratory choice."""
     _used_vars: frozenset[str] | None = dataclasses.field(
         default=None, init=False, repr=False, compare=False
     )
+    _code: str | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    _owner: object | None = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    """The token of the test case owning this statement, see :class:`TestCase`."""
+    _epoch: int = dataclasses.field(default=0, init=False, repr=False, compare=False)
+    """The epoch of the owning test case in which it took ownership."""
 
     def has_only_exception_assertion(self) -> bool:
         """Does this statement only have an exception assertion?
@@ -159,17 +166,149 @@ class Statement:
             self._used_vars = frozenset(collector.names)
         return self._used_vars
 
+    def to_code(self) -> str:
+        """Return (and cache) the Python source string of this statement.
 
-def _get_used_variables(stmt: Statement) -> frozenset[str]:
-    """Return all variable names used (read) in *stmt*.
+        Returns:
+            The source string of this statement, without its assertions.
+        """
+        if self._code is None:
+            self._code = _EMPTY_MODULE.code_for_node(self.node)
+        return self._code
 
-    Args:
-        stmt: The statement to inspect.
 
-    Returns:
-        The set of variable names read by the statement.
+_EMPTY_MODULE = cst.Module(body=[])
+
+
+@dataclasses.dataclass
+class _DefUseIndex:
+    """Maps variable names to the positions of the statements defining and reading them.
+
+    The position lists are sorted in ascending order.  An index is created empty and
+    built on the first query, such that clones can share it before it is built.
     """
-    return stmt.used_variables()
+
+    definitions: dict[str, list[int]] = dataclasses.field(default_factory=dict)
+    uses: dict[str, list[int]] = dataclasses.field(default_factory=dict)
+    built: bool = False
+
+    @classmethod
+    def build(cls, statements: list[Statement]) -> _DefUseIndex:
+        """Index all statements.
+
+        Args:
+            statements: The statements of a test case.
+
+        Returns:
+            The index of the statements.
+        """
+        index = cls()
+        index.populate(statements)
+        return index
+
+    def populate(self, statements: list[Statement]) -> None:
+        """Index all statements in this empty index.
+
+        Args:
+            statements: The statements of a test case.
+        """
+        for position, stmt in enumerate(statements):
+            self.add(position, stmt)
+        self.built = True
+
+    def copy(self) -> _DefUseIndex:
+        """Copy the index.
+
+        Returns:
+            An index with copies of the position lists.
+        """
+        return _DefUseIndex(
+            {name: list(positions) for name, positions in self.definitions.items()},
+            {name: list(positions) for name, positions in self.uses.items()},
+            built=self.built,
+        )
+
+    def insert(self, position: int, stmt: Statement) -> None:
+        """Add a statement inserted before the statement at *position*.
+
+        The positions of the statements from *position* on are shifted by one.
+
+        Args:
+            position: The position of the inserted statement.
+            stmt: The statement.
+        """
+        for positions in (*self.definitions.values(), *self.uses.values()):
+            for number in range(bisect.bisect_left(positions, position), len(positions)):
+                positions[number] += 1
+        self.add(position, stmt)
+
+    def add(self, position: int, stmt: Statement) -> None:
+        """Add the variables defined and read by a statement.
+
+        Args:
+            position: The position of the statement.
+            stmt: The statement.
+        """
+        if stmt.bound_variable is not None:
+            bisect.insort(self.definitions.setdefault(stmt.bound_variable, []), position)
+        for name in stmt.used_variables():
+            bisect.insort(self.uses.setdefault(name, []), position)
+
+    def discard(self, position: int, stmt: Statement) -> None:
+        """Remove the variables defined and read by a statement.
+
+        Args:
+            position: The position of the statement.
+            stmt: The statement.
+        """
+        if stmt.bound_variable is not None:
+            _discard_position(self.definitions, stmt.bound_variable, position)
+        for name in stmt.used_variables():
+            _discard_position(self.uses, name, position)
+
+    def remove(self, removed: set[int]) -> None:
+        """Remove the statements at the given positions.
+
+        The positions of the remaining statements are shifted to close the gaps.
+
+        Args:
+            removed: The positions of the removed statements.
+        """
+        if not removed:
+            return
+        ordered = sorted(removed)
+        for positions_by_name in (self.definitions, self.uses):
+            for name, positions in list(positions_by_name.items()):
+                start = bisect.bisect_left(positions, ordered[0])
+                if start == len(positions):
+                    continue
+                positions[start:] = [
+                    position - bisect.bisect_left(ordered, position)
+                    for position in positions[start:]
+                    if position not in removed
+                ]
+                if not positions:
+                    del positions_by_name[name]
+
+    def users_after(self, name: str, position: int) -> list[int]:
+        """Return the positions after *position* of statements reading *name*.
+
+        Args:
+            name: The variable name.
+            position: The exclusive lower bound.
+
+        Returns:
+            The sorted positions of the statements.
+        """
+        positions = self.uses.get(name, [])
+        return positions[bisect.bisect_right(positions, position) :]
+
+
+def _discard_position(positions: dict[str, list[int]], name: str, position: int) -> None:
+    names = positions[name]
+    del names[bisect.bisect_left(names, position)]
+    if not names:
+        del positions[name]
 
 
 def _uses_variable(stmt: Statement, var_name: str) -> bool:
@@ -186,14 +325,31 @@ def _uses_variable(stmt: Statement, var_name: str) -> bool:
 
 
 class TestCase:  # noqa: PLR0904
-    """An ordered list of CST-backed statements forming a single test case."""
+    """An ordered list of CST-backed statements forming a single test case.
+
+    Clones share their statement list, their type registry and the statements
+    themselves with the original, which makes :meth:`clone` O(1).  The list and
+    the registry are copied on the first structural change of either test case.
+    A statement is copied the first time it is handed out by
+    :meth:`get_statement` or :meth:`statements` to a test case that does not own
+    it, because callers mutate the assertions of the returned statements.  A
+    test case owns the statements it added since it was last cloned; ownership
+    is recorded as the test case's token and epoch on the statement, and cloning
+    bumps the epoch instead of touching every statement.
+    """
 
     def __init__(self) -> None:
         """Initializes an empty test case."""
         self._statements: list[Statement] = []
+        self._statements_shared: bool = False
         self._var_counter: int = 0
         self._type_registry: dict[type, list[str]] = {}
+        self._registry_shared: bool = False
         self._code_cache: str | None = None
+        self._def_use: _DefUseIndex | None = None
+        self._def_use_shared: bool = False
+        self._token: object = object()
+        self._epoch: int = 0
 
     # ------------------------------------------------------------------
     # Statement management
@@ -206,22 +362,28 @@ class TestCase:  # noqa: PLR0904
             stmt: The statement to append.
         """
         self._code_cache = None
-        self._statements.append(stmt)
+        self._adopt(stmt)
+        self._writable_statements().append(stmt)
         self._register(stmt)
+        self._update_def_use(self.size() - 1, None, stmt)
 
     def insert_statement(self, index: int, stmt: Statement) -> None:
-        """Insert a statement at *index* and rebuild the type registry.
+        """Insert a statement at *index* and update the type registry.
 
         Args:
             index: The index to insert the statement at.
             stmt: The statement to insert.
         """
         self._code_cache = None
-        self._statements.insert(index, stmt)
-        self._rebuild_registry()
+        index = min(max(index + self.size() if index < 0 else index, 0), self.size())
+        self._adopt(stmt)
+        self._register_at(index, stmt)
+        self._writable_statements().insert(index, stmt)
+        if (def_use := self._writable_def_use()) is not None:
+            def_use.insert(index, stmt)
 
     def remove_statement(self, index: int) -> Statement:
-        """Remove and return the statement at *index*; rebuild the type registry.
+        """Remove and return the statement at *index*; update the type registry.
 
         Args:
             index: The index of the statement to remove.
@@ -230,20 +392,28 @@ class TestCase:  # noqa: PLR0904
             The removed statement.
         """
         self._code_cache = None
-        stmt = self._statements.pop(index)
-        self._rebuild_registry()
+        index = range(self.size())[index]
+        stmt = self._owned_statement(index)
+        self._unregister_at(index, stmt)
+        self._writable_statements().pop(index)
+        if (def_use := self._writable_def_use()) is not None:
+            def_use.remove({index})
         return stmt
 
     def replace_statement(self, index: int, stmt: Statement) -> None:
-        """Replace the statement at *index* in-place; rebuild the type registry.
+        """Replace the statement at *index* in-place; update the type registry.
 
         Args:
             index: The index of the statement to replace.
             stmt: The replacement statement.
         """
         self._code_cache = None
-        self._statements[index] = stmt
-        self._rebuild_registry()
+        index = range(self.size())[index]
+        self._unregister_at(index, self._statements[index])
+        self._register_at(index, stmt)
+        self._update_def_use(index, self._statements[index], stmt)
+        self._adopt(stmt)
+        self._writable_statements()[index] = stmt
 
     def remove_statements_batch(self, indices: set[int]) -> None:
         """Remove all statements at *indices* in one pass; rebuild registry once.
@@ -252,7 +422,10 @@ class TestCase:  # noqa: PLR0904
             indices: The set of indices to remove.
         """
         self._code_cache = None
+        if (def_use := self._writable_def_use()) is not None:
+            def_use.remove({index for index in indices if 0 <= index < self.size()})
         self._statements = [s for i, s in enumerate(self._statements) if i not in indices]
+        self._statements_shared = False
         self._rebuild_registry()
 
     def chop(self, position: int) -> None:
@@ -280,25 +453,44 @@ class TestCase:  # noqa: PLR0904
             The set of statement indices in the forward-dependency closure
             (including *index* itself).
         """
+        def_use = self._get_def_use()
         closure = {index}
         # Names bound by statements currently in the closure.
-        tainted_names: set[str] = set()
+        tainted_names: list[str] = []
         root_var = self._statements[index].bound_variable
         if root_var is not None:
-            tainted_names.add(root_var)
-
-        changed = True
-        while changed:
-            changed = False
-            for i in range(index + 1, self.size()):
-                if i in closure:
+            tainted_names.append(root_var)
+        seen_names = set(tainted_names)
+        while tainted_names:
+            for user in def_use.users_after(tainted_names.pop(), index):
+                if user in closure:
                     continue
-                stmt = self._statements[i]
-                if stmt.used_variables() & tainted_names:
-                    closure.add(i)
-                    if stmt.bound_variable is not None and stmt.bound_variable not in tainted_names:
-                        tainted_names.add(stmt.bound_variable)
-                    changed = True
+                closure.add(user)
+                bound = self._statements[user].bound_variable
+                if bound is not None and bound not in seen_names:
+                    seen_names.add(bound)
+                    tainted_names.append(bound)
+        return closure
+
+    def backward_dependencies(self, names: set[str]) -> set[str]:
+        """Return *names* plus every variable transitively read to compute them.
+
+        Args:
+            names: The variable names to start from.
+
+        Returns:
+            The names of the variables in the backward-dependency closure
+            (including *names* themselves).
+        """
+        def_use = self._get_def_use()
+        closure = set(names)
+        pending = list(names)
+        while pending:
+            for position in def_use.definitions.get(pending.pop(), []):
+                for used in self._statements[position].used_variables():
+                    if used not in closure:
+                        closure.add(used)
+                        pending.append(used)
         return closure
 
     def remove_statement_with_forward_dependencies(self, index: int) -> set[int]:
@@ -351,12 +543,12 @@ class TestCase:  # noqa: PLR0904
         # Variables bound by other's head (before `start`), with their types.
         head_types: dict[str, type | None] = {
             stmt.bound_variable: stmt.bound_type
-            for stmt in other.statements()[:start]
+            for stmt in other._statements[:start]
             if stmt.bound_variable is not None
         }
         rename: dict[str, str] = {}
         dropped: set[str] = set()
-        for stmt in other.statements()[start:]:
+        for stmt in other._statements[start:]:
             # Resolve references into other's head; drop the statement if a
             # reference cannot be satisfied from this test case.
             if not self._resolve_head_references(stmt, head_types, rename, dropped):
@@ -427,21 +619,36 @@ class TestCase:  # noqa: PLR0904
     def get_statement(self, index: int) -> Statement:
         """Return the statement at *index*.
 
+        The statement is owned by this test case and may be mutated.
+
         Args:
             index: The index of the statement.
 
         Returns:
             The statement at the index.
         """
-        return self._statements[index]
+        return self._owned_statement(index)
 
     def statements(self) -> list[Statement]:
         """Return a shallow copy of the statement list.
 
+        The statements are owned by this test case and may be mutated.
+
         Returns:
             A shallow copy of the statement list.
         """
-        return list(self._statements)
+        return [self._owned_statement(index) for index in range(self.size())]
+
+    def iter_statements(self) -> Iterator[Statement]:
+        """Iterate over the statements without taking ownership of them.
+
+        Unlike :meth:`statements`, this does not copy statements shared with
+        clones, so the statements must not be mutated.
+
+        Returns:
+            An iterator over the statements, in order.
+        """
+        return iter(self._statements)
 
     # ------------------------------------------------------------------
     # Variable naming
@@ -488,13 +695,31 @@ class TestCase:  # noqa: PLR0904
     def to_code(self) -> str:
         """Return the Python source string for this test case.
 
+        The source is joined from the cached sources of the statements, so only
+        statements that were never rendered before need code generation.
+
         Returns:
             The source string for this test case.
         """
         if self._code_cache is None:
-            self._code_cache = self.to_module().code
+            if self._statements:
+                self._code_cache = "".join(stmt.to_code() for stmt in self._statements)
+            else:
+                self._code_cache = self.to_module().code
         return self._code_cache
 
+    def statement_codes(self) -> tuple[str, ...]:
+        """Return the source strings of all statements.
+
+        Two non-empty test cases have the same code iff their statement codes are
+        equal.  The statement codes are cached per statement and survive cloning,
+        so comparing them does not render the whole test case.
+
+        Returns:
+            The source string of every statement, in order.
+        """
+        return tuple(stmt.to_code() for stmt in self._statements)
+
     def to_test_function(self, index: int = 0) -> cst.Module:
         """Wrap all statements in ``def test_N():`` and return as a Module.
 
@@ -557,25 +782,25 @@ class TestCase:  # noqa: PLR0904
             A deep copy of this test case.
         """
         tc = TestCase()
-        cloned = []
-        for stmt in self._statements:
-            s = Statement(
-                node=stmt.node,
-                bound_variable=stmt.bound_variable,
-                bound_type=stmt.bound_type,
-                assertions=list(stmt.assertions),
-                accessible=stmt.accessible,
-                ml_info=stmt.ml_info,
-            )
-            s._used_vars = stmt._used_vars  # noqa: SLF001 # propagate cached set; nodes are immutable
-            cloned.append(s)
-        tc._statements = cloned
+        tc._statements = self._statements
+        tc._type_registry = self._type_registry
+        tc._statements_shared = tc._registry_shared = True
+        self._statements_shared = self._registry_shared = True
+        # Statements this test case owned so far are now shared with the clone.
+        self._epoch += 1
+        # The index is shared even before it is built, such that it is built at most
+        # once for the original and all its unchanged clones.
+        if self._def_use is None:
+            self._def_use = _DefUseIndex()
+        tc._def_use = self._def_use
+        tc._def_use_shared = self._def_use_shared = True
         tc._var_counter = self._var_counter
-        tc._rebuild_registry()
         tc._code_cache = self._code_cache
         return tc
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, TestCase):
             return NotImplemented
         return self.to_code() == other.to_code()
@@ -586,36 +811,35 @@ class TestCase:  # noqa: PLR0904
     def remove_unused_variables(self) -> None:
         """Remove assignments to variables that are not used later in the test case.
 
-        Uses a backward pass to track alive variables. For each assignment, if the
-        bound variable is not alive at that point, the assignment is replaced with
-        a simple expression statement.
+        An assignment is unused if no later statement reads its variable before
+        the variable is bound again; the statement rebinding it may read it
+        itself.  Unused assignments are replaced with simple expression
+        statements.
         """
         self._code_cache = None
-        alive_vars: set[str] = set()
+        def_use = self._get_def_use()
+        unused: list[int] = []
+        for name, definitions in def_use.definitions.items():
+            for number, position in enumerate(definitions):
+                users = def_use.users_after(name, position)
+                next_definition = (
+                    definitions[number + 1] if number + 1 < len(definitions) else self.size()
+                )
+                if not users or users[0] > next_definition:
+                    unused.append(position)
 
-        for i in range(len(self._statements) - 1, -1, -1):
+        for i in unused:
             stmt = self._statements[i]
-            bv = stmt.bound_variable
-
-            if bv is not None:
-                if bv in alive_vars:
-                    # Variable is used later. It is NOT alive before this assignment.
-                    alive_vars.remove(bv)
-                    alive_vars.update(_get_used_variables(stmt))
-                else:
-                    # Variable is NOT used later. Transform Assign to Expr.
-                    new_node = self._transform_assign_to_expr(stmt.node)
-                    if new_node is not stmt.node:
-                        self._statements[i] = Statement(
-                            node=new_node,
-                            bound_variable=None,
-                            bound_type=None,
-                        )
-                    # Even if unused, the RHS might use other variables
-                    alive_vars.update(_get_used_variables(stmt))
-            else:
-                # Not an assignment, just update alive vars
-                alive_vars.update(_get_used_variables(stmt))
+            new_node = self._transform_assign_to_expr(stmt.node)
+            if new_node is not stmt.node:
+                new_stmt = Statement(
+                    node=new_node,
+                    bound_variable=None,
+                    bound_type=None,
+                )
+                self._update_def_use(i, stmt, new_stmt)
+                self._adopt(new_stmt)
+                self._writable_statements()[i] = new_stmt
 
         self._rebuild_registry()
 
@@ -651,11 +875,103 @@ class TestCase:  # noqa: PLR0904
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _adopt(self, stmt: Statement) -> None:
+        stmt._owner = self._token  # noqa: SLF001
+        stmt._epoch = self._epoch  # noqa: SLF001
+
+    def _owned_statement(self, index: int) -> Statement:
+        stmt = self._statements[index]
+        if stmt._owner is self._token and stmt._epoch == self._epoch:  # noqa: SLF001
+            return stmt
+        # Only the test case the statement originates from keeps this flag.
+        from_self = stmt._owner is self._token  # noqa: SLF001
+        copy = Statement(
+            node=stmt.node,
+            bound_variable=stmt.bound_variable,
+            bound_type=stmt.bound_type,
+            assertions=list(stmt.assertions),
+            accessible=stmt.accessible,
+            ml_info=stmt.ml_info,
+            local_search_applied=stmt.local_search_applied and from_self,
+        )
+        copy._used_vars = stmt._used_vars  # noqa: SLF001 # propagate cached set; nodes are immutable
+        copy._code = stmt._code  # noqa: SLF001
+        self._adopt(copy)
+        self._writable_statements()[index] = copy
+        return copy
+
+    def _get_def_use(self) -> _DefUseIndex:
+        if self._def_use is None:
+            self._def_use = _DefUseIndex()
+            self._def_use_shared = False
+        if not self._def_use.built:
+            # The test cases sharing an index have the same statements until one of
+            # them changes, which detaches it from the shared index first.
+            self._def_use.populate(self._statements)
+        return self._def_use
+
+    def _writable_def_use(self) -> _DefUseIndex | None:
+        """Provide the index to update before changing the statements.
+
+        Returns:
+            The index owned by this test case, or None if it is not built yet.
+        """
+        if self._def_use is None or not self._def_use.built:
+            self._def_use = None
+            self._def_use_shared = False
+            return None
+        if self._def_use_shared:
+            self._def_use = self._def_use.copy()
+            self._def_use_shared = False
+        return self._def_use
+
+    def _update_def_use(self, position: int, old: Statement | None, new: Statement) -> None:
+        if (def_use := self._writable_def_use()) is not None:
+            if old is not None:
+                def_use.discard(position, old)
+            def_use.add(position, new)
+
+    def _writable_statements(self) -> list[Statement]:
+        if self._statements_shared:
+            self._statements = list(self._statements)
+            self._statements_shared = False
+        return self._statements
+
+    def _writable_registry(self) -> dict[type, list[str]]:
+        if self._registry_shared:
+            self._type_registry = {t: list(names) for t, names in self._type_registry.items()}
+            self._registry_shared = False
+        return self._type_registry
+
+    def _registry_position(self, index: int, bound_type: type) -> int:
+        # The registry lists the variables of a type in statement order.
+        return sum(
+            1
+            for stmt in self._statements[:index]
+            if stmt.bound_variable is not None and stmt.bound_type == bound_type
+        )
+
     def _register(self, stmt: Statement) -> None:
         if stmt.bound_variable is not None and stmt.bound_type is not None:
-            self._type_registry.setdefault(stmt.bound_type, []).append(stmt.bound_variable)
+            self._writable_registry().setdefault(stmt.bound_type, []).append(stmt.bound_variable)
+
+    def _register_at(self, index: int, stmt: Statement) -> None:
+        if stmt.bound_variable is not None and stmt.bound_type is not None:
+            position = self._registry_position(index, stmt.bound_type)
+            self._writable_registry().setdefault(stmt.bound_type, []).insert(
+                position, stmt.bound_variable
+            )
+
+    def _unregister_at(self, index: int, stmt: Statement) -> None:
+        if stmt.bound_variable is not None and stmt.bound_type is not None:
+            registry = self._writable_registry()
+            names = registry[stmt.bound_type]
+            del names[self._registry_position(index, stmt.bound_type)]
+            if not names:
+                del registry[stmt.bound_type]
 
     def _rebuild_registry(self) -> None:
         self._type_registry = {}
+        self._registry_shared = False
         for stmt in self._statements:
             self._register(stmt)
@@ -27,7 +27,7 @@ import pynguin.configuration as config
 import pynguin.utils.generic.genericaccessibleobject as gao
 from pynguin.analyses.constants import ConstantProvider, EmptyConstantProvider
 from pynguin.analyses.typesystem import ANY, AnyType, Instance, ProperType, TupleType
-from pynguin.testcase import literalgen
+from pynguin.testcase import interning, literalgen
 from pynguin.testcase.testcase import MLStatementInfo, Statement
 from pynguin.utils import randomness
 from pynguin.utils.exceptions import ConstructionFailedException
@@ -329,7 +329,7 @@ class TestFactory:
         under_test = self._test_cluster.accessible_objects_under_test
         return any(
             statement.accessible is not None and statement.accessible in under_test
-            for statement in test_case.statements()
+            for statement in test_case.iter_statements()
         )
 
     @staticmethod
@@ -502,7 +502,7 @@ class TestFactory:
         new_node = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(assign_var))],
+                    targets=[cst.AssignTarget(target=interning.name(assign_var))],
                     value=expr,
                 )
             ]
@@ -584,7 +584,7 @@ class TestFactory:
         new_assign = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(assign_var))],
+                    targets=[cst.AssignTarget(target=interning.name(assign_var))],
                     value=node,
                 )
             ]
@@ -632,11 +632,11 @@ class TestFactory:
         if not candidates:
             return False
         replacement = randomness.choice(candidates)
-        new_rhs = rhs.with_changes(attr=cst.Name(replacement.field))
+        new_rhs = rhs.with_changes(attr=interning.name(replacement.field))
         new_node = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(statement.bound_variable))],
+                    targets=[cst.AssignTarget(target=interning.name(statement.bound_variable))],
                     value=new_rhs,
                 )
             ]
@@ -680,8 +680,8 @@ class TestFactory:
             )
             owner = replacement.owner
             class_name = owner.name if owner is not None else "object"
-            func: cst.BaseExpression = cst.Attribute(
-                value=cst.Name(self._module_alias()), attr=cst.Name(class_name)
+            func: cst.BaseExpression = interning.attribute_chain(
+                f"{self._module_alias()}.{class_name}"
             )
             bound_type = _raw_type_or_none(owner.raw_type) if owner is not None else None
             return cst.Call(func=func, args=args), bound_type, cursor
@@ -701,7 +701,7 @@ class TestFactory:
             args, cursor = self._satisfy_params(
                 test_case, replacement.inferred_signature, cursor, 0, accessible=replacement
             )
-            func = cst.Attribute(value=cst.Name(receiver), attr=cst.Name(method_name))
+            func = cst.Attribute(value=interning.name(receiver), attr=interning.name(method_name))
             bound_type_m = _proper_type_to_raw(replacement.generated_type())
             return cst.Call(func=func, args=args), bound_type_m, cursor
         if isinstance(replacement, gao.GenericFunction):
@@ -711,10 +711,7 @@ class TestFactory:
             args, cursor = self._satisfy_params(
                 test_case, replacement.inferred_signature, cursor, 0, accessible=replacement
             )
-            func = cst.Attribute(
-                value=cst.Name(self._module_alias()),
-                attr=cst.Name(function_name),
-            )
+            func = interning.attribute_chain(f"{self._module_alias()}.{function_name}")
             bound_type_f = _proper_type_to_raw(replacement.generated_type())
             return cst.Call(func=func, args=args), bound_type_f, cursor
         if isinstance(replacement, gao.GenericEnum):
@@ -783,7 +780,7 @@ class TestFactory:
         assign = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(var_name))],
+                    targets=[cst.AssignTarget(target=interning.name(var_name))],
                     value=node,
                 )
             ]
@@ -825,10 +822,7 @@ class TestFactory:
         )
         owner = accessible.owner
         class_name = owner.name if owner is not None else "object"
-        func = cst.Attribute(
-            value=cst.Name(self._module_alias()),
-            attr=cst.Name(class_name),
-        )
+        func = interning.attribute_chain(f"{self._module_alias()}.{class_name}")
         bound_type = _raw_type_or_none(owner.raw_type) if owner is not None else None
         return cst.Call(func=func, args=args), bound_type, cursor
 
@@ -871,7 +865,7 @@ class TestFactory:
         args, cursor = self._satisfy_params(
             test_case, accessible.inferred_signature, cursor, depth, accessible=accessible
         )
-        func = cst.Attribute(value=cst.Name(receiver), attr=cst.Name(method_name))
+        func = cst.Attribute(value=interning.name(receiver), attr=interning.name(method_name))
         bound_type = _proper_type_to_raw(accessible.generated_type())
         return cst.Call(func=func, args=args), bound_type, cursor
 
@@ -900,7 +894,7 @@ class TestFactory:
         args, cursor = self._satisfy_params(
             test_case, accessible.inferred_signature, cursor, depth, accessible=accessible
         )
-        func = cst.Attribute(value=cst.Name(self._module_alias()), attr=cst.Name(func_name))
+        func = interning.attribute_chain(f"{self._module_alias()}.{func_name}")
         bound_type = _proper_type_to_raw(accessible.generated_type())
         return cst.Call(func=func, args=args), bound_type, cursor
 
@@ -918,11 +912,8 @@ class TestFactory:
         members = list(getattr(accessible, "names", []) or [])
         member = randomness.choice(members) if members else "value"
         node = cst.Attribute(
-            value=cst.Attribute(
-                value=cst.Name(self._module_alias()),
-                attr=cst.Name(enum_name),
-            ),
-            attr=cst.Name(member),
+            value=interning.attribute_chain(f"{self._module_alias()}.{enum_name}"),
+            attr=interning.name(member),
         )
         bound_type = _raw_type_or_none(owner.raw_type) if owner is not None else None
         return node, bound_type
@@ -967,7 +958,7 @@ class TestFactory:
             receiver = self._find_any_variable(test_case, cursor)
         if receiver is None:
             return None
-        node = cst.Attribute(value=cst.Name(receiver), attr=cst.Name(accessible.field))
+        node = cst.Attribute(value=interning.name(receiver), attr=interning.name(accessible.field))
         bound_type = _proper_type_to_raw(accessible.generated_type())
         return node, bound_type, cursor
 
@@ -1067,7 +1058,7 @@ class TestFactory:
             elif emit_positionally:
                 args.append(cst.Arg(value=value))
             else:
-                args.append(cst.Arg(keyword=cst.Name(name), value=value))
+                args.append(cst.Arg(keyword=interning.name(name), value=value))
 
         return args, cursor
 
@@ -1101,30 +1092,30 @@ class TestFactory:
             # callable *value* (a function, a class, or a lambda) instead.
             emitted = self._emit_callable_statement(test_case, cursor)
             if emitted is not None:
-                return cst.Name(emitted[0]), emitted[1]
+                return interning.name(emitted[0]), emitted[1]
         var_name, cursor = self._create_or_reuse_var(test_case, param_type, raw, cursor, depth)
         if var_name is not None:
-            return cst.Name(var_name), cursor
+            return interning.name(var_name), cursor
         if raw is type:
             emitted = self._emit_class_statement(test_case, cursor)
             if emitted is not None:
-                return cst.Name(emitted[0]), emitted[1]
+                return interning.name(emitted[0]), emitted[1]
         if raw is not None and raw in _COLLECTION_RAWS:
             # Named, possibly reference-carrying collection statement.
             var_name, cursor = self._emit_collection_statement(
                 test_case, raw, param_type, cursor, depth
             )
-            return cst.Name(var_name), cursor
+            return interning.name(var_name), cursor
         if raw is not None and raw in literalgen.LITERAL_TYPES:
             # Emit as a named statement so it can be reused and mutated later.
             var_name, cursor = self._emit_primitive_statement(test_case, raw, cursor)
-            return cst.Name(var_name), cursor
+            return interning.name(var_name), cursor
         mapped = literalgen.map_abstract_collection(raw) if raw is not None else None
         if mapped is not None:
             var_name, cursor = self._emit_collection_statement(
                 test_case, mapped, param_type, cursor, depth
             )
-            return cst.Name(var_name), cursor
+            return interning.name(var_name), cursor
         # Unresolvable (Any) parameter, or a type we can neither reuse nor
         # construct: coin-flip between reusing an arbitrary in-scope variable
         # and generating a literal.  Real objects reach code that accesses
@@ -1132,7 +1123,7 @@ class TestFactory:
         # exploring string/number-guarded branches; both matter.
         any_var = self._find_any_variable(test_case, cursor)
         if any_var is not None and randomness.next_bool():
-            return cst.Name(any_var), cursor
+            return interning.name(any_var), cursor
         return self._fallback_literal_value(raw), cursor
 
     def _emit_primitive_statement(
@@ -1153,7 +1144,7 @@ class TestFactory:
         node = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(var_name))],
+                    targets=[cst.AssignTarget(target=interning.name(var_name))],
                     value=expr,
                 )
             ]
@@ -1181,7 +1172,7 @@ class TestFactory:
             A non-empty list of CST expressions usable as a class literal RHS.
         """
         candidates: list[cst.BaseExpression] = [
-            cst.Name(builtin.__name__) for builtin in _BUILTIN_CLASS_POOL
+            interning.name(builtin.__name__) for builtin in _BUILTIN_CLASS_POOL
         ]
         module_name = config.configuration.module_name
         alias = self._module_alias()
@@ -1192,7 +1183,7 @@ class TestFactory:
                 continue
             if not type_info.name.isidentifier():
                 continue
-            candidates.append(cst.Attribute(value=cst.Name(alias), attr=cst.Name(type_info.name)))
+            candidates.append(interning.attribute_chain(f"{alias}.{type_info.name}"))
         return candidates
 
     def _emit_class_statement(
@@ -1216,7 +1207,7 @@ class TestFactory:
         node = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(var_name))],
+                    targets=[cst.AssignTarget(target=interning.name(var_name))],
                     value=expr,
                 )
             ]
@@ -1254,7 +1245,7 @@ class TestFactory:
         new_node = stmt.node.with_changes(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(stmt.bound_variable))],
+                    targets=[cst.AssignTarget(target=interning.name(stmt.bound_variable))],
                     value=new_expr,
                 )
             ]
@@ -1291,7 +1282,7 @@ class TestFactory:
             (expr, type) for expr in self._class_literal_candidates()
         ]
         candidates.extend(
-            (cst.Name(name), types.BuiltinFunctionType) for name in _BUILTIN_FUNCTION_POOL
+            (interning.name(name), types.BuiltinFunctionType) for name in _BUILTIN_FUNCTION_POOL
         )
         alias = self._module_alias()
         for accessible in self._test_cluster.accessible_objects_under_test:
@@ -1301,7 +1292,7 @@ class TestFactory:
             if name is None:
                 continue
             candidates.append((
-                cst.Attribute(value=cst.Name(alias), attr=cst.Name(name)),
+                interning.attribute_chain(f"{alias}.{name}"),
                 types.FunctionType,
             ))
         return candidates
@@ -1318,8 +1309,8 @@ class TestFactory:
         result_type = randomness.choice(_LAMBDA_RESULT_TYPES)
         node = cst.Lambda(
             params=cst.Parameters(
-                star_arg=cst.Param(name=cst.Name("args"), star="*"),
-                star_kwarg=cst.Param(name=cst.Name("kwargs"), star="**"),
+                star_arg=cst.Param(name=interning.name("args"), star="*"),
+                star_kwarg=cst.Param(name=interning.name("kwargs"), star="**"),
             ),
             body=literalgen.generate_literal(result_type, self._constant_provider),
         )
@@ -1366,7 +1357,7 @@ class TestFactory:
         node = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(var_name))],
+                    targets=[cst.AssignTarget(target=interning.name(var_name))],
                     value=expr,
                 )
             ]
@@ -1389,7 +1380,7 @@ class TestFactory:
         """
         candidates = [
             statement.bound_variable
-            for idx, statement in enumerate(test_case.statements())
+            for idx, statement in enumerate(test_case.iter_statements())
             if idx < position
             and statement.bound_variable is not None
             and _holds_callable(statement.bound_type)
@@ -1460,8 +1451,8 @@ class TestFactory:
         node = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(var_name))],
-                    value=cst.Call(func=cst.Name(statement.bound_variable), args=args),
+                    targets=[cst.AssignTarget(target=interning.name(var_name))],
+                    value=cst.Call(func=interning.name(statement.bound_variable), args=args),
                 )
             ]
         )
@@ -1485,8 +1476,8 @@ class TestFactory:
             A list of ``cst.Name`` nodes referencing in-scope variables.
         """
         return [
-            cst.Name(statement.bound_variable)
-            for idx, statement in enumerate(test_case.statements())
+            interning.name(statement.bound_variable)
+            for idx, statement in enumerate(test_case.iter_statements())
             if idx < position and statement.bound_variable is not None
         ]
 
@@ -1519,15 +1510,15 @@ class TestFactory:
             raw_elem = _proper_type_to_raw(elem_type)
             var, cursor = self._create_or_reuse_var(test_case, elem_type, raw_elem, cursor, depth)
             if var is not None:
-                return cst.Name(var), cursor
+                return interning.name(var), cursor
             if raw_elem is not None and raw_elem in _COLLECTION_RAWS:
                 var, cursor = self._emit_collection_statement(
                     test_case, raw_elem, elem_type, cursor, depth
                 )
-                return cst.Name(var), cursor
+                return interning.name(var), cursor
             if raw_elem is not None and raw_elem in literalgen.LITERAL_TYPES:
                 var, cursor = self._emit_primitive_statement(test_case, raw_elem, cursor)
-                return cst.Name(var), cursor
+                return interning.name(var), cursor
         pool = self._reference_pool(test_case, cursor)
         return literalgen._element_value(self._constant_provider, pool), cursor  # noqa: SLF001
 
@@ -1607,7 +1598,7 @@ class TestFactory:
             expr = cst.List(elements=[cst.Element(value=v) for v in element_nodes])
         elif raw is set:
             if not element_nodes:
-                expr = cst.Call(func=cst.Name("set"))
+                expr = cst.Call(func=interning.name("set"))
             else:
                 expr = cst.Set(elements=[cst.Element(value=v) for v in element_nodes])
         else:  # tuple
@@ -1675,7 +1666,7 @@ class TestFactory:
         node = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(var_name))],
+                    targets=[cst.AssignTarget(target=interning.name(var_name))],
                     value=expr,
                 )
             ]
@@ -1727,7 +1718,7 @@ class TestFactory:
         new_node = stmt.node.with_changes(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(stmt.bound_variable))],
+                    targets=[cst.AssignTarget(target=interning.name(stmt.bound_variable))],
                     value=new_expr,
                 )
             ]
@@ -1804,7 +1795,7 @@ class TestFactory:
                 args.append(
                     self._as_arg(
                         name,
-                        cst.Name(reused)
+                        interning.name(reused)
                         if reused is not None and randomness.next_bool()
                         else self._callable_value_expr()[0],
                         positional_only=is_positional_only,
@@ -1824,7 +1815,7 @@ class TestFactory:
                 existing = self._find_any_variable(test_case, position)
             value: cst.BaseExpression
             if existing is not None and randomness.next_bool():
-                value = cst.Name(existing)
+                value = interning.name(existing)
             elif raw is type:
                 value = randomness.choice(self._class_literal_candidates())
             elif raw is not None and raw in literalgen.LITERAL_TYPES:
@@ -1855,7 +1846,7 @@ class TestFactory:
         """
         if positional_only:
             return cst.Arg(value=value)
-        return cst.Arg(keyword=cst.Name(name), value=value)
+        return cst.Arg(keyword=interning.name(name), value=value)
 
     def _fallback_literal_value(
         self,
@@ -1884,10 +1875,10 @@ class TestFactory:
         if raw is None:
             # AnyType / unresolvable: random primitive, occasionally None.
             if randomness.next_float() < 0.1:
-                return cst.Name("None")
+                return interning.name("None")
             fallback = randomness.choice(sorted(literalgen.LITERAL_TYPES, key=str))
             return literalgen.generate_literal(fallback, self._constant_provider, pool)
-        return cst.Name("None")
+        return interning.name("None")
 
     def mutate_call(self, test_case: tc.TestCase, position: int) -> bool:  # noqa: C901
         """Regenerate the argument values of the call statement at *position*.
@@ -1919,7 +1910,7 @@ class TestFactory:
             owner = accessible.owner
             class_name = owner.name if owner is not None else "object"
             new_call: cst.BaseExpression = cst.Call(
-                func=cst.Attribute(value=cst.Name(self._module_alias()), attr=cst.Name(class_name)),
+                func=interning.attribute_chain(f"{self._module_alias()}.{class_name}"),
                 args=args,
             )
         elif isinstance(accessible, gao.GenericMethod):
@@ -1934,7 +1925,9 @@ class TestFactory:
                 test_case, accessible.inferred_signature, position, accessible=accessible
             )
             new_call = cst.Call(
-                func=cst.Attribute(value=cst.Name(receiver), attr=cst.Name(method_name)),
+                func=cst.Attribute(
+                    value=interning.name(receiver), attr=interning.name(method_name)
+                ),
                 args=args,
             )
         elif isinstance(accessible, gao.GenericFunction):
@@ -1945,10 +1938,7 @@ class TestFactory:
                 test_case, accessible.inferred_signature, position, accessible=accessible
             )
             new_call = cst.Call(
-                func=cst.Attribute(
-                    value=cst.Name(self._module_alias()),
-                    attr=cst.Name(function_name),
-                ),
+                func=interning.attribute_chain(f"{self._module_alias()}.{function_name}"),
                 args=args,
             )
         elif isinstance(accessible, gao.GenericEnum):
@@ -1957,22 +1947,24 @@ class TestFactory:
             members = list(getattr(accessible, "names", []) or [])
             member = randomness.choice(members) if members else "value"
             new_call = cst.Attribute(
-                value=cst.Attribute(value=cst.Name(self._module_alias()), attr=cst.Name(enum_name)),
-                attr=cst.Name(member),
+                value=interning.attribute_chain(f"{self._module_alias()}.{enum_name}"),
+                attr=interning.name(member),
             )
         elif isinstance(accessible, gao.GenericField):
             owner_raw = _raw_type_or_none(accessible.owner.raw_type)
             receiver = self._find_variable_of_type(test_case, owner_raw, position)
             if receiver is None:
                 return False
-            new_call = cst.Attribute(value=cst.Name(receiver), attr=cst.Name(accessible.field))
+            new_call = cst.Attribute(
+                value=interning.name(receiver), attr=interning.name(accessible.field)
+            )
         else:
             return False
 
         new_node = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(stmt.bound_variable))],
+                    targets=[cst.AssignTarget(target=interning.name(stmt.bound_variable))],
                     value=new_call,
                 )
             ]
@@ -2088,7 +2080,7 @@ class TestFactory:
             A variable name, or ``None`` if no bound variable is in scope.
         """
         candidates: list[str] = []
-        for idx, statement in enumerate(test_case.statements()):
+        for idx, statement in enumerate(test_case.iter_statements()):
             if idx >= position:
                 break
             if statement.bound_variable is not None:
@@ -2114,7 +2106,7 @@ class TestFactory:
         if raw is None:
             return None
         candidates: list[str] = []
-        for idx, statement in enumerate(test_case.statements()):
+        for idx, statement in enumerate(test_case.iter_statements()):
             if idx >= position:
                 break
             if statement.bound_variable is None or statement.bound_type is None:
@@ -2341,7 +2333,7 @@ class MLTestFactory(TestFactory):
             if is_positional_only:
                 args.append(cst.Arg(value=value))
             else:
-                args.append(cst.Arg(keyword=cst.Name(name), value=value))
+                args.append(cst.Arg(keyword=interning.name(name), value=value))
         return args, cursor
 
     def _ml_arg_for_parameter(  # noqa: PLR0914
@@ -2385,7 +2377,7 @@ class MLTestFactory(TestFactory):
                 MLStatementInfo(kind="allowed_values", allowed_values=allowed),
                 bound_type=type(value),
             )
-            return cst.Name(var), cursor
+            return interning.name(var), cursor
 
         dtype = mltu.select_dtype(parameter_obj)
 
@@ -2393,12 +2385,12 @@ class MLTestFactory(TestFactory):
             parameter_obj.current_data = None
             var, cursor = self._emit_ml_assign(
                 test_case,
-                cst.Name("None"),
+                interning.name("None"),
                 cursor,
                 MLStatementInfo(kind="ml_scalar", dtype="None"),
                 bound_type=None,
             )
-            return cst.Name(var), cursor
+            return interning.name(var), cursor
 
         ndim = mltu.select_ndim(parameter_obj, dtype)
         shape = mltu.generate_shape(parameter_obj, ndim)
@@ -2431,7 +2423,7 @@ class MLTestFactory(TestFactory):
             bound_type=bound_type,
         )
         if is_final_value:
-            return cst.Name(ndarray_var), cursor
+            return interning.name(ndarray_var), cursor
 
         dtype_var, cursor = self._emit_ml_assign(
             test_case,
@@ -2441,7 +2433,7 @@ class MLTestFactory(TestFactory):
             bound_type=None,
         )
         var, cursor = self._emit_tensor_calls(test_case, ndarray_var, dtype_var, cursor)
-        return cst.Name(var), cursor
+        return interning.name(var), cursor
 
     def _emit_ml_scalar(
         self,
@@ -2499,7 +2491,7 @@ class MLTestFactory(TestFactory):
             MLStatementInfo(kind="ml_scalar", dtype=dtype, low=float(low), high=float(high)),
             bound_type=type(value),
         )
-        return cst.Name(var), cursor
+        return interning.name(var), cursor
 
     def _emit_tensor_calls(
         self,
@@ -2522,10 +2514,10 @@ class MLTestFactory(TestFactory):
         import pynguin.utils.pynguinml.ml_testing_resources as tr  # noqa: PLC0415
 
         np_call = cst.Call(
-            func=cst.Attribute(value=cst.Name("np"), attr=cst.Name("array")),
+            func=cst.Attribute(value=interning.name("np"), attr=interning.name("array")),
             args=[
-                cst.Arg(keyword=cst.Name("object"), value=cst.Name(ndarray_var)),
-                cst.Arg(keyword=cst.Name("dtype"), value=cst.Name(dtype_var)),
+                cst.Arg(keyword=interning.name("object"), value=interning.name(ndarray_var)),
+                cst.Arg(keyword=interning.name("dtype"), value=interning.name(dtype_var)),
             ],
         )
         nparray_var, cursor = self._emit_ml_assign(
@@ -2545,7 +2537,9 @@ class MLTestFactory(TestFactory):
         parameter_name = config.configuration.pynguinml.constructor_function_parameter
         ctor_call = cst.Call(
             func=func,
-            args=[cst.Arg(keyword=cst.Name(parameter_name), value=cst.Name(nparray_var))],
+            args=[
+                cst.Arg(keyword=interning.name(parameter_name), value=interning.name(nparray_var))
+            ],
         )
         tensor_var, cursor = self._emit_ml_assign(
             test_case,
@@ -2584,7 +2578,7 @@ class MLTestFactory(TestFactory):
         node = cst.SimpleStatementLine(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(var_name))],
+                    targets=[cst.AssignTarget(target=interning.name(var_name))],
                     value=expr,
                 )
             ]
@@ -2641,7 +2635,7 @@ class MLTestFactory(TestFactory):
         new_node = stmt.node.with_changes(
             body=[
                 cst.Assign(
-                    targets=[cst.AssignTarget(target=cst.Name(stmt.bound_variable))],
+                    targets=[cst.AssignTarget(target=interning.name(stmt.bound_variable))],
                     value=new_expr,
                 )
             ]
@@ -2722,8 +2716,4 @@ def _attribute_chain(dotted_path: str) -> cst.BaseExpression:
     Returns:
         A ``cst.Name`` for a bare identifier, else a nested ``cst.Attribute``.
     """
-    parts = dotted_path.split(".")
-    node: cst.BaseExpression = cst.Name(parts[0])
-    for part in parts[1:]:
-        node = cst.Attribute(value=node, attr=cst.Name(part))
-    return node
+    return interning.attribute_chain(dotted_path)
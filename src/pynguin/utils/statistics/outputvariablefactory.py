@@ -61,8 +61,16 @@ class ChromosomeOutputVariableFactory(ABC, Generic[T]):
 class SequenceOutputVariableFactory(ABC, Generic[T]):
     """Creates an output variable that represents a sequence of values."""
 
-    def __init__(self, variable: stat.RuntimeVariable) -> None:  # noqa: D107
+    def __init__(self, variable: stat.RuntimeVariable, *, bounded: bool = True) -> None:
+        """Initializes the factory for a given RuntimeVariable.
+
+        Args:
+            variable: The runtime variable for that output variable
+            bounded: Whether the values lie between 0 and 1, which the normalised
+                area under curve asserts
+        """
         self._variable = variable
+        self._bounded = bounded
         self._time_stamps: list[int] = []
         self._values: list[T] = []
         self._start_time: int = 0
@@ -173,7 +181,9 @@ class SequenceOutputVariableFactory(ABC, Generic[T]):
             normalised_area = (
                 self.area_under_curve + last_value * time_delta
             ) / config.configuration.stopping.maximum_search_time
-        assert 0.0 <= normalised_area <= 1.0, f"Normalised AuC out of range ({normalised_area})!"
+        assert not self._bounded or 0.0 <= normalised_area <= 1.0, (
+            f"Normalised AuC out of range ({normalised_area})!"
+        )
         return normalised_area
 
     @property
@@ -236,8 +246,10 @@ class SequenceOutputVariableFactory(ABC, Generic[T]):
 class DirectSequenceOutputVariableFactory(SequenceOutputVariableFactory, Generic[T]):
     """Sequence output variable whose value can be set directly."""
 
-    def __init__(self, variable: RuntimeVariable, start_value: T) -> None:  # noqa: D107
-        super().__init__(variable)
+    def __init__(  # noqa: D107
+        self, variable: RuntimeVariable, start_value: T, *, bounded: bool = True
+    ) -> None:
+        super().__init__(variable, bounded=bounded)
         self._value = start_value  # type: ignore[var-annotated]
 
     def get_value(self, individual) -> T:  # noqa: D102
@@ -253,17 +265,18 @@ class DirectSequenceOutputVariableFactory(SequenceOutputVariableFactory, Generic
 
     @staticmethod
     def get_float(
-        variable: RuntimeVariable,
+        variable: RuntimeVariable, *, bounded: bool = True
     ) -> DirectSequenceOutputVariableFactory:
         """Creates a factory for a float variable.
 
         Args:
             variable: the runtime variable
+            bounded: whether the values lie between 0 and 1
 
         Returns:
             A factory for that variable
         """
-        return DirectSequenceOutputVariableFactory(variable, 0.0)
+        return DirectSequenceOutputVariableFactory(variable, 0.0, bounded=bounded)
 
     @staticmethod
     def get_integer(
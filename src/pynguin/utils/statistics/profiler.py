@@ -0,0 +1,298 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a sampling profiler that tells apart the time of Pynguin and the SUT.
+
+The profiler is enabled by the ``profile`` option of the statistics output.  It
+samples the stacks of all threads whenever the process consumed another interval of
+CPU time, which is signalled by ``SIGPROF``, so it costs next to nothing between two
+samples.  Forked subprocesses, i.e., the subprocesses executing test cases and the
+islands or workers of a parallel search, sample themselves and spool their stacks to
+a file that the main process merges at the end of the run.
+
+Every sample is tagged with the phase of the run it was taken in.  The profiler
+writes the samples in the collapsed-stack format, which flame graph tools such as
+``flamegraph.pl`` or speedscope read, to the report directory: ``profile.collapsed``
+contains all samples with the phase as the root frame, and ``profile-<phase>.collapsed``
+contains the samples of a single phase.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import enum
+import functools
+import logging
+import signal
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
+
+import pynguin.configuration as config
+from pynguin.utils.statistics.searchphases import SearchPhase, phase_timer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from types import CodeType, FrameType
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_LOGGER = logging.getLogger(__name__)
+
+_SPOOL_FILE_NAME = "profile-subprocesses.spool"
+
+
+class ProfilePhase(str, enum.Enum):
+    """The phases of a run that samples are tagged with."""
+
+    GENERATION = "generation"
+    EXECUTION = "execution"
+    ASSERTION_GENERATION = "assertion_generation"
+    MINIMIZATION = "minimization"
+    EXPORT = "export"
+    OTHER = "other"
+
+
+class SamplingProfiler:
+    """Samples the stacks of all threads of the process on ``SIGPROF``.
+
+    A sample taken while a test case is executed is tagged as execution, regardless
+    of the phase that executes the test case; other samples are tagged with the
+    innermost phase entered via :meth:`phase`.
+    """
+
+    def __init__(self, interval: float, spool_file: Path) -> None:
+        """Initializes the profiler.
+
+        Args:
+            interval: The seconds of CPU time between two samples
+            spool_file: The file to which subprocesses append their samples
+        """
+        self._interval = interval
+        self._spool_file = spool_file
+        self._samples: collections.Counter[tuple[str, ...]] = collections.Counter()
+        self._phases: list[ProfilePhase] = []
+        self._labels: dict[CodeType, str] = {}
+        self._root: tuple[str, ...] = ()
+        self._main_thread = threading.main_thread().ident
+        self._previous_handler: Any = signal.SIG_DFL
+
+    @property
+    def samples(self) -> collections.Counter[tuple[str, ...]]:
+        """Provides the samples taken in this process.
+
+        Returns:
+            The number of samples per tagged stack, root first
+        """
+        return self._samples
+
+    def start(self) -> None:
+        """Starts sampling."""
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self._interval, self._interval)
+
+    def stop(self) -> None:
+        """Stops sampling."""
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+
+    @contextlib.contextmanager
+    def phase(self, phase: ProfilePhase) -> Generator[None, None, None]:
+        """Tags the samples taken in the context with a phase.
+
+        Args:
+            phase: The phase
+
+        Yields:
+            Nothing
+        """
+        self._phases.append(phase)
+        try:
+            yield
+        finally:
+            self._phases.pop()
+
+    def restart_in_subprocess(self, name: str) -> None:
+        """Restarts sampling in a forked subprocess, which does not inherit the timer.
+
+        Args:
+            name: The name of the subprocess, which becomes the frame below the tag
+        """
+        self._samples = collections.Counter()
+        self._root = (f"[{name}]",)
+        self._main_thread = threading.main_thread().ident
+        signal.setitimer(signal.ITIMER_PROF, self._interval, self._interval)
+
+    def spool(self) -> None:
+        """Stops sampling in a subprocess and appends its samples to the spool file."""
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        # A single write, such that concurrent subprocesses do not interleave lines.
+        with self._spool_file.open(mode="a", encoding="utf-8") as file:
+            file.write(_collapse(self._samples))
+
+    def write_report(self, report_dir: Path) -> int:
+        """Merges the samples of all processes and writes the collapsed-stack files.
+
+        Args:
+            report_dir: The directory to write the files to
+
+        Returns:
+            The number of samples
+        """
+        samples = collections.Counter(self._samples)
+        if self._spool_file.is_file():
+            for line in self._spool_file.read_text(encoding="utf-8").splitlines():
+                stack, _, count = line.rpartition(" ")
+                if stack:
+                    samples[tuple(stack.split(";"))] += int(count)
+            self._spool_file.unlink()
+        report_dir.mkdir(parents=True, exist_ok=True)
+        (report_dir / "profile.collapsed").write_text(_collapse(samples), encoding="utf-8")
+        for phase in ProfilePhase:
+            phase_samples = collections.Counter({
+                stack[1:]: count for stack, count in samples.items() if stack[0] == phase.value
+            })
+            (report_dir / f"profile-{phase.value}.collapsed").write_text(
+                _collapse(phase_samples), encoding="utf-8"
+            )
+        return samples.total()
+
+    def _tag(self) -> str:
+        if phase_timer.active_phase is SearchPhase.EXECUTION:
+            return ProfilePhase.EXECUTION.value
+        if self._phases:
+            return self._phases[-1].value
+        return ProfilePhase.OTHER.value
+
+    def _sample(self, _signum: int, frame: FrameType | None) -> None:
+        prefix = (self._tag(), *self._root)
+        for thread, thread_frame in sys._current_frames().items():  # noqa: SLF001
+            # The current frame of the main thread is this handler.
+            stack = self._stack(frame if thread == self._main_thread else thread_frame)
+            if stack:
+                self._samples[prefix + stack] += 1
+
+    def _stack(self, frame: FrameType | None) -> tuple[str, ...]:
+        labels: list[str] = []
+        while frame is not None:
+            code = frame.f_code
+            if (label := self._labels.get(code)) is None:
+                label = self._labels[code] = (
+                    f"{frame.f_globals.get('__name__', '?')}."
+                    f"{getattr(code, 'co_qualname', code.co_name)}"
+                )
+            labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        return tuple(labels)
+
+
+def _collapse(samples: collections.Counter[tuple[str, ...]]) -> str:
+    return "".join(f"{';'.join(stack)} {count}\n" for stack, count in samples.items())
+
+
+_profiler: SamplingProfiler | None = None
+
+
+@contextlib.contextmanager
+def profiling() -> Generator[None, None, None]:
+    """Runs the profiler in the context if the configuration enables it.
+
+    Yields:
+        Nothing
+    """
+    global _profiler  # noqa: PLW0603
+    statistics_output = config.configuration.statistics_output
+    if not statistics_output.profile:
+        yield
+        return
+    if not hasattr(signal, "setitimer") or (
+        threading.current_thread() is not threading.main_thread()
+    ):
+        _LOGGER.warning("Profiling requires SIGPROF and the main thread, not profiling")
+        yield
+        return
+    report_dir = Path(statistics_output.report_dir)
+    report_dir.mkdir(parents=True, exist_ok=True)
+    spool_file = report_dir / _SPOOL_FILE_NAME
+    spool_file.unlink(missing_ok=True)
+    _profiler = SamplingProfiler(
+        statistics_output.profile_sampling_interval / 1_000_000_000, spool_file
+    )
+    _profiler.start()
+    try:
+        yield
+    finally:
+        _profiler.stop()
+        samples = _profiler.write_report(report_dir)
+        _profiler = None
+        _LOGGER.info("Wrote %d profiler samples to %s", samples, report_dir)
+
+
+def profiled_subprocess(name: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Provides a decorator for the entry point of a forked subprocess.
+
+    The subprocess is profiled if its parent process is profiled.
+
+    Args:
+        name: The name of the subprocess, which becomes the frame below the tag
+
+    Returns:
+        The decorator
+    """
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _profiler is None:
+                return function(*args, **kwargs)
+            _profiler.restart_in_subprocess(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _profiler.spool()
+
+        return wrapper
+
+    return decorator
+
+
+def profile_phase(phase: ProfilePhase) -> contextlib.AbstractContextManager[None]:
+    """Tags the samples taken in the returned context with a phase.
+
+    Args:
+        phase: The phase
+
+    Returns:
+        The context manager, which does nothing if the run is not profiled
+    """
+    if _profiler is None:
+        return contextlib.nullcontext()
+    return _profiler.phase(phase)
+
+
+def profiled(phase: ProfilePhase) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Provides a decorator that tags the samples taken in a function with a phase.
+
+    Args:
+        phase: The phase
+
+    Returns:
+        The decorator
+    """
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with profile_phase(phase):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
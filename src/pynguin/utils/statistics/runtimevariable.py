@@ -94,7 +94,7 @@ class RuntimeVariable(str, enum.Enum):
     # The number of lines in the source file
     LineNos = "LineNos"
 
-    # The number of created mutants
+    # The number of created mutants, without those dropped as equivalent or duplicate
     NumberOfCreatedMutants = "NumberOfCreatedMutants"
 
     # The number of mutants actually checked (executed against the test suite).
@@ -162,6 +162,36 @@ class RuntimeVariable(str, enum.Enum):
     # Time overhead (ns) caused by type tracing executions
     TypeTracingTime = "TypeTracingTime"
 
+    # Number of offspring executions avoided because an equal test case was
+    # already evaluated or bred in the same generation
+    AvoidedExecutions = "AvoidedExecutions"
+
+    # Ratio of avoided executions to the number of bred offspring
+    AvoidedExecutionRate = "AvoidedExecutionRate"
+
+    # Share of the time of a search iteration spent breeding offspring
+    BreedingTimeShareTimeline = "BreedingTimeShareTimeline"
+
+    # Share of the time of a search iteration spent executing test cases
+    ExecutionTimeShareTimeline = "ExecutionTimeShareTimeline"
+
+    # Share of the time of a search iteration spent computing fitness values,
+    # excluding the executions they trigger
+    FitnessComputationTimeShareTimeline = "FitnessComputationTimeShareTimeline"
+
+    # Share of the time of a search iteration spent updating the archive
+    ArchiveUpdateTimeShareTimeline = "ArchiveUpdateTimeShareTimeline"
+
+    # Share of the time of a search iteration spent ranking the population
+    RankingTimeShareTimeline = "RankingTimeShareTimeline"
+
+    # Share of the time of a search iteration spent in local search, excluding the
+    # executions and fitness computations it triggers
+    LocalSearchTimeShareTimeline = "LocalSearchTimeShareTimeline"
+
+    # Number of test-case executions per second during a search iteration
+    ExecutionsPerSecondTimeline = "ExecutionsPerSecondTimeline"
+
     # ========= Values collected at the end of the search =========
 
     # Total number of statements in the resulting test suite
@@ -0,0 +1,158 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Provides a timer that attributes the time of the search to its phases.
+
+The search loops, the executors and the fitness computations enter the phase they
+are about to run via :meth:`PhaseTimer.measure`.  Phases nest, e.g., a fitness
+computation executes a test case, and the time of a phase excludes the time of
+the phases nested in it, so the times of all phases add up to at most the
+elapsed time.
+"""
+
+from __future__ import annotations
+
+import enum
+import functools
+import time
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class SearchPhase(enum.Enum):
+    """The phases of a search iteration, with the timeline recording their share."""
+
+    BREEDING = RuntimeVariable.BreedingTimeShareTimeline
+    EXECUTION = RuntimeVariable.ExecutionTimeShareTimeline
+    FITNESS_COMPUTATION = RuntimeVariable.FitnessComputationTimeShareTimeline
+    ARCHIVE_UPDATE = RuntimeVariable.ArchiveUpdateTimeShareTimeline
+    RANKING = RuntimeVariable.RankingTimeShareTimeline
+    LOCAL_SEARCH = RuntimeVariable.LocalSearchTimeShareTimeline
+
+
+class _Measurement:
+    """Context manager entering a phase; one instance is reused per phase."""
+
+    def __init__(self, timer: PhaseTimer, phase: SearchPhase) -> None:
+        self._timer = timer
+        self._phase = phase
+
+    def __enter__(self) -> None:
+        self._timer.enter(self._phase)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self._timer.leave()
+
+
+class PhaseTimer:
+    """Accumulates the exclusive time spent in each phase of the search."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self._measurements = {phase: _Measurement(self, phase) for phase in SearchPhase}
+        self._times: dict[SearchPhase, int] = dict.fromkeys(SearchPhase, 0)
+        self._active: list[SearchPhase] = []
+        self._mark = 0
+        self._executions = 0
+
+    def measure(self, phase: SearchPhase) -> _Measurement:
+        """Provides a context manager that attributes its time to a phase.
+
+        Args:
+            phase: The phase
+
+        Returns:
+            The context manager
+        """
+        return self._measurements[phase]
+
+    @property
+    def active_phase(self) -> SearchPhase | None:
+        """Provides the innermost phase that is currently active.
+
+        Returns:
+            The phase, or None if no phase is active
+        """
+        return self._active[-1] if self._active else None
+
+    def enter(self, phase: SearchPhase) -> None:
+        """Enters a phase, pausing the phase that is currently active.
+
+        Args:
+            phase: The phase
+        """
+        now = time.perf_counter_ns()
+        if self._active:
+            self._times[self._active[-1]] += now - self._mark
+        self._active.append(phase)
+        self._mark = now
+
+    def leave(self) -> None:
+        """Leaves the innermost phase, resuming the phase it was nested in."""
+        now = time.perf_counter_ns()
+        self._times[self._active.pop()] += now - self._mark
+        self._mark = now
+
+    def count_execution(self, executions: int = 1) -> None:
+        """Counts executed test cases.
+
+        Args:
+            executions: The number of executed test cases
+        """
+        self._executions += executions
+
+    def take(self) -> tuple[dict[SearchPhase, int], int]:
+        """Provides and resets the times and executions accumulated so far.
+
+        The time that the active phases spent so far is included.
+
+        Returns:
+            The nanoseconds spent in each phase and the number of executions
+        """
+        if self._active:
+            now = time.perf_counter_ns()
+            self._times[self._active[-1]] += now - self._mark
+            self._mark = now
+        times, executions = self._times, self._executions
+        self._times = dict.fromkeys(SearchPhase, 0)
+        self._executions = 0
+        return times, executions
+
+
+phase_timer = PhaseTimer()
+
+
+def measured(phase: SearchPhase) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Provides a decorator that attributes the time of a function to a phase.
+
+    Args:
+        phase: The phase
+
+    Returns:
+        The decorator
+    """
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with phase_timer.measure(phase):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
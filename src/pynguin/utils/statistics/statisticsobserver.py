@@ -14,6 +14,7 @@ import typing
 import pynguin.ga.searchobserver as so
 import pynguin.utils.statistics.stats as stat
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+from pynguin.utils.statistics.searchphases import phase_timer
 
 if typing.TYPE_CHECKING:
     import pynguin.ga.testsuitechromosome as tsc
@@ -86,3 +87,42 @@ class BestIndividualObserver(so.SearchObserver):
 
     def after_search_finish(self) -> None:  # noqa: D102
         pass
+
+
+class PhaseTimingObserver(so.SearchObserver):
+    """Records which share of each search iteration was spent in which phase.
+
+    Must be added before the :class:`BestIndividualObserver`, which records the
+    values of the timelines after each iteration.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        self._iteration_start_ns = 0
+
+    def before_search_start(self, start_time_ns: int) -> None:  # noqa: D102
+        pass
+
+    def before_first_search_iteration(  # noqa: D102
+        self, initial: tsc.TestSuiteChromosome
+    ) -> None:
+        # Do not attribute the initial population to the first iteration.
+        phase_timer.take()
+        self._iteration_start_ns = time.perf_counter_ns()
+
+    def after_search_iteration(  # noqa: D102
+        self, best: tsc.TestSuiteChromosome
+    ) -> None:
+        now = time.perf_counter_ns()
+        elapsed = max(now - self._iteration_start_ns, 1)
+        self._iteration_start_ns = now
+        times, executions = phase_timer.take()
+        for phase, phase_time in times.items():
+            stat.set_output_variable_for_runtime_variable(
+                phase.value, min(phase_time / elapsed, 1.0)
+            )
+        stat.set_output_variable_for_runtime_variable(
+            RuntimeVariable.ExecutionsPerSecondTimeline, executions * 1_000_000_000 / elapsed
+        )
+
+    def after_search_finish(self) -> None:  # noqa: D102
+        pass
@@ -20,6 +20,7 @@ import pynguin.ga.chromosome as chrom
 import pynguin.utils.statistics.outputvariablefactory as ovf
 import pynguin.utils.statistics.statisticsbackend as sb
 from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+from pynguin.utils.statistics.searchphases import SearchPhase
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -223,6 +224,15 @@ class _SearchStatistics:
                 RuntimeVariable.TotalExceptionsTimeline
             )
         )
+        for phase in SearchPhase:
+            self._sequence_output_variable_factories[phase.value.name] = (
+                ovf.DirectSequenceOutputVariableFactory.get_float(phase.value)
+            )
+        self._sequence_output_variable_factories[
+            RuntimeVariable.ExecutionsPerSecondTimeline.name
+        ] = ovf.DirectSequenceOutputVariableFactory.get_float(
+            RuntimeVariable.ExecutionsPerSecondTimeline, bounded=False
+        )
 
     def set_sequence_output_variable_start_time(self, start_time: int) -> None:
         """Set start time for sequence data.
@@ -0,0 +1,137 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import importlib
+from logging import Logger
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.analyses.corpus as cp
+import pynguin.configuration as config
+import pynguin.ga.generationalgorithmfactory as gaf
+from pynguin.analyses.module import generate_test_cluster
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.instrumentation.tracer import SubjectProperties
+from pynguin.testcase.execution import TestCaseExecutor
+from tests.fixtures.examples import queue, triangle
+
+
+def test_code_object_hash_is_stable():
+    code_object = triangle.triangle.__code__
+    assert cp.get_code_object_hash(code_object) == cp.get_code_object_hash(code_object)
+
+
+def test_code_object_hash_differs():
+    assert cp.get_code_object_hash(triangle.triangle.__code__) != cp.get_code_object_hash(
+        queue.Queue.enqueue.__code__
+    )
+
+
+def test_code_object_hash_without_source():
+    assert cp.get_code_object_hash(compile("x = 1", "<string>", "exec")) is None
+
+
+def test_save_load(tmp_path):
+    corpus = cp.TestCorpus(
+        tests=["def test_case_0():\n    pass\n"], code_objects={"a": [0], "b": []}
+    )
+    path = cp.TestCorpus.get_path(tmp_path, "foo.bar")
+    corpus.save(path)
+    assert path.name == "foo.bar.json.gz"
+    assert cp.TestCorpus.load(path) == corpus
+
+
+def test_load_missing(tmp_path):
+    assert cp.TestCorpus.load(tmp_path / "missing.json.gz") is None
+
+
+def test_load_corrupt(tmp_path):
+    path = tmp_path / "corrupt.json.gz"
+    path.write_text("not gzip")
+    assert cp.TestCorpus.load(path) is None
+
+
+def test_knows():
+    corpus = cp.TestCorpus(code_objects={"a": []})
+    assert corpus.knows("a")
+    assert not corpus.knows("b")
+
+
+@pytest.fixture
+def triangle_setup(subject_properties: SubjectProperties):
+    module_name = "tests.fixtures.examples.triangle"
+    config.configuration.algorithm = config.Algorithm.DYNAMOSA
+    config.configuration.stopping.maximum_iterations = 10
+    config.configuration.module_name = module_name
+    with install_import_hook(module_name, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module = importlib.import_module(module_name)
+            importlib.reload(module)
+        yield TestCaseExecutor(subject_properties), generate_test_cluster(module_name)
+
+
+def _get_search_algorithm(executor, cluster):
+    search_algorithm = gaf.TestSuiteGenerationAlgorithmFactory(
+        executor, cluster
+    ).get_search_algorithm()
+    search_algorithm._logger = MagicMock(Logger)
+    return search_algorithm
+
+
+def test_create_corpus(triangle_setup):
+    executor, cluster = triangle_setup
+    result = _get_search_algorithm(executor, cluster).generate_tests()
+    corpus = cp.TestCorpus.create(
+        (chromosome.test_case for chromosome in result.test_case_chromosomes), executor
+    )
+    assert len(corpus.tests) == result.size()
+    assert set(corpus.code_objects) == set(
+        cp.get_code_object_hashes(executor.subject_properties).values()
+    )
+    assert corpus.get_test_cases(corpus.code_objects, cluster)
+
+
+def test_replay_unchanged_corpus(triangle_setup, tmp_path):
+    executor, cluster = triangle_setup
+    result = _get_search_algorithm(executor, cluster).generate_tests()
+    cp.TestCorpus.create(
+        (chromosome.test_case for chromosome in result.test_case_chromosomes), executor
+    ).save(cp.TestCorpus.get_path(tmp_path, config.configuration.module_name))
+
+    config.configuration.seeding.corpus_directory = str(tmp_path)
+    replayed = _get_search_algorithm(executor, cluster)
+    assert len(replayed._resumed_test_cases) == result.size()
+    # The replayed tests are resumed with their results, so they are executed once.
+    assert all(execution is not None for _, execution in replayed._resumed_test_cases)
+    with mock.patch.object(executor, "execute") as execute:
+        resumed = replayed._take_resumed_chromosomes()
+        assert all(chromosome.get_fitness() >= 0 for chromosome in resumed)
+    execute.assert_not_called()
+    replayed.resume_evaluated(resumed)
+    # Only the goals the replayed tests cover are left.
+    assert len(replayed.test_case_fitness_functions) == sum(
+        1
+        for goal in replayed.test_case_fitness_functions
+        if any(solution.get_is_covered(goal) for solution in result.test_case_chromosomes)
+    )
+    replayed_result = replayed.generate_tests()
+    assert replayed_result.get_coverage() == pytest.approx(1.0)
+
+
+def test_replay_changed_code_object(triangle_setup, tmp_path):
+    executor, cluster = triangle_setup
+    config.configuration.seeding.corpus_directory = str(tmp_path)
+    all_goals = _get_search_algorithm(executor, cluster).test_case_fitness_functions
+    # A corpus of a previous version of the module, in which every code object
+    # differed, keeps all goals.
+    cp.TestCorpus(code_objects={"outdated": []}).save(
+        cp.TestCorpus.get_path(tmp_path, config.configuration.module_name)
+    )
+    replayed = _get_search_algorithm(executor, cluster)
+    assert not replayed._resumed_test_cases
+    assert len(replayed.test_case_fitness_functions) == len(all_goals)
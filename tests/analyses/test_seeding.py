@@ -8,7 +8,7 @@ import pytest
 
 import pynguin.configuration as config
 from pynguin.analyses.module import generate_test_cluster
-from pynguin.analyses.seeding import parse_seed_module
+from pynguin.analyses.seeding import parse_seed_module, render_seed_module
 from pynguin.utils.generic.genericaccessibleobject import (
     GenericConstructor,
     GenericFunction,
@@ -80,6 +80,22 @@ def test_parameter_mapping_roundtrip(parameters_test_cluster, testcase_seed, exp
     assert testcases[0].to_code() == expected_code
 
 
+def test_render_seed_module_roundtrip(parameters_test_cluster):
+    source = (
+        "import tests.fixtures.grammar.parameters as module_0\n\n\n"
+        "def test_case_0():\n"
+        "    float_0 = 1.1\n"
+        "    var_0 = module_0.positional_only(float_0)\n\n\n"
+        "def test_case_1():\n"
+        "    int_0 = 42\n"
+        "    var_0 = module_0.positional_only(int_0)\n"
+    )
+    testcases = parse_seed_module(source, parameters_test_cluster, create_assertions=False)
+    rendered = render_seed_module(testcases)
+    reparsed = parse_seed_module(rendered, parameters_test_cluster, create_assertions=False)
+    assert reparsed == testcases
+
+
 def test_parameter_mapping_call_is_resolved(parameters_test_cluster):
     source = (
         "import tests.fixtures.grammar.parameters as module_0\n\n\n"
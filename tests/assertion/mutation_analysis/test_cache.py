@@ -0,0 +1,150 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+from unittest import mock
+
+import pytest
+
+import pynguin.assertion.assertion as ass
+import pynguin.assertion.mutation_analysis.mutators as mu
+import pynguin.assertion.mutation_analysis.operators as mo
+from pynguin.assertion.mutation_analysis.cache import (
+    CachedTestException,
+    MutationAnalysisCache,
+    get_mutants_key,
+    get_test_key,
+)
+from pynguin.assertion.mutation_analysis.controller import MutationController
+from pynguin.assertion.mutation_analysis.equivalence import EquivalentMutantFilter
+from pynguin.assertion.mutation_analysis.transformer import ParentNodeTransformer, create_module
+from pynguin.testcase.execution_result import ExecutionResult
+from tests.testcase._builders import int_stmt, make_test_case
+
+
+@pytest.fixture
+def mutants():
+    module_ast = ParentNodeTransformer.create_ast("def f(x):\n    return x + 1 - x * 2\n")
+    module = create_module(module_ast, "cache_mutant")
+    mutator = mu.FirstOrderMutator([mo.ArithmeticOperatorReplacement])
+    return [
+        (number, mutations)
+        for number, (mutations, _) in enumerate(mutator.mutate(module_ast, module), start=1)
+    ]
+
+
+@pytest.fixture
+def test_cases():
+    return [make_test_case(int_stmt("int_0", value)) for value in (1, 2)]
+
+
+def _killing_result() -> ExecutionResult:
+    result = ExecutionResult()
+    result.report_new_thrown_exception(0, ValueError())
+    result.assertion_verification_trace.failed[0].add(1)
+    return result
+
+
+def test_mutants_key_depends_on_source_operators_and_settings():
+    key = get_mutants_key("x = 1", [mo.ArithmeticOperatorReplacement], "FIRST_ORDER_MUTANTS")
+    assert key == get_mutants_key(
+        "x = 1", [mo.ArithmeticOperatorReplacement], "FIRST_ORDER_MUTANTS"
+    )
+    assert key != get_mutants_key(
+        "x = 2", [mo.ArithmeticOperatorReplacement], "FIRST_ORDER_MUTANTS"
+    )
+    assert key != get_mutants_key("x = 1", [mo.ArithmeticOperatorDeletion], "FIRST_ORDER_MUTANTS")
+    assert key != get_mutants_key("x = 1", [mo.ArithmeticOperatorReplacement], "EACH_CHOICE")
+
+
+def test_test_key_depends_on_assertions(test_cases):
+    key = get_test_key(test_cases[0])
+    assert key != get_test_key(test_cases[1])
+    test_cases[0].statements()[0].assertions.append(ass.ObjectAssertion("int_0", 1))
+    assert key != get_test_key(test_cases[0])
+
+
+def test_kill_matrix_round_trip(tmp_path, mutants, test_cases):
+    cache = MutationAnalysisCache(tmp_path, "mutants")
+    kill_matrix = cache.load_kill_matrix(test_cases)
+    number, mutations = mutants[0]
+    assert kill_matrix.cached_results(number, mutations) == [None, None]
+    kill_matrix.record(number, mutations, [_killing_result(), None])
+    kill_matrix.record(mutants[1][0], mutants[1][1], [ExecutionResult(timeout=True), None])
+    kill_matrix.save()
+
+    kill_matrix = cache.load_kill_matrix(test_cases)
+    killing, not_executed = kill_matrix.cached_results(number, mutations)
+    assert not_executed is None
+    assert killing is not None
+    assert not killing.timeout
+    assert isinstance(killing.exceptions[0], CachedTestException)
+    assert killing.assertion_verification_trace.was_violated(0, 1)
+    assert not killing.assertion_verification_trace.was_violated(0, 0)
+    # Timeouts are not cached, such that the tests are executed again.
+    assert kill_matrix.cached_results(*mutants[1]) == [None, None]
+    assert kill_matrix.cached_results(*mutants[2]) == [None, None]
+
+
+def test_kill_matrix_of_other_tests_is_separate(tmp_path, mutants, test_cases):
+    cache = MutationAnalysisCache(tmp_path, "mutants")
+    kill_matrix = cache.load_kill_matrix(test_cases[:1])
+    kill_matrix.record(*mutants[0], [_killing_result()])
+    kill_matrix.save()
+
+    results = cache.load_kill_matrix(test_cases[::-1]).cached_results(*mutants[0])
+    assert results[0] is None
+    assert results[1] is not None
+    assert MutationAnalysisCache(tmp_path, "other").load_kill_matrix(test_cases[:1]).cached_results(
+        *mutants[0]
+    ) == [None]
+
+
+def test_unreadable_cache_is_ignored(tmp_path, mutants, test_cases):
+    kills = tmp_path / "mutants" / "kills"
+    kills.mkdir(parents=True)
+    (kills / f"{get_test_key(test_cases[0])}.json").write_text("{", encoding="utf-8")
+    kill_matrix = MutationAnalysisCache(tmp_path, "mutants").load_kill_matrix(test_cases[:1])
+    assert kill_matrix.cached_results(*mutants[0]) == [None]
+    kill_matrix.record(*mutants[0], [_killing_result()])
+    kill_matrix.save()
+    # No temporary file is left over.
+    assert [path.name for path in (tmp_path / "mutants").rglob("*") if path.is_file()] == [
+        f"{get_test_key(test_cases[0])}.json"
+    ]
+    kill_matrix = MutationAnalysisCache(tmp_path, "mutants").load_kill_matrix(test_cases[:1])
+    assert kill_matrix.cached_results(*mutants[0])[0] is not None
+    (tmp_path / "mutants" / "mutants.json").write_text("[]", encoding="utf-8")
+    assert MutationAnalysisCache(tmp_path, "mutants").load_dropped_mutants() is None
+
+
+def test_dropped_mutants_are_taken_from_the_cache(tmp_path):
+    source = "def f(x):\n    if False:\n        return x + 1\n    return x * 2\n"
+    cache = MutationAnalysisCache(tmp_path, "mutants")
+
+    def create_controller():
+        module_ast = ParentNodeTransformer.create_ast(source)
+        return MutationController(
+            mu.FirstOrderMutator([mo.ArithmeticOperatorReplacement]),
+            module_ast,
+            create_module(module_ast, "cache_mutant"),
+            filter_equivalent=True,
+            cache=cache,
+        )
+
+    controller = create_controller()
+    count = controller.mutant_count()
+    mutations = [mutations for _, mutations in controller.create_mutant_sources()]
+    assert len(mutations) == count
+    assert cache.load_dropped_mutants()
+
+    with mock.patch.object(EquivalentMutantFilter, "is_redundant") as is_redundant:
+        controller = create_controller()
+        assert controller.mutant_count() == count
+        cached_mutations = [mutations for _, mutations in controller.create_mutant_sources()]
+    is_redundant.assert_not_called()
+    assert [[m.visitor_name for m in mutant] for mutant in cached_mutations] == [
+        [m.visitor_name for m in mutant] for mutant in mutations
+    ]
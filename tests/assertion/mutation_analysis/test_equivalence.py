@@ -0,0 +1,75 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import ast
+
+import pytest
+
+import pynguin.assertion.mutation_analysis.mutators as mu
+import pynguin.assertion.mutation_analysis.operators as mo
+from pynguin.assertion.mutation_analysis.controller import MutationController
+from pynguin.assertion.mutation_analysis.equivalence import (
+    EquivalentMutantFilter,
+    code_fingerprint,
+)
+from pynguin.assertion.mutation_analysis.transformer import ParentNodeTransformer, create_module
+
+
+def _fingerprint(source: str):
+    return code_fingerprint(compile(source, "equivalence", "exec"))
+
+
+def test_fingerprint_ignores_positions():
+    assert _fingerprint("def f(x):\n    return x + 1") == _fingerprint(
+        "\n\ndef f(x):\n\n    return (x +\n            1)"
+    )
+
+
+@pytest.mark.parametrize(
+    "source, other",
+    [
+        ("x = 1", "x = True"),
+        ("x = 0.0", "x = -0.0"),
+        ("x = (1, 2)", "x = (1, 2.0)"),
+        ("def f(x):\n    return x + 1", "def f(x):\n    return x - 1"),
+        ("def f(x):\n    return x", "def g(x):\n    return x"),
+    ],
+)
+def test_fingerprint_distinguishes_code(source, other):
+    assert _fingerprint(source) != _fingerprint(other)
+
+
+@pytest.mark.parametrize(
+    "source, operators, mutants",
+    [
+        # The compiler removes the dead branch and with it the first mutation.
+        (
+            "def f(x):\n    if False:\n        return x + 1\n    return x * 2\n",
+            [mo.ArithmeticOperatorReplacement],
+            ["return x / 2", "return x // 2", "return x ** 2"],
+        ),
+        # Deleting either negation results in the same mutant.
+        ("def f(x):\n    return -(-x)\n", [mo.ArithmeticOperatorDeletion], ["return -x"]),
+    ],
+)
+def test_controller_drops_equivalent_and_duplicate_mutants(source, operators, mutants):
+    module_ast = ParentNodeTransformer.create_ast(source)
+    module = create_module(module_ast, "equivalence_mutant")
+    controller = MutationController(
+        mu.FirstOrderMutator(operators), module_ast, module, filter_equivalent=True
+    )
+    assert [
+        ast.unparse(mutant_ast).splitlines()[-1].strip()
+        for mutant_ast, _ in controller.create_mutant_sources()
+    ] == mutants
+    assert controller.mutant_count() == len(mutants)
+
+
+def test_filter_keeps_invalid_mutants():
+    module_ast = ast.parse("x = 1")
+    equivalence_filter = EquivalentMutantFilter(module_ast, "equivalence_mutant")
+    assert not equivalence_filter.is_redundant(ast.parse("break"))
+    assert equivalence_filter.is_redundant(ast.parse("x = 1"))
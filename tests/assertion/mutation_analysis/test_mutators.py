@@ -18,6 +18,7 @@ from pynguin.assertion.mutation_analysis.operators import (
     experimental_operators,
     standard_operators,
 )
+from pynguin.assertion.mutation_analysis.operators.base import MutationLocation
 from pynguin.assertion.mutation_analysis.operators.loop import (
     OneIterationLoop,
     ReverseIterationLoop,
@@ -285,3 +286,37 @@ def test_high_order_mutator_generation_with_multiple_visitors():
             },
         },
     )
+
+
+_LOCATION_SOURCE = inspect.cleandoc(
+    """
+    LIMIT = 1 + 2
+
+
+    def f(x, y=3 + 4):
+        if x > LIMIT:
+            return (x +
+                    y)
+        return lambda z: z - 1
+    """
+)
+
+
+def test_mutation_location():
+    module_ast = ParentNodeTransformer.create_ast(_LOCATION_SOURCE)
+    module = create_module(module_ast, "location_mutant")
+    mutator = FirstOrderMutator([ArithmeticOperatorReplacement])
+    locations = [mutations[0].location for mutations, _ in mutator.mutate(module_ast, module)]
+    assert locations == [
+        # Evaluated when the module is created.
+        None,
+        None,
+        MutationLocation(6, 7),
+        MutationLocation(8, 8),
+    ]
+
+
+def test_mutation_location_is_reached():
+    location = MutationLocation(6, 7)
+    assert location.is_reached({1, 7})
+    assert not location.is_reached({5, 8})
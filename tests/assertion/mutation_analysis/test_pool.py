@@ -0,0 +1,130 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import ast
+import os
+import time
+
+import pytest
+
+from pynguin.assertion.mutation_analysis.pool import MutantExecutionPool
+from pynguin.testcase.execution_result import ExecutionResult
+
+# The value of a mutant on which a worker hangs.
+_HANGING = 100
+
+# The values of the mutants a worker executed before.
+_executed: list[int] = []
+
+
+def _execute_mutant(index: int, mutant_ast: ast.Module) -> list[ExecutionResult | None] | None:
+    value = ast.literal_eval(mutant_ast.body[0].value)
+    if value < 0:
+        return None
+    if value == 0:
+        os._exit(1)
+    if value == _HANGING:
+        time.sleep(60)
+    result = ExecutionResult()
+    result.assertion_verification_trace.failed[index].add(value)
+    result.execution_trace.executed_code_objects.add(value)
+    if _executed:
+        # The earlier mutants are reported as errors.
+        result.assertion_verification_trace.error[index].update(_executed)
+    _executed.append(value)
+    return [result, None]
+
+
+def _mutants(*values: int):
+    for value in values:
+        yield ast.parse(f"x = {value}")
+
+
+def _execute(
+    subject_properties, values, stop=lambda: False, *, fork_per_mutant=False, mutant_timeout=None
+):
+    pool = MutantExecutionPool(
+        subject_properties,
+        _execute_mutant,
+        2,
+        2,
+        fork_per_mutant=fork_per_mutant,
+        mutant_timeout=mutant_timeout,
+    )
+    assert pool.start()
+    try:
+        return list(pool.execute(_mutants(*values), stop))
+    finally:
+        pool.close()
+
+
+@pytest.mark.parametrize("fork_per_mutant", [False, True])
+def test_results_are_in_mutant_order(subject_properties, fork_per_mutant):
+    results = _execute(subject_properties, [3, -1, 5, 7], fork_per_mutant=fork_per_mutant)
+    assert results[1] is None
+    for index, value in ((1, 3), (3, 5), (4, 7)):
+        result, padding = results[index - 1]
+        assert padding is None
+        assert result.assertion_verification_trace.was_violated(index, value)
+        # Only what decides the kill is reported back.
+        assert not result.execution_trace.executed_code_objects
+
+
+def test_forked_workers_do_not_share_state(subject_properties):
+    results = _execute(subject_properties, [1, 2, 3, 4, 5], fork_per_mutant=True)
+    assert not any(result.assertion_verification_trace.error for result, _ in results)
+    assert not _executed
+
+
+def test_workers_share_state(subject_properties):
+    results = _execute(subject_properties, [1, 2, 3, 4, 5])
+    assert any(result.assertion_verification_trace.error for result, _ in results)
+
+
+@pytest.mark.parametrize("fork_per_mutant", [False, True])
+def test_crashed_worker_is_replaced(subject_properties, fork_per_mutant):
+    results = _execute(subject_properties, [0, 2, 0, 4], fork_per_mutant=fork_per_mutant)
+    assert [result[0].timeout for result in results] == [True, False, True, False]
+    assert results[0][1] is None
+
+
+def test_died_idle_worker_is_replaced(subject_properties):
+    pool = MutantExecutionPool(subject_properties, _execute_mutant, 2, 2)
+    assert pool.start()
+    try:
+        for worker in pool._workers.values():
+            worker.kill()
+            worker.join()
+        results = list(pool.execute(_mutants(1, 2, 3), lambda: False))
+        assert len(results) == 3
+        assert all(worker.is_alive() for worker in pool._workers.values())
+    finally:
+        pool.close()
+    for index, (result, padding) in enumerate(results, start=1):
+        assert padding is None
+        assert result.assertion_verification_trace.was_violated(index, index)
+
+
+@pytest.mark.parametrize("fork_per_mutant", [False, True])
+def test_hanging_worker_is_killed_and_replaced(subject_properties, fork_per_mutant):
+    start = time.monotonic()
+    results = _execute(
+        subject_properties,
+        [_HANGING, 2, _HANGING, 4],
+        fork_per_mutant=fork_per_mutant,
+        mutant_timeout=lambda _: 1.0,
+    )
+    assert time.monotonic() - start < 30
+    assert [result[0].timeout for result in results] == [True, False, True, False]
+    assert results[1][0].assertion_verification_trace.was_violated(2, 2)
+
+
+@pytest.mark.parametrize("fork_per_mutant", [False, True])
+def test_stop_condition_prevents_handing_out_mutants(subject_properties, fork_per_mutant):
+    assert (
+        _execute(subject_properties, [1, 2, 3], stop=lambda: True, fork_per_mutant=fork_per_mutant)
+        == []
+    )
@@ -0,0 +1,142 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import ast
+import inspect
+import types
+
+import pynguin.assertion.mutation_analysis.mutators as mu
+import pynguin.assertion.mutation_analysis.operators as mo
+from pynguin.assertion.mutation_analysis.controller import MutationController
+from pynguin.assertion.mutation_analysis.schemata import SWITCH_NAME, MutantSchemata
+from pynguin.assertion.mutation_analysis.transformer import ParentNodeTransformer, create_module
+
+_SOURCE = inspect.cleandoc(
+    """
+    LIMIT = 1 + 2
+
+
+    def compute():
+        return LIMIT * 2
+
+
+    DOUBLE = compute()
+
+
+    def f(x, y=3):
+        total = 0
+        for i in range(x):
+            if i % 2 == 0 and i > 1:
+                total += i * y
+            elif i == 3:
+                continue
+            else:
+                total -= 1
+            if total > 10:
+                break
+        values = [x, y, 0]
+        values[0:1] = [y]
+        match x:
+            case 1:
+                return "one"
+            case _:
+                pass
+        try:
+            return total, values[-1:], f"{x!r:>3}", (lambda z: -z)(*values[:1])
+        except IndexError:
+            return None
+
+
+    class A:
+        def g(self, x):
+            return x is None or not x
+    """
+)
+
+
+def _outcome(call):
+    try:
+        return call()
+    except Exception as exception:  # noqa: BLE001
+        return type(exception)
+
+
+def _behavior(module: types.ModuleType) -> list:
+    return [
+        module.DOUBLE,
+        *(_outcome(lambda args=args: module.f(*args)) for args in ((0,), (1,), (5,), (10, 2))),
+        _outcome(lambda: module.A().g(None)),
+        _outcome(lambda: module.A().g(3)),
+    ]
+
+
+def _controller(*, schemata: bool) -> MutationController:
+    module_ast = ParentNodeTransformer.create_ast(_SOURCE)
+    module = create_module(module_ast, "schemata_mutant")
+    mutator = mu.FirstOrderMutator([*mo.standard_operators, *mo.experimental_operators])
+    return MutationController(mutator, module_ast, module, schemata=schemata)
+
+
+def test_schemata_mutants_behave_like_separate_mutants():
+    expected = [
+        None if module is None else _behavior(module)
+        for module, _ in _controller(schemata=False).create_mutants()
+    ]
+    controller = _controller(schemata=True)
+    sources = list(controller.create_mutant_sources())
+    assert len(sources) == len(expected)
+    switched = [source for source, _ in sources if isinstance(source, int)]
+    assert len(switched) > len(sources) // 2
+
+    actual = []
+    for source, _ in sources:
+        module = controller.try_create_mutant(source)
+        actual.append(None if module is None else _behavior(module))
+    assert actual == expected
+
+
+def test_mutants_evaluated_at_import_are_not_switched():
+    controller = _controller(schemata=True)
+    for source, mutations in controller.create_mutant_sources():
+        line = mutations[0].node.lineno
+        if line <= 8:
+            # The module statements and the function called by them.
+            assert isinstance(source, ast.Module)
+        if isinstance(source, int):
+            assert line > 8
+
+
+def test_activate_sets_switch():
+    module_ast = ParentNodeTransformer.create_ast("def f(x):\n    return x + 1\n")
+    module = create_module(module_ast, "switch_mutant")
+    schemata = MutantSchemata(module_ast, "switch_mutant")
+    numbers = [
+        schemata.add(mutations)
+        for mutations, _ in mu.FirstOrderMutator([mo.ArithmeticOperatorReplacement]).mutate(
+            module_ast, module
+        )
+    ]
+    assert numbers == [1]
+    meta_module = schemata.create_module()
+    assert meta_module is not None
+    assert getattr(meta_module, SWITCH_NAME) == 0
+    assert meta_module.f(1) == 2
+    assert schemata.activate(1) is meta_module
+    assert meta_module.f(1) == 0
+    assert ast.unparse(schemata.create_mutant_ast(1)) == "def f(x):\n    return x - 1"
+
+
+def test_invalid_schemata_switches_no_mutant():
+    module_ast = ParentNodeTransformer.create_ast("def f(x):\n    return x + 1\n\nraise ValueError")
+    module = types.ModuleType("invalid_mutant")
+    schemata = MutantSchemata(module_ast, "invalid_mutant")
+    for mutations, _ in mu.FirstOrderMutator([mo.ArithmeticOperatorReplacement]).mutate(
+        module_ast, module
+    ):
+        schemata.add(mutations)
+    assert schemata.create_module() is None
+    assert not schemata.is_switched(1)
+    assert schemata.switched_count() == 0
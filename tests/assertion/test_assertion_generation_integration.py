@@ -22,6 +22,7 @@ import ast
 import builtins
 import importlib
 import inspect
+import logging
 import threading
 from unittest import mock
 
@@ -36,6 +37,7 @@ import pynguin.configuration as config
 import pynguin.ga.testcasechromosome as tcc
 import pynguin.ga.testsuitechromosome as tsc
 import pynguin.testcase.testcase as tc
+from pynguin.assertion.mutation_analysis.cache import MutationAnalysisCache
 from pynguin.assertion.mutation_analysis.controller import MutationController
 from pynguin.assertion.mutation_analysis.transformer import ParentNodeTransformer
 from pynguin.instrumentation.machinery import install_import_hook
@@ -499,6 +501,265 @@ def test_mutation_analysis_integration_full(  # noqa: PLR0917
         _assert_no_execution_threads_leaked()
 
 
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+@pytest.mark.parametrize(
+    "module,tc_factory,mutants,killed,timeout",
+    [
+        ("tests.fixtures.mutation.mutation", _tc_mutation_killing, _MUTANTS, {0, 1, 3, 4}, set()),
+        (
+            "tests.fixtures.mutation.timeout",
+            _tc_timeout,
+            _TIMEOUT_MUTANTS,
+            {3},
+            {0, 4},
+        ),
+    ],
+)
+def test_mutation_analysis_in_worker_processes(  # noqa: PLR0917
+    module,
+    tc_factory,
+    mutants,
+    killed,
+    timeout,
+    subject_properties: SubjectProperties,
+):
+    config.configuration.module_name = module
+    config.configuration.test_case_output.mutation_workers = 2
+    alias = get_module_alias(module)
+    with install_import_hook(module, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module_type = importlib.import_module(module)
+            importlib.reload(module_type)
+
+        test_case = tc_factory(alias)
+        expected_test_case = test_case.clone()
+        module_ast = _module_ast(module_type)
+        gen = ag.MutationAnalysisAssertionGenerator(
+            TestCaseExecutor(subject_properties),
+            _mutation_controller(_standard_mutant_generator(), module_type, module_ast),
+            testing=True,
+        )
+        _suite(test_case).accept(gen)
+
+        config.configuration.test_case_output.mutation_workers = 1
+        sequential_gen = ag.MutationAnalysisAssertionGenerator(
+            TestCaseExecutor(subject_properties),
+            _mutation_controller(_standard_mutant_generator(), module_type, module_ast),
+        )
+        _suite(expected_test_case).accept(sequential_gen)
+
+    summary = gen._testing_mutation_summary
+    assert len(summary.mutant_information) == len(mutants)
+    assert {k.mut_num for k in summary.get_killed()} == killed
+    assert {k.mut_num for k in summary.get_timeout()} == timeout
+    assert _render(test_case) == _render(expected_test_case)
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+@pytest.mark.parametrize(
+    "coverage_metrics,not_reached",
+    [
+        # The covered lines exclude the branch that mutant 2 changes.
+        ([config.CoverageMetric.BRANCH, config.CoverageMetric.LINE], {2}),
+        # The executed function contains all lines that the mutants change.
+        ([config.CoverageMetric.BRANCH], set()),
+    ],
+)
+def test_mutation_analysis_executes_only_reaching_tests(
+    coverage_metrics, not_reached, subject_properties: SubjectProperties
+):
+    module = "tests.fixtures.mutation.mutation"
+    config.configuration.module_name = module
+    config.configuration.statistics_output.coverage_metrics = coverage_metrics
+    alias = get_module_alias(module)
+    with install_import_hook(module, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module_type = importlib.import_module(module)
+            importlib.reload(module_type)
+
+        test_case = _tc_mutation_killing(alias)
+        gen = ag.MutationAnalysisAssertionGenerator(
+            TestCaseExecutor(subject_properties),
+            _mutation_controller(
+                _standard_mutant_generator(), module_type, _module_ast(module_type)
+            ),
+            testing=True,
+        )
+        with mock.patch.object(
+            gen._mutation_executor,
+            "execute_multiple",
+            wraps=gen._mutation_executor.execute_multiple,
+        ) as execute_multiple:
+            _suite(test_case).accept(gen)
+
+    summary = gen._testing_mutation_summary
+    assert {k.mut_num for k in summary.get_killed()} == {0, 1, 3, 4}
+    assert {k.mut_num for k in summary.mutant_information if k.not_reached_by} == not_reached
+    assert execute_multiple.call_count == len(_MUTANTS) - len(not_reached)
+    assert _render(test_case) == (
+        "def test_0():\n"
+        "    int_3 = 1\n"
+        "    float_0 = mutation_.foo(int_3)\n"
+        "    assert float_0 == pytest.approx(2.0, abs=0.01, rel=0.01)\n"
+    )
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+@pytest.mark.parametrize("mutation_workers", [1, 2])
+@pytest.mark.parametrize(
+    "module,tc_factory,killed,timeout",
+    [
+        ("tests.fixtures.mutation.mutation", _tc_mutation_killing, {0, 1, 3, 4}, set()),
+        ("tests.fixtures.mutation.exception", _tc_exception, {0, 3, 4}, set()),
+        ("tests.fixtures.mutation.timeout", _tc_timeout, {3}, {0, 4}),
+    ],
+)
+def test_mutation_analysis_in_mutant_schemata(  # noqa: PLR0917
+    module,
+    tc_factory,
+    killed,
+    timeout,
+    mutation_workers,
+    subject_properties: SubjectProperties,
+):
+    config.configuration.module_name = module
+    config.configuration.test_case_output.mutation_workers = mutation_workers
+    alias = get_module_alias(module)
+    with install_import_hook(module, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module_type = importlib.import_module(module)
+            importlib.reload(module_type)
+
+        test_case = tc_factory(alias)
+        expected_test_case = test_case.clone()
+        module_ast = _module_ast(module_type)
+        controller = MutationController(
+            _standard_mutant_generator(), module_ast, module_type, schemata=True
+        )
+        gen = ag.MutationAnalysisAssertionGenerator(
+            TestCaseExecutor(subject_properties), controller, testing=True
+        )
+        _suite(test_case).accept(gen)
+
+        sequential_gen = ag.MutationAnalysisAssertionGenerator(
+            TestCaseExecutor(subject_properties),
+            _mutation_controller(_standard_mutant_generator(), module_type, module_ast),
+        )
+        _suite(expected_test_case).accept(sequential_gen)
+
+    summary = gen._testing_mutation_summary
+    assert {k.mut_num for k in summary.get_killed()} == killed
+    assert {k.mut_num for k in summary.get_timeout()} == timeout
+    assert _render(test_case) == _render(expected_test_case)
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+@pytest.mark.parametrize("mutation_fork_server", [True, False])
+@pytest.mark.parametrize(
+    "module,tc_factory,killed,timeout",
+    [
+        ("tests.fixtures.mutation.mutation", _tc_mutation_killing, {0, 1, 3, 4}, set()),
+        ("tests.fixtures.mutation.exception", _tc_exception, {0, 3, 4}, set()),
+        ("tests.fixtures.mutation.timeout", _tc_timeout, {3}, {0, 4}),
+    ],
+)
+def test_mutation_analysis_in_subprocesses(  # noqa: PLR0917
+    module,
+    tc_factory,
+    killed,
+    timeout,
+    mutation_fork_server,
+    subject_properties: SubjectProperties,
+):
+    config.configuration.module_name = module
+    config.configuration.subprocess = True
+    config.configuration.test_case_output.mutation_fork_server = mutation_fork_server
+    alias = get_module_alias(module)
+    with install_import_hook(module, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module_type = importlib.import_module(module)
+            importlib.reload(module_type)
+
+        test_case = tc_factory(alias)
+        gen = ag.MutationAnalysisAssertionGenerator(
+            TestCaseExecutor(subject_properties),
+            _mutation_controller(
+                _standard_mutant_generator(), module_type, _module_ast(module_type)
+            ),
+            testing=True,
+        )
+        with mock.patch.object(
+            gen._mutation_executor,
+            "execute_multiple",
+            wraps=gen._mutation_executor.execute_multiple,
+        ) as execute_multiple:
+            _suite(test_case).accept(gen)
+
+    summary = gen._testing_mutation_summary
+    assert {k.mut_num for k in summary.get_killed()} == killed
+    assert {k.mut_num for k in summary.get_timeout()} == timeout
+    # The forked processes execute the tests in-process instead of in subprocesses.
+    assert (execute_multiple.call_count == 0) == mutation_fork_server
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+@pytest.mark.parametrize("mutation_workers", [1, 2])
+@pytest.mark.parametrize(
+    "module,tc_factory,killed,timeout",
+    [
+        ("tests.fixtures.mutation.mutation", _tc_mutation_killing, {0, 1, 3, 4}, set()),
+        ("tests.fixtures.mutation.exception", _tc_exception, {0, 3, 4}, set()),
+        ("tests.fixtures.mutation.timeout", _tc_timeout, {3}, {0, 4}),
+    ],
+)
+def test_mutation_analysis_from_cache(  # noqa: PLR0917
+    module,
+    tc_factory,
+    killed,
+    timeout,
+    mutation_workers,
+    subject_properties: SubjectProperties,
+    tmp_path,
+):
+    config.configuration.module_name = module
+    config.configuration.test_case_output.mutation_workers = mutation_workers
+    alias = get_module_alias(module)
+    with install_import_hook(module, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module_type = importlib.import_module(module)
+            importlib.reload(module_type)
+
+        module_ast = _module_ast(module_type)
+        cache = MutationAnalysisCache(tmp_path, "mutants")
+        rendered = []
+        for _ in range(2):
+            test_case = tc_factory(alias)
+            gen = ag.MutationAnalysisAssertionGenerator(
+                TestCaseExecutor(subject_properties),
+                MutationController(
+                    _standard_mutant_generator(), module_ast, module_type, cache=cache
+                ),
+                testing=True,
+            )
+            with mock.patch.object(
+                gen._mutation_executor,
+                "execute_multiple",
+                wraps=gen._mutation_executor.execute_multiple,
+            ) as execute_multiple:
+                _suite(test_case).accept(gen)
+            rendered.append(_render(test_case))
+
+            summary = gen._testing_mutation_summary
+            assert {k.mut_num for k in summary.get_killed()} == killed
+            assert {k.mut_num for k in summary.get_timeout()} == timeout
+
+    # The tests are executed on the mutants in the workers, if there are any.  Only
+    # the timed out mutants are not cached, so only they are executed again.
+    if mutation_workers == 1:
+        assert execute_multiple.call_count == len(timeout)
+    assert rendered[0] == rendered[1]
+
+
 @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
 def test_mutation_analysis_truncated_by_mutant_cap(
     subject_properties: SubjectProperties,
@@ -544,6 +805,35 @@ def test_mutation_analysis_truncated_by_mutant_cap(
         _assert_no_execution_threads_leaked()
 
 
+def test_mutation_analysis_with_dropped_mutants_is_not_truncated(
+    subject_properties: SubjectProperties, caplog
+):
+    module = "tests.fixtures.mutation.equivalent"
+    config.configuration.module_name = module
+    alias = get_module_alias(module)
+    with install_import_hook(module, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module_type = importlib.import_module(module)
+            importlib.reload(module_type)
+
+        mutant_generator = _standard_mutant_generator()
+        module_ast = _module_ast(module_type)
+        controller = MutationController(
+            mutant_generator, module_ast, module_type, filter_equivalent=True
+        )
+        gen = ag.MutationAnalysisAssertionGenerator(
+            TestCaseExecutor(subject_properties), controller, testing=True
+        )
+        with caplog.at_level(logging.INFO):
+            _suite(_tc_mutation_killing(alias)).accept(gen)
+
+    num_checked = len(gen._testing_mutation_summary.mutant_information)
+    # The mutants of the dead branch are dropped and not counted as created.
+    assert num_checked < mutant_generator.mutation_count(module_ast, module_type)
+    assert num_checked == controller.mutant_count()
+    assert "Mutation analysis truncated" not in caplog.text
+
+
 @pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
 def test_mutation_analysis_truncated_by_time_budget(subject_properties: SubjectProperties):
     module = "tests.fixtures.mutation.mutation"
@@ -154,6 +154,16 @@ def test_abort_after_first_timeout_without_timeout_passes_through():
     assert out == results
 
 
+@pytest.mark.parametrize("reached,timeout", [(None, 3.5), ([False, True], 2.5), ([False] * 2, 0.0)])
+def test_mutant_timeout_covers_the_reaching_tests(reached, timeout):
+    executor = MagicMock(ex.TestCaseExecutor)
+    executor._maximum_test_execution_timeout = 5
+    executor._calculate_timeout.side_effect = lambda test_case: test_case
+    assert ag.MutationAnalysisAssertionGenerator._mutant_timeout(
+        [1.0, 2.5], executor, (MagicMock(), reached)
+    ) == pytest.approx(timeout + 5 + ag._MUTANT_TIMEOUT_SLACK)
+
+
 def test_score_excludes_unchecked_mutants():
     # Only the two checked mutants (one killed, one survived) form the denominator;
     # a third, unchecked mutant never enters the summary and cannot fake-survive.
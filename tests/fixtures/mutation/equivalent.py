@@ -0,0 +1,13 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+
+
+def foo(param) -> float:
+    """The compiler removes the dead branch, so mutating it is equivalent."""
+    if False:
+        return param + 1.0
+    return param * 2.0
@@ -10,13 +10,17 @@ from unittest.mock import MagicMock
 import pytest
 
 import pynguin.ga.computations as ff
+import pynguin.ga.coveragegoals as bg
 import pynguin.ga.testcasechromosome as tcc
 from pynguin.ga.algorithms.archive import (
     CoverageArchive,
+    GoalIndex,
     MIOArchive,
     MIOPopulation,
     MIOPopulationPair,
 )
+from pynguin.instrumentation.tracer import ExecutionTrace
+from pynguin.testcase.execution import ExecutionResult
 from pynguin.utils.orderedset import OrderedSet
 
 
@@ -75,6 +79,72 @@ def test_update_solution(objectives, chromosomes):
     assert chromosomes[1].get_is_covered.call_count == 4
 
 
+def _executed_result(code_objects=(), lines=()) -> ExecutionResult:
+    result = ExecutionResult()
+    result.execution_trace = ExecutionTrace(
+        executed_code_objects=OrderedSet(code_objects), covered_line_ids=OrderedSet(lines)
+    )
+    return result
+
+
+@pytest.fixture
+def indexed_goals() -> list[ff.TestCaseFitnessFunction]:
+    executor = MagicMock()
+    return [
+        bg.BranchCoverageTestFitness(executor, bg.BranchlessCodeObjectGoal(0)),
+        bg.BranchCoverageTestFitness(executor, bg.BranchlessCodeObjectGoal(1)),
+        bg.LineCoverageTestFitness(executor, bg.LineCoverageGoal(0, 5)),
+        MagicMock(ff.TestCaseFitnessFunction),
+    ]
+
+
+def test_goal_index_candidates(indexed_goals):
+    index = GoalIndex(indexed_goals)
+    assert index.has_indexed_goals
+    assert index.get_candidates(_executed_result(code_objects=(1,), lines=(5, 6))) == [
+        indexed_goals[3],
+        indexed_goals[1],
+        indexed_goals[2],
+    ]
+
+
+def test_goal_index_without_indexed_goals(objectives):
+    assert not GoalIndex(objectives).has_indexed_goals
+
+
+def test_update_only_checks_candidate_goals(indexed_goals):
+    archive = CoverageArchive(OrderedSet(indexed_goals))
+    chromosome = MagicMock(tcc.TestCaseChromosome)
+    chromosome.changed = False
+    chromosome.get_last_execution_result.return_value = _executed_result(code_objects=(0,))
+    chromosome.get_is_covered.return_value = True
+    assert archive.update([chromosome])
+    checked = [call.args[0] for call in chromosome.get_is_covered.call_args_list]
+    assert checked == [indexed_goals[0], indexed_goals[3]]
+    assert archive.uncovered_goals == OrderedSet([indexed_goals[1], indexed_goals[2]])
+
+
+def test_update_checks_all_goals_of_changed_solution(indexed_goals):
+    archive = CoverageArchive(OrderedSet(indexed_goals))
+    chromosome = MagicMock(tcc.TestCaseChromosome)
+    chromosome.changed = True
+    chromosome.get_is_covered.return_value = False
+    assert not archive.update([chromosome])
+    assert chromosome.get_is_covered.call_count == len(indexed_goals)
+
+
+def test_added_goals_are_indexed(indexed_goals):
+    archive = CoverageArchive(OrderedSet())
+    archive.add_goals(OrderedSet(indexed_goals[:2]))
+    chromosome = MagicMock(tcc.TestCaseChromosome)
+    chromosome.changed = False
+    chromosome.get_last_execution_result.return_value = _executed_result(code_objects=(1,))
+    chromosome.get_is_covered.return_value = True
+    archive.update([chromosome])
+    assert archive.is_covered(indexed_goals[1])
+    assert not archive.is_covered(indexed_goals[0])
+
+
 def test_coverage_archive_prefers_error_free_over_shorter():
     """Test that error-free test is preferred over shorter one with errors."""
     objective = MagicMock(ff.TestCaseFitnessFunction)
@@ -549,3 +619,30 @@ def test_mio_archive_num_covered_targets():
     clone.get_fitness_for.return_value = 0.0
     archive.update([solution])
     assert archive.num_covered_targets == 1
+
+
+def test_mio_archive_update_notifies_solution_added():
+    fitness = MagicMock()
+    archive = MIOArchive(OrderedSet([fitness]), 3)
+    callback = MagicMock()
+    archive.add_on_solution_added(callback)
+    solution = MagicMock()
+    clone = MagicMock()
+    solution.clone.return_value = clone
+    clone.get_fitness_for.return_value = 0.0
+    archive.update([solution])
+    callback.assert_called_once_with(fitness, 1.0, clone)
+
+
+def test_mio_archive_add_solution():
+    fitness = MagicMock()
+    archive = MIOArchive(OrderedSet([fitness]), 3)
+    solution_added = MagicMock()
+    target_covered = MagicMock()
+    archive.add_on_solution_added(solution_added)
+    archive.add_on_target_covered(target_covered)
+    solution = MagicMock()
+    assert archive.add_solution(fitness, 1.0, solution)
+    assert archive.solutions == OrderedSet([solution])
+    target_covered.assert_called_once_with(fitness)
+    solution_added.assert_not_called()
@@ -11,9 +11,11 @@ import pytest
 import pynguin.ga.algorithms.dynamosaalgorithm as dyna
 import pynguin.ga.coveragegoals as bg
 from pynguin.configuration import ToCoverConfiguration
+from pynguin.ga.algorithms.archive import CoverageArchive
 from pynguin.instrumentation.tracer import SubjectProperties
 from pynguin.instrumentation.transformer import InstrumentationTransformer
 from pynguin.instrumentation.version import BranchCoverageInstrumentation
+from pynguin.utils.orderedset import OrderedSet
 from tests.testutils import instrument_function
 
 
@@ -88,3 +90,27 @@ def test_fitness_graph_nested(dynamosa_subject_properties_nested):
         bg.BranchlessCodeObjectGoal(0),
         bg.BranchlessCodeObjectGoal(1),
     }
+
+
+def test_goals_manager_replaces_covered_goals_by_children(dynamosa_subject_properties):
+    pool = bg.BranchGoalPool(dynamosa_subject_properties)
+    ffs = bg.create_branch_coverage_fitness_functions(MagicMock(), pool)
+    archive = CoverageArchive(OrderedSet())
+    manager = dyna._GoalsManager(ffs, archive, dynamosa_subject_properties)
+    roots = list(manager.current_goals)
+    covered_root = next(root for root in roots if manager._graph.get_structural_children(root))
+    children = manager._graph.get_structural_children(covered_root)
+    # The children take the place of the covered goal.
+    expected = [goal for root in roots for goal in (children if root is covered_root else (root,))]
+
+    chromosome = MagicMock()
+    chromosome.changed = True
+    chromosome.size.return_value = 1
+    chromosome.get_is_covered.side_effect = lambda goal: goal is covered_root
+    manager.update([chromosome])
+    assert archive.is_covered(covered_root)
+    assert list(manager.current_goals) == expected
+
+    # Nothing new is covered, so the current goals remain the same.
+    manager.update([chromosome])
+    assert list(manager.current_goals) == expected
@@ -0,0 +1,122 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import importlib
+import queue
+from logging import Logger
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.configuration as config
+import pynguin.ga.generationalgorithmfactory as gaf
+from pynguin.analyses.module import generate_test_cluster
+from pynguin.ga.algorithms.islanddynamosaalgorithm import IslandDynaMOSAAlgorithm, Migration
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.instrumentation.tracer import SubjectProperties
+from pynguin.testcase.execution import TestCaseExecutor
+
+
+class _Inbox:
+    def __init__(self):
+        self.messages = []
+
+    def put(self, message):
+        self.messages.append(message)
+
+    def get_nowait(self):
+        if not self.messages:
+            raise queue.Empty
+        return self.messages.pop(0)
+
+
+@pytest.fixture
+def island_algorithm() -> IslandDynaMOSAAlgorithm:
+    algorithm = IslandDynaMOSAAlgorithm()
+    algorithm._inboxes = [_Inbox(), _Inbox(), _Inbox()]
+    algorithm._archive = MagicMock()
+    algorithm._goals_manager = MagicMock()
+    return algorithm
+
+
+def test_emigrate_broadcasts_archive_and_sends_elites_to_successor(island_algorithm):
+    config.configuration.search_algorithm.island_migration_size = 1
+    solution = MagicMock()
+    island_algorithm._archive.solutions = [solution]
+    island_algorithm._population = [MagicMock(), MagicMock()]
+    island_algorithm._encode = lambda solutions: ",".join(str(id(s)) for s in solutions)
+    island_algorithm._emigrate()
+    own, successor, other = island_algorithm._inboxes
+    assert own.messages == []
+    assert successor.messages == [
+        Migration(0, str(id(solution)), str(id(island_algorithm._population[0])))
+    ]
+    assert other.messages == [Migration(0, str(id(solution)), "")]
+
+    # Archive solutions are only sent once.
+    island_algorithm._emigrate()
+    assert not successor.messages[-1].archive
+    assert len(other.messages) == 1
+
+
+def test_immigrate_replaces_worst_individuals(island_algorithm):
+    population = [MagicMock(rank=0, distance=1.0), MagicMock(rank=3, distance=0.5)]
+    island_algorithm._population = list(population)
+    archive_test, elite = MagicMock(), MagicMock()
+    decoded = {"archive": [archive_test], "elites": [elite], "": []}
+    island_algorithm._decode = decoded.__getitem__
+    island_algorithm._inboxes[0].put(Migration(2, "archive", "elites"))
+    island_algorithm._immigrate()
+    island_algorithm._goals_manager.update.assert_called_once_with([archive_test])
+    assert island_algorithm._population == [population[0], elite]
+    assert elite.rank == 3
+    assert elite.distance == pytest.approx(0.5)
+
+
+def test_single_island_does_not_migrate(island_algorithm):
+    island_algorithm._inboxes = []
+    island_algorithm._emigrate = MagicMock()
+    island_algorithm._goals_manager.current_goals = []
+    island_algorithm._population = []
+    island_algorithm._generation = 0
+    config.configuration.search_algorithm.island_migration_interval = 1
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            "pynguin.ga.algorithms.dynamosaalgorithm.DynaMOSAAlgorithm.evolve", lambda _: None
+        )
+        island_algorithm.evolve()
+    island_algorithm._emigrate.assert_not_called()
+
+
+def test_factory_creates_islands():
+    config.configuration.algorithm = config.Algorithm.DYNAMOSA
+    config.configuration.search_algorithm.number_of_islands = 2
+    factory = gaf.TestSuiteGenerationAlgorithmFactory(MagicMock(TestCaseExecutor), MagicMock())
+    assert isinstance(factory.get_search_algorithm(), IslandDynaMOSAAlgorithm)
+
+
+def test_integrate_islands(subject_properties: SubjectProperties):
+    module_name = "tests.fixtures.examples.triangle"
+    config.configuration.algorithm = config.Algorithm.DYNAMOSA
+    config.configuration.stopping.maximum_iterations = 4
+    config.configuration.module_name = module_name
+    config.configuration.search_algorithm.population = 4
+    config.configuration.search_algorithm.number_of_islands = 2
+    config.configuration.search_algorithm.island_migration_interval = 1
+    with install_import_hook(module_name, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module = importlib.import_module(module_name)
+            importlib.reload(module)
+
+        executor = TestCaseExecutor(subject_properties)
+        cluster = generate_test_cluster(module_name)
+        search_algorithm = gaf.TestSuiteGenerationAlgorithmFactory(
+            executor, cluster
+        ).get_search_algorithm()
+        search_algorithm._logger = MagicMock(Logger)
+        test_cases = search_algorithm.generate_tests()
+        assert test_cases.size() > 0
+        assert all(not process.is_alive() for process in search_algorithm._islands)
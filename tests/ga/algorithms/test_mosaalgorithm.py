@@ -9,12 +9,16 @@ from unittest.mock import MagicMock
 import pytest
 
 import pynguin.ga.chromosomefactory as cf
+import pynguin.ga.testcasechromosome as tcc
+import pynguin.utils.statistics.stats as stat
 from pynguin.ga.algorithms.mosaalgorithm import MOSAAlgorithm
 from pynguin.ga.operators.crossover import CrossOverFunction
 from pynguin.ga.operators.ranking import RankingFunction
 from pynguin.ga.operators.selection import SelectionFunction
 from pynguin.instrumentation.tracer import ExecutionTracer
 from pynguin.testcase.execution import TestCaseExecutor
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+from tests.testcase._builders import int_stmt, make_test_case
 
 
 @pytest.fixture
@@ -50,3 +54,31 @@ def test_property_ranking_function(mosa_strategy):
     ranking_function = MagicMock(RankingFunction)
     mosa_strategy.ranking_function = ranking_function
     assert mosa_strategy.ranking_function == ranking_function
+
+
+def _chromosome(*statements, evaluated=False):
+    chromosome = tcc.TestCaseChromosome(make_test_case(*statements))
+    if evaluated:
+        chromosome.set_last_execution_result(MagicMock())
+        chromosome.changed = False
+    return chromosome
+
+
+def test_deduplicate_offspring(mosa_strategy):
+    parent = _chromosome(int_stmt("var_0", 1), evaluated=True)
+    mosa_strategy._population = [parent]
+    mosa_strategy._archive = MagicMock(solutions=[])
+    same_as_parent = _chromosome(int_stmt("var_0", 1))
+    unique = _chromosome(int_stmt("var_0", 2))
+    duplicate = _chromosome(int_stmt("var_0", 2))
+
+    offspring = mosa_strategy._deduplicate_offspring([same_as_parent, unique, duplicate])
+
+    assert offspring == [same_as_parent, unique]
+    assert offspring[1] is unique
+    assert not same_as_parent.changed
+    assert same_as_parent.get_last_execution_result() is parent.get_last_execution_result()
+    assert unique.changed
+    variables = stat.statistics_tracker.output_variables
+    assert variables[RuntimeVariable.AvoidedExecutions.name].value == 2
+    assert variables[RuntimeVariable.AvoidedExecutionRate.name].value == pytest.approx(2 / 3)
@@ -0,0 +1,139 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import importlib
+import queue
+from logging import Logger
+from unittest import mock
+from unittest.mock import MagicMock
+
+import multiprocess as mp
+import pytest
+
+import pynguin.configuration as config
+import pynguin.ga.generationalgorithmfactory as gaf
+from pynguin.analyses.module import generate_test_cluster
+from pynguin.ga.algorithms.archive import MIOArchive
+from pynguin.ga.algorithms.parallelmioalgorithm import ArchiveUpdate, ParallelMIOAlgorithm
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.instrumentation.tracer import SubjectProperties
+from pynguin.testcase.execution import TestCaseExecutor
+from pynguin.utils.orderedset import OrderedSet
+
+
+class _Inbox:
+    def __init__(self):
+        self.messages = []
+
+    def put(self, message):
+        self.messages.append(message)
+
+    def get_nowait(self):
+        if not self.messages:
+            raise queue.Empty
+        return self.messages.pop(0)
+
+
+@pytest.fixture
+def targets():
+    return [MagicMock(), MagicMock()]
+
+
+@pytest.fixture
+def mio_algorithm(targets) -> ParallelMIOAlgorithm:
+    algorithm = ParallelMIOAlgorithm()
+    algorithm._inboxes = [_Inbox(), _Inbox(), _Inbox()]
+    algorithm._archive = MIOArchive(OrderedSet(targets), 3)
+    algorithm._targets = targets
+    algorithm._target_indices = {target: index for index, target in enumerate(targets)}
+    return algorithm
+
+
+def test_synchronize_broadcasts_stored_solutions(mio_algorithm, targets):
+    first, second = MagicMock(), MagicMock()
+    mio_algorithm._pending = [(targets[0], 0.5, first), (targets[1], 1.0, first)]
+    mio_algorithm._pending.append((targets[0], 0.25, second))
+    with mock.patch(
+        "pynguin.ga.algorithms.parallelmioalgorithm.render_seed_module",
+        side_effect=lambda test_cases: str(id(test_cases[0])),
+    ):
+        mio_algorithm._synchronize()
+    update = ArchiveUpdate(
+        0,
+        (str(id(first.test_case)), str(id(second.test_case))),
+        ((0, 0.5, 0), (1, 1.0, 0), (0, 0.25, 1)),
+    )
+    assert mio_algorithm._inboxes[0].messages == []
+    assert mio_algorithm._inboxes[1].messages == [update]
+    assert mio_algorithm._inboxes[2].messages == [update]
+    assert mio_algorithm._pending == []
+
+
+def test_synchronize_without_stored_solutions_sends_nothing(mio_algorithm):
+    mio_algorithm._synchronize()
+    assert all(not inbox.messages for inbox in mio_algorithm._inboxes)
+
+
+def test_receive_stores_solutions_with_sent_h_values(mio_algorithm):
+    solution = MagicMock()
+    mio_algorithm._decode = {"covering": solution, "broken": None}.__getitem__
+    mio_algorithm._inboxes[0].put(
+        ArchiveUpdate(1, ("covering", "broken"), ((1, 1.0, 0), (0, 0.5, 1)))
+    )
+    mio_algorithm._synchronize()
+    assert mio_algorithm._archive.num_covered_targets == 1
+    assert mio_algorithm._archive.solutions == OrderedSet([solution])
+    # Received solutions are not sent on again.
+    assert mio_algorithm._pending == []
+
+
+def test_solutions_are_not_recorded_without_workers(targets):
+    config.configuration.mio.number_of_workers = 2
+    algorithm = ParallelMIOAlgorithm()
+    algorithm._archive = MIOArchive(OrderedSet(targets), 3)
+    algorithm._test_case_fitness_functions = OrderedSet(targets)
+    with (
+        mock.patch.object(mp, "get_context", side_effect=ValueError),
+        mock.patch("pynguin.ga.algorithms.mioalgorithm.MIOAlgorithm.generate_tests"),
+    ):
+        algorithm.generate_tests()
+    assert not algorithm._inboxes
+    assert not algorithm._archive._on_solution_added
+
+
+def test_progress_is_averaged_over_workers(mio_algorithm):
+    mio_algorithm._progress = mp.Array("d", [0.2, 0.6, 0.4])
+    assert mio_algorithm.progress() == pytest.approx(0.4)
+
+
+def test_factory_creates_parallel_mio():
+    config.configuration.algorithm = config.Algorithm.MIO
+    config.configuration.mio.number_of_workers = 2
+    factory = gaf.TestSuiteGenerationAlgorithmFactory(MagicMock(TestCaseExecutor), MagicMock())
+    assert isinstance(factory.get_search_algorithm(), ParallelMIOAlgorithm)
+
+
+def test_integrate_parallel_mio(subject_properties: SubjectProperties):
+    module_name = "tests.fixtures.examples.triangle"
+    config.configuration.algorithm = config.Algorithm.MIO
+    config.configuration.stopping.maximum_iterations = 20
+    config.configuration.module_name = module_name
+    config.configuration.mio.number_of_workers = 2
+    config.configuration.mio.synchronization_interval = 2
+    with install_import_hook(module_name, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module = importlib.import_module(module_name)
+            importlib.reload(module)
+
+        executor = TestCaseExecutor(subject_properties)
+        cluster = generate_test_cluster(module_name)
+        search_algorithm = gaf.TestSuiteGenerationAlgorithmFactory(
+            executor, cluster
+        ).get_search_algorithm()
+        search_algorithm._logger = MagicMock(Logger)
+        test_cases = search_algorithm.generate_tests()
+        assert test_cases.size() > 0
+        assert all(not process.is_alive() for process in search_algorithm._workers)
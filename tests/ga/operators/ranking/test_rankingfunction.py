@@ -4,13 +4,22 @@
 #
 #  SPDX-License-Identifier: MIT
 #
+import random
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
 import pynguin.configuration as config
 import pynguin.ga.chromosome as chrom
-from pynguin.ga.operators.ranking import RankBasedPreferenceSorting, RankedFronts, RankingFunction
+from pynguin.ga.operators import ranking
+from pynguin.ga.operators.ranking import (
+    RankBasedPreferenceSorting,
+    RankedFronts,
+    RankingFunction,
+    VectorizedRankBasedPreferenceSorting,
+)
+from pynguin.utils.orderedset import OrderedSet
 
 
 @pytest.fixture
@@ -68,3 +77,72 @@ def test_compute_ranking_assignment(ranking_function):
 
     result = ranking_function.compute_ranking_assignment(solutions, set())
     assert result == expected
+
+
+def _chromosome_with_fitness(goals, values, length):
+    chromosome = MagicMock(chrom.Chromosome)
+    fitness = dict(zip(goals, values, strict=True))
+    chromosome.get_fitness_for.side_effect = fitness.__getitem__
+    chromosome.get_fitness_values.side_effect = lambda functions: [fitness[f] for f in functions]
+    chromosome.length.return_value = length
+    chromosome.rank = None
+    return chromosome
+
+
+def _random_population(size, number_of_goals, seed):
+    rng = random.Random(seed)  # noqa: S311
+    goals = [MagicMock() for _ in range(number_of_goals)]
+    solutions = [
+        _chromosome_with_fitness(
+            goals,
+            [rng.choice((0.0, 0.25, 0.5, 1.0, 2.5)) for _ in goals],
+            # Unique lengths make the preferred solution of every goal unique.
+            index,
+        )
+        for index in range(size)
+    ]
+    return solutions, OrderedSet(goals)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("population", [1, 5, 50])
+def test_vectorized_ranking_equals_ranking(seed, population):
+    config.configuration.search_algorithm.population = population
+    solutions, goals = _random_population(30, 6, seed)
+    expected = RankBasedPreferenceSorting().compute_ranking_assignment(solutions, goals)
+    expected_ranks = [solution.rank for solution in solutions]
+    result = VectorizedRankBasedPreferenceSorting().compute_ranking_assignment(solutions, goals)
+    assert result == expected
+    assert [solution.rank for solution in solutions] == expected_ranks
+
+
+def test_vectorized_ranking_without_goals():
+    config.configuration.search_algorithm.population = 10
+    solutions, _ = _random_population(3, 0, 0)
+    result = VectorizedRankBasedPreferenceSorting().compute_ranking_assignment(
+        solutions, OrderedSet()
+    )
+    assert result == RankedFronts(fronts=[[], solutions])
+
+
+def test_vectorized_ranking_without_solutions():
+    result = VectorizedRankBasedPreferenceSorting().compute_ranking_assignment([], OrderedSet())
+    assert result == RankedFronts()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_epsilon_dominance_assignment(seed):
+    solutions, goals = _random_population(20, 6, seed)
+    with mock.patch.object(ranking, "NUMPY_AVAILABLE", new=False):
+        ranking.fast_epsilon_dominance_assignment(solutions, goals)
+    expected = [solution.distance for solution in solutions]
+    ranking.fast_epsilon_dominance_assignment(solutions, goals)
+    assert [solution.distance for solution in solutions] == pytest.approx(expected)
+
+
+def test_dominance_matrix_blocks():
+    solutions, goals = _random_population(20, 4, 0)
+    fitness = ranking.fitness_matrix(solutions, list(goals))
+    with mock.patch.object(VectorizedRankBasedPreferenceSorting, "_BLOCK_ELEMENTS", new=1):
+        blocked = VectorizedRankBasedPreferenceSorting._dominance_matrix(fitness)
+    assert (blocked == VectorizedRankBasedPreferenceSorting._dominance_matrix(fitness)).all()
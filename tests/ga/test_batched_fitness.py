@@ -0,0 +1,114 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+from __future__ import annotations
+
+import importlib
+from itertools import starmap
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.configuration as config
+import pynguin.ga.batched_fitness as bf
+import pynguin.ga.coveragegoals as bg
+import pynguin.ga.testcasechromosome as tcc
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.instrumentation.tracer import ExecutionTrace, LineMetaData
+from pynguin.testcase.execution import ExecutionResult, TestCaseExecutor
+from pynguin.utils.naming import get_module_alias
+from pynguin.utils.orderedset import OrderedSet
+from tests.testcase._builders import call_stmt, int_stmt, make_test_case
+
+if TYPE_CHECKING:
+    from pynguin.instrumentation.tracer import SubjectProperties
+
+
+@pytest.mark.parametrize(
+    "module_name, function_name, arguments",
+    [
+        pytest.param("tests.fixtures.branchcoverage.singlebranches", "first", (5,)),
+        pytest.param("tests.fixtures.branchcoverage.singlebranches", "first", (-5,)),
+        pytest.param("tests.fixtures.branchcoverage.nestedbranches", "nested_branches", (-50,)),
+        pytest.param("tests.fixtures.branchcoverage.nestedbranches", "nested_branches", (50,)),
+        pytest.param("tests.fixtures.branchcoverage.simplenesting", "foo", (0, 10)),
+        pytest.param("tests.fixtures.branchcoverage.simplenesting", "foo", (10, 10)),
+    ],
+)
+def test_batched_fitness_equals_single_fitness(
+    module_name: str,
+    function_name: str,
+    arguments: tuple[int, ...],
+    subject_properties: SubjectProperties,
+):
+    config.configuration.module_name = module_name
+    with install_import_hook(module_name, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module = importlib.import_module(module_name)
+            importlib.reload(module)
+        executor = TestCaseExecutor(subject_properties)
+        names = [f"int_{i}" for i in range(len(arguments))]
+        chromosome = tcc.TestCaseChromosome(
+            test_case=make_test_case(
+                *starmap(int_stmt, zip(names, arguments, strict=True)),
+                call_stmt(
+                    "var_0",
+                    f"{get_module_alias(module_name)}.{function_name}({', '.join(names)})",
+                    bound_type=int,
+                ),
+            )
+        )
+        functions = list(
+            bg.create_branch_coverage_fitness_functions(
+                executor, bg.BranchGoalPool(subject_properties)
+            )
+        )
+        functions.extend(bg.create_line_coverage_fitness_functions(executor))
+
+        batched = bf.compute_fitness_vector(chromosome, functions)
+        single = [function.compute_fitness(chromosome) for function in functions]
+        assert batched == pytest.approx(single)
+
+
+def test_batched_fitness_line_goals(subject_properties: SubjectProperties):
+    subject_properties.existing_lines = {
+        line_id: LineMetaData(0, "foo.py", line_id + 1) for line_id in range(4)
+    }
+    trace = ExecutionTrace(covered_line_ids=OrderedSet((1, 3)))
+    result = ExecutionResult()
+    result.execution_trace = trace
+    evaluator = bf.BatchedFitnessEvaluator(subject_properties)
+    goals = [bg.LineCoverageGoal(0, line_id) for line_id in range(4)]
+    assert evaluator.compute(result, goals) == [1.0, 0.0, 1.0, 0.0]
+
+
+def test_batched_fitness_keeps_recently_used_plans(subject_properties: SubjectProperties):
+    evaluator = bf.BatchedFitnessEvaluator(subject_properties)
+    goal_sequences = [[bg.LineCoverageGoal(0, line_id)] for line_id in range(bf.MAX_PLANS + 1)]
+    for goals in goal_sequences[: bf.MAX_PLANS]:
+        evaluator.compute(ExecutionResult(), goals)
+    # Using the first plan again keeps it, the second one is dropped instead.
+    evaluator.compute(ExecutionResult(), goal_sequences[0])
+    evaluator.compute(ExecutionResult(), goal_sequences[-1])
+    assert len(evaluator._plans) == bf.MAX_PLANS
+    assert (id(goal_sequences[0][0]),) in evaluator._plans
+    assert (id(goal_sequences[1][0]),) not in evaluator._plans
+
+
+def test_batched_fitness_unsupported_function_falls_back():
+    function = MagicMock()
+    function.compute_fitness.return_value = 2.5
+    chromosome = MagicMock()
+    assert not bf.supports_batching(function)
+    assert bf.compute_fitness_vector(chromosome, [function]) == [2.5]
+    function.compute_fitness.assert_called_once_with(chromosome)
+
+
+def test_get_evaluator_is_shared(subject_properties: SubjectProperties):
+    evaluator = bf.get_evaluator(subject_properties)
+    assert bf.get_evaluator(subject_properties) is evaluator
+    assert evaluator.subject_properties is subject_properties
@@ -0,0 +1,151 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import gzip
+import importlib
+from logging import Logger
+from unittest.mock import MagicMock
+
+import pytest
+
+import pynguin.configuration as config
+import pynguin.ga.checkpoint as ckpt
+import pynguin.ga.generationalgorithmfactory as gaf
+import pynguin.utils.statistics.stats as stat
+from pynguin.analyses.constants import (
+    ConstantPool,
+    DynamicConstantProvider,
+    EmptyConstantProvider,
+)
+from pynguin.analyses.module import generate_test_cluster
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.instrumentation.tracer import SubjectProperties
+from pynguin.testcase.execution import TestCaseExecutor
+from pynguin.utils import randomness
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+
+
+@pytest.fixture
+def checkpoint() -> ckpt.SearchCheckpoint:
+    return ckpt.SearchCheckpoint(
+        fingerprint=ckpt.get_fingerprint(),
+        covered_goals=["goal"],
+        archive="",
+        population="",
+        rng_state=ckpt._encode_rng_state(randomness.RNG.getstate()),
+        constants={},
+        statistics={},
+    )
+
+
+def test_write_read_checkpoint(tmp_path, checkpoint):
+    path = tmp_path / "report" / ckpt.CHECKPOINT_FILE_NAME
+    ckpt.write_checkpoint(checkpoint, path)
+    assert ckpt.read_checkpoint(path) == checkpoint
+    assert not path.with_name(f"{path.name}.tmp").exists()
+
+
+def test_read_missing_checkpoint(tmp_path):
+    assert ckpt.read_checkpoint(tmp_path / ckpt.CHECKPOINT_FILE_NAME) is None
+
+
+def test_read_corrupt_checkpoint(tmp_path):
+    path = tmp_path / ckpt.CHECKPOINT_FILE_NAME
+    with gzip.open(path, mode="wt") as file:
+        file.write("{")
+    assert ckpt.read_checkpoint(path) is None
+
+
+def test_read_checkpoint_of_other_search(tmp_path, checkpoint):
+    path = tmp_path / ckpt.CHECKPOINT_FILE_NAME
+    ckpt.write_checkpoint(checkpoint, path)
+    config.configuration.seeding.seed += 1
+    assert ckpt.read_checkpoint(path) is None
+
+
+def test_constants_roundtrip():
+    pool = ConstantPool()
+    values = [42, 3.5, "foo", b"\x00bar", 1 + 2j]
+    for value in values:
+        pool.add_constant(value)
+    assert ckpt._decode_constants(ckpt._encode_constants(pool)) == values
+
+
+def test_rng_state_roundtrip():
+    state = ckpt._encode_rng_state(randomness.RNG.getstate())
+    expected = [randomness.next_int() for _ in range(5)]
+    randomness.RNG.setstate(ckpt._decode_rng_state(state))
+    assert [randomness.next_int() for _ in range(5)] == expected
+
+
+def test_restore_keeps_tracked_statistics(checkpoint):
+    checkpoint.statistics = {
+        RuntimeVariable.Goals.name: 3,
+        RuntimeVariable.TypeTracingExecutions.name: 17,
+    }
+    stat.set_output_variable_for_runtime_variable(RuntimeVariable.Goals, 5)
+    algorithm = MagicMock()
+    ckpt.restore_checkpoint(checkpoint, algorithm, None)
+    algorithm.resume.assert_called_once_with([])
+    variables = stat.statistics_tracker.output_variables
+    assert variables[RuntimeVariable.Goals.name].value == 5
+    assert variables[RuntimeVariable.TypeTracingExecutions.name].value == 17
+
+
+def test_observer_writes_checkpoint(tmp_path):
+    path = tmp_path / ckpt.CHECKPOINT_FILE_NAME
+    algorithm = MagicMock(population=[], test_case_fitness_functions=[])
+    algorithm.archive.solutions = []
+    observer = ckpt.CheckpointObserver(algorithm, ConstantPool(), path, 3600)
+    observer.before_search_start(0)
+    observer.after_search_iteration(MagicMock())
+    assert ckpt.read_checkpoint(path) is not None
+    path.unlink()
+    observer.after_search_iteration(MagicMock())
+    assert not path.exists()
+    observer.after_search_finish()
+    assert path.exists()
+
+
+@pytest.mark.parametrize("algorithm", [config.Algorithm.DYNAMOSA, config.Algorithm.MIO])
+def test_resume_search(algorithm, tmp_path, subject_properties: SubjectProperties):
+    module_name = "tests.fixtures.examples.triangle"
+    config.configuration.algorithm = algorithm
+    config.configuration.stopping.maximum_iterations = 10
+    config.configuration.module_name = module_name
+    config.configuration.statistics_output.report_dir = str(tmp_path)
+    config.configuration.search_algorithm.checkpoint_interval = 3600
+    with install_import_hook(module_name, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module = importlib.import_module(module_name)
+            importlib.reload(module)
+
+        executor = TestCaseExecutor(subject_properties)
+        cluster = generate_test_cluster(module_name)
+        constant_provider = DynamicConstantProvider(
+            ConstantPool(), EmptyConstantProvider(), 0.5, 10
+        )
+        constant_provider.pool.add_constant("constant")
+
+        def run():
+            search_algorithm = gaf.TestSuiteGenerationAlgorithmFactory(
+                executor, cluster, constant_provider
+            ).get_search_algorithm()
+            search_algorithm._logger = MagicMock(Logger)
+            return search_algorithm, search_algorithm.generate_tests()
+
+        _, first_result = run()
+        checkpoint = ckpt.read_checkpoint(tmp_path / ckpt.CHECKPOINT_FILE_NAME)
+        assert checkpoint is not None
+        assert checkpoint.constants["str"] == ["constant"]
+
+        resumed = gaf.TestSuiteGenerationAlgorithmFactory(
+            executor, cluster, constant_provider
+        ).get_search_algorithm()
+        assert len(resumed._resumed_test_cases) >= first_result.size()
+        resumed._logger = MagicMock(Logger)
+        resumed_result = resumed.generate_tests()
+        assert resumed_result.get_coverage() >= first_result.get_coverage()
@@ -232,24 +232,29 @@ def test_run_test_suite_chromosome_cache(executor_mock: MagicMock):
     result2 = MagicMock()
     executor_mock.execute_multiple.return_value = [result0, result1]
     func = DummyTestSuiteChromosomeComputation(executor_mock)
+    fitness_function = MagicMock()
+    fitness_function.is_maximisation_function.return_value = False
     indiv = tsc.TestSuiteChromosome()
     # Executed because it was changed.
     test_case0 = tcc.TestCaseChromosome(MagicMock())
     test_case0.changed = True
-    test_case0.computation_cache._fitness_cache = {"foo": "bar"}
+    test_case0.add_fitness_function(fitness_function)
+    test_case0.computation_cache.set_fitness_values({fitness_function: 1.0})
     # Executed because it has no result
     test_case1 = tcc.TestCaseChromosome(MagicMock())
     test_case1.changed = False
-    test_case1.computation_cache._fitness_cache = {"foo": "bar"}
+    test_case1.add_fitness_function(fitness_function)
+    test_case1.computation_cache.set_fitness_values({fitness_function: 1.0})
     # Not executed.
     test_case2 = tcc.TestCaseChromosome(MagicMock())
     test_case2.changed = False
-    test_case2.computation_cache._fitness_cache = {"foo": "bar"}
+    test_case2.add_fitness_function(fitness_function)
+    test_case2.computation_cache.set_fitness_values({fitness_function: 1.0})
     test_case2.set_last_execution_result(result2)
     indiv.add_test_case_chromosome(test_case0)
     indiv.add_test_case_chromosome(test_case1)
     indiv.add_test_case_chromosome(test_case2)
     assert func._run_test_suite_chromosome(indiv) == [result0, result1, result2]
-    assert test_case0.computation_cache._fitness_cache == {}
-    assert test_case1.computation_cache._fitness_cache == {}
-    assert test_case2.computation_cache._fitness_cache == {"foo": "bar"}
+    assert test_case0.computation_cache._fitness_values is None
+    assert test_case1.computation_cache._fitness_values is None
+    assert test_case2.computation_cache._fitness_values is not None
@@ -8,6 +8,7 @@
 # Tests for cache:
 from __future__ import annotations
 
+from array import array
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
@@ -66,9 +67,57 @@ def test_computation_cache_clone(cache):
     cloned = cache.clone(new)
     assert cloned.get_fitness_functions() == [func]
     assert cloned.get_coverage_functions() == [func2]
-    assert cloned._is_covered_cache[func] is True
-    assert cloned._fitness_cache[func] == 0
-    assert cloned._coverage_cache[func2] == 1
+    assert cloned._is_covered_values.get(0) == 1.0
+    assert cloned._fitness_values.get(0) == 0
+    assert cloned._coverage_values.get(0) == 1
+
+
+def test_computation_cache_clone_copies_on_write(cache):
+    func = MagicMock()
+    func.is_maximisation_function.return_value = False
+    cache.add_fitness_function(func)
+    cache.set_fitness_values({func: 2.0})
+
+    cloned = cache.clone(MagicMock())
+    assert cloned._fitness_values is cache._fitness_values
+    cloned.set_fitness_values({func: 3.0})
+    assert cloned._fitness_values is not cache._fitness_values
+    assert cache._fitness_values.get(0) == 2.0
+    assert cloned._fitness_values.get(0) == 3.0
+
+
+def test_computation_cache_clone_add_function_keeps_original(cache):
+    func = MagicMock()
+    func.is_maximisation_function.return_value = False
+    cache.add_fitness_function(func)
+    cloned = cache.clone(MagicMock())
+
+    func2 = MagicMock()
+    func2.is_maximisation_function.return_value = False
+    cloned.add_fitness_function(func2)
+    assert cloned.get_fitness_functions() == [func, func2]
+    assert cache.get_fitness_functions() == [func]
+
+
+def test_computation_cache_share_functions(cache):
+    func = MagicMock()
+    func.is_maximisation_function.return_value = False
+    cache.add_fitness_function(func)
+    other = ComputationCache(MagicMock())
+    other.share_functions(cache)
+    assert other.get_fitness_functions() == [func]
+    assert other.get_fitness_function_index(func) == 0
+    assert other._fitness_index is cache._fitness_index
+
+
+def test_computation_cache_invalidate(cache):
+    func = MagicMock()
+    func.is_maximisation_function.return_value = False
+    cache.add_fitness_function(func)
+    cache.set_fitness_values({func: 2.0})
+    cache.invalidate_cache()
+    assert cache._fitness_values is None
+    assert cache._is_covered_values is None
 
 
 def test_computation_cache_fitness_cache(cache):
@@ -225,3 +274,36 @@ def test_computation_cache_set_coverage(cache):
 
     assert cache.get_coverage() == 1
     assert cache.get_coverage_for(func) == 1
+
+
+def test_computation_cache_fitness_array_roundtrip(cache):
+    func = MagicMock()
+    func.is_maximisation_function.return_value = False
+    func.compute_fitness.return_value = 0
+    func2 = MagicMock()
+    func2.is_maximisation_function.return_value = False
+    func2.compute_fitness.return_value = 2
+    cache.add_fitness_function(func)
+    cache.add_fitness_function(func2)
+    cache._chromosome.changed = False
+
+    values = cache.get_fitness_array()
+    assert values == array("d", [0, 2])
+    cache.set_fitness_array(array("d", [1, 0]))
+    assert values == array("d", [0, 2])
+    assert cache.get_fitness_vector() == [1, 0]
+    assert cache.get_is_covered(func) is False
+    assert cache.get_is_covered(func2) is True
+    assert func.compute_is_covered.call_count == 0
+
+
+def test_computation_cache_coverage_array_roundtrip(cache):
+    func = MagicMock()
+    func.compute_coverage.return_value = 0.5
+    cache.add_coverage_function(func)
+    cache._chromosome.changed = False
+
+    assert cache.get_coverage_array() == array("d", [0.5])
+    cache.set_coverage_array(array("d", [1]))
+    assert cache.get_coverage_for(func) == 1
+    assert func.compute_coverage.call_count == 1
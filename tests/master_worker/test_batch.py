@@ -0,0 +1,187 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Tests for the batch mode."""
+
+import ast
+import csv
+import math
+from unittest import mock
+
+import pytest
+
+import pynguin.configuration as config
+from pynguin.generator import ReturnCode
+from pynguin.master_worker import batch
+
+
+@pytest.fixture
+def project(tmp_path):
+    package = tmp_path / "pkg"
+    (package / "sub").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "__main__.py").write_text("")
+    (package / "simple.py").write_text("def foo(x):\n    return x\n")
+    (package / "sub" / "__init__.py").write_text("")
+    (package / "sub" / "branchy.py").write_text(
+        "def bar(x):\n    if x:\n        return 1\n    while x:\n        x -= 1\n    return 0\n"
+    )
+    return tmp_path
+
+
+def test_discover_modules(project):
+    assert batch.discover_modules(project, "pkg") == [
+        "pkg",
+        "pkg.simple",
+        "pkg.sub",
+        "pkg.sub.branchy",
+    ]
+
+
+def test_discover_modules_ignored(project):
+    assert batch.discover_modules(project, "pkg", ["pkg.simple", "pkg.sub"]) == [
+        "pkg",
+        "pkg.sub.branchy",
+    ]
+
+
+def test_discover_single_module(project):
+    assert batch.discover_modules(project, "pkg.simple") == ["pkg.simple"]
+
+
+def test_estimate_goals():
+    tree = ast.parse("def foo(x):\n    if x:\n        pass\n    return 1 if x else 2\n")
+    assert batch.estimate_goals(tree) == 6
+
+
+def test_get_module_weight(project):
+    simple = batch.get_module_weight(project, "pkg.simple")
+    branchy = batch.get_module_weight(project, "pkg.sub.branchy")
+    assert 1 <= simple < branchy
+
+
+def test_get_module_weight_nothing_to_test(project):
+    assert batch.get_module_weight(project, "pkg.sub") == 0
+
+
+def test_get_module_weight_missing(project):
+    assert batch.get_module_weight(project, "pkg.missing") == 1
+
+
+def test_scheduler_splits_proportionally():
+    runs = [batch.ModuleRun("small", 1), batch.ModuleRun("large", 3)]
+    scheduler = batch.BudgetScheduler(runs, 100, 0)
+    first = scheduler.start_next()
+    second = scheduler.start_next()
+    assert first.module_name == "large"
+    assert first.budget == pytest.approx(75)
+    assert second.budget == pytest.approx(25)
+    assert not scheduler.has_pending()
+
+
+def test_scheduler_reassigns_unused_budget():
+    runs = [batch.ModuleRun("a", 2), batch.ModuleRun("b", 1), batch.ModuleRun("c", 1)]
+    scheduler = batch.BudgetScheduler(runs, 100, 0)
+    first = scheduler.start_next()
+    assert first.budget == pytest.approx(50)
+    scheduler.finish(first, 10)
+    assert first.elapsed == 10
+    assert scheduler.start_next().budget == pytest.approx(45)
+    assert scheduler.start_next().budget == pytest.approx(45)
+
+
+def test_scheduler_minimum_budget():
+    runs = [batch.ModuleRun("a", 99), batch.ModuleRun("b", 1)]
+    scheduler = batch.BudgetScheduler(runs, 100, 5)
+    scheduler.start_next()
+    assert scheduler.start_next().budget == 5
+
+
+def test_scheduler_unlimited_budget():
+    scheduler = batch.BudgetScheduler([batch.ModuleRun("a", 1)], math.inf, 5)
+    assert scheduler.start_next().budget == math.inf
+
+
+def test_merge_statistics(tmp_path):
+    for name, header, row in (
+        ("a", "TargetModule,Coverage", "a,1.0"),
+        ("b", "TargetModule,Length", "b,3"),
+    ):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "statistics.csv").write_text(f"{header}\n{row}\n")
+    output_file = tmp_path / "statistics.csv"
+    rows = batch.merge_statistics(
+        [tmp_path / "a", tmp_path / "b", tmp_path / "missing"], output_file
+    )
+    assert rows == 2
+    with output_file.open(newline="") as file:
+        assert list(csv.DictReader(file)) == [
+            {"TargetModule": "a", "Coverage": "1.0", "Length": ""},
+            {"TargetModule": "b", "Coverage": "", "Length": "3"},
+        ]
+
+
+def test_configure_module():
+    configuration = config.Configuration(
+        project_path="project",
+        module_name="pkg",
+        test_case_output=config.TestCaseOutputConfiguration(output_path="out"),
+    )
+    configuration.statistics_output.report_dir = "report"
+    module_configuration = batch._configure_module(
+        configuration,
+        config.BatchConfiguration(batch_plateau_iterations=7),
+        batch.ModuleRun("pkg.simple", 1, budget=12.4),
+    )
+    assert module_configuration.module_name == "pkg.simple"
+    assert module_configuration.stopping.maximum_search_time == 12
+    assert module_configuration.stopping.maximum_coverage_plateau == 7
+    assert module_configuration.statistics_output.report_dir.endswith("pkg.simple")
+    assert configuration.module_name == "pkg"
+    assert configuration.stopping.maximum_coverage_plateau == -1
+
+
+@pytest.mark.parametrize(
+    "return_codes, expected",
+    [
+        ((ReturnCode.OK, ReturnCode.OK), ReturnCode.OK),
+        ((ReturnCode.OK, None), ReturnCode.NO_TESTS_GENERATED),
+        ((ReturnCode.SETUP_FAILED, ReturnCode.OK), ReturnCode.SETUP_FAILED),
+    ],
+)
+def test_run_batch(project, return_codes, expected):
+    configuration = config.Configuration(
+        project_path=str(project),
+        module_name="pkg",
+        test_case_output=config.TestCaseOutputConfiguration(output_path="out"),
+    )
+    configuration.statistics_output.report_dir = str(project / "report")
+    configuration.stopping.maximum_search_time = 60
+
+    def run_modules(_configuration, _batch_configuration, scheduler, workers):
+        assert workers == 2
+        runs = [scheduler.start_next(), scheduler.start_next()]
+        assert not scheduler.has_pending()
+        assert sum(run.budget for run in runs) == pytest.approx(120)
+        for run, return_code in zip(
+            sorted(runs, key=lambda run: run.module_name), return_codes, strict=False
+        ):
+            run.return_code = return_code
+
+    with mock.patch.object(batch, "_run_modules", side_effect=run_modules):
+        assert (
+            batch.run_batch(configuration, config.BatchConfiguration(batch_workers=4)) == expected
+        )
+    assert (project / "report" / "statistics.csv").is_file()
+
+
+def test_run_batch_without_modules(tmp_path):
+    configuration = config.Configuration(
+        project_path=str(tmp_path),
+        module_name="pkg",
+        test_case_output=config.TestCaseOutputConfiguration(output_path="out"),
+    )
+    assert batch.run_batch(configuration, config.BatchConfiguration()) == ReturnCode.SETUP_FAILED
@@ -111,3 +111,19 @@ def test_get_result_task_id_not_found(master_and_config):
     result = master.get_result(taskid)
     assert result.worker_return_code == WorkerReturnCode.ERROR
     assert "not found" in str(result.error)
+
+
+def test_wait(master_and_config):
+    master, mock_config = master_and_config
+
+    taskid = master.start_pynguin(mock_config)
+    assert master.wait([taskid, "unknown"], timeout=60) == [taskid]
+    master.stop()
+
+
+def test_start_pynguin_unique_task_ids(master_and_config):
+    master, mock_config = master_and_config
+
+    taskids = {master.start_pynguin(mock_config) for _ in range(3)}
+    master.stop()
+    assert len(taskids) == 3
@@ -21,6 +21,7 @@ from pynguin.cli import (
     _create_argument_parser,  # noqa: PLC2701
     _expand_arguments_if_necessary,  # noqa: PLC2701
     _setup_logging,  # noqa: PLC2701
+    batch_main,
     main,
 )
 from pynguin.generator import ReturnCode
@@ -34,6 +35,7 @@ def test_main_empty_argv():
                     with mock.patch.dict(os.environ, {_DANGER_ENV: "foobar"}):
                         generator_mock.return_value = ReturnCode.OK
                         parser = MagicMock()
+                        parser.parse_args.return_value.config.use_master_worker = False
                         parser_mock.return_value = parser
                         main()
                         assert len(parser.parse_args.call_args[0][0]) > 0
@@ -47,6 +49,7 @@ def test_main_with_argv():
                     with mock.patch.dict(os.environ, {_DANGER_ENV: "foobar"}):
                         generator_mock.return_value = ReturnCode.OK
                         parser = MagicMock()
+                        parser.parse_args.return_value.config.use_master_worker = False
                         parser_mock.return_value = parser
                         args = ["foo", "--help"]
                         main(args)
@@ -382,3 +385,33 @@ def test_parse_arguments_type_tracing_float(tmp_path):
         "0.1",
     ])
     assert parsed.config.type_inference.type_tracing == 0.1
+
+
+@pytest.mark.parametrize("has_console", [True, False])
+def test_batch_main(patch_dependencies, has_console):
+    log_mock, parser_mock, parser = patch_dependencies
+    parsed = parser.parse_args.return_value
+    mock_console = MagicMock()
+    log_mock.return_value = mock_console if has_console else None
+    with (
+        mock.patch.dict(os.environ, {_DANGER_ENV: "foobar"}),
+        mock.patch("pynguin.cli.run_batch", return_value=ReturnCode.OK) as run_batch,
+    ):
+        assert batch_main(["prog"]) == 0
+    parser_mock.assert_called_once_with(batch=True)
+    run_batch.assert_called_once_with(parsed.config, parsed.batch)
+
+
+def test__create_argument_parser_batch():
+    parser = _create_argument_parser(batch=True)
+    parsed = parser.parse_args([
+        "--project-path",
+        ".",
+        "--module-name",
+        "package",
+        "--output-path",
+        "out",
+        "--batch-workers",
+        "4",
+    ])
+    assert parsed.batch == config.BatchConfiguration(batch_workers=4)
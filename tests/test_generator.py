@@ -232,7 +232,11 @@ def test__setup_report_dir_not_required(tmp_path: Path):
 
 
 def test_run(tmp_path):
-    gen.set_configuration(configuration=MagicMock(log_file=None, project_path=tmp_path / "nope"))
+    gen.set_configuration(
+        configuration=MagicMock(
+            log_file=None, project_path=tmp_path / "nope", **{"statistics_output.profile": False}
+        )
+    )
     with mock.patch("pynguin.generator._run") as run_mock:
         gen.run_pynguin()
         run_mock.assert_called_once()
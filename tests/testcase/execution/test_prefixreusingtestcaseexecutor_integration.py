@@ -0,0 +1,114 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+"""Integration tests for :class:`PrefixReusingTestCaseExecutor`."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+import pynguin.configuration as config
+from pynguin.instrumentation.machinery import install_import_hook
+from pynguin.testcase.execution import TestCaseExecutor
+from pynguin.testcase.prefix_executor import PrefixReusingTestCaseExecutor
+from tests.testcase._builders import assign, make_test_case, stmt
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pynguin.instrumentation.tracer import SubjectProperties
+    from pynguin.testcase.testcase import TestCase
+
+MODULE_ACCESSIBLE = "tests.fixtures.accessibles.accessible"
+
+
+@contextlib.contextmanager
+def _executor_for(subject_properties: SubjectProperties) -> Iterator[TestCaseExecutor]:
+    config.configuration.module_name = MODULE_ACCESSIBLE
+    with install_import_hook(MODULE_ACCESSIBLE, subject_properties):
+        with subject_properties.instrumentation_tracer:
+            module = importlib.import_module(MODULE_ACCESSIBLE)
+            importlib.reload(module)
+        yield TestCaseExecutor(subject_properties)
+
+
+def _probe(test_case: TestCase, value: str) -> TestCase:
+    probe = test_case.clone()
+    probe.replace_statement(2, assign("var_2", value, bound_type=int))
+    return probe
+
+
+@pytest.fixture
+def test_case(tmp_path: Path) -> TestCase:
+    log = tmp_path / "prefix.log"
+    return make_test_case(
+        stmt(f"written = open({str(log)!r}, 'a').write('x')"),
+        assign("var_1", "simple_function(1.0)", bound_type=float),
+        assign("var_2", "1", bound_type=int),
+        assign("var_3", "var_1 / var_2", bound_type=float),
+    )
+
+
+def test_prefix_is_executed_once(
+    test_case: TestCase, tmp_path: Path, subject_properties: SubjectProperties
+) -> None:
+    with _executor_for(subject_properties) as delegate:
+        executor = PrefixReusingTestCaseExecutor(delegate, test_case, 2)
+        try:
+            results = list(executor.execute_multiple(_probe(test_case, v) for v in "234"))
+        finally:
+            executor.close()
+    assert all(not result.has_test_exceptions() for result in results)
+    assert (tmp_path / "prefix.log").read_text() == "x"
+
+
+def test_result_matches_full_execution(
+    test_case: TestCase, subject_properties: SubjectProperties
+) -> None:
+    probe = _probe(test_case, "0")
+    with _executor_for(subject_properties) as delegate:
+        full_result = delegate.execute(probe)
+        executor = PrefixReusingTestCaseExecutor(delegate, test_case, 2)
+        try:
+            result = executor.execute(probe)
+        finally:
+            executor.close()
+    assert result.get_first_position_of_thrown_exception() == 3
+    assert isinstance(result.exceptions[3], ZeroDivisionError)
+    assert result.execution_trace == full_result.execution_trace
+
+
+def test_changed_prefix_is_executed_in_full(
+    test_case: TestCase, subject_properties: SubjectProperties
+) -> None:
+    probe = test_case.clone()
+    probe.replace_statement(1, assign("var_1", "simple_function(2.0)", bound_type=float))
+    with _executor_for(subject_properties) as delegate:
+        executor = PrefixReusingTestCaseExecutor(delegate, test_case, 2)
+        with mock.patch.object(delegate, "execute", wraps=delegate.execute) as execute:
+            executor.execute(probe)
+        execute.assert_called_once_with(probe)
+        executor.close()
+
+
+def test_raising_prefix_is_executed_in_full(subject_properties: SubjectProperties) -> None:
+    test_case = make_test_case(
+        stmt("bad = 1 / 0"),
+        assign("var_1", "1", bound_type=int),
+    )
+    with _executor_for(subject_properties) as delegate:
+        executor = PrefixReusingTestCaseExecutor(delegate, test_case, 1)
+        with mock.patch.object(delegate, "execute", wraps=delegate.execute) as execute:
+            results = list(executor.execute_multiple([test_case, test_case]))
+        assert execute.call_count == 2
+        executor.close()
+    assert all(result.get_first_position_of_thrown_exception() == 0 for result in results)
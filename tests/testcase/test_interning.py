@@ -0,0 +1,32 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import libcst as cst
+
+from pynguin.testcase import interning, literalgen
+
+
+def test_name_is_interned():
+    assert interning.name("var_0") is interning.name("var_0")
+    assert interning.name("var_0") is not interning.name("var_1")
+
+
+def test_attribute_chain():
+    chain = interning.attribute_chain("module_0.Foo.bar")
+    assert cst.Module(body=[]).code_for_node(chain) == "module_0.Foo.bar"
+    assert isinstance(chain, cst.Attribute)
+    assert chain.value is interning.attribute_chain("module_0.Foo")
+    assert chain.attr is interning.name("bar")
+    assert interning.attribute_chain("module_0") is interning.name("module_0")
+
+
+def test_literals_are_interned():
+    assert literalgen.literal_to_cst(42) is literalgen.literal_to_cst(42)
+    assert literalgen.literal_to_cst("foo") is literalgen.literal_to_cst("foo")
+    assert literalgen.literal_to_cst(None) is literalgen.literal_to_cst(None)
+    negative = literalgen.literal_to_cst(-42)
+    assert isinstance(negative, cst.UnaryOperation)
+    assert negative.expression is literalgen.literal_to_cst(42)
@@ -5,6 +5,7 @@
 #  SPDX-License-Identifier: MIT
 """Tests for the libcst-based local search re-implementation."""
 
+from array import array
 from unittest.mock import MagicMock
 
 import libcst as cst
@@ -14,8 +15,9 @@ import pynguin.configuration as config
 import pynguin.utils.generic.genericaccessibleobject as gao
 from pynguin.ga.testcasechromosome import TestCaseChromosome
 from pynguin.ga.testsuitechromosome import TestSuiteChromosome
-from pynguin.testcase import literalgen
+from pynguin.testcase import literalgen, localsearchobjective
 from pynguin.testcase.localsearch import TestCaseLocalSearch, TestSuiteLocalSearch
+from pynguin.testcase.localsearchobjective import LocalSearchImprovement, LocalSearchObjective
 from pynguin.testcase.localsearchstatement import (
     BooleanLocalSearch,
     CollectionLocalSearch,
@@ -469,3 +471,64 @@ def test_local_search_modules_are_importable():
     assert pynguin.testcase.localsearch is not None
     assert pynguin.testcase.llmlocalsearch is not None
     assert pynguin.testcase.localsearchstatement is not None
+
+
+def test_objective_reuses_given_execution_result():
+    suite = MagicMock()
+    suite.get_fitness_functions.return_value = []
+    suite.get_coverage_functions.return_value = []
+    suite.get_fitness_array.return_value = array("d", [1.0])
+    suite.get_coverage_array.return_value = array("d")
+    objective = LocalSearchObjective(suite, 0)
+    chromosome = MagicMock()
+    result = MagicMock()
+    assert objective.has_changed(chromosome, result) == LocalSearchImprovement.NONE
+    chromosome.set_last_execution_result.assert_called_once_with(result)
+    assert chromosome.changed is False
+    suite.set_test_case_chromosome.assert_called_once_with(0, chromosome)
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+def test_covered_goals_bitset(monkeypatch, numpy_available):
+    monkeypatch.setattr(localsearchobjective, "NUMPY_AVAILABLE", numpy_available)
+    fitness = array("d", [0.0, 0.5, 0.0] + [1.0] * 8 + [0.0])
+    assert localsearchobjective.covered_goals(fitness) == 0b1000_0000_0101
+    assert localsearchobjective.fitness_sum(fitness) == pytest.approx(8.5)
+
+
+def _objective_suite(*fitness_arrays: list[float]) -> MagicMock:
+    suite = MagicMock()
+    suite.get_fitness_functions.return_value = [
+        MagicMock(**{"is_maximisation_function.return_value": False})
+    ]
+    suite.get_fitness_array.side_effect = [array("d", values) for values in fitness_arrays]
+    suite.get_coverage_array.return_value = array("d", [0.5])
+    return suite
+
+
+def test_objective_gaining_goals_is_an_improvement():
+    # The sum of the fitness values worsens, but the first goal is covered now.
+    suite = _objective_suite([0.5, 0.2, 0.0], [0.0, 0.9, 0.0])
+    objective = LocalSearchObjective(suite, 0)
+    assert objective.has_changed(MagicMock()) == LocalSearchImprovement.IMPROVEMENT
+
+
+def test_objective_trading_goals_compares_fitness_sum():
+    suite = _objective_suite([0.5, 0.0], [0.0, 0.6])
+    objective = LocalSearchObjective(suite, 0)
+    assert objective.has_improved(MagicMock()) is False
+
+
+def test_objective_deterioration_restores_latest_values():
+    suite = _objective_suite([0.5, 0.0], [0.5, 0.2])
+    objective = LocalSearchObjective(suite, 0)
+    assert objective.has_changed(MagicMock()) == LocalSearchImprovement.DETERIORATION
+    suite.set_fitness_array.assert_called_once_with(array("d", [0.5, 0.0]))
+    suite.set_coverage_array.assert_called_once_with(array("d", [0.5]))
+
+
+def test_objective_lower_fitness_sum_is_an_improvement():
+    suite = _objective_suite([0.5, 0.0], [0.25, 0.0], [0.25, 0.0])
+    objective = LocalSearchObjective(suite, 0)
+    assert objective.has_changed(MagicMock()) == LocalSearchImprovement.IMPROVEMENT
+    assert objective.has_changed(MagicMock()) == LocalSearchImprovement.NONE
@@ -16,13 +16,16 @@ target shape) and the assertions check the committed statement afterwards.
 from __future__ import annotations
 
 from typing import cast
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
 import pynguin.configuration as config
+import pynguin.testcase.localsearchstatement as lss
 import pynguin.utils.generic.genericaccessibleobject as gao
 from pynguin.ga.testcasechromosome import TestCaseChromosome
+from pynguin.testcase.execution import TestCaseExecutor
 from pynguin.testcase.localsearchobjective import LocalSearchImprovement, LocalSearchObjective
 from pynguin.testcase.localsearchstatement import (
     BooleanLocalSearch,
@@ -91,7 +94,7 @@ class _FitnessObjective(LocalSearchObjective):
     def best(self) -> float:
         return self._best
 
-    def has_changed(self, _chromosome) -> LocalSearchImprovement:
+    def has_changed(self, _chromosome, result=None) -> LocalSearchImprovement:
         value = self._read()
         if value is None:
             return LocalSearchImprovement.NONE
@@ -103,14 +106,26 @@ class _FitnessObjective(LocalSearchObjective):
             return LocalSearchImprovement.DETERIORATION
         return LocalSearchImprovement.NONE
 
-    def has_improved(self, chromosome) -> bool:
-        return self.has_changed(chromosome) == LocalSearchImprovement.IMPROVEMENT
+    def has_improved(self, chromosome, result=None) -> bool:
+        return self.has_changed(chromosome, result) == LocalSearchImprovement.IMPROVEMENT
 
 
 def _chromosome(test_case) -> TestCaseChromosome:
     return TestCaseChromosome(test_case, None)
 
 
+def _batch_executor(raw, batches) -> MagicMock:
+    """An executor recording the literal values of the batches it executes."""
+
+    def execute_multiple(test_cases):
+        batches.append([get_literal_value(t.get_statement(0), raw) for t in test_cases])
+        return [MagicMock() for _ in test_cases]
+
+    executor = MagicMock()
+    executor.execute_multiple.side_effect = execute_multiple
+    return executor
+
+
 # ---------------------------------------------------------------------------
 # Value-access helpers
 # ---------------------------------------------------------------------------
@@ -205,6 +220,56 @@ def test_integer_local_search_false_when_not_int_literal():
     assert search.search() is False
 
 
+def test_integer_local_search_batched_converges_to_target():
+    config.configuration.local_search.ls_batch_size = 4
+    tc = make_test_case(int_stmt("var_0", 0))
+    objective = _FitnessObjective(tc, int, lambda v: abs(17 - v))
+    batches: list[list[int]] = []
+    search = IntegerLocalSearch(
+        _chromosome(tc), 0, objective, MagicMock(), _no_limit_timer(), _batch_executor(int, batches)
+    )
+    assert search.search() is True
+    assert get_literal_value(tc.get_statement(0), int) == 17
+    # The exponential steps 1, 2, 4, 8 of the first climb form one batch.
+    assert batches[0] == [1, 3, 7, 15]
+    assert all(len(batch) <= 4 for batch in batches)
+
+
+def test_integer_local_search_without_executor_is_not_batched():
+    config.configuration.local_search.ls_batch_size = 4
+    tc = make_test_case(int_stmt("var_0", 0))
+    objective = _FitnessObjective(tc, int, lambda v: abs(17 - v))
+    search = IntegerLocalSearch(_chromosome(tc), 0, objective, MagicMock(), _no_limit_timer())
+    assert search.search() is True
+    assert get_literal_value(tc.get_statement(0), int) == 17
+
+
+def test_integer_local_search_reuses_prefix():
+    config.configuration.local_search.ls_reuse_prefix = True
+    tc = make_test_case(int_stmt("var_0", 0))
+    objective = _FitnessObjective(tc, int, lambda v: abs(17 - v))
+    batches: list[list[int]] = []
+    prefix_executor = _batch_executor(int, batches)
+    with mock.patch.object(
+        lss, "PrefixReusingTestCaseExecutor", return_value=prefix_executor
+    ) as executor_factory:
+        search = IntegerLocalSearch(
+            _chromosome(tc),
+            0,
+            objective,
+            MagicMock(),
+            _no_limit_timer(),
+            MagicMock(TestCaseExecutor),
+        )
+        assert search.search() is True
+        search.close()
+    assert get_literal_value(tc.get_statement(0), int) == 17
+    # A single worker executes the prefix for all climbs, one candidate at a time.
+    executor_factory.assert_called_once()
+    assert all(len(batch) == 1 for batch in batches)
+    prefix_executor.close.assert_called_once()
+
+
 def test_float_local_search_converges_to_fractional_target():
     # A fractional target forces FloatLocalSearch's sub-integer precision loop:
     # the integer phase only reaches 2.0, so converging to 2.25 needs the float
@@ -238,6 +303,38 @@ def test_string_replace_chars_avm_converges_to_target_char():
     assert get_literal_value(tc.get_statement(0), str) == "a"
 
 
+@pytest.mark.parametrize("batch_size", [1, 3])
+def test_string_replace_chars_batched_matches_sequential(batch_size):
+    config.configuration.local_search.ls_batch_size = batch_size
+    tc = make_test_case(str_stmt("var_0", "zb"))
+    objective = _FitnessObjective(tc, str, lambda v: abs(ord(v[0]) - ord("c")) + len(v))
+    batches: list[list[str]] = []
+    search = StringLocalSearch(
+        _chromosome(tc), 0, objective, MagicMock(), _no_limit_timer(), _batch_executor(str, batches)
+    )
+    assert search.replace_chars() is True
+    assert get_literal_value(tc.get_statement(0), str) == "cb"
+    assert bool(batches) == (batch_size > 1)
+
+
+def test_bytes_replace_values_batched_converges_to_target_byte():
+    config.configuration.local_search.ls_batch_size = 3
+    tc = make_test_case(bytes_stmt("var_0", b"z"))
+    objective = _FitnessObjective(tc, bytes, lambda v: abs(v[0] - ord("a")) if v else 255)
+    batches: list[list[bytes]] = []
+    search = BytesLocalSearch(
+        _chromosome(tc),
+        0,
+        objective,
+        MagicMock(),
+        _no_limit_timer(),
+        _batch_executor(bytes, batches),
+    )
+    assert search.replace_values() is True
+    assert get_literal_value(tc.get_statement(0), bytes) == b"a"
+    assert batches
+
+
 def test_string_add_chars_grows_toward_target_length():
     tc = make_test_case(str_stmt("var_0", ""))
     objective = _FitnessObjective(tc, str, lambda v: abs(len(v) - 3))
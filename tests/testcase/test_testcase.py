@@ -6,6 +6,8 @@
 #
 """Targeted unit tests for the remaining uncovered edges of ``testcase.py``."""
 
+from unittest import mock
+
 import libcst as cst
 import pytest
 
@@ -47,6 +49,66 @@ def test_clone_is_deep_copy_and_independent():
     assert cloned.to_code() != original.to_code()
 
 
+def test_statement_codes_match_code_and_survive_clone():
+    test_case = make_test_case(
+        int_stmt("var_0", 1),
+        assign("var_1", "var_0 + 1", bound_type=int),
+    )
+    assert "".join(test_case.statement_codes()) == test_case.to_code()
+
+    cloned = test_case.clone()
+    assert cloned.get_statement(1).to_code() is test_case.get_statement(1).to_code()
+    cloned.add_statement(int_stmt("var_2", 42))
+    assert cloned.statement_codes()[:2] == test_case.statement_codes()
+    assert "".join(cloned.statement_codes()) == cloned.to_code()
+
+
+def test_clone_shares_storage_until_written():
+    original = make_test_case(
+        int_stmt("var_0", 1),
+        str_stmt("var_1", "a"),
+    )
+    cloned = original.clone()
+    assert cloned._statements is original._statements
+    assert cloned._type_registry is original._type_registry
+
+    cloned.add_statement(int_stmt("var_2", 2))
+    assert cloned._statements is not original._statements
+    assert original.variables_of_type(int) == ["var_0"]
+    assert cloned.variables_of_type(int) == ["var_0", "var_2"]
+    # Reading without taking ownership does not copy shared statements.
+    assert next(cloned.iter_statements()) is next(original.iter_statements())
+
+
+def test_clone_keeps_local_search_flag_of_original_only():
+    original = make_test_case(int_stmt("var_0", 1))
+    original.get_statement(0).local_search_applied = True
+
+    cloned = original.clone()
+
+    assert not cloned.get_statement(0).local_search_applied
+    assert original.get_statement(0).local_search_applied
+
+
+def test_incremental_registry_matches_rebuilt_registry():
+    test_case = make_test_case(
+        int_stmt("var_0", 1),
+        str_stmt("var_1", "a"),
+        int_stmt("var_2", 2),
+    )
+    test_case.insert_statement(1, int_stmt("var_3", 3))
+    test_case.insert_statement(-1, str_stmt("var_4", "b"))
+    test_case.replace_statement(0, str_stmt("var_5", "c"))
+    test_case.remove_statement(-1)
+    registry = {t: list(names) for t, names in test_case._type_registry.items()}
+
+    test_case._rebuild_registry()
+
+    assert registry == test_case._type_registry
+    assert test_case.variables_of_type(int) == ["var_3"]
+    assert test_case.variables_of_type(str) == ["var_5", "var_1", "var_4"]
+
+
 @pytest.mark.parametrize(
     ("position", "expected_size"),
     [
@@ -109,6 +171,90 @@ def test_remove_unused_variables_transforms_unused_assign_and_keeps_used():
     assert "var_1 = 2" in test_case.to_code()
 
 
+def test_remove_unused_variables_with_rebound_variable():
+    test_case = make_test_case(
+        assign("x", "1", bound_type=int),  # rebound before being read -> unused
+        assign("x", "2", bound_type=int),  # read by its own rebinding -> used
+        assign("x", "x + 1", bound_type=int),  # read later -> used
+        assign("y", "x", bound_type=int),  # never read -> unused
+    )
+
+    test_case.remove_unused_variables()
+
+    assert [s.bound_variable for s in test_case.iter_statements()] == [None, "x", "x", None]
+    assert test_case.to_code() == "1\nx = 2\nx = x + 1\nx\n"
+
+
+def test_def_use_index_is_maintained_incrementally():
+    test_case = make_test_case(
+        int_stmt("var_0", 1),
+        assign("var_1", "var_0 + 1", bound_type=int),
+    )
+    assert test_case.forward_dependencies(0) == {0, 1}
+    cloned = test_case.clone()
+    # The clone shares the index until it changes.
+    assert cloned.forward_dependencies(0) == {0, 1}
+    assert cloned._def_use is test_case._def_use
+
+    # Changing a shared index copies it, and the copy is updated in place.
+    test_case.add_statement(assign("var_2", "var_1 * 2", bound_type=int))
+    assert test_case.forward_dependencies(1) == {1, 2}
+    test_case.replace_statement(1, assign("var_1", "3", bound_type=int))
+    test_case.add_statement(assign("var_3", "var_0", bound_type=int))
+
+    assert test_case._def_use == tc._DefUseIndex.build(test_case.statements())
+    assert test_case.forward_dependencies(0) == {0, 3}
+    assert test_case.forward_dependencies(1) == {1, 2}
+    assert cloned.forward_dependencies(0) == {0, 1}
+
+
+def test_def_use_index_follows_inserted_and_removed_statements():
+    test_case = make_test_case(
+        int_stmt("var_0", 1),
+        assign("var_1", "var_0 + 1", bound_type=int),
+        assign("var_2", "var_1 + var_0", bound_type=int),
+        assign("var_3", "var_2 * 2", bound_type=int),
+    )
+    assert test_case.forward_dependencies(1) == {1, 2, 3}
+    test_case.insert_statement(1, int_stmt("var_4", 4))
+    assert test_case._def_use == tc._DefUseIndex.build(test_case.statements())
+    test_case.remove_statement(0)
+    assert test_case._def_use == tc._DefUseIndex.build(test_case.statements())
+    test_case.remove_statements_batch({0, 3})
+    assert test_case._def_use == tc._DefUseIndex.build(test_case.statements())
+    assert test_case.forward_dependencies(0) == {0, 1}
+
+
+def test_def_use_index_is_built_once_across_removal_trials():
+    test_case = make_test_case(
+        int_stmt("var_0", 1),
+        *(assign(f"var_{i}", f"var_{i - 1} + 1", bound_type=int) for i in range(1, 12)),
+    )
+    with mock.patch.object(
+        tc._DefUseIndex, "populate", autospec=True, side_effect=tc._DefUseIndex.populate
+    ) as populate:
+        for trial in range(10):
+            clone = test_case.clone()
+            clone.remove_statement_with_forward_dependencies(clone.size() - 1)
+            if trial % 3 == 0:
+                # An accepted removal updates the index of the original.
+                test_case.remove_statement_with_forward_dependencies(test_case.size() - 1)
+    assert populate.call_count == 1
+    assert test_case._def_use == tc._DefUseIndex.build(test_case.statements())
+
+
+def test_backward_dependencies():
+    test_case = make_test_case(
+        int_stmt("var_0", 1),
+        int_stmt("var_1", 2),
+        assign("var_2", "var_0 + 1", bound_type=int),
+        assign("var_3", "var_2 + var_1", bound_type=int),
+    )
+
+    assert test_case.backward_dependencies({"var_2"}) == {"var_0", "var_2"}
+    assert test_case.backward_dependencies({"var_3"}) == {"var_0", "var_1", "var_2", "var_3"}
+
+
 def test_transform_assign_to_expr_edge_cases_leave_node_unchanged():
     # A bound variable on a compound statement (not a SimpleStatementLine) cannot
     # be transformed to an Expr and must be returned unchanged.
@@ -130,6 +276,27 @@ def test_transform_assign_to_expr_edge_cases_leave_node_unchanged():
     assert test_case.get_statement(1).bound_variable == "chained_a"
 
 
+def test_to_code_joins_cached_statement_codes():
+    test_case = make_test_case(
+        int_stmt("var_0", 1),
+        stmt("for x in range(var_0):\n    if x:\n        print(x)\n"),
+    )
+    assert test_case.to_code() == test_case.to_module().code
+    assert tc.TestCase().to_code() == "pass\n"
+
+    cloned = test_case.clone()
+    cloned.add_statement(int_stmt("var_1", 2))
+    with mock.patch.object(
+        cst.Module, "code_for_node", autospec=True, side_effect=cst.Module.code_for_node
+    ) as render:
+        code = cloned.to_code()
+    assert code == cloned.to_module().code
+    # Only the new statement is rendered.
+    render.assert_called_once()
+    assert cloned != test_case
+    assert cloned == cloned.clone()
+
+
 def test_eq_returns_not_implemented_for_non_testcase():
     test_case = make_test_case(int_stmt("var_0", 1))
 
@@ -181,3 +181,14 @@ def test_normalised_area_under_curve_outlier(sequence_factory):
     sequence_factory._values = [0.0, 1 / 2, 2 / 3, 3 / 4, 4 / 5, 5 / 6, 6 / 7]
     expected = 2987 / (840 * 5.5)
     assert sequence_factory.normalised_area_under_curve == pytest.approx(expected)
+
+
+def test_normalised_area_under_curve_unbounded():
+    config.configuration.stopping.maximum_search_time = 5
+    factory = DirectSequenceOutputVariableFactory.get_float(
+        RuntimeVariable.ExecutionsPerSecondTimeline, bounded=False
+    )
+    factory.set_start_time(time.time_ns())
+    factory._time_stamps = [i * 1_000_000_000 for i in range(6)]
+    factory._values = [100.0] * 6
+    assert factory.normalised_area_under_curve == pytest.approx(100.0)
@@ -0,0 +1,103 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+import signal
+import sys
+import time
+from unittest import mock
+
+import pytest
+
+import pynguin.configuration as config
+from pynguin.utils.statistics import profiler
+from pynguin.utils.statistics.searchphases import SearchPhase, phase_timer
+
+
+@pytest.fixture
+def sampling_profiler(tmp_path):
+    return profiler.SamplingProfiler(0.001, tmp_path / "spool")
+
+
+def _sampled_stacks(sampling_profiler):
+    sampling_profiler._sample(signal.SIGPROF, sys._getframe(1))
+    return list(sampling_profiler.samples)
+
+
+def test_sample_is_tagged_with_innermost_phase(sampling_profiler):
+    with (
+        sampling_profiler.phase(profiler.ProfilePhase.GENERATION),
+        sampling_profiler.phase(profiler.ProfilePhase.EXPORT),
+    ):
+        stacks = _sampled_stacks(sampling_profiler)
+    assert {stack[0] for stack in stacks} == {"export"}
+    assert any(
+        stack[-1] == f"{__name__}.test_sample_is_tagged_with_innermost_phase" for stack in stacks
+    )
+
+
+def test_sample_during_execution(sampling_profiler):
+    with (
+        sampling_profiler.phase(profiler.ProfilePhase.ASSERTION_GENERATION),
+        phase_timer.measure(SearchPhase.EXECUTION),
+    ):
+        stacks = _sampled_stacks(sampling_profiler)
+    assert {stack[0] for stack in stacks} == {"execution"}
+
+
+def test_sample_without_phase(sampling_profiler):
+    assert {stack[0] for stack in _sampled_stacks(sampling_profiler)} == {"other"}
+
+
+def test_write_report_merges_subprocess_samples(sampling_profiler, tmp_path):
+    sampling_profiler.samples["generation", "main", "search"] += 2
+    (tmp_path / "spool").write_text("execution;[worker];run 3\ngeneration;main;search 1\n")
+    assert sampling_profiler.write_report(tmp_path / "report") == 6
+    assert not (tmp_path / "spool").exists()
+    assert sorted((tmp_path / "report" / "profile.collapsed").read_text().splitlines()) == [
+        "execution;[worker];run 3",
+        "generation;main;search 3",
+    ]
+    assert (tmp_path / "report" / "profile-execution.collapsed").read_text() == "[worker];run 3\n"
+    assert not (tmp_path / "report" / "profile-export.collapsed").read_text()
+
+
+def test_profiled_subprocess_spools_samples(sampling_profiler, tmp_path):
+    @profiler.profiled_subprocess("worker")
+    def work():
+        sampling_profiler._sample(signal.SIGPROF, sys._getframe())
+        return 42
+
+    with (
+        mock.patch.object(profiler, "_profiler", sampling_profiler),
+        mock.patch.object(signal, "setitimer") as setitimer,
+    ):
+        assert work() == 42
+    assert setitimer.call_args_list[-1] == mock.call(signal.ITIMER_PROF, 0)
+    lines = (tmp_path / "spool").read_text().splitlines()
+    assert lines
+    assert all(line.startswith("other;[worker];") for line in lines)
+
+
+def test_profiled_without_profiler():
+    @profiler.profiled(profiler.ProfilePhase.MINIMIZATION)
+    def work():
+        return 42
+
+    assert work() == 42
+
+
+def test_profiling(tmp_path):
+    config.configuration.statistics_output.report_dir = str(tmp_path)
+    config.configuration.statistics_output.profile = True
+    config.configuration.statistics_output.profile_sampling_interval = 1_000_000
+    with profiler.profiling(), profiler.profile_phase(profiler.ProfilePhase.GENERATION):
+        end = time.process_time() + 0.2
+        while time.process_time() < end:
+            pass
+    assert profiler._profiler is None
+    assert signal.getsignal(signal.SIGPROF) == signal.SIG_DFL
+    assert (tmp_path / "profile-generation.collapsed").read_text()
+    assert (tmp_path / "profile.collapsed").is_file()
@@ -0,0 +1,73 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2026 Pynguin Contributors
+#
+#  SPDX-License-Identifier: MIT
+#
+from unittest import mock
+
+import pytest
+
+import pynguin.utils.statistics.searchphases as sp
+import pynguin.utils.statistics.statisticsobserver as sso
+from pynguin.utils.statistics.runtimevariable import RuntimeVariable
+
+
+@pytest.fixture
+def timer():
+    return sp.PhaseTimer()
+
+
+def test_nested_phases_are_exclusive(timer):
+    with (
+        mock.patch.object(sp.time, "perf_counter_ns", side_effect=[0, 10, 40, 100]),
+        timer.measure(sp.SearchPhase.FITNESS_COMPUTATION),
+        timer.measure(sp.SearchPhase.EXECUTION),
+    ):
+        pass
+    times, executions = timer.take()
+    assert times[sp.SearchPhase.FITNESS_COMPUTATION] == 70
+    assert times[sp.SearchPhase.EXECUTION] == 30
+    assert times[sp.SearchPhase.BREEDING] == 0
+    assert executions == 0
+
+
+def test_take_resets(timer):
+    timer.count_execution()
+    timer.count_execution(3)
+    with mock.patch.object(sp.time, "perf_counter_ns", side_effect=[0, 5, 7, 9]):
+        timer.enter(sp.SearchPhase.RANKING)
+        assert timer.take() == ({**dict.fromkeys(sp.SearchPhase, 0), sp.SearchPhase.RANKING: 5}, 4)
+        timer.leave()
+        times, executions = timer.take()
+    assert times[sp.SearchPhase.RANKING] == 2
+    assert executions == 0
+
+
+def test_measured():
+    @sp.measured(sp.SearchPhase.LOCAL_SEARCH)
+    def function(value):
+        """Docs."""
+        return value + 1
+
+    with mock.patch.object(sp, "phase_timer") as timer:
+        assert function(41) == 42
+    timer.measure.assert_called_once_with(sp.SearchPhase.LOCAL_SEARCH)
+    assert function.__doc__ == "Docs."
+
+
+def test_phase_timing_observer():
+    observer = sso.PhaseTimingObserver()
+    times = dict.fromkeys(sp.SearchPhase, 0)
+    times[sp.SearchPhase.EXECUTION] = 500_000_000
+    with (
+        mock.patch.object(sso.time, "perf_counter_ns", side_effect=[0, 1_000_000_000]),
+        mock.patch.object(sso, "phase_timer") as timer,
+        mock.patch.object(sso.stat, "set_output_variable_for_runtime_variable") as set_variable,
+    ):
+        timer.take.return_value = (times, 20)
+        observer.before_first_search_iteration(mock.MagicMock())
+        observer.after_search_iteration(mock.MagicMock())
+    set_variable.assert_any_call(RuntimeVariable.ExecutionTimeShareTimeline, 0.5)
+    set_variable.assert_any_call(RuntimeVariable.BreedingTimeShareTimeline, 0.0)
+    set_variable.assert_any_call(RuntimeVariable.ExecutionsPerSecondTimeline, 20.0)
@@ -49,6 +49,12 @@ mutation_strategy = "FIRST_ORDER_MUTANTS"
 mutation_order = 1
 maximum_mutation_time = -1
 maximum_mutants = -1
+mutation_workers = 1
+mutation_fork_server = false
+mutation_test_selection = true
+mutant_schemata = false
+filter_equivalent_mutants = true
+mutation_cache_directory = ""
 post_process = true
 float_precision = 0.01
 format_with_black = true
@@ -68,6 +74,8 @@ project_name = ""
 create_coverage_report = false
 type_guess_top_n = 10
 store_test_before_execution = false
+profile = false
+profile_sampling_interval = 5000000
 
 [stopping]
 maximum_search_time = -1
@@ -118,6 +126,7 @@ initial_population_seeding = false
 initial_population_data = ""
 seeded_testcases_reuse_probability = 0.9
 initial_population_mutations = 0
+corpus_directory = ""
 dynamic_constant_seeding = true
 seeded_primitives_reuse_probability = 0.2
 seeded_dynamic_values_reuse_probability = 0.6
@@ -203,9 +212,15 @@ selection = "RANK_SELECTION"
 use_archive = false
 filter_covered_targets_from_test_cluster = false
 number_of_mutations = 3
+number_of_islands = 1
+island_migration_interval = 10
+island_migration_size = 2
+checkpoint_interval = 0
 
 [mio]
 exploitation_starts_at_percent = 0.5
+number_of_workers = 1
+synchronization_interval = 20
 
 [random]
 max_sequence_length = 10
@@ -242,6 +257,8 @@ local_search_complex_objects = false
 local_search_probability = 0.02
 local_search_time = 5000
 ls_int_delta_increasing_factor = 2
+ls_batch_size = 1
+ls_reuse_prefix = false
 ls_string_random_mutation_count = 10
 ls_random_parametrized_statement_call_count = 10
 ls_max_different_type_mutations = 10
@@ -282,7 +299,10 @@ def expected_txt(tmp_path):
  'filter_assertions_in_subprocess=True, '
  'mutation_strategy=<MutationStrategy.FIRST_ORDER_MUTANTS: '
  "'FIRST_ORDER_MUTANTS'>, mutation_order=1, maximum_mutation_time=-1, "
- 'maximum_mutants=-1, post_process=True, '
+ 'maximum_mutants=-1, mutation_workers=1, mutation_fork_server=False, '
+ 'mutation_test_selection=True, mutant_schemata=False, '
+ "filter_equivalent_mutants=True, mutation_cache_directory='', "
+ 'post_process=True, '
  'minimization=Minimization(test_case_minimization_strategy=<MinimizationStrategy.CASE: '
  "'CASE'>, test_case_minimization_direction=<MinimizationDirection.BACKWARD: "
  "'BACKWARD'>), float_precision=0.01, format_with_black=True, no_xfail=False, "
@@ -293,7 +313,8 @@ def expected_txt(tmp_path):
  "coverage_metrics=[<CoverageMetric.BRANCH: 'BRANCH'>], "
  "output_variables=[TargetModule, Coverage], configuration_id='', run_id='', "
  "project_name='', create_coverage_report=False, type_guess_top_n=10, "
- 'store_test_before_execution=False), '
+ 'store_test_before_execution=False, profile=False, '
+ 'profile_sampling_interval=5000000), '
  'stopping=StoppingConfiguration(maximum_search_time=-1, '
  'maximum_test_executions=-1, maximum_statement_executions=-1, '
  'maximum_slicing_time=600, maximum_iterations=-1, '
@@ -316,8 +337,8 @@ def expected_txt(tmp_path):
  'seeding=SeedingConfiguration(seed={SEED}, '
  'constant_seeding=True, initial_population_seeding=False, '
  "initial_population_data='', seeded_testcases_reuse_probability=0.9, "
- 'initial_population_mutations=0, dynamic_constant_seeding=True, '
- 'seeded_primitives_reuse_probability=0.2, '
+ "initial_population_mutations=0, corpus_directory='', "
+ 'dynamic_constant_seeding=True, seeded_primitives_reuse_probability=0.2, '
  'seeded_dynamic_values_reuse_probability=0.6, seed_from_archive=False, '
  'seed_from_archive_probability=0.2, seed_from_archive_mutations=3, '
  'max_dynamic_length=1000, max_dynamic_pool_size=50), '
@@ -354,12 +375,15 @@ def expected_txt(tmp_path):
  'change_parameter_probability=0.1, change_statement_type_probability=0.05, '
  'tournament_size=4, rank_bias=1.68, selection=<Selection.RANK_SELECTION: '
  "'RANK_SELECTION'>, use_archive=False, "
- 'filter_covered_targets_from_test_cluster=False, number_of_mutations=3), '
+ 'filter_covered_targets_from_test_cluster=False, number_of_mutations=3, '
+ 'number_of_islands=1, island_migration_interval=10, island_migration_size=2, '
+ 'checkpoint_interval=0), '
  'mio=MIOConfiguration(initial_config=MIOPhaseConfiguration(number_of_tests_per_target=10, '
  'random_test_or_from_archive_probability=0.5, number_of_mutations=1), '
  'focused_config=MIOPhaseConfiguration(number_of_tests_per_target=1, '
  'random_test_or_from_archive_probability=0.0, number_of_mutations=10), '
- 'exploitation_starts_at_percent=0.5), '
+ 'exploitation_starts_at_percent=0.5, number_of_workers=1, '
+ 'synchronization_interval=20), '
  'random=RandomConfiguration(max_sequence_length=10, '
  'max_sequences_combined=10), to_cover=ToCoverConfiguration(only_cover=[], '
  'no_cover=[], enable_inline_pynguin_no_cover=True, '
@@ -378,7 +402,8 @@ def expected_txt(tmp_path):
  'local_search_llm=False, local_search_primitives=True, '
  'local_search_collections=False, local_search_complex_objects=False, '
  'local_search_probability=0.02, local_search_time=5000, '
- 'ls_int_delta_increasing_factor=2, ls_string_random_mutation_count=10, '
+ 'ls_int_delta_increasing_factor=2, ls_batch_size=1, ls_reuse_prefix=False, '
+ 'ls_string_random_mutation_count=10, '
  'ls_random_parametrized_statement_call_count=10, '
  'ls_max_different_type_mutations=10, '
  'ls_different_type_primitive_probability=0.3, '
@@ -489,6 +514,8 @@ True
 True
 --local_search.local_search_time
 5000
+--local_search.ls_batch_size
+1
 --local_search.ls_dict_max_insertions
 10
 --local_search.ls_different_type_collection_probability
@@ -503,6 +530,8 @@ False
 10
 --local_search.ls_random_parametrized_statement_call_count
 10
+--local_search.ls_reuse_prefix
+False
 --local_search.ls_string_random_mutation_count
 10
 --mio.exploitation_starts_at_percent
@@ -519,6 +548,10 @@ False
 10
 --mio.initial_config.random_test_or_from_archive_probability
 0.5
+--mio.number_of_workers
+1
+--mio.synchronization_interval
+20
 --module_name
 dummy
 --project_path
@@ -539,6 +572,8 @@ False
 0.1
 --search_algorithm.change_statement_type_probability
 0.05
+--search_algorithm.checkpoint_interval
+0
 --search_algorithm.chop_max_length
 True
 --search_algorithm.chromosome_length
@@ -549,10 +584,16 @@ True
 1
 --search_algorithm.filter_covered_targets_from_test_cluster
 False
+--search_algorithm.island_migration_interval
+10
+--search_algorithm.island_migration_size
+2
 --search_algorithm.max_initial_tests
 10
 --search_algorithm.min_initial_tests
 1
+--search_algorithm.number_of_islands
+1
 --search_algorithm.number_of_mutations
 3
 --search_algorithm.population
@@ -610,6 +651,10 @@ False
 --statistics_output.output_variables
 TargetModule
 Coverage
+--statistics_output.profile
+False
+--statistics_output.profile_sampling_interval
+5000000
 --statistics_output.report_dir
 pynguin-report
 --statistics_output.statistics_backend
@@ -672,6 +717,8 @@ True
 PY_TEST
 --test_case_output.filter_assertions_in_subprocess
 True
+--test_case_output.filter_equivalent_mutants
+True
 --test_case_output.float_precision
 0.01
 --test_case_output.format_with_black
@@ -686,10 +733,18 @@ True
 BACKWARD
 --test_case_output.minimization.test_case_minimization_strategy
 CASE
+--test_case_output.mutant_schemata
+False
+--test_case_output.mutation_fork_server
+False
 --test_case_output.mutation_order
 1
 --test_case_output.mutation_strategy
 FIRST_ORDER_MUTANTS
+--test_case_output.mutation_test_selection
+True
+--test_case_output.mutation_workers
+1
 --test_case_output.no_xfail
 False
 --test_case_output.post_process